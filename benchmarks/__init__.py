@@ -0,0 +1,3 @@
+"""
+Performance benchmarks of laws and core hot paths. See __main__.py for usage.
+"""
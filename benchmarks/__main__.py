@@ -0,0 +1,98 @@
+"""
+Run benchmarks and compare results with baseline.
+
+Examples:
+python -m benchmarks run --output results.json
+python -m benchmarks run --filter "core.*" --quick
+python -m benchmarks compare results.json baseline.json --threshold 0.2 --thresholds thresholds.json
+
+Thresholds file is JSON object with glob patterns of benchmark names and allowed relative slowdown,
+eg {"core.flux_*": 0.5}. Comparison exits with status 1 if any benchmark regressed.
+"""
+
+import argparse
+import fnmatch
+import json
+import sys
+
+from .runner import (DEFAULT_MIN_TIME, DEFAULT_ROUNDS, DEFAULT_THRESHOLD, compare_results,
+    load_results, run_benchmarks, save_results)
+
+
+def _run(args: argparse.Namespace) -> int:
+    # pylint: disable=import-outside-toplevel
+    from .core import core_benchmarks
+    from .laws import discover_law_benchmarks
+
+    benchmarks = core_benchmarks()
+    skipped: dict[str, str] = {}
+    if not args.core_only:
+        (law_benchmarks, skipped) = discover_law_benchmarks()
+        benchmarks.extend(law_benchmarks)
+    if args.filter:
+        benchmarks = [b for b in benchmarks if fnmatch.fnmatchcase(b.name, args.filter)]
+        skipped = {n: r for (n, r) in skipped.items() if fnmatch.fnmatchcase(n, args.filter)}
+    (min_time, rounds) = (DEFAULT_MIN_TIME / 10, 3) if args.quick else (args.min_time, args.rounds)
+    results = run_benchmarks(benchmarks,
+        min_time=min_time,
+        rounds=rounds,
+        skipped=skipped,
+        progress=lambda name: print(name, file=sys.stderr) if args.verbose else None)
+    if args.output:
+        save_results(results, args.output)
+    width = max((len(n) for n in [*results["benchmarks"], *results["skipped"]]), default=0)
+    for (name, stats) in results["benchmarks"].items():
+        print(f"{name:<{width}} {stats['median'] * 1e6:>12.1f} us")
+    for (name, reason) in results["skipped"].items():
+        print(f"{name:<{width}} skipped: {reason}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    thresholds = {}
+    if args.thresholds:
+        with open(args.thresholds, encoding="utf-8") as file:
+            thresholds = json.load(file)
+    regressions = compare_results(load_results(args.current),
+        load_results(args.baseline),
+        threshold=args.threshold,
+        thresholds=thresholds)
+    for r in regressions:
+        print(f"{r.name}: {r.baseline * 1e6:.1f} us -> {r.current * 1e6:.1f} us "
+            f"({(r.ratio - 1) * 100:+.1f}%, allowed {r.threshold * 100:.0f}%)")
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed")
+        return 1
+    print("No regressions")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run benchmarks")
+    run.add_argument("--output", help="save results to JSON file")
+    run.add_argument("--filter", help="glob pattern of benchmark names, eg 'core.*'")
+    run.add_argument("--core-only", action="store_true", help="do not run law benchmarks")
+    run.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+        help="minimal time of a round in seconds")
+    run.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="number of rounds")
+    run.add_argument("--quick", action="store_true", help="short rounds, for smoke testing")
+    run.add_argument("--verbose", action="store_true", help="print benchmark names as they run")
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser("compare", help="compare results with baseline")
+    compare.add_argument("current", help="JSON file with current results")
+    compare.add_argument("baseline", help="JSON file with baseline results")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="allowed relative slowdown of median time, eg 0.2 for 20%%")
+    compare.add_argument("--thresholds", help="JSON file with thresholds per glob pattern")
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
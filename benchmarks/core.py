@@ -0,0 +1,200 @@
+"""
+Benchmarks of core hot paths: quantities, dimension analysis, unit validation, vectors and
+fields.
+"""
+
+from sympy import cos, pi, sin, sqrt, Expr, Symbol as SymSymbol
+
+from symplyphysics import units, Quantity, QuantityVector, validate_input, validate_output
+from symplyphysics.circuits import (Capacitor, ElementKind, Inductor, Netlist, Parallel,
+    PowerAnalyzer, Resistor, Series, frequency_sweep, simulate_transient, solve_circuit)
+from symplyphysics.core.batch import import_numpy
+from symplyphysics.core.coordinate_systems.coordinate_systems import (CoordinateSystem,
+    coordinates_rotate, coordinates_transform)
+from symplyphysics.core.coordinate_systems.transformations import transform_array
+from symplyphysics.core.dimensions import collect_factor_and_dimension
+from symplyphysics.core.fields.analysis import NUMERIC, flux_across_surface
+from symplyphysics.core.fields.operators import cache_clear, curl_operator, laplacian_operator
+from symplyphysics.core.fields.vector_field import VectorField
+from symplyphysics.core.geometry.kernels import surface_kernel
+from symplyphysics.core.geometry.normals import parametrized_surface_normal
+from symplyphysics.core.points.point import Point
+from symplyphysics.core.vectors.vectors import Vector
+
+from .runner import Benchmark
+
+
+def _quantity_init() -> Quantity:
+    return Quantity(3 * units.kilometer / units.hour)
+
+
+_EXPRESSION = 2 * units.kilogram * units.meter**2 / units.second**2 + 5 * units.joule
+
+
+def _collect_factor_and_dimension_cached() -> None:
+    collect_factor_and_dimension(_EXPRESSION)
+
+
+def _collect_factor_and_dimension_uncached() -> None:
+    collect_factor_and_dimension.__wrapped__(_EXPRESSION)
+
+
+@validate_input(mass_=units.mass, acceleration_=units.acceleration)
+@validate_output(units.force)
+def _validated_force(mass_: Quantity, acceleration_: Quantity) -> Quantity:
+    return Quantity(mass_ * acceleration_)
+
+
+_MASS = Quantity(2 * units.kilogram)
+_ACCELERATION = Quantity(3 * units.meter / units.second**2)
+
+
+def _validate_input() -> None:
+    _validated_force(_MASS, _ACCELERATION)
+
+
+_CARTESIAN = CoordinateSystem()
+_CYLINDRICAL = coordinates_transform(_CARTESIAN, CoordinateSystem.System.CYLINDRICAL)
+_VECTOR = Vector([1, 2, 3], _CARTESIAN)
+
+
+def _vector_rebase() -> None:
+    _VECTOR.rebase(_CYLINDRICAL)
+
+
+_ROTATED = coordinates_rotate(_CARTESIAN, pi / 6, _CARTESIAN.coord_system.k)
+_QUANTITY_VECTOR = QuantityVector([_MASS, 2 * _MASS, 3 * _MASS], _CARTESIAN)
+
+
+def _quantity_vector_rotate() -> None:
+    _QUANTITY_VECTOR.rebase(_ROTATED)
+
+
+# 'numpy' is optional, arrays are created on first call
+_POINTS: list = []
+
+
+def _transform_array() -> None:
+    if not _POINTS:
+        _POINTS.append(import_numpy().random.default_rng(0).uniform(-1, 1, (1000, 3)))
+    transform_array(_POINTS[0], CoordinateSystem.System.CARTESIAN,
+        CoordinateSystem.System.SPHERICAL)
+
+
+def _field_function(point: Point) -> list[Expr]:
+    (x, y, z) = (point.coordinate(i) for i in range(3))
+    return [y * z, x**2, sin(x * y)]
+
+
+_FIELD = VectorField(_field_function, _CARTESIAN)
+
+
+def _curl_operator() -> None:
+    curl_operator(_FIELD)
+
+
+def _vector_laplacian_uncached() -> None:
+    cache_clear()
+    laplacian_operator(_FIELD)
+
+
+_PARAMETER1 = SymSymbol("parameter1")
+_PARAMETER2 = SymSymbol("parameter2")
+_FLUX_FIELD = VectorField(lambda p: [p.coordinate(0), p.coordinate(1), 0], _CARTESIAN)
+# hyperboloid between planes z = -2 and z = 1
+_SURFACE = [
+    sqrt(_PARAMETER1**2 + 1) * cos(_PARAMETER2),
+    sqrt(_PARAMETER1**2 + 1) * sin(_PARAMETER2), -_PARAMETER1
+]
+
+
+def _flux_across_surface() -> None:
+    flux_across_surface(_FLUX_FIELD, _SURFACE, (_PARAMETER1, -2, 1), (_PARAMETER2, 0, 6.28))
+
+
+def _flux_across_surface_numeric() -> None:
+    flux_across_surface(_FLUX_FIELD,
+        _SURFACE, (_PARAMETER1, -2, 1), (_PARAMETER2, 0, 6.28),
+        method=NUMERIC)
+
+
+def _surface_normal() -> None:
+    parametrized_surface_normal(Vector(_SURFACE, _CARTESIAN), _PARAMETER1, _PARAMETER2)
+
+
+def _surface_kernel_mesh() -> None:
+    np = import_numpy()
+    (mesh1, mesh2) = np.meshgrid(np.linspace(-2, 1, 100), np.linspace(0, 6.28, 100))
+    surface_kernel(Vector(_SURFACE, _CARTESIAN), _PARAMETER1,
+        _PARAMETER2).area_elements(mesh1, mesh2)
+
+
+# RC ladder: series resistors with capacitors to the ground at every node
+_LADDER_SIZE = 500
+_LADDER: list = []
+
+
+def _nodal_analysis_ladder() -> None:
+    if not _LADDER:
+        netlist = Netlist()
+        netlist.add_voltage_source("V", 1, "0", 1.0)
+        nodes = list(range(1, _LADDER_SIZE + 1))
+        netlist.add_elements(ElementKind.RESISTOR, [f"R{n}" for n in nodes], nodes,
+            [n + 1 for n in nodes], 100.0)
+        netlist.add_elements(ElementKind.CAPACITOR, [f"C{n}" for n in nodes],
+            [n + 1 for n in nodes], ["0"] * _LADDER_SIZE, 1e-6)
+        _LADDER.append(netlist)
+    solve_circuit(_LADDER[0], 1000.0)
+
+
+_RESONATOR = Series(Resistor(10), Inductor(1e-3), Parallel(Capacitor(1e-6), Resistor(1e4)))
+
+
+def _frequency_sweep() -> None:
+    sweep = frequency_sweep(_RESONATOR, import_numpy().logspace(2, 6, 10**5))
+    sweep.resonances()
+
+
+def _transient_rc() -> None:
+    netlist = Netlist()
+    netlist.add_voltage_source("V", "in", "0", 1.0)
+    netlist.add_resistor("R", "in", "out", 1000.0)
+    netlist.add_capacitor("C", "out", "0", 1e-6)
+    simulate_transient(netlist, 0.1, 1e-6)
+
+
+_POWER_SAMPLES: list = []
+
+
+def _power_analysis() -> None:
+    np = import_numpy()
+    if not _POWER_SAMPLES:
+        times = np.arange(10**6) / 10000.0
+        _POWER_SAMPLES.append((np.sin(2 * np.pi * 50 * times), np.cos(2 * np.pi * 50 * times)))
+    (voltages, currents) = _POWER_SAMPLES[0]
+    analyzer = PowerAnalyzer(10000.0, 2000)
+    for start in range(0, len(voltages), 65536):
+        analyzer.update(voltages[start:start + 65536], currents[start:start + 65536])
+
+
+def core_benchmarks() -> list[Benchmark]:
+    return [
+        Benchmark("core.quantity_init", _quantity_init),
+        Benchmark("core.collect_factor_and_dimension", _collect_factor_and_dimension_cached),
+        Benchmark("core.collect_factor_and_dimension_uncached",
+        _collect_factor_and_dimension_uncached),
+        Benchmark("core.validate_input", _validate_input),
+        Benchmark("core.vector_rebase", _vector_rebase),
+        Benchmark("core.quantity_vector_rotate", _quantity_vector_rotate),
+        Benchmark("core.transform_array", _transform_array),
+        Benchmark("core.curl_operator", _curl_operator),
+        Benchmark("core.vector_laplacian_uncached", _vector_laplacian_uncached),
+        Benchmark("core.flux_across_surface", _flux_across_surface),
+        Benchmark("core.flux_across_surface_numeric", _flux_across_surface_numeric),
+        Benchmark("core.surface_normal", _surface_normal),
+        Benchmark("core.surface_kernel_mesh", _surface_kernel_mesh),
+        Benchmark("core.nodal_analysis_ladder", _nodal_analysis_ladder),
+        Benchmark("core.frequency_sweep", _frequency_sweep),
+        Benchmark("core.transient_rc", _transient_rc),
+        Benchmark("core.power_analysis", _power_analysis),
+    ]
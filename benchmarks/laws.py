@@ -0,0 +1,119 @@
+"""
+Discovery of calculate_* functions in laws and definitions.
+
+Inputs are generated from expected units of function parameters: from ``validate_input``
+decorator, or from the module symbol with the same name as parameter, eg ``mass`` for
+``mass_``. Vectors and lists of quantities have 3 components. Values are random, but the same
+for every run.
+"""
+
+import importlib
+import inspect
+import pkgutil
+import random
+from functools import partial
+from types import ModuleType
+from typing import Any, Callable, Optional, Sequence
+from sympy.physics.units import Dimension
+
+from symplyphysics import Quantity, QuantityVector
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.dimensions import si_unit
+from symplyphysics.core.symbols.probability import Probability
+from symplyphysics.core.symbols.symbols import DimensionSymbol
+
+from .runner import Benchmark
+
+DEFAULT_PACKAGES = ("symplyphysics.laws", "symplyphysics.definitions")
+# Size of arrays for batch functions
+BATCH_SIZE = 1000
+_COMPONENTS = 3
+
+
+def _expected_dimension(module: ModuleType, function: Callable[..., Any],
+    parameter: inspect.Parameter) -> Optional[Dimension]:
+    expected = getattr(function, "validated_inputs", {}).get(parameter.name)
+    if expected is None:
+        expected = getattr(module, parameter.name.rstrip("_"), None)
+    if isinstance(expected, DimensionSymbol):
+        return expected.dimension
+    if isinstance(expected, Dimension):
+        return expected
+    return None
+
+
+def _argument(module: ModuleType, function: Callable[..., Any], parameter: inspect.Parameter,
+    rng: random.Random) -> Any:
+    dimension = _expected_dimension(module, function, parameter)
+    annotation = str(parameter.annotation)
+    if dimension is None:
+        if parameter.annotation is int:
+            return rng.randint(1, 9)
+        if parameter.annotation in (float, Probability):
+            return parameter.annotation(rng.uniform(0.2, 0.9))
+        raise ValueError(f"Unknown units of parameter '{parameter.name}'")
+
+    def quantity() -> Quantity:
+        return Quantity(rng.uniform(0.2, 0.9) * si_unit(dimension))
+
+    if "QuantityVector" in annotation:
+        return QuantityVector([quantity() for _ in range(_COMPONENTS)])
+    if any(s in annotation for s in ("Sequence", "list", "tuple")):
+        return [quantity() for _ in range(_COMPONENTS)]
+    return quantity()
+
+
+def _function_benchmark(name: str, module: ModuleType,
+    function: Callable[..., Any]) -> Callable[[], Any]:
+    rng = random.Random(name)
+    arguments = {}
+    for parameter in inspect.signature(function).parameters.values():
+        if parameter.default is not inspect.Parameter.empty and not hasattr(
+                module, parameter.name.rstrip("_")):
+            continue
+        arguments[parameter.name] = _argument(module, function, parameter, rng)
+    return partial(function, **arguments)
+
+
+def _batch_benchmark(name: str, batch: BatchLaw) -> Callable[[], Any]:
+    rng = random.Random(name)
+    arguments = {
+        parameter: [rng.uniform(0.2, 0.9) for _ in range(BATCH_SIZE)]
+        for parameter in batch.inputs
+    }
+    return partial(batch, **arguments)
+
+
+def discover_law_benchmarks(
+    packages: Sequence[str] = DEFAULT_PACKAGES
+) -> tuple[list[Benchmark], dict[str, str]]:
+    """
+    Return benchmarks of all calculate_* functions, and reasons of skipped functions. Functions
+    are called once here, so that functions failing with generated inputs are skipped.
+    """
+
+    benchmarks = []
+    skipped = {}
+    for package_name in packages:
+        package = importlib.import_module(package_name)
+        for info in pkgutil.walk_packages(package.__path__, package_name + "."):
+            if info.ispkg:
+                continue
+            module = importlib.import_module(info.name)
+            for (attribute, value) in sorted(vars(module).items()):
+                if not attribute.startswith("calculate_"):
+                    continue
+                name = f"{info.name.removeprefix('symplyphysics.')}.{attribute}"
+                try:
+                    if isinstance(value, BatchLaw):
+                        function = _batch_benchmark(name, value)
+                    elif inspect.isfunction(value):
+                        function = _function_benchmark(name, module, value)
+                    else:
+                        continue
+                    function()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    skipped[name] = f"{type(e).__name__}: {e}"
+                    continue
+                benchmarks.append(Benchmark(name, function))
+    return (benchmarks, skipped)
@@ -0,0 +1,156 @@
+"""
+Timing of benchmarks, storage of results and comparison with baseline.
+
+Each benchmark is a function without arguments. It is called in several rounds, and each round
+calls it enough times to take at least ``min_time`` seconds. Statistics are per call, in seconds.
+"""
+
+import fnmatch
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections import namedtuple
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+RESULTS_VERSION = 1
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.2
+
+Benchmark = namedtuple("Benchmark", ["name", "function"])
+BenchmarkStats = namedtuple("BenchmarkStats",
+    ["min", "max", "mean", "median", "stdev", "rounds", "number"])
+# 'ratio' is current median time divided by baseline median time
+Regression = namedtuple("Regression", ["name", "baseline", "current", "ratio", "threshold"])
+
+
+def _time_round(function: Callable[[], Any], number: int) -> float:
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure(function: Callable[[], Any],
+    *,
+    min_time: float = DEFAULT_MIN_TIME,
+    rounds: int = DEFAULT_ROUNDS) -> BenchmarkStats:
+    # warm up caches and find number of calls per round
+    number = 1
+    elapsed = _time_round(function, number)
+    while elapsed < min_time:
+        number = number * 10 if elapsed < min_time / 10 else number * 2
+        elapsed = _time_round(function, number)
+    times = [_time_round(function, number) / number for _ in range(rounds)]
+    return BenchmarkStats(min=min(times),
+        max=max(times),
+        mean=statistics.fmean(times),
+        median=statistics.median(times),
+        stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+        rounds=rounds,
+        number=number)
+
+
+def _environment() -> dict[str, str]:
+    environment = {"python": platform.python_version(), "platform": platform.platform()}
+    for package in ("sympy", "numpy"):
+        module = sys.modules.get(package)
+        if module is not None:
+            environment[package] = getattr(module, "__version__", "")
+    return environment
+
+
+def run_benchmarks(benchmarks: Iterable[Benchmark],
+    *,
+    min_time: float = DEFAULT_MIN_TIME,
+    rounds: int = DEFAULT_ROUNDS,
+    skipped: Optional[Mapping[str, str]] = None,
+    progress: Optional[Callable[[str], None]] = None) -> dict[str, Any]:
+    """
+    Run benchmarks and return results, that can be stored as JSON. Benchmarks that raise are
+    reported in 'skipped' with the error message.
+    """
+
+    results: dict[str, Any] = {}
+    skipped_results = dict(skipped or {})
+    for benchmark in benchmarks:
+        if progress is not None:
+            progress(benchmark.name)
+        try:
+            stats = measure(benchmark.function, min_time=min_time, rounds=rounds)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            skipped_results[benchmark.name] = f"{type(e).__name__}: {e}"
+            continue
+        results[benchmark.name] = stats._asdict()
+    return {
+        "version": RESULTS_VERSION,
+        "environment": _environment(),
+        "settings": {
+        "min_time": min_time,
+        "rounds": rounds
+        },
+        "benchmarks": dict(sorted(results.items())),
+        "skipped": dict(sorted(skipped_results.items())),
+    }
+
+
+def save_results(results: Mapping[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write(os.linesep)
+
+
+def load_results(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        results = json.load(file)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported results version {results.get('version')} in '{path}', "
+            f"expected {RESULTS_VERSION}")
+    return results
+
+
+def _threshold_for(name: str, threshold: float, thresholds: Mapping[str, float]) -> float:
+    # the longest matching pattern is the most specific one
+    matching = [pattern for pattern in thresholds if fnmatch.fnmatchcase(name, pattern)]
+    if not matching:
+        return threshold
+    return thresholds[max(matching, key=len)]
+
+
+def compare_results(current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    thresholds: Optional[Mapping[str, float]] = None) -> list[Regression]:
+    """
+    Return benchmarks, whose median time grew by more than ``threshold`` (0.2 is 20%) compared
+    to baseline. ``thresholds`` override the threshold for benchmarks matching the glob pattern,
+    eg ``{"core.flux_*": 0.5}``. Benchmarks missing in one of results are not compared.
+    """
+
+    regressions = []
+    baseline_benchmarks = baseline["benchmarks"]
+    for (name, stats) in current["benchmarks"].items():
+        baseline_stats = baseline_benchmarks.get(name)
+        if baseline_stats is None or baseline_stats["median"] <= 0:
+            continue
+        ratio = stats["median"] / baseline_stats["median"]
+        allowed = _threshold_for(name, threshold, thresholds or {})
+        if ratio > 1 + allowed:
+            regressions.append(
+                Regression(name=name,
+                baseline=baseline_stats["median"],
+                current=stats["median"],
+                ratio=ratio,
+                threshold=allowed))
+    return regressions
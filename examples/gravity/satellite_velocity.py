@@ -2,6 +2,7 @@
 
 from sympy import solve, Eq, simplify
 from symplyphysics import (print_expression, units, convert_to, Quantity)
+from symplyphysics.core.composition import compose_laws
 from symplyphysics.laws.kinematic import centripetal_acceleration_is_squared_velocity_by_radius as centripetal_acceleration_law
 from symplyphysics.laws.gravity import free_fall_acceleration_from_height as free_fall_law
 
@@ -42,3 +43,23 @@ required_velocity_expression = satellite_velocity.subs({
 result_velocity = Quantity(required_velocity_expression)
 result = convert_to(result_velocity, units.kilometer / units.second).evalf(3)
 print(f"Required velocity to launch satellite is {result} kilometer/sec")
+
+## Same calculation for many orbit heights. Laws are composed and compiled once, and each
+## evaluation is a single call of the compiled function. Requires numpy.
+satellite_velocity_law = compose_laws(
+    [centripetal_acceleration_law, free_fall_law],
+    centripetal_acceleration_law.linear_velocity,
+    links={
+    centripetal_acceleration_law.centripetal_acceleration: free_fall_law.free_fall_acceleration,
+    centripetal_acceleration_law.curve_radius:
+    free_fall_law.planet_radius + free_fall_law.height_above_surface
+    },
+    solutions={centripetal_acceleration_law.linear_velocity: 1},
+    planet_mass_=free_fall_law.planet_mass,
+    planet_radius_=free_fall_law.planet_radius,
+    height_above_surface_=free_fall_law.height_above_surface)
+
+heights = [100, 400, 1000, 35786]
+velocities = satellite_velocity_law(planet_mass, planet_radius_, (heights, units.kilometer))
+for (height, velocity) in zip(heights, velocities):
+    print(f"Required velocity for {height} km orbit is {velocity / 1000:.3f} kilometer/sec")
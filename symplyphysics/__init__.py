@@ -4,12 +4,14 @@ from sympy.physics.units.definitions.dimension_definitions import angle as angle
 from .core import errors
 from .core.dimensions import dimensionless
 from .core.symbols.quantities import Quantity, list_of_quantities
+from .core.symbols.numeric_quantities import NumericQuantity
 from .core.convert import convert_to
 from .core.symbols.symbols import Function, Symbol, print_expression
 from .core.symbols.prefixes import prefixes
-from .core.quantity_decorator import validate_input, validate_output
+from .core.quantity_decorator import validate_input, validate_output, validation
 from .core.vectors.vectors import Vector, QuantityVector
 from .core.vectors.arithmetics import scale_vector, add_cartesian_vectors, dot_vectors, cross_cartesian_vectors, vector_unit, vector_magnitude
+from .core.vectors.numeric_vectors import NumericVector, scale_numeric_vector, add_numeric_vectors, dot_numeric_vectors, cross_numeric_vectors, numeric_vector_unit, numeric_vector_magnitude
 from .core.coordinate_systems.coordinate_systems import CoordinateSystem, coordinates_transform
 
 __all__ = [
@@ -23,6 +25,7 @@ __all__ = [
     # symbols
     "Function",
     "Quantity",
+    "NumericQuantity",
     "Symbol",
     "prefixes",
     "print_expression",
@@ -32,6 +35,7 @@ __all__ = [
     # decorators
     "validate_input",
     "validate_output",
+    "validation",
     # vectors
     "Vector",
     "QuantityVector",
@@ -41,6 +45,13 @@ __all__ = [
     "cross_cartesian_vectors",
     "vector_unit",
     "vector_magnitude",
+    "NumericVector",
+    "scale_numeric_vector",
+    "add_numeric_vectors",
+    "dot_numeric_vectors",
+    "cross_numeric_vectors",
+    "numeric_vector_unit",
+    "numeric_vector_magnitude",
     # coordinate systems
     "CoordinateSystem",
     "coordinates_transform",
@@ -0,0 +1,46 @@
+"""
+Numeric analysis of whole circuits, built from the elements of electricity laws.
+"""
+
+from .netlist import GROUND, Element, ElementKind, Netlist
+from .nodal_analysis import CircuitSolution, solve_circuit
+from .networks import Network, Component, Resistor, Capacitor, Inductor, Series, Parallel
+from .frequency_sweep import (FrequencySweep, Resonance, frequency_sweep, find_resonances,
+    lc_resonant_frequency)
+from .transient import (Integrator, TransientSolution, simulate_transient,
+    simulate_transient_adaptive)
+from .power_analysis import PowerAnalyzer, PowerWindows, analyze_power
+
+__all__ = [
+    # netlist
+    "GROUND",
+    "Element",
+    "ElementKind",
+    "Netlist",
+    # nodal analysis
+    "CircuitSolution",
+    "solve_circuit",
+    # networks
+    "Network",
+    "Component",
+    "Resistor",
+    "Capacitor",
+    "Inductor",
+    "Series",
+    "Parallel",
+    # frequency sweep
+    "FrequencySweep",
+    "Resonance",
+    "frequency_sweep",
+    "find_resonances",
+    "lc_resonant_frequency",
+    # transient
+    "Integrator",
+    "TransientSolution",
+    "simulate_transient",
+    "simulate_transient_adaptive",
+    # power analysis
+    "PowerAnalyzer",
+    "PowerWindows",
+    "analyze_power",
+]
@@ -0,0 +1,209 @@
+"""
+This module calculates frequency response of two-terminal networks.
+
+Sweep evaluates network impedance for the whole array of circular frequencies, eg 10^6
+log-spaced points, in a single vectorized pass, and derives admittance, see
+'admittance_is_inversed_impedance', magnitude and phase, see
+'impedance_is_resistance_and_reactance', and quality factor, see 'quality_factor_is_energies_ratio'.
+
+Resonances are frequencies, where network impedance is purely resistive. Reactance of a passive
+network increases with frequency between its poles (Foster reactance theorem), so reactance
+changes its sign from negative to positive at series resonances, and from positive to negative
+at parallel resonances, where susceptance changes its sign instead. Resonances are located
+between sweep points and then refined with bisection on the network impedance.
+"""
+
+from __future__ import annotations
+import math
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any
+from sympy import Basic
+
+from ..core.batch import import_numpy
+from ..definitions import admittance_is_inversed_impedance as admittance_definition
+from ..definitions import quality_factor_is_energies_ratio as quality_definition
+from ..laws.electricity.circuits import oscillation_period_for_capacitor_inductor_node as lc_law
+from .networks import Network, to_circular_frequencies
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# Number of bisection steps to refine resonances. Each step halves the interval between sweep
+# points, so that resonances are found with double precision.
+BISECTION_STEPS = 60
+
+# Relative step of the numeric derivative of reactance and susceptance at resonances
+_DERIVATIVE_STEP = 1e-6
+
+# Resonance of the network. 'series' is True for series resonances, where impedance magnitude
+# has minimum, and False for parallel resonances, where it has maximum. 'quality_factor' is the
+# quality factor of the resonance, see _quality_factors().
+Resonance = namedtuple("Resonance", ["circular_frequency", "series", "quality_factor"])
+
+
+class FrequencySweep:
+    """
+    Frequency response of the network. All arrays have the shape of circular frequencies. Values
+    are numbers in canonical SI units: ohms, siemens and radians.
+    """
+
+    _network: Network
+    _circular_frequencies: NDArray[Any]
+    _impedance: NDArray[Any]
+
+    def __init__(self, network: Network, circular_frequencies: NDArray[Any],
+        impedance: NDArray[Any]) -> None:
+        self._network = network
+        self._circular_frequencies = circular_frequencies
+        self._impedance = impedance
+
+    @property
+    def network(self) -> Network:
+        return self._network
+
+    @property
+    def circular_frequencies(self) -> NDArray[Any]:
+        return self._circular_frequencies
+
+    # Complex impedance
+    @property
+    def impedance(self) -> NDArray[Any]:
+        return self._impedance
+
+    # Complex admittance, see 'admittance_is_inversed_impedance'
+    @property
+    def admittance(self) -> NDArray[Any]:
+        np = import_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return admittance_definition.calculate_admittance_batch(self._impedance)
+
+    # Real part of impedance
+    @property
+    def resistance(self) -> NDArray[Any]:
+        return self._impedance.real
+
+    # Imaginary part of impedance
+    @property
+    def reactance(self) -> NDArray[Any]:
+        return self._impedance.imag
+
+    # Absolute value of impedance, see 'impedance_is_resistance_and_reactance'
+    @property
+    def magnitude(self) -> NDArray[Any]:
+        return import_numpy().abs(self._impedance)
+
+    # Phase of impedance in radians, from -pi/2 for capacitive networks to pi/2 for inductive ones
+    @property
+    def phase(self) -> NDArray[Any]:
+        return import_numpy().angle(self._impedance)
+
+    # Quality factor of the network at each frequency, see 'quality_factor_is_energies_ratio'.
+    # For the current of 1 ampere, network dissipates 'resistance' watts and stores
+    # 'abs(reactance) / circular_frequency' joules, so Q = abs(reactance) / resistance.
+    @property
+    def quality_factor(self) -> NDArray[Any]:
+        np = import_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return quality_definition.calculate_quality_factor_batch(
+                self._circular_frequencies,
+                np.abs(self.reactance) / self._circular_frequencies, self.resistance)
+
+    # Detects resonances between sweep points, see module description.
+    # return - list of resonances, ordered by frequency
+    def resonances(self) -> list[Resonance]:
+        np = import_numpy()
+        frequencies = self._circular_frequencies.ravel()
+        order = np.argsort(frequencies)
+        frequencies = frequencies[order]
+        reactance = self.reactance.ravel()[order]
+        signs = np.sign(reactance)
+        changes = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+        series = signs[changes] < 0
+        refined = _bisect(self._network, frequencies[changes], frequencies[changes + 1], series)
+        # exact zeros are resonances themselves, if reactance changes its sign around them.
+        # Runs of zeros, eg reactance of resistive networks, are not resonances.
+        inner = np.arange(1, len(signs) - 1)
+        exact = inner[(signs[1:-1] == 0) & (signs[:-2] * signs[2:] < 0)]
+        # series resonance is where reactance rises through zero
+        rising = signs[exact - 1] < 0
+        resonant = np.concatenate([refined, frequencies[exact]])
+        series = np.concatenate([series, rising])
+        quality_factors = _quality_factors(self._network, resonant, series)
+        found = [
+            Resonance(float(w), bool(s), float(q))
+            for (w, s, q) in zip(resonant, series, quality_factors)
+        ]
+        return sorted(found, key=lambda r: r.circular_frequency)
+
+
+# Quality factors of resonances, see 'quality_factor_is_energies_ratio'. For the current of
+# 1 ampere at series resonance, network dissipates 'resistance' watts and stores
+# 'd(reactance)/d(circular_frequency) / 2' joules, eg 'L' for serial RLC circuit. Parallel
+# resonance is the same for the voltage of 1 volt, conductance and susceptance.
+def _quality_factors(network: Network, frequencies: NDArray[Any],
+    series: NDArray[Any]) -> NDArray[Any]:
+    np = import_numpy()
+    if frequencies.size == 0:
+        return frequencies
+    steps = frequencies * _DERIVATIVE_STEP
+    with np.errstate(divide="ignore", invalid="ignore"):
+        (lower, center, upper) = (network.impedance(frequencies + k * steps) for k in (-1, 0, 1))
+        # open networks, eg lossless parallel LC circuit at resonance, have zero admittance,
+        # so that their quality factor is infinite, the same as of lossless series circuits
+        (lower, center, upper) = (np.where(series, z, np.where(np.isinf(z), 0, 1 / z))
+            for z in (lower, center, upper))
+        energies = (upper.imag - lower.imag) / (2 * steps) / 2
+        return quality_definition.calculate_quality_factor_batch(frequencies, energies,
+            center.real)
+
+
+# Refines all resonances at once. Series resonances are zeros of reactance, parallel ones are
+# zeros of susceptance. Both rise with frequency, so the sign of the middle point tells which
+# half of the interval contains the resonance.
+def _bisect(network: Network, lows: NDArray[Any], highs: NDArray[Any],
+    series: NDArray[Any]) -> NDArray[Any]:
+    np = import_numpy()
+    (lows, highs) = (lows.astype(float), highs.astype(float))
+    if lows.size == 0:
+        return lows
+    for _ in range(BISECTION_STEPS):
+        middles = np.sqrt(lows * highs)
+        impedance = network.impedance(middles)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rising = np.where(series, impedance.imag, (1 / impedance).imag)
+        above = rising > 0
+        highs = np.where(above, middles, highs)
+        lows = np.where(above, lows, middles)
+    return np.sqrt(lows * highs)
+
+
+# Calculates frequency response of the network for circular frequencies, eg
+# np.logspace(0, 6, 10**6) radians per second, or (frequencies, units.radian / units.second).
+def frequency_sweep(network: Network, circular_frequencies: ArrayLike | tuple[ArrayLike, Basic] |
+    Basic) -> FrequencySweep:
+    values = to_circular_frequencies(circular_frequencies, "frequency_sweep")
+    return FrequencySweep(network, values, network.impedance(values))
+
+
+# Resonant circular frequency of the LC circuit: 2 * pi / T, where T is the oscillation period,
+# see 'oscillation_period_for_capacitor_inductor_node'.
+# Inputs are array-like of numbers in canonical SI units, pairs of array-like and unit, or
+# quantities, as inputs of BatchLaw.
+def lc_resonant_frequency(inductance: ArrayLike | tuple[ArrayLike, Basic] | Basic,
+    capacitance: ArrayLike | tuple[ArrayLike, Basic] | Basic) -> NDArray[Any]:
+    period = lc_law.calculate_oscillation_period_batch(inductance, capacitance)
+    return 2 * math.pi / period
+
+
+# Detects resonances of the network in the range of circular frequencies. Range is swept with
+# 'points' log-spaced frequencies, resonances between them are refined with bisection.
+def find_resonances(network: Network,
+    low: Basic | float,
+    high: Basic | float,
+    points: int = 1000) -> list[Resonance]:
+    np = import_numpy()
+    low = float(to_circular_frequencies(low, "find_resonances"))
+    high = float(to_circular_frequencies(high, "find_resonances"))
+    if low >= high:
+        raise ValueError(f"Lower frequency should be less than higher one, got {low} and {high}")
+    return frequency_sweep(network, np.geomspace(low, high, points)).resonances()
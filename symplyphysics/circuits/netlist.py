@@ -0,0 +1,204 @@
+"""
+This module describes circuits as netlists of two-terminal elements.
+
+Element connects 2 nodes and has a single value: resistance, capacitance, inductance, source
+voltage or source current. Values are checked against the symbols of the corresponding laws, eg
+resistance of the resistor has the dimension of 'current_is_proportional_to_voltage.resistance'.
+
+Netlist stores elements column-wise, as arrays of node indices and values in canonical SI units,
+so that circuits with 10^5 elements are assembled without creating per-element objects. Add
+elements one by one with add_*() methods, or as whole arrays with add_elements().
+"""
+
+from __future__ import annotations
+from collections import namedtuple
+from enum import Enum, unique
+from typing import TYPE_CHECKING, Any, Hashable, Iterable, Sequence
+from sympy import Basic
+from sympy.physics.units import Dimension
+
+from ..core.batch import import_numpy, to_si_array
+from ..laws.electricity import current_is_proportional_to_voltage as ohms_law
+from ..laws.electricity import capacitor_impedance_from_capacitance_and_frequency as capacitor_law
+from ..laws.electricity import coil_impedance_from_inductivity_and_frequency as coil_law
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# Default name of the ground node. Voltages of all other nodes are relative to the ground.
+GROUND = "0"
+
+
+@unique
+class ElementKind(Enum):
+    RESISTOR = "resistor"
+    CAPACITOR = "capacitor"
+    INDUCTOR = "inductor"
+    VOLTAGE_SOURCE = "voltage_source"
+    CURRENT_SOURCE = "current_source"
+
+    # Dimension of the element value, see the laws of elements.
+    @property
+    def dimension(self) -> Dimension:
+        return _ELEMENT_SYMBOLS[self].dimension
+
+
+# Element values are symbols of the laws, that describe elements
+_ELEMENT_SYMBOLS = {
+    ElementKind.RESISTOR: ohms_law.resistance,
+    ElementKind.CAPACITOR: capacitor_law.capacitor_capacitance,
+    ElementKind.INDUCTOR: coil_law.coil_inductivity,
+    ElementKind.VOLTAGE_SOURCE: ohms_law.voltage,
+    ElementKind.CURRENT_SOURCE: ohms_law.current,
+}
+
+# Two-terminal element. Current flows from 'node1' through the element to 'node2'. Voltage source
+# keeps 'node1' at 'value' volts above 'node2'. Current source drives 'value' amperes from 'node1'
+# through the source to 'node2'. 'value' is a number in canonical SI units, complex for AC phasors.
+Element = namedtuple("Element", ["kind", "name", "node1", "node2", "value"])
+
+
+class Netlist:
+    """
+    Circuit as a list of two-terminal elements, connected at named nodes.
+    """
+
+    _ground: Hashable
+    _nodes: dict[Hashable, int]
+    _names: dict[str, int]
+    _kinds: list[Any]
+    _nodes1: list[Any]
+    _nodes2: list[Any]
+    _values: list[Any]
+
+    def __init__(self, ground: Hashable = GROUND) -> None:
+        self._ground = ground
+        self._nodes = {ground: 0}
+        self._names = {}
+        self._kinds = []
+        self._nodes1 = []
+        self._nodes2 = []
+        self._values = []
+
+    @staticmethod
+    def from_elements(elements: Iterable[Element], ground: Hashable = GROUND) -> Netlist:
+        netlist = Netlist(ground)
+        for e in elements:
+            netlist.add(e.kind, e.name, e.node1, e.node2, e.value)
+        return netlist
+
+    @property
+    def ground(self) -> Hashable:
+        return self._ground
+
+    # Node names in the order of their indices. Ground node has index 0.
+    @property
+    def nodes(self) -> list[Hashable]:
+        return list(self._nodes)
+
+    # Element names in the order they were added
+    @property
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def node_index(self, node: Hashable) -> int:
+        index = self._nodes.get(node)
+        if index is None:
+            raise ValueError(f"Node '{node}' is not in the netlist")
+        return index
+
+    def element_index(self, name: str) -> int:
+        index = self._names.get(name)
+        if index is None:
+            raise ValueError(f"Element '{name}' is not in the netlist")
+        return index
+
+    def _element(self, index: int, name: str, nodes: Sequence[Hashable]) -> Element:
+        return Element(ElementKind(self._kinds[index]), name, nodes[self._nodes1[index]],
+            nodes[self._nodes2[index]], self._values[index])
+
+    def element(self, name: str) -> Element:
+        return self._element(self.element_index(name), name, self.nodes)
+
+    @property
+    def elements(self) -> list[Element]:
+        nodes = self.nodes
+        return [self._element(i, name, nodes) for (name, i) in self._names.items()]
+
+    def _node(self, node: Hashable) -> int:
+        index = self._nodes.get(node)
+        if index is None:
+            index = len(self._nodes)
+            self._nodes[node] = index
+        return index
+
+    # Adds element. 'value' is a number in canonical SI units or SymPy quantity with the dimension
+    # of the element value, eg Quantity(5 * units.kilo * units.ohm) for resistor.
+    def add(self, kind: ElementKind, name: str, node1: Hashable, node2: Hashable,
+        value: Basic | complex) -> None:
+        self.add_elements(kind, [name], [node1], [node2],
+            value if isinstance(value, Basic) else [value])
+
+    def add_resistor(self, name: str, node1: Hashable, node2: Hashable,
+        resistance: Basic | float) -> None:
+        self.add(ElementKind.RESISTOR, name, node1, node2, resistance)
+
+    def add_capacitor(self, name: str, node1: Hashable, node2: Hashable,
+        capacitance: Basic | float) -> None:
+        self.add(ElementKind.CAPACITOR, name, node1, node2, capacitance)
+
+    def add_inductor(self, name: str, node1: Hashable, node2: Hashable,
+        inductance: Basic | float) -> None:
+        self.add(ElementKind.INDUCTOR, name, node1, node2, inductance)
+
+    def add_voltage_source(self, name: str, node1: Hashable, node2: Hashable,
+        voltage: Basic | complex) -> None:
+        self.add(ElementKind.VOLTAGE_SOURCE, name, node1, node2, voltage)
+
+    def add_current_source(self, name: str, node1: Hashable, node2: Hashable,
+        current: Basic | complex) -> None:
+        self.add(ElementKind.CURRENT_SOURCE, name, node1, node2, current)
+
+    # Adds elements of the same kind at once. 'values' are array-like of numbers in canonical SI
+    # units, pair of array-like and unit, eg (capacitances, units.microfarad), or a single
+    # quantity for all elements. Units are checked once for all elements.
+    def add_elements(self, kind: ElementKind, names: Sequence[str], nodes1: Sequence[Hashable],
+        nodes2: Sequence[Hashable], values: ArrayLike | tuple[ArrayLike, Basic] | Basic) -> None:
+        np = import_numpy()
+        if not len(names) == len(nodes1) == len(nodes2):
+            raise ValueError(f"Names and nodes of elements should have the same length, got "
+                f"{len(names)}, {len(nodes1)} and {len(nodes2)}")
+        array = np.broadcast_to(
+            to_si_array(values, kind.dimension, kind.value, f"add_elements({kind.value})"),
+            (len(names),))
+        if kind == ElementKind.RESISTOR and np.any(array == 0):
+            raise ValueError("Resistance should not be zero, use zero voltage source instead")
+        duplicates = [n for n in names if n in self._names]
+        if duplicates or len(set(names)) != len(names):
+            raise ValueError(f"Element names should be unique, got duplicates {duplicates}")
+        self._names.update((n, i) for (i, n) in enumerate(names, len(self._names)))
+        self._kinds.extend([kind.value] * len(names))
+        self._nodes1.extend(self._node(n) for n in nodes1)
+        self._nodes2.extend(self._node(n) for n in nodes2)
+        self._values.extend(array.tolist())
+
+    # Columns of elements of the given kind.
+    # return - (element indices, node1 indices, node2 indices, values) arrays
+    def columns(self,
+        kind: ElementKind) -> tuple[NDArray[Any], NDArray[Any], NDArray[Any], NDArray[Any]]:
+        np = import_numpy()
+        kinds = np.asarray(self._kinds)
+        indices = np.flatnonzero(kinds == kind.value)
+        nodes1 = np.asarray(self._nodes1, dtype=np.intp)[indices]
+        nodes2 = np.asarray(self._nodes2, dtype=np.intp)[indices]
+        values = np.asarray(self._values)[indices] if indices.size else np.zeros(0)
+        # values of other kinds may be complex
+        if np.iscomplexobj(values) and not np.any(values.imag):
+            values = values.real
+        return (indices, nodes1, nodes2, values)
@@ -0,0 +1,163 @@
+"""
+This module describes two-terminal networks of components, connected in series and in parallel.
+
+Network impedance is calculated for whole arrays of circular frequencies at once. Impedances of
+components are calculated with batch versions of the impedance laws, see
+'capacitor_impedance_from_capacitance_and_frequency' and
+'coil_impedance_from_inductivity_and_frequency'. Serial impedances are summed, as in
+'resistivity_of_serial_resistors', and admittances of parallel branches are summed, as in
+'admittance_of_parallel_dipoles'.
+"""
+
+from __future__ import annotations
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any
+from sympy import Basic
+
+from ..core.batch import import_numpy, to_si_array
+from ..definitions import admittance_is_inversed_impedance as admittance_definition
+from ..laws.electricity import capacitor_impedance_from_capacitance_and_frequency as capacitor_law
+from ..laws.electricity import coil_impedance_from_inductivity_and_frequency as coil_law
+from .netlist import ElementKind
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+class Network:
+    """
+    Two-terminal network. Impedance is an array of complex numbers in ohms, one for each
+    circular frequency in radians per second.
+    """
+
+    @abstractmethod
+    def impedance(self, circular_frequencies: NDArray[Any]) -> NDArray[Any]:
+        pass
+
+    # Components of the network, in the order they were connected
+    @abstractmethod
+    def components(self) -> list[Component]:
+        pass
+
+
+class Component(Network):
+    """
+    Resistor, capacitor or inductor with the value in canonical SI units.
+    """
+
+    _kind: ElementKind
+    _value: float
+
+    def __init__(self, kind: ElementKind, value: Basic | float) -> None:
+        if kind not in (ElementKind.RESISTOR, ElementKind.CAPACITOR, ElementKind.INDUCTOR):
+            raise ValueError(f"Network component should be passive, got {kind.value}")
+        array = to_si_array(value, kind.dimension, kind.value, type(self).__name__)
+        if array.size != 1 or import_numpy().iscomplexobj(array):
+            raise ValueError(f"Value of {kind.value} should be a real number, got {value}")
+        self._kind = kind
+        self._value = float(array)
+
+    @property
+    def kind(self) -> ElementKind:
+        return self._kind
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def impedance(self, circular_frequencies: NDArray[Any]) -> NDArray[Any]:
+        np = import_numpy()
+        if self._kind == ElementKind.CAPACITOR:
+            return capacitor_law.calculate_impedance_batch(self._value, circular_frequencies)
+        if self._kind == ElementKind.INDUCTOR:
+            return coil_law.calculate_impedance_batch(self._value, circular_frequencies)
+        return np.full(np.shape(circular_frequencies), self._value, dtype=complex)
+
+    def components(self) -> list[Component]:
+        return [self]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._value})"
+
+
+class Resistor(Component):
+
+    def __init__(self, resistance: Basic | float) -> None:
+        super().__init__(ElementKind.RESISTOR, resistance)
+
+
+class Capacitor(Component):
+
+    def __init__(self, capacitance: Basic | float) -> None:
+        super().__init__(ElementKind.CAPACITOR, capacitance)
+
+
+class Inductor(Component):
+
+    def __init__(self, inductance: Basic | float) -> None:
+        super().__init__(ElementKind.INDUCTOR, inductance)
+
+
+class _Connection(Network):  # pylint: disable=abstract-method
+    _networks: tuple[Network, ...]
+
+    def __init__(self, *networks: Network) -> None:
+        if len(networks) == 0:
+            raise ValueError(f"{type(self).__name__} should connect at least one network")
+        self._networks = networks
+
+    @property
+    def networks(self) -> tuple[Network, ...]:
+        return self._networks
+
+    def components(self) -> list[Component]:
+        return [c for n in self._networks for c in n.components()]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(repr(n) for n in self._networks)})"
+
+
+class Series(_Connection):
+    """
+    Networks, connected in series. Impedance is the sum of impedances.
+    """
+
+    def impedance(self, circular_frequencies: NDArray[Any]) -> NDArray[Any]:
+        total = self._networks[0].impedance(circular_frequencies)
+        for n in self._networks[1:]:
+            total = total + n.impedance(circular_frequencies)
+        return total
+
+
+class Parallel(_Connection):
+    """
+    Networks, connected in parallel. Admittance is the sum of admittances.
+    """
+
+    def impedance(self, circular_frequencies: NDArray[Any]) -> NDArray[Any]:
+        np = import_numpy()
+        # shorted branches have infinite admittance and short the whole connection
+        with np.errstate(divide="ignore"):
+            admittances = [
+                admittance_definition.calculate_admittance_batch(n.impedance(circular_frequencies))
+                for n in self._networks
+            ]
+        total = admittances[0]
+        for a in admittances[1:]:
+            total = total + a
+        shorted = np.isinf(total)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = 1 / total
+        return np.where(shorted, 0, result)
+
+
+# Converts circular frequencies to the array in radians per second. Frequencies should be
+# positive, as capacitors have no finite impedance at DC.
+def to_circular_frequencies(circular_frequencies: ArrayLike | tuple[ArrayLike, Basic] | Basic,
+    function_name: str) -> NDArray[Any]:
+    np = import_numpy()
+    values = to_si_array(circular_frequencies, coil_law.circular_frequency.dimension,
+        "circular_frequencies", function_name)
+    if np.iscomplexobj(values) or not np.all(values > 0):
+        raise ValueError(f"Circular frequencies of {function_name}() should be positive numbers")
+    return values
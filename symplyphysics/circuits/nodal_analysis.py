@@ -0,0 +1,283 @@
+"""
+This module solves netlists with modified nodal analysis (MNA).
+
+Unknowns are voltages of all nodes except the ground and currents of elements, that fix voltage
+between their nodes: inductors and voltage sources. Each node gives Kirchhoff current equation,
+see 'sum_of_all_currents_through_an_electrical_node_is_zero', each inductor and voltage source
+gives the equation of its voltage. Resistors and capacitors are stamped with their admittances,
+see 'current_is_proportional_to_voltage' and 'capacitor_impedance_from_capacitance_and_frequency',
+inductors with their impedances, see 'coil_impedance_from_inductivity_and_frequency'. Impedances
+are calculated with batch versions of these laws, so all elements of a kind are handled at once.
+
+Circuit is solved for a single circular frequency. Zero frequency is DC analysis, where capacitors
+are open and inductors are shorted. Source values at non-zero frequency are complex phasors.
+
+The system is assembled as a sparse matrix and solved with SciPy sparse direct solver, if SciPy
+is installed. Otherwise, small circuits are solved with dense NumPy solver.
+"""
+
+from __future__ import annotations
+import importlib
+import warnings
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Hashable, Optional
+from sympy import Basic
+
+from ..core.batch import import_numpy, to_si_array
+from ..core.dimensions import si_unit
+from ..core.symbols.quantities import Quantity
+from ..laws.electricity import current_is_proportional_to_voltage as ohms_law
+from ..laws.electricity import capacitor_impedance_from_capacitance_and_frequency as capacitor_law
+from ..laws.electricity import coil_impedance_from_inductivity_and_frequency as coil_law
+from .netlist import ElementKind, Netlist
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Maximum number of unknowns, that are solved with dense solver when SciPy is not installed
+DENSE_SIZE_LIMIT = 2048
+
+
+# scipy is an optional dependency, dense solver is used without it
+def _import_sparse() -> Optional[tuple[ModuleType, ModuleType]]:
+    try:
+        return (importlib.import_module("scipy.sparse"),
+            importlib.import_module("scipy.sparse.linalg"))
+    except ImportError:
+        return None
+
+
+# return - 'scipy.sparse' and 'scipy.sparse.linalg' modules
+def import_sparse() -> tuple[ModuleType, ModuleType]:
+    sparse = _import_sparse()
+    if sparse is None:
+        raise ImportError("Sparse solver requires scipy. Install it with 'pip install .[sparse]'")
+    return sparse
+
+
+# Converts circular frequency to the number in radians per second
+def to_circular_frequency(circular_frequency: Basic | float, function_name: str) -> float:
+    value = to_si_array(circular_frequency, coil_law.circular_frequency.dimension,
+        "circular_frequency", function_name)
+    return float(value)
+
+
+class CircuitSolution:
+    """
+    Node voltages and element currents of the solved netlist. Values are numbers in canonical SI
+    units: volts and amperes, complex phasors for AC circuits. Element current flows from its
+    first node to the second one, see Element.
+    """
+
+    _netlist: Netlist
+    _circular_frequency: float
+    _node_voltages: NDArray[Any]
+    _element_currents: NDArray[Any]
+
+    def __init__(self, netlist: Netlist, circular_frequency: float, node_voltages: NDArray[Any],
+        element_currents: NDArray[Any]) -> None:
+        self._netlist = netlist
+        self._circular_frequency = circular_frequency
+        self._node_voltages = node_voltages
+        self._element_currents = element_currents
+
+    @property
+    def netlist(self) -> Netlist:
+        return self._netlist
+
+    @property
+    def circular_frequency(self) -> float:
+        return self._circular_frequency
+
+    # Voltages of nodes in the order of Netlist.nodes. Ground voltage is zero.
+    @property
+    def node_voltages(self) -> NDArray[Any]:
+        return self._node_voltages
+
+    # Currents through elements in the order of Netlist.names
+    @property
+    def element_currents(self) -> NDArray[Any]:
+        return self._element_currents
+
+    # Voltage of the node relative to the 'reference' node, ground by default
+    def voltage(self, node: Hashable, reference: Optional[Hashable] = None) -> Quantity:
+        value = self._node_voltages[self._netlist.node_index(node)]
+        if reference is not None:
+            value = value - self._node_voltages[self._netlist.node_index(reference)]
+        return Quantity(_to_number(value) * si_unit(ohms_law.voltage.dimension))
+
+    # Voltage between the first and the second node of the element
+    def element_voltage(self, name: str) -> Quantity:
+        element = self._netlist.element(name)
+        return self.voltage(element.node1, element.node2)
+
+    def current(self, name: str) -> Quantity:
+        value = self._element_currents[self._netlist.element_index(name)]
+        return Quantity(_to_number(value) * si_unit(ohms_law.current.dimension))
+
+
+def _to_number(value: Any) -> complex:
+    value = complex(value)
+    return value.real if value.imag == 0 else value
+
+
+# Square matrix of the system of linear equations in triplet form: row indices, column indices
+# and values. Entries with the same indices are summed. Unknowns of ground are not in the system,
+# entries with negative indices are dropped.
+class TripletMatrix:
+    _size: int
+    _rows: list[NDArray[Any]]
+    _columns: list[NDArray[Any]]
+    _values: list[NDArray[Any]]
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._rows = []
+        self._columns = []
+        self._values = []
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def add(self, rows: NDArray[Any], columns: NDArray[Any], values: Any) -> None:
+        np = import_numpy()
+        (rows, columns, values) = np.broadcast_arrays(rows, columns, values)
+        mask = (rows >= 0) & (columns >= 0)
+        self._rows.append(rows[mask])
+        self._columns.append(columns[mask])
+        self._values.append(values[mask])
+
+    # return - (row indices, column indices, values) arrays
+    def triplets(self) -> tuple[NDArray[Any], NDArray[Any], NDArray[Any]]:
+        np = import_numpy()
+        if not self._rows:
+            return (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp), np.zeros(0))
+        return (np.concatenate(self._rows), np.concatenate(self._columns),
+            np.concatenate(self._values))
+
+    # Sum of this matrix and the other one, multiplied by 'factor'
+    def combine(self, other: TripletMatrix, factor: Any) -> TripletMatrix:
+        result = TripletMatrix(self._size)
+        (rows, columns, values) = self.triplets()
+        result.add(rows, columns, values)
+        (rows, columns, values) = other.triplets()
+        result.add(rows, columns, values * factor)
+        return result
+
+    def to_dense(self) -> NDArray[Any]:
+        np = import_numpy()
+        (rows, columns, values) = self.triplets()
+        matrix = np.zeros((self._size, self._size), dtype=values.dtype)
+        np.add.at(matrix, (rows, columns), values)
+        return matrix
+
+    # Compressed sparse column matrix, requires scipy
+    def to_sparse(self) -> Any:
+        (scipy_sparse, _) = import_sparse()
+        (rows, columns, values) = self.triplets()
+        return scipy_sparse.csc_matrix((values, (rows, columns)), shape=(self._size, self._size))
+
+
+# Adds values to the vector, eg right-hand side of the system. Negative indices of ground are
+# dropped.
+def add_to_vector(vector: NDArray[Any], rows: NDArray[Any], values: NDArray[Any]) -> None:
+    np = import_numpy()
+    mask = rows >= 0
+    np.add.at(vector, rows[mask], values[mask])
+
+
+# Raises ImportError if the system is too large for the dense solver and scipy is not installed
+def assert_solvable(size: int) -> None:
+    if size > DENSE_SIZE_LIMIT and _import_sparse() is None:
+        raise ImportError(f"Circuits with more than {DENSE_SIZE_LIMIT} unknowns require "
+            "scipy. Install it with 'pip install .[sparse]'")
+
+
+def solve_linear(matrix: TripletMatrix, rhs: NDArray[Any]) -> NDArray[Any]:
+    np = import_numpy()
+    if matrix.size == 0:
+        return np.zeros(0, dtype=rhs.dtype)
+    assert_solvable(matrix.size)
+    if _import_sparse() is not None:
+        (_, scipy_linalg) = import_sparse()
+        # singular matrix is reported with warning and NaN solution
+        with warnings.catch_warnings(), np.errstate(all="ignore"):
+            warnings.simplefilter("ignore")
+            solution = np.atleast_1d(scipy_linalg.spsolve(matrix.to_sparse(), rhs))
+        if not np.all(np.isfinite(solution)):
+            raise ValueError(SINGULAR_MESSAGE)
+        return solution
+    try:
+        return np.linalg.solve(matrix.to_dense(), rhs)
+    except np.linalg.LinAlgError as e:
+        raise ValueError(SINGULAR_MESSAGE) from e
+
+
+SINGULAR_MESSAGE = ("Circuit has no unique solution. Check that every node is connected to the "
+    "ground, and there are no loops of voltage sources and inductors, or cuts of current sources "
+    "and capacitors.")
+
+
+# Solves the netlist at the given circular frequency, eg Quantity(100 * units.radian /
+# units.second) or a number in radians per second. Zero frequency is DC analysis.
+def solve_circuit(netlist: Netlist, circular_frequency: Basic | float = 0) -> CircuitSolution:
+    np = import_numpy()
+    omega = to_circular_frequency(circular_frequency, "solve_circuit")
+    (resistors, r1, r2, resistances) = netlist.columns(ElementKind.RESISTOR)
+    (capacitors, c1, c2, capacitances) = netlist.columns(ElementKind.CAPACITOR)
+    (inductors, l1, l2, inductances) = netlist.columns(ElementKind.INDUCTOR)
+    (voltage_sources, v1, v2, voltages) = netlist.columns(ElementKind.VOLTAGE_SOURCE)
+    (current_sources, i1, i2, currents) = netlist.columns(ElementKind.CURRENT_SOURCE)
+
+    # capacitors are open at DC
+    if omega == 0:
+        (capacitors, c1, c2, capacitances) = (capacitors[:0], c1[:0], c2[:0], capacitances[:0])
+    capacitor_impedances = capacitor_law.calculate_impedance_batch(capacitances, omega)
+    inductor_impedances = coil_law.calculate_impedance_batch(inductances, omega)
+
+    # Unknown index is node index - 1, ground has no unknown and is mapped to -1
+    nodes_count = len(netlist.nodes) - 1
+    matrix = TripletMatrix(nodes_count + len(inductors) + len(voltage_sources))
+    rhs = np.zeros(matrix.size, dtype=complex)
+
+    # Admittances of resistors and capacitors
+    admittance_nodes1 = np.concatenate([r1, c1]) - 1
+    admittance_nodes2 = np.concatenate([r2, c2]) - 1
+    admittances = np.concatenate([1 / resistances, 1 / capacitor_impedances])
+    matrix.add(admittance_nodes1, admittance_nodes1, admittances)
+    matrix.add(admittance_nodes2, admittance_nodes2, admittances)
+    matrix.add(admittance_nodes1, admittance_nodes2, -admittances)
+    matrix.add(admittance_nodes2, admittance_nodes1, -admittances)
+
+    # Branch currents of inductors and voltage sources leave their first node and enter the
+    # second one. Voltage between nodes is the impedance drop, or the source voltage.
+    branches = np.arange(nodes_count, matrix.size)
+    branch_nodes1 = np.concatenate([l1, v1]) - 1
+    branch_nodes2 = np.concatenate([l2, v2]) - 1
+    matrix.add(branch_nodes1, branches, 1)
+    matrix.add(branch_nodes2, branches, -1)
+    matrix.add(branches, branch_nodes1, 1)
+    matrix.add(branches, branch_nodes2, -1)
+    matrix.add(branches, branches, -np.concatenate([inductor_impedances,
+        np.zeros(len(voltage_sources))]))
+    add_to_vector(rhs, branches[len(inductors):], voltages)
+
+    # Current sources drive current out of their first node into the second one
+    add_to_vector(rhs, i1 - 1, -currents)
+    add_to_vector(rhs, i2 - 1, currents)
+
+    solution = solve_linear(matrix, rhs)
+    node_voltages = np.concatenate([np.zeros(1, dtype=complex), solution[:nodes_count]])
+    element_currents = np.zeros(len(netlist), dtype=complex)
+    element_currents[resistors] = ohms_law.calculate_current_batch(
+        node_voltages[r1] - node_voltages[r2], resistances)
+    element_currents[capacitors] = ohms_law.calculate_current_batch(
+        node_voltages[c1] - node_voltages[c2], capacitor_impedances)
+    element_currents[inductors] = solution[nodes_count:nodes_count + len(inductors)]
+    element_currents[voltage_sources] = solution[nodes_count + len(inductors):]
+    element_currents[current_sources] = currents
+    # DC circuits with real sources have real solution
+    if omega == 0 and not np.iscomplexobj(voltages) and not np.iscomplexobj(currents):
+        (node_voltages, element_currents) = (node_voltages.real, element_currents.real)
+    return CircuitSolution(netlist, omega, node_voltages, element_currents)
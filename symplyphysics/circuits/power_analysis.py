@@ -0,0 +1,193 @@
+"""
+This module analyzes power of AC circuits from streams of sampled voltage and current.
+
+Samples arrive in blocks of any size at the declared sample rate, eg blocks of a meter, and are
+aggregated over consecutive windows of the fixed number of samples, eg 10 cycles of the line
+frequency. Samples of the incomplete window are kept in buffers of the window size, so that
+memory does not depend on the length of the stream. Each window gives:
+* RMS voltage and current, square roots of mean squares of samples,
+* active power, the mean of instantaneous power, see 'power_is_proportional_voltage_and_current',
+* apparent power, the product of RMS voltage and current, see the same law,
+* reactive power, sqrt(S^2 - P^2) for apparent power S and active power P, that also includes
+  power of harmonics, as there is no single phase shift for distorted waveforms,
+* power factor, see 'power_factor_from_active_and_full_power'.
+
+Energy is accumulated as the integral of instantaneous power over all samples. RMS values are
+defined so that resistive loads dissipate the same power as with DC of the same value, see
+'dissipated_heat_power_is_proportional_to_current_square' and
+'amount_energy_from_voltage_time_resistance'.
+"""
+
+from __future__ import annotations
+import math
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+from sympy import Basic
+from sympy.physics import units
+
+from ..core.batch import import_numpy, to_si_array
+from ..laws.electricity import power_factor_from_active_and_full_power as power_factor_law
+from ..laws.electricity import power_is_proportional_voltage_and_current as power_law
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# Block of samples: voltages and currents of the same length, array-like of numbers in canonical
+# SI units, pairs of array-like and unit, eg (samples, units.millivolt), or quantities
+Block = tuple[Any, Any]
+
+# Power of windows, completed by the block of samples. Fields are arrays with one value for each
+# window, in canonical SI units: 'times' are ends of windows from the start of the stream,
+# 'energy' is the energy accumulated from the start of the stream to the end of the window.
+PowerWindows = namedtuple("PowerWindows", [
+    "times", "rms_voltage", "rms_current", "active_power", "apparent_power", "reactive_power",
+    "power_factor", "energy"
+])
+
+
+class PowerAnalyzer:
+    """
+    Streaming power analyzer. Blocks of samples are passed to update() or stream(), windows
+    are completed as soon as they have 'window' samples.
+    """
+
+    _sample_rate: float
+    _window: int
+    # Samples of the incomplete window
+    _voltages: NDArray[Any]
+    _currents: NDArray[Any]
+    _pending: int
+    _windows: int
+    _energy: float
+
+    def __init__(self, sample_rate: Basic | float, window: int) -> None:
+        np = import_numpy()
+        rate = to_si_array(sample_rate, units.frequency, "sample_rate", "PowerAnalyzer")
+        if rate.size != 1 or np.iscomplexobj(rate):
+            raise ValueError(f"Sample rate should be a number, got {sample_rate}")
+        self._sample_rate = float(rate)
+        if not math.isfinite(self._sample_rate) or self._sample_rate <= 0:
+            raise ValueError(f"Sample rate should be a positive number, got {sample_rate}")
+        if int(window) != window or window < 1:
+            raise ValueError(f"Window should be a positive number of samples, got {window}")
+        self._window = int(window)
+        self._voltages = np.empty(self._window)
+        self._currents = np.empty(self._window)
+        self.reset()
+
+    # Sample rate in hertz
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    # Number of samples in the window
+    @property
+    def window(self) -> int:
+        return self._window
+
+    # Number of samples, that were analyzed
+    @property
+    def samples(self) -> int:
+        return self._windows * self._window + self._pending
+
+    # Energy in joules, accumulated from the start of the stream, including the incomplete window
+    @property
+    def energy(self) -> float:
+        np = import_numpy()
+        pending = np.dot(self._voltages[:self._pending], self._currents[:self._pending])
+        return self._energy + float(pending) / self._sample_rate
+
+    # Starts the new stream
+    def reset(self) -> None:
+        self._pending = 0
+        self._windows = 0
+        self._energy = 0.0
+
+    # Analyzes the block of samples.
+    # return - power of windows, completed by the block
+    def update(self, voltages: ArrayLike | tuple[ArrayLike, Basic] | Basic,
+        currents: ArrayLike | tuple[ArrayLike, Basic] | Basic) -> PowerWindows:
+        np = import_numpy()
+        voltages = to_si_array(voltages, power_law.voltage.dimension, "voltages",
+            "PowerAnalyzer.update")
+        currents = to_si_array(currents, power_law.current.dimension, "currents",
+            "PowerAnalyzer.update")
+        if voltages.ndim != 1 or voltages.shape != currents.shape:
+            raise ValueError(f"Voltages and currents should be one-dimensional arrays of the "
+                f"same length, got shapes {voltages.shape} and {currents.shape}")
+        if np.iscomplexobj(voltages) or np.iscomplexobj(currents):
+            raise ValueError("Samples of voltages and currents should be real numbers")
+        window = self._window
+        sums = []
+        # complete the window, that was started by previous blocks
+        start = 0
+        if self._pending > 0:
+            start = min(window - self._pending, len(voltages))
+            self._voltages[self._pending:self._pending + start] = voltages[:start]
+            self._currents[self._pending:self._pending + start] = currents[:start]
+            self._pending += start
+            if self._pending == window:
+                sums.append(_window_sums(self._voltages[None, :], self._currents[None, :]))
+                self._pending = 0
+        count = (len(voltages) - start) // window
+        end = start + count * window
+        sums.append(
+            _window_sums(voltages[start:end].reshape(count, window),
+            currents[start:end].reshape(count, window)))
+        if end < len(voltages):
+            self._pending = len(voltages) - end
+            self._voltages[:self._pending] = voltages[end:]
+            self._currents[:self._pending] = currents[end:]
+        return self._power(np.concatenate(sums, axis=1))
+
+    # Analyzes blocks of samples, eg generator of blocks of the meter, as they arrive.
+    # return - generator of power of windows, completed by each block
+    def stream(self, blocks: Iterable[Block]) -> Iterator[PowerWindows]:
+        for (voltages, currents) in blocks:
+            yield self.update(voltages, currents)
+
+    # 'sums' - sums of squares of voltages, squares of currents and instantaneous powers of
+    # completed windows
+    def _power(self, sums: NDArray[Any]) -> PowerWindows:
+        np = import_numpy()
+        (squared_voltages, squared_currents, active_power) = sums / self._window
+        rms_voltage = np.sqrt(squared_voltages)
+        rms_current = np.sqrt(squared_currents)
+        apparent_power = power_law.calculate_power_batch(rms_current, rms_voltage)
+        # apparent power is never less than active one, except for rounding errors
+        reactive_power = np.sqrt(np.maximum(apparent_power**2 - active_power**2, 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            power_factor = power_factor_law.calculate_power_factor_batch(active_power,
+                apparent_power)
+        duration = self._window / self._sample_rate
+        energy = self._energy + np.cumsum(active_power) * duration
+        if len(energy) > 0:
+            self._energy = float(energy[-1])
+        times = (self._windows + np.arange(1, len(energy) + 1)) * duration
+        self._windows += len(energy)
+        return PowerWindows(times, rms_voltage, rms_current, active_power, apparent_power,
+            reactive_power, power_factor, energy)
+
+
+# return - (3, windows) array of sums of squared voltages, squared currents and instantaneous
+# powers of each window, see 'power_is_proportional_voltage_and_current'
+def _window_sums(voltages: NDArray[Any], currents: NDArray[Any]) -> NDArray[Any]:
+    np = import_numpy()
+    return np.stack([
+        np.einsum("ij,ij->i", voltages, voltages),
+        np.einsum("ij,ij->i", currents, currents),
+        np.einsum("ij,ij->i", voltages, currents),
+    ])
+
+
+# Analyzes all blocks of samples at 'sample_rate', eg Quantity(10 * units.kilohertz) or a number
+# in hertz, with windows of 'window' samples. Samples of the last incomplete window are not
+# included in the result.
+# return - power of all completed windows
+def analyze_power(blocks: Iterable[Block], sample_rate: Basic | float,
+    window: int) -> PowerWindows:
+    np = import_numpy()
+    analyzer = PowerAnalyzer(sample_rate, window)
+    empty = np.empty(0)
+    results = [analyzer.update(empty, empty), *analyzer.stream(blocks)]
+    return PowerWindows(*(np.concatenate(f) for f in zip(*results)))
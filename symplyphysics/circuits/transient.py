@@ -0,0 +1,464 @@
+"""
+This module simulates transients of circuits in time domain.
+
+Netlist is described with the system of differential-algebraic equations G * x + C * dx/dt = b(t),
+where unknowns x are voltages of nodes and currents of capacitors, inductors and voltage sources.
+Each node gives Kirchhoff current equation, see
+'sum_of_all_currents_through_an_electrical_node_is_zero'. Capacitor current is the derivative of
+its charge, see 'current_is_charge_derivative', inductor voltage is proportional to the derivative
+of its current, see 'self_induction_voltage_from_current_derivative'. Right-hand side b(t) is
+built from source waveforms: constant values of the netlist, or functions of time.
+
+The system is integrated with implicit methods, that are stable for stiff circuits:
+* backward Euler method is first order accurate and damps all oscillations,
+* trapezoidal method is second order accurate and keeps oscillations of LC circuits.
+
+Fixed step integration of small circuits propagates the state by blocks of steps with matrix
+products, so that millions of steps are simulated without a Python loop per step. Adaptive
+integration compares trapezoidal steps with pairs of half steps to estimate their error.
+
+Initial state is consistent with sources: capacitors have initial voltages and inductors have
+initial currents, zero by default, and the rest of unknowns are solved from algebraic equations.
+States are written to output buffers, that are preallocated for all steps.
+"""
+
+from __future__ import annotations
+import math
+from enum import Enum, unique
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Mapping, Optional, TypeAlias
+from sympy import Basic
+
+from ..core.batch import import_numpy, to_si_array
+from ..laws.electricity import current_is_proportional_to_voltage as ohms_law
+from ..laws.electricity.circuits import resistor_and_capacitor_as_integrator_node as rc_law
+from .netlist import ElementKind, Netlist
+from .nodal_analysis import (SINGULAR_MESSAGE, TripletMatrix, assert_solvable, import_sparse,
+    solve_linear)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Source waveform: constant number in canonical SI units, quantity, or function of the array of
+# times in seconds, eg 'lambda t: 5 * np.sin(100 * t)'
+Waveform: TypeAlias = float | Basic | Callable[[Any], Any]
+
+# Circuits with more unknowns are integrated with sparse LU factorization, if scipy is installed
+DENSE_STEP_LIMIT = 256
+# Number of steps in the block, propagated with a single matrix product, times number of unknowns
+_BLOCK_SIZE = 256
+# Number of steps, that are propagated at once. Limits the memory of temporary arrays.
+_CHUNK_STEPS = 1 << 16
+
+
+@unique
+class Integrator(Enum):
+    BACKWARD_EULER = "backward_euler"
+    TRAPEZOIDAL = "trapezoidal"
+
+
+def _to_seconds(value: Basic | float, param_name: str, function_name: str) -> float:
+    array = to_si_array(value, rc_law.time.dimension, param_name, function_name)
+    if array.size != 1 or import_numpy().iscomplexobj(array):
+        raise ValueError(f"{param_name} of {function_name}() should be a number, got {value}")
+    seconds = float(array)
+    if not math.isfinite(seconds) or seconds <= 0:
+        raise ValueError(f"{param_name} of {function_name}() should be a positive number, "
+            f"got {value}")
+    return seconds
+
+
+# Waveforms of sources. 'defaults' are netlist values of sources by element index. Constant
+# waveforms are numbers in canonical SI units.
+def _resolve_waveforms(netlist: Netlist, defaults: Mapping[int, float],
+    waveforms: Mapping[str, Waveform]) -> list[Waveform]:
+    names = netlist.names
+    unknown = set(waveforms) - {names[e] for e in defaults}
+    if unknown:
+        raise ValueError(f"Waveforms should be set for voltage and current sources of the "
+            f"netlist, got {unknown}")
+    result: list[Waveform] = []
+    for (e, value) in defaults.items():
+        waveform = waveforms.get(names[e], value)
+        if not callable(waveform):
+            dimension = netlist.element(names[e]).kind.dimension
+            waveform = float(to_si_array(waveform, dimension, names[e], "waveforms"))
+        result.append(waveform)
+    return result
+
+
+# System G * x + C * dx/dt = S * s(t) of the netlist, where s(t) are the values of sources
+class _Descriptor:  # pylint: disable=too-many-instance-attributes
+    size: int
+    # Columns of capacitors, inductors and voltage sources in states, by element index
+    branches: dict[int, int]
+    # Columns of voltage and current sources in source values, by element index
+    sources: dict[int, int]
+    conductance: TripletMatrix
+    storage: TripletMatrix
+    # Conductance with equations of capacitors and inductors, replaced with their initial state
+    initial: TripletMatrix
+    placement: NDArray[Any]
+    _initial_rows: dict[int, int]
+    _waveforms: list[Waveform]
+
+    def __init__(self, netlist: Netlist, waveforms: Mapping[str, Waveform]) -> None:
+        np = import_numpy()
+        (_, r1, r2, resistances) = netlist.columns(ElementKind.RESISTOR)
+        (capacitors, c1, c2, capacitances) = netlist.columns(ElementKind.CAPACITOR)
+        (inductors, l1, l2, inductances) = netlist.columns(ElementKind.INDUCTOR)
+        (voltage_sources, v1, v2, voltages) = netlist.columns(ElementKind.VOLTAGE_SOURCE)
+        (current_sources, i1, i2, currents) = netlist.columns(ElementKind.CURRENT_SOURCE)
+        if np.iscomplexobj(voltages) or np.iscomplexobj(currents):
+            raise ValueError("Sources of transient simulation should have real values")
+
+        # Unknown index is node index - 1, ground has no unknown and is mapped to -1
+        nodes_count = len(netlist.nodes) - 1
+        branch_elements = np.concatenate([capacitors, inductors, voltage_sources])
+        self.size = nodes_count + len(branch_elements)
+        branches = np.arange(nodes_count, self.size)
+        self.branches = dict(zip(branch_elements.tolist(), branches.tolist()))
+        (capacitor_rows, inductor_rows, source_rows) = np.split(branches,
+            [len(capacitors), len(capacitors) + len(inductors)])
+
+        self.conductance = TripletMatrix(self.size)
+        self.storage = TripletMatrix(self.size)
+        self.initial = TripletMatrix(self.size)
+        for matrix in (self.conductance, self.initial):
+            conductances = 1 / resistances
+            matrix.add(r1 - 1, r1 - 1, conductances)
+            matrix.add(r2 - 1, r2 - 1, conductances)
+            matrix.add(r1 - 1, r2 - 1, -conductances)
+            matrix.add(r2 - 1, r1 - 1, -conductances)
+            # Branch currents leave their first node and enter the second one
+            matrix.add(np.concatenate([c1, l1, v1]) - 1, branches, 1.0)
+            matrix.add(np.concatenate([c2, l2, v2]) - 1, branches, -1.0)
+            # Voltage sources fix voltage between their nodes
+            matrix.add(source_rows, v1 - 1, 1.0)
+            matrix.add(source_rows, v2 - 1, -1.0)
+        # Capacitors: C * d(v1 - v2)/dt - i = 0
+        self.conductance.add(capacitor_rows, capacitor_rows, -1.0)
+        self.storage.add(capacitor_rows, c1 - 1, capacitances)
+        self.storage.add(capacitor_rows, c2 - 1, -capacitances)
+        # Inductors: v1 - v2 - L * di/dt = 0
+        self.conductance.add(inductor_rows, l1 - 1, 1.0)
+        self.conductance.add(inductor_rows, l2 - 1, -1.0)
+        self.storage.add(inductor_rows, inductor_rows, -inductances)
+        # Initial state: v1 - v2 = initial voltage of capacitor, i = initial current of inductor
+        self.initial.add(capacitor_rows, c1 - 1, 1.0)
+        self.initial.add(capacitor_rows, c2 - 1, -1.0)
+        self.initial.add(inductor_rows, inductor_rows, 1.0)
+        self._initial_rows = dict(
+            zip(np.concatenate([capacitors, inductors]).tolist(),
+            np.concatenate([capacitor_rows, inductor_rows]).tolist()))
+
+        # Voltage sources are right-hand sides of their equations, current sources drive current
+        # out of their first node into the second one
+        source_elements = np.concatenate([voltage_sources, current_sources])
+        self.sources = {e: i for (i, e) in enumerate(source_elements.tolist())}
+        self.placement = np.zeros((self.size, len(source_elements)))
+        self.placement[source_rows, np.arange(len(voltage_sources))] = 1.0
+        current_columns = np.arange(len(voltage_sources), len(source_elements))
+        for (nodes, sign) in ((i1, -1.0), (i2, 1.0)):
+            mask = nodes > 0
+            self.placement[nodes[mask] - 1, current_columns[mask]] = sign
+
+        values = np.concatenate([voltages, currents])
+        defaults = dict(zip(source_elements.tolist(), values.tolist()))
+        self._waveforms = _resolve_waveforms(netlist, defaults, waveforms)
+
+    # return - (len(times), sources) array of source values
+    def source_values(self, times: NDArray[Any]) -> NDArray[Any]:
+        np = import_numpy()
+        values = np.empty((len(times), len(self._waveforms)))
+        for (i, waveform) in enumerate(self._waveforms):
+            values[:, i] = waveform(times) if callable(waveform) else waveform
+        return values
+
+    # Solves algebraic equations of the initial state. 'initial_conditions' are voltages of
+    # capacitors and currents of inductors by name.
+    def initial_state(self, netlist: Netlist, source_values: NDArray[Any],
+        initial_conditions: Mapping[str, float | Basic]) -> NDArray[Any]:
+        np = import_numpy()
+        rhs = self.placement @ source_values
+        for (name, value) in initial_conditions.items():
+            index = netlist.element_index(name)
+            row = self._initial_rows.get(index)
+            if row is None:
+                raise ValueError(f"Initial conditions should be set for capacitors and "
+                    f"inductors, got '{name}'")
+            kind = netlist.element(name).kind
+            dimension = (ohms_law.voltage.dimension
+                if kind == ElementKind.CAPACITOR else ohms_law.current.dimension)
+            rhs[row] = float(to_si_array(value, dimension, name, "initial_conditions"))
+        return np.asarray(solve_linear(self.initial, rhs), dtype=float)
+
+
+class TransientSolution:
+    """
+    States of the circuit at simulated times. Values are numbers in canonical SI units: seconds,
+    volts and amperes. Element current flows from its first node to the second one, see Element.
+    """
+
+    _netlist: Netlist
+    _times: NDArray[Any]
+    _states: NDArray[Any]
+    _source_values: NDArray[Any]
+    _descriptor: _Descriptor
+
+    def __init__(self, netlist: Netlist, descriptor: _Descriptor, times: NDArray[Any],
+        states: NDArray[Any], source_values: NDArray[Any]) -> None:
+        self._netlist = netlist
+        self._descriptor = descriptor
+        self._times = times
+        self._states = states
+        self._source_values = source_values
+
+    @property
+    def netlist(self) -> Netlist:
+        return self._netlist
+
+    @property
+    def times(self) -> NDArray[Any]:
+        return self._times
+
+    # Voltages of the node relative to the 'reference' node, ground by default
+    def voltages(self, node: Hashable, reference: Optional[Hashable] = None) -> NDArray[Any]:
+        np = import_numpy()
+        index = self._netlist.node_index(node)
+        result = self._states[:, index - 1] if index > 0 else np.zeros(len(self._times))
+        if reference is not None:
+            result = result - self.voltages(reference)
+        return result
+
+    # Voltages between the first and the second node of the element
+    def element_voltages(self, name: str) -> NDArray[Any]:
+        element = self._netlist.element(name)
+        return self.voltages(element.node1, element.node2)
+
+    def currents(self, name: str) -> NDArray[Any]:
+        index = self._netlist.element_index(name)
+        element = self._netlist.element(name)
+        if element.kind == ElementKind.RESISTOR:
+            return ohms_law.calculate_current_batch(self.element_voltages(name), element.value)
+        if element.kind == ElementKind.CURRENT_SOURCE:
+            return self._source_values[:, self._descriptor.sources[index]]
+        return self._states[:, self._descriptor.branches[index]]
+
+
+# Linear system G + alpha * C, factorized for repeated solutions
+class _Stepper:
+    _dense: bool
+    _conductance: Any
+    _storage: Any
+    _placement: NDArray[Any]
+
+    def __init__(self, descriptor: _Descriptor) -> None:
+        self._dense = descriptor.size <= DENSE_STEP_LIMIT
+        if not self._dense:
+            assert_solvable(descriptor.size)
+            # large systems are solved with dense solver only if scipy is not installed
+            try:
+                import_sparse()
+            except ImportError:
+                self._dense = True
+        convert = ((lambda m: m.to_dense().astype(float)) if self._dense else
+            (lambda m: m.to_sparse().astype(float)))
+        self._conductance = convert(descriptor.conductance)
+        self._storage = convert(descriptor.storage)
+        self._placement = descriptor.placement
+
+    @property
+    def dense(self) -> bool:
+        return self._dense
+
+    @property
+    def placement(self) -> NDArray[Any]:
+        return self._placement
+
+    # return - function, that solves (G + alpha * C) * x = rhs
+    def factorize(self, alpha: float) -> Callable[[NDArray[Any]], NDArray[Any]]:
+        np = import_numpy()
+        matrix = self._conductance + alpha * self._storage
+        if self._dense:
+            try:
+                inverse = np.linalg.inv(matrix)
+            except np.linalg.LinAlgError as e:
+                raise ValueError(SINGULAR_MESSAGE) from e
+            return lambda rhs: inverse @ rhs
+        (_, scipy_linalg) = import_sparse()
+        try:
+            lu = scipy_linalg.splu(matrix.tocsc())
+        except RuntimeError as e:
+            raise ValueError(SINGULAR_MESSAGE) from e
+        return lu.solve
+
+    # Single trapezoidal step of 'step' seconds from 'state' with sources 'start' and 'end'
+    def trapezoidal(self, state: NDArray[Any], step: float, start: NDArray[Any],
+        end: NDArray[Any]) -> NDArray[Any]:
+        rhs = self._storage @ state * (2 / step) - self._conductance @ state
+        return self.solve(2 / step, rhs + self._placement @ (start + end))
+
+    # Solves (G + alpha * C) * x = rhs without keeping factorization, for steps that change
+    def solve(self, alpha: float, rhs: NDArray[Any]) -> NDArray[Any]:
+        np = import_numpy()
+        if not self._dense:
+            return self.factorize(alpha)(rhs)
+        try:
+            return np.linalg.solve(self._conductance + alpha * self._storage, rhs)
+        except np.linalg.LinAlgError as e:
+            raise ValueError(SINGULAR_MESSAGE) from e
+
+    # Matrices of the step x[n + 1] = inverse(A) * (M * x[n] + S * u[n]), where u are sources of
+    # the step: s[n + 1] for backward Euler method, s[n] + s[n + 1] for trapezoidal method.
+    # return - (alpha, M) for A = G + alpha * C
+    def step_matrices(self, integrator: Integrator, step: float) -> tuple[float, Any]:
+        if integrator == Integrator.BACKWARD_EULER:
+            return (1 / step, self._storage / step)
+        return (2 / step, self._storage * (2 / step) - self._conductance)
+
+
+def _step_sources(integrator: Integrator, source_values: NDArray[Any], start: int,
+    end: int) -> NDArray[Any]:
+    if integrator == Integrator.BACKWARD_EULER:
+        return source_values[start + 1:end + 1]
+    return source_values[start + 1:end + 1] + source_values[start:end]
+
+
+# Propagates states of small circuits by blocks of steps. Inside the block, state after k + 1
+# steps is x[n + k + 1] = K^(k + 1) * x[n] + sum(K^(k - j) * U[n + j], j <= k), where
+# K = inverse(A) * M and U = inverse(A) * S * u. Sums for all blocks are a single matrix product,
+# only block starts are propagated one by one.
+def _propagate_dense(stepper: _Stepper, integrator: Integrator, step: float,
+    source_values: NDArray[Any], states: NDArray[Any]) -> None:
+    np = import_numpy()
+    size = states.shape[1]
+    (alpha, step_matrix) = stepper.step_matrices(integrator, step)
+    solve = stepper.factorize(alpha)
+    transition = solve(step_matrix)
+    injection = solve(stepper.placement)
+    block = max(1, _BLOCK_SIZE // size)
+    powers = np.empty((block + 1, size, size))
+    powers[0] = np.eye(size)
+    for k in range(1, block + 1):
+        powers[k] = transition @ powers[k - 1]
+    # block lower triangular matrix of K^(k - j)
+    accumulation = np.zeros((block * size, block * size))
+    for k in range(block):
+        for j in range(k + 1):
+            accumulation[k * size:(k + 1) * size, j * size:(j + 1) * size] = powers[k - j]
+    # K^(k + 1) for all k, stacked by rows
+    growth = powers[1:].reshape(block * size, size)
+    steps = len(states) - 1
+    chunk = max(block, _CHUNK_STEPS // block * block)
+    for start in range(0, steps, chunk):
+        count = min(chunk, steps - start)
+        blocks = -(-count // block)
+        inputs = np.zeros((blocks * block, size))
+        inputs[:count] = _step_sources(integrator, source_values, start,
+            start + count) @ injection.T
+        sums = inputs.reshape(blocks, block * size) @ accumulation.T
+        starts = np.empty((blocks, size))
+        x = states[start]
+        for b in range(blocks):
+            starts[b] = x
+            x = powers[block] @ x + sums[b, -size:]
+        result = (starts @ growth.T + sums).reshape(blocks * block, size)
+        states[start + 1:start + 1 + count] = result[:count]
+
+
+def _propagate_sparse(stepper: _Stepper, integrator: Integrator, step: float,
+    source_values: NDArray[Any], states: NDArray[Any]) -> None:
+    (alpha, step_matrix) = stepper.step_matrices(integrator, step)
+    solve = stepper.factorize(alpha)
+    steps = len(states) - 1
+    for start in range(0, steps, _CHUNK_STEPS):
+        end = min(steps, start + _CHUNK_STEPS)
+        inputs = _step_sources(integrator, source_values, start, end) @ stepper.placement.T
+        for n in range(start, end):
+            states[n + 1] = solve(step_matrix @ states[n] + inputs[n - start])
+
+
+# Simulates the netlist for 'duration' with fixed 'step', eg Quantity(1 * units.millisecond) or
+# a number in seconds. 'waveforms' are source values by name, netlist values by default.
+# 'initial_conditions' are voltages of capacitors and currents of inductors by name, zero by
+# default.
+def simulate_transient(netlist: Netlist,  # pylint: disable=too-many-arguments
+    duration: Basic | float,
+    step: Basic | float,
+    *,
+    integrator: Integrator = Integrator.TRAPEZOIDAL,
+    waveforms: Optional[Mapping[str, Waveform]] = None,
+    initial_conditions: Optional[Mapping[str, float | Basic]] = None) -> TransientSolution:
+    np = import_numpy()
+    duration = _to_seconds(duration, "duration", "simulate_transient")
+    step = _to_seconds(step, "step", "simulate_transient")
+    steps = max(1, math.ceil(duration / step - 1e-9))
+    times = np.arange(steps + 1) * step
+    descriptor = _Descriptor(netlist, waveforms or {})
+    source_values = descriptor.source_values(times)
+    states = np.empty((steps + 1, descriptor.size))
+    states[0] = descriptor.initial_state(netlist, source_values[0], initial_conditions or {})
+    if descriptor.size > 0:
+        stepper = _Stepper(descriptor)
+        propagate = _propagate_dense if stepper.dense else _propagate_sparse
+        propagate(stepper, integrator, step, source_values, states)
+    return TransientSolution(netlist, descriptor, times, states, source_values)
+
+
+# Simulates the netlist for 'duration' with adaptive step. Each step is taken with trapezoidal
+# method twice: as a single step and as two half steps. Trapezoidal method is second order
+# accurate, so the error of half steps is a third of their difference with the single step.
+# Error of every unknown should be less than 'absolute_tolerance' + 'relative_tolerance' *
+# abs(value). See simulate_transient() for 'waveforms' and 'initial_conditions'.
+def simulate_transient_adaptive(netlist: Netlist,  # pylint: disable=too-many-arguments
+    duration: Basic | float,
+    *,
+    initial_step: Optional[Basic | float] = None,
+    relative_tolerance: float = 1e-6,
+    absolute_tolerance: float = 1e-9,
+    max_steps: int = 10**6,
+    waveforms: Optional[Mapping[str, Waveform]] = None,
+    initial_conditions: Optional[Mapping[str, float | Basic]] = None) -> TransientSolution:
+    np = import_numpy()
+    function_name = "simulate_transient_adaptive"
+    duration = _to_seconds(duration, "duration", function_name)
+    step = (duration / 1000 if initial_step is None else _to_seconds(initial_step,
+        "initial_step", function_name))
+    descriptor = _Descriptor(netlist, waveforms or {})
+    stepper = _Stepper(descriptor)
+    # buffers grow twice when filled
+    capacity = 1024
+    times = np.empty(capacity)
+    states = np.empty((capacity, descriptor.size))
+    source_values = np.empty((capacity, descriptor.placement.shape[1]))
+    times[0] = 0.0
+    source_values[0] = descriptor.source_values(times[:1])[0]
+    states[0] = descriptor.initial_state(netlist, source_values[0], initial_conditions or {})
+    count = 1
+    while times[count - 1] < duration:
+        if count > max_steps:
+            raise ValueError(f"Simulation did not finish in {max_steps} steps")
+        (time, state) = (times[count - 1], states[count - 1])
+        step = min(step, duration - time)
+        if step <= duration * np.finfo(float).eps:
+            raise ValueError(f"Step of {function_name}() is too small at {time} seconds")
+        (middle, sources) = descriptor.source_values(np.asarray([time + step / 2, time + step]))
+        single = stepper.trapezoidal(state, step, source_values[count - 1], sources)
+        halves = stepper.trapezoidal(state, step / 2, source_values[count - 1], middle)
+        halves = stepper.trapezoidal(halves, step / 2, middle, sources)
+        scale = absolute_tolerance + relative_tolerance * np.maximum(np.abs(halves),
+            np.abs(state))
+        error = float(np.max(np.abs(halves - single) / scale, initial=0.0)) / 3
+        if error <= 1.0:
+            if count == len(times):
+                times = np.resize(times, 2 * count)
+                states = np.resize(states, (2 * count, descriptor.size))
+                source_values = np.resize(source_values, (2 * count, source_values.shape[1]))
+            times[count] = time + step if step < duration - time else duration
+            states[count] = halves
+            source_values[count] = sources
+            count += 1
+        # local error of trapezoidal step is proportional to step^3
+        step *= min(5.0, max(0.2, 0.9 / error**(1 / 3))) if error > 0 else 5.0
+    return TransientSolution(netlist, descriptor, times[:count], states[:count],
+        source_values[:count])
@@ -0,0 +1,271 @@
+"""
+This module compiles laws to vectorized NumPy kernels.
+
+Scalar `calculate_*` functions validate units, solve and substitute the law for every call. Batch
+version of a law solves and compiles it once, validates units once per batch and evaluates the
+whole batch with NumPy.
+
+All values inside the batch are plain numbers in canonical SI units, eg kilograms, meters,
+seconds, kelvins and radians. See `si_unit()` for the canonical unit of a dimension.
+"""
+
+from __future__ import annotations
+import importlib
+import math
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from sympy import S, Basic, Dummy, Expr, lambdify, sympify
+from sympy.core.function import AppliedUndef
+from sympy.physics.units import Dimension, Quantity as SymQuantity
+from sympy.physics.units.systems.si import SI
+
+from .dimensions import (assert_equivalent_dimension, collect_factor_and_dimension,
+    si_scale_factor, si_unit)
+from .operations.sum_array import compensated_sum, solve_sum_law
+from .solved_forms import solve_for
+from .symbols.symbols import Function, Symbol
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+# numpy is an optional dependency, so it is imported only when numeric evaluation is requested
+def import_numpy() -> ModuleType:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as e:
+        raise ImportError(
+            "Numeric evaluation requires numpy. Install it with 'pip install .[numeric]'") from e
+
+
+# Converts SymPy quantity or unit expression, eg 'units.kilometer / units.hour' to the number in
+# canonical SI units.
+def to_si_value(value: Basic, expected_dimension: Dimension, param_name: str,
+    function_name: str) -> Expr:
+    assert_equivalent_dimension(value, param_name, function_name, expected_dimension)
+    (scale_factor, dimension) = collect_factor_and_dimension(sympify(value))
+    return scale_factor / si_scale_factor(dimension)
+
+
+# Array of real or complex numbers. Complex numbers are phasors, eg AC voltages and impedances.
+def _numeric_array(value: Any) -> NDArray[Any]:
+    np = import_numpy()
+    values = np.asarray(value)
+    return values if np.iscomplexobj(values) else values.astype(float, copy=False)
+
+
+# Converts array-like of numbers in canonical SI units, pair of array-like and unit, eg
+# (masses, units.gram), or SymPy quantity to the array in canonical SI units of
+# 'expected_dimension'. Units are checked once for the whole array.
+def to_si_array(value: Any, expected_dimension: Dimension, param_name: str,
+    function_name: str) -> NDArray[Any]:
+    unit: Optional[Basic] = None
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], Basic):
+        (value, unit) = value
+    elif isinstance(value, Basic):
+        (value, unit) = (1.0, value)
+    values = _numeric_array(value)
+    # plain numbers are already in canonical SI units
+    if unit is None:
+        return values
+    factor = complex(to_si_value(unit, expected_dimension, param_name, function_name))
+    factor = factor.real if factor.imag == 0 else factor
+    return values if factor == 1.0 else values * factor
+
+
+def _subs_constants(expr: Expr) -> Expr:
+    constants = {
+        q: SI.get_quantity_scale_factor(q) / si_scale_factor(SI.get_quantity_dimension(q))
+        for q in expr.atoms(SymQuantity)
+    }
+    return expr.subs(constants)
+
+
+# Law compiled to a vectorized NumPy kernel. Solves the law for the unknown and evaluates the
+# solution for arrays of inputs. Inputs are named the same way as parameters of the
+# corresponding calculate_* function and mapped to law symbols. Unknown is a symbol or a
+# function of inputs, eg 'capacitor_voltage(time)'.
+# Each input is either array-like of numbers in canonical SI units, or a pair of array-like
+# and unit, eg (masses, units.gram), or SymPy quantity. Inputs are broadcast against each other.
+# Units are checked once per call, not per element. Result is an array in canonical SI units
+# of the unknown. Complex inputs and results, eg impedances, are complex arrays.
+# 'function' is the scalar calculate_* function, that is vectorized. Unless 'name' is given, batch
+# is named after the function in errors, eg 'calculate_force_batch', or after the unknown.
+# Example:
+# calculate_force_batch = BatchLaw(law,
+#     force,
+#     function=calculate_force,
+#     mass_=mass,
+#     acceleration_=acceleration)
+# calculate_force_batch(masses, (accelerations, units.centimeter / units.second**2))
+class BatchLaw:
+    _law: Basic
+    _unknown: Symbol
+    # Symbol or function of the unknown, eg 'capacitor_voltage' for 'capacitor_voltage(time)'
+    _unknown_symbol: Symbol | Function
+    _inputs: dict[str, Symbol]
+    _name: str
+    _kernel: Optional[Callable[..., Any]]
+
+    def __init__(self,
+        law: Basic,
+        unknown: Symbol,
+        *,
+        function: Optional[Callable[..., Any]] = None,
+        name: Optional[str] = None,
+        **inputs: Symbol) -> None:
+        self._law = law
+        self._unknown = unknown
+        self._unknown_symbol = unknown.func if isinstance(unknown, AppliedUndef) else unknown
+        self._inputs = inputs
+        if name is None:
+            name = (f"calculate_{self._unknown_symbol.display_name}_batch"
+                if function is None else f"{function.__name__}_batch")
+        self._name = name
+        self._kernel = None
+
+    @property
+    def unknown(self) -> Symbol:
+        return self._unknown
+
+    @property
+    def inputs(self) -> dict[str, Symbol]:
+        return dict(self._inputs)
+
+    @property
+    def unit(self) -> Expr:
+        return si_unit(self._unknown_symbol.dimension)
+
+    @property
+    def input_units(self) -> dict[str, Expr]:
+        return {name: si_unit(symbol.dimension) for name, symbol in self._inputs.items()}
+
+    # Solved form of the law, where all constants are replaced with their values in
+    # canonical SI units.
+    def solved(self) -> Expr:
+        return _subs_constants(solve_for(self._law, self._unknown))
+
+    def kernel(self) -> Callable[..., Any]:
+        if self._kernel is None:
+            self._kernel = self._compile()
+        return self._kernel
+
+    def _compile(self) -> Callable[..., Any]:
+        solved = solve_for(self._law, self._unknown)
+        symbols = list(self._inputs.values())
+        unknown_symbols = solved.free_symbols - set(symbols)
+        if unknown_symbols:
+            raise ValueError(f"Solution of '{self._unknown}' depends on {unknown_symbols}, "
+                f"which are not inputs of '{self._name}'")
+        # Solution should have dimension of the unknown. Check it once, instead of
+        # checking each result.
+        #HACK: this allows to treat angle type as dimensionless, see assert_equivalent_dimension()
+        solved_dimension = solved.subs({s: s.dimension.subs("angle", S.One) for s in symbols})
+        assert_equivalent_dimension(solved_dimension, "return", self._name,
+            self._unknown_symbol.dimension)
+        import_numpy()
+        return lambdify(symbols, _subs_constants(solved), modules="numpy", cse=True)
+
+    def _to_array(self, value: Any, symbol: Symbol, param_name: str) -> NDArray[Any]:
+        return to_si_array(value, symbol.dimension, param_name, self._name)
+
+    # Maps positional and keyword arguments to input names
+    def _arguments(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        names = list(self._inputs.keys())
+        if len(args) > len(names):
+            raise TypeError(f"{self._name}() takes {len(names)} arguments but {len(args)} "
+                f"were given")
+        values = dict(zip(names, args))
+        for name, value in kwargs.items():
+            if name not in self._inputs:
+                raise TypeError(f"{self._name}() got an unexpected keyword argument '{name}'")
+            if name in values:
+                raise TypeError(f"{self._name}() got multiple values for argument '{name}'")
+            values[name] = value
+        missing = [name for name in names if name not in values]
+        if missing:
+            raise TypeError(f"{self._name}() missing arguments: {missing}")
+        return values
+
+    def __call__(self, *args: ArrayLike | tuple[ArrayLike, Basic] | Basic,
+        **kwargs: ArrayLike | tuple[ArrayLike, Basic] | Basic) -> NDArray[Any]:
+        values = self._arguments(args, kwargs)
+        names = list(self._inputs.keys())
+        arrays = [self._to_array(values[name], self._inputs[name], name) for name in names]
+        np = import_numpy()
+        result = _numeric_array(self.kernel()(*arrays))
+        shape = np.broadcast_shapes(*(a.shape for a in arrays))
+        # solutions that do not depend on some inputs are not broadcast by NumPy
+        if result.shape != shape:
+            result = np.broadcast_to(result, shape).copy()
+        return result
+
+
+# Sum law compiled to compensated summation, see SumArray. Law contains SumArray of the single
+# input, eg 'Eq(serial_resistance, SumArray(resistances))'. Components of the sum are the last
+# axis of the input, so that several sums are calculated at once. Input is array-like of numbers
+# in canonical SI units, pair of array-like and unit, or sequence of quantities.
+# Sums are calculated in O(n) and are correctly rounded, see compensated_sum().
+# Example:
+# calculate_serial_resistance_batch = BatchSum(law,
+#     serial_resistance,
+#     function=calculate_serial_resistance,
+#     resistances_=resistances)
+# calculate_serial_resistance_batch(np.full(10000, 5.0))
+class BatchSum(BatchLaw):
+    _components: Symbol
+
+    def __init__(self,
+        law: Basic,
+        unknown: Symbol,
+        *,
+        function: Optional[Callable[..., Any]] = None,
+        name: Optional[str] = None,
+        **components: Symbol) -> None:
+        if len(components) != 1:
+            raise TypeError(
+                f"Sum law should have a single array of components, got {len(components)}")
+        super().__init__(law, unknown, function=function, name=name, **components)
+        self._components = next(iter(components.values()))
+
+    def solved(self) -> Expr:
+        return _subs_constants(solve_sum_law(self._law, self._unknown, self._components))
+
+    def _compile(self) -> Callable[..., Any]:
+        total = Dummy("total")
+        solved = solve_sum_law(self._law, self._unknown, self._components, total)
+        unknown_symbols = solved.free_symbols - {total}
+        if unknown_symbols:
+            raise ValueError(f"Solution of '{self._unknown}' depends on {unknown_symbols}, "
+                f"which are not inputs of '{self._name}'")
+        # sum has dimension of its components
+        #HACK: this allows to treat angle type as dimensionless, see assert_equivalent_dimension()
+        solved_dimension = solved.subs(total, self._components.dimension.subs("angle", S.One))
+        assert_equivalent_dimension(solved_dimension, "return", self._name,
+            self._unknown_symbol.dimension)
+        import_numpy()
+        return lambdify([total], _subs_constants(solved), modules="numpy")
+
+    def _to_array(self, value: Any, symbol: Symbol, param_name: str) -> NDArray[Any]:
+        if isinstance(value, (list, tuple)) and len(value) > 0 and all(
+                isinstance(v, Basic) for v in value):
+            factors = [to_si_value(v, symbol.dimension, param_name, self._name) for v in value]
+            return _numeric_array([float(f) if f.is_real else complex(f) for f in factors])
+        return super()._to_array(value, symbol, param_name)
+
+    def __call__(self, *args: ArrayLike | tuple[ArrayLike, Basic] | Basic,
+        **kwargs: ArrayLike | tuple[ArrayLike, Basic] | Basic) -> NDArray[Any]:
+        values = self._arguments(args, kwargs)
+        ((name, value),) = values.items()
+        np = import_numpy()
+        components = np.atleast_1d(self._to_array(value, self._components, name))
+        shape = components.shape[:-1]
+        rows = components.reshape(math.prod(shape), components.shape[-1])
+        # compensated_sum() returns complex sums of complex components, eg admittances
+        totals = np.fromiter((compensated_sum(r) for r in rows.tolist()),
+            dtype=complex if np.iscomplexobj(components) else float,
+            count=len(rows)).reshape(shape)
+        result = _numeric_array(self.kernel()(totals))
+        if result.shape != totals.shape:
+            result = np.broadcast_to(result, totals.shape).copy()
+        return result
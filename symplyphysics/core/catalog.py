@@ -0,0 +1,214 @@
+"""
+This module builds and loads catalog of laws and definitions.
+
+Catalog is generated once by importing all law modules, and stored as JSON file next to this
+package. Loading the catalog does not import law modules, so it is fast enough to find laws
+by dimension or symbol name at runtime.
+
+This module only depends on the standard library, so it can also be loaded by its path, without
+importing the package and SymPy. Dimensions are then passed as catalog keys, see dimension_key():
+
+spec = importlib.util.find_spec("symplyphysics")
+path = os.path.join(spec.submodule_search_locations[0], "core", "catalog.py")
+spec = importlib.util.spec_from_file_location("symplyphysics_catalog", path)
+catalog = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(catalog)
+catalog.load_catalog().find_by_output_dimension("length**-1*mass*time**-2")
+
+Regenerate the catalog after adding or changing laws:
+python -m symplyphysics.core.catalog
+"""
+
+from __future__ import annotations
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import re
+from collections import namedtuple
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Iterable, Optional, Sequence
+
+CATALOG_VERSION = 2
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "catalog.json")
+DEFAULT_PACKAGES = ("symplyphysics.laws", "symplyphysics.definitions")
+
+# 'name' is the module attribute name, 'dimension' is the dimension key, see dimension_key()
+SymbolEntry = namedtuple("SymbolEntry", ["name", "display_name", "dimension"])
+# 'output' is the name of the calculated symbol, if it is known
+FunctionEntry = namedtuple("FunctionEntry", ["name", "signature", "output"])
+# 'kind' is "law" or "definition" for modules with equation, None otherwise. 'equation' is printed
+# in a single line with display names of symbols, eg "acceleration = force/mass".
+LawEntry = namedtuple("LawEntry",
+    ["module", "kind", "equation", "output", "inputs", "symbols", "functions"])
+
+
+def dimension_key(dimension: Any) -> str:
+    """
+    Return catalog key of the dimension, eg ``"length*mass*time**-2"`` for ``units.force``.
+    Strings are returned as is. Dimensionless quantities have empty key.
+    """
+
+    if isinstance(dimension, str):
+        return dimension
+    # pylint: disable-next=import-outside-toplevel
+    from .dimensions import dimension_vector
+    return "*".join(
+        name if power == 1 else f"{name}**{power}" for (name, power) in dimension_vector(dimension))
+
+
+# Catalog of laws with inverted indices by dimension and symbol name
+class LawCatalog:
+    _laws: list[LawEntry]
+    _by_module: dict[str, int]
+    _by_output_dimension: dict[str, list[int]]
+    _by_dimension: dict[str, list[int]]
+    _by_symbol: dict[str, list[int]]
+
+    def __init__(self, laws: Iterable[LawEntry]) -> None:
+        self._laws = list(laws)
+        self._by_module = {}
+        self._by_output_dimension = {}
+        self._by_dimension = {}
+        self._by_symbol = {}
+        for (idx, entry) in enumerate(self._laws):
+            self._by_module[entry.module] = idx
+            outputs = [entry.output] if entry.output is not None else []
+            outputs.extend(s for s in entry.symbols
+                if any(f.output == s.name for f in entry.functions))
+            for dimension in sorted({s.dimension for s in outputs}):
+                self._by_output_dimension.setdefault(dimension, []).append(idx)
+            for dimension in sorted({s.dimension for s in entry.symbols}):
+                self._by_dimension.setdefault(dimension, []).append(idx)
+            names = {s.name for s in entry.symbols} | {s.display_name for s in entry.symbols}
+            for name in sorted(names):
+                self._by_symbol.setdefault(name, []).append(idx)
+
+    @property
+    def laws(self) -> Sequence[LawEntry]:
+        return self._laws
+
+    def get(self, module: str) -> Optional[LawEntry]:
+        idx = self._by_module.get(module)
+        return None if idx is None else self._laws[idx]
+
+    # Laws, that calculate value of the dimension
+    def find_by_output_dimension(self, dimension: Any) -> list[LawEntry]:
+        return [self._laws[i] for i in self._by_output_dimension.get(dimension_key(dimension), [])]
+
+    # Laws, that contain symbols of the dimension
+    def find_by_dimension(self, dimension: Any) -> list[LawEntry]:
+        return [self._laws[i] for i in self._by_dimension.get(dimension_key(dimension), [])]
+
+    # Laws, that contain symbol with module attribute name or display name
+    def find_by_symbol(self, name: str) -> list[LawEntry]:
+        return [self._laws[i] for i in self._by_symbol.get(name, [])]
+
+    def save(self, path: str = DEFAULT_CATALOG_PATH) -> None:
+        data = {"version": CATALOG_VERSION, "laws": self._laws}
+        directory = os.path.dirname(os.path.abspath(path))
+        temporary_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temporary_path, path)
+
+    @staticmethod
+    def load(path: str = DEFAULT_CATALOG_PATH) -> LawCatalog:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != CATALOG_VERSION:
+            raise ValueError(f"Unsupported catalog version {data.get('version')}, "
+                f"expected {CATALOG_VERSION}. Regenerate the catalog.")
+        return LawCatalog(_law_from_json(law) for law in data["laws"])
+
+
+def _law_from_json(data: Sequence[Any]) -> LawEntry:
+    (module, kind, equation, output, inputs, symbols, functions) = data
+    return LawEntry(module=module,
+        kind=kind,
+        equation=equation,
+        output=None if output is None else SymbolEntry(*output),
+        inputs=tuple(SymbolEntry(*s) for s in inputs),
+        symbols=tuple(SymbolEntry(*s) for s in symbols),
+        functions=tuple(FunctionEntry(*f) for f in functions))
+
+
+# Catalog is read from disk once
+@lru_cache(maxsize=1)
+def load_catalog() -> LawCatalog:
+    return LawCatalog.load()
+
+
+def _module_names(packages: Sequence[str]) -> list[str]:
+    names = []
+    for package_name in packages:
+        package = importlib.import_module(package_name)
+        for info in pkgutil.walk_packages(package.__path__, package_name + "."):
+            if not info.ispkg:
+                names.append(info.name)
+    return sorted(names)
+
+
+def _law_entry(module: ModuleType) -> LawEntry:
+    # pylint: disable=import-outside-toplevel
+    from sympy import Equality
+    from sympy.core.function import AppliedUndef
+    from .symbols.symbols import DimensionSymbol, print_expression_line
+
+    symbols: dict[Any, SymbolEntry] = {}
+    for (name, value) in vars(module).items():
+        if isinstance(value, DimensionSymbol) and value not in symbols:
+            symbols[value] = SymbolEntry(name, value.display_name, dimension_key(value.dimension))
+
+    (kind, equation) = (None, None)
+    for candidate in ("law", "definition"):
+        value = getattr(module, candidate, None)
+        if isinstance(value, Equality):
+            (kind, equation) = (candidate, value)
+            break
+
+    output: Optional[SymbolEntry] = None
+    inputs: list[SymbolEntry] = []
+    if equation is not None:
+        # applied functions, eg force(time), are cataloged as functions
+        applied = equation.atoms(AppliedUndef)
+        lhs = equation.lhs.func if equation.lhs in applied else equation.lhs
+        output = symbols.get(lhs)
+        atoms = equation.free_symbols | {f.func for f in applied}
+        inputs = [s for (v, s) in symbols.items() if v in atoms and s != output]
+
+    functions = []
+    names = {s.name: s for s in symbols.values()}
+    for (name, value) in sorted(vars(module).items()):
+        if not name.startswith("calculate_") or not inspect.isfunction(value):
+            continue
+        # output is the symbol of @validate_output, the symbol named after the function, or
+        # the calculated symbol of the equation
+        calculated = symbols.get(getattr(value, "validated_output", None),
+            names.get(name[len("calculate_"):], output))
+        # drop module paths from annotations, eg 'symplyphysics.core.symbols.quantities.Quantity'
+        signature = re.sub(r"\b(?:\w+\.)+(\w+)", r"\1", str(inspect.signature(value)))
+        functions.append(
+            FunctionEntry(name, signature, None if calculated is None else calculated.name))
+    return LawEntry(module=module.__name__,
+        kind=kind,
+        equation=None if equation is None else print_expression_line(equation),
+        output=output,
+        inputs=tuple(inputs),
+        symbols=tuple(symbols.values()),
+        functions=tuple(functions))
+
+
+def build_catalog(packages: Sequence[str] = DEFAULT_PACKAGES) -> LawCatalog:
+    """
+    Import all modules of the packages and build catalog of their laws.
+    """
+
+    return LawCatalog(
+        _law_entry(importlib.import_module(name)) for name in _module_names(packages))
+
+
+if __name__ == "__main__":
+    build_catalog().save()
@@ -0,0 +1,125 @@
+"""
+This module composes several laws into a single compiled law.
+
+Laws are chained by solving them one by one: each step solves an equation, that has exactly one
+unresolved symbol, and substitutes the solution into the remaining equations. Intermediate
+symbols are eliminated once, when composition is built, and the resulting expression of the
+wanted symbol is compiled to a single NumPy kernel with common subexpression elimination.
+"""
+
+from __future__ import annotations
+from collections import namedtuple
+from types import ModuleType
+from typing import Iterable, Mapping, Optional
+from sympy import Basic, Eq, Equality, Expr
+
+from .batch import BatchLaw
+from .solved_forms import solutions_for
+from .symbols.symbols import Symbol
+
+# Symbol is solved from the equation, after substitution of 'dependencies' symbols, that were
+# solved on previous steps.
+CompositionStep = namedtuple("CompositionStep", ["symbol", "equation", "solution", "dependencies"])
+
+
+def _law_equation(law: ModuleType | Equality) -> Equality:
+    if isinstance(law, Equality):
+        return law
+    for name in ("law", "definition"):
+        equation = getattr(law, name, None)
+        if isinstance(equation, Equality):
+            return equation
+    raise ValueError(f"Module '{law.__name__}' should have 'law' or 'definition' equation")
+
+
+# Builds dependency graph of the wanted symbol. Returns steps in the order of evaluation.
+def _resolve(equations: list[Equality], wanted: Symbol, known: set[Basic],
+    solutions: Mapping[Basic, int]) -> list[CompositionStep]:
+    resolved: dict[Basic, Expr] = {}
+    steps: dict[Basic, CompositionStep] = {}
+    pending = list(equations)
+    while wanted not in resolved:
+        for equation in pending:
+            dependencies = tuple(s for s in equation.free_symbols if s in resolved)
+            applied = equation.subs({s: resolved[s] for s in dependencies})
+            unresolved = applied.free_symbols - known
+            if len(unresolved) == 1:
+                break
+        else:
+            raise ValueError(f"Cannot express '{wanted}' with known symbols "
+                f"{sorted(map(str, known))}. Unresolved equations: {pending}")
+        pending.remove(equation)
+        symbol = unresolved.pop()
+        found = solutions_for(applied, symbol)
+        index = solutions.get(symbol, 0)
+        if index >= len(found):
+            raise ValueError(f"Equation '{equation}' has {len(found)} solutions for '{symbol}', "
+                f"solution {index} is requested")
+        resolved[symbol] = found[index][symbol]
+        steps[symbol] = CompositionStep(symbol, equation, resolved[symbol], dependencies)
+    # keep only steps, that the wanted symbol depends on
+    required = {wanted}
+    for step in reversed(list(steps.values())):
+        if step.symbol in required:
+            required.update(step.dependencies)
+    return [step for step in steps.values() if step.symbol in required]
+
+
+# Laws composed into a single batch law. 'steps' contain the dependency graph of the wanted
+# symbol in the order of evaluation.
+class ComposedLaw(BatchLaw):
+    _steps: list[CompositionStep]
+
+    def __init__(self,
+        steps: list[CompositionStep],
+        wanted: Symbol,
+        *,
+        name: Optional[str] = None,
+        **inputs: Symbol) -> None:
+        self._steps = steps
+        name = f"calculate_{wanted.display_name}_composed" if name is None else name
+        super().__init__(Eq(wanted, steps[-1].solution), wanted, name=name, **inputs)
+
+    @property
+    def steps(self) -> list[CompositionStep]:
+        return list(self._steps)
+
+    # Expression of the wanted symbol in terms of input symbols
+    @property
+    def expression(self) -> Expr:
+        return self._steps[-1].solution
+
+
+def compose_laws(laws: Iterable[ModuleType | Equality],
+    wanted: Symbol,
+    *,
+    links: Optional[Mapping[Basic, Expr]] = None,
+    solutions: Optional[Mapping[Basic, int]] = None,
+    name: Optional[str] = None,
+    **known: Symbol) -> ComposedLaw:
+    """
+    Compose laws to calculate ``wanted`` symbol from ``known`` symbols. Laws are law modules or
+    equations. Known symbols are named the same way as parameters of the resulting function,
+    see ``BatchLaw``.
+
+    Different laws have different symbols for the same value. ``links`` maps symbols of one law
+    to symbols or expressions of another law, eg ``{curve_radius: planet_radius + height}``.
+    When equation has several solutions, first one is used, unless ``solutions`` maps the symbol
+    to another solution index.
+
+    Example:
+    satellite_velocity = compose_laws([centripetal_acceleration_law, free_fall_law],
+        centripetal_acceleration_law.linear_velocity,
+        links={centripetal_acceleration_law.centripetal_acceleration: free_fall_law.free_fall_acceleration},
+        solutions={centripetal_acceleration_law.linear_velocity: 1},
+        planet_mass_=free_fall_law.planet_mass, ...)
+    satellite_velocity(planet_masses, ...)
+    """
+
+    links = {} if links is None else links
+    equations = [_law_equation(law).subs(links) for law in laws]
+    known_symbols = set(known.values())
+    if wanted in known_symbols:
+        raise ValueError(f"Wanted symbol '{wanted}' should not be known")
+    steps = _resolve(equations, wanted, known_symbols, {} if solutions is None else solutions)
+    return ComposedLaw(steps, wanted, name=name, **known)
@@ -1,14 +1,23 @@
+from typing import Any
 from sympy import Expr, sympify
 from sympy.physics.units import Quantity as SymQuantity
 
-from .dimensions import assert_equivalent_dimension
+from .dimensions import assert_equivalent_dimension, collect_factor_and_dimension, si_scale_factor
 from .symbols.quantities import Quantity
+from .symbols.numeric_quantities import NumericQuantity
 
 
-def convert_to(value: Quantity, target_unit: SymQuantity) -> Expr:
+def convert_to(value: Quantity | NumericQuantity, target_unit: SymQuantity) -> Expr | Any:
     """
     Convert ``value`` to its scale factor with ``value`` unit represented as ``target_unit``.
+    ``NumericQuantity`` is converted to a number or NumPy array.
     """
+
+    if isinstance(value, NumericQuantity):
+        (target_scale_factor, target_dimension) = collect_factor_and_dimension(target_unit)
+        assert_equivalent_dimension(value.dimension, value.dimension.name, "convert_to",
+            target_dimension)
+        return value.value * float(si_scale_factor(value.dimension) / target_scale_factor)
     target_quantity = Quantity(target_unit)
     assert_equivalent_dimension(value, value.dimension.name, "convert_to",
         target_quantity.dimension)
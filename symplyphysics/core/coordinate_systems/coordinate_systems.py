@@ -3,6 +3,7 @@ from typing import Optional
 from sympy import acos, atan2, cos, sin, sqrt, Expr
 from sympy.vector import CoordSys3D, Vector as SymVector
 from ..symbols.symbols import next_name
+from ..registries import track_coordinate_system
 
 
 class CoordinateSystem:
@@ -43,6 +44,7 @@ class CoordinateSystem:
         if inner is None:
             self._coord_system = CoordSys3D(next_name("SYS"),
                 variable_names=CoordinateSystem.system_to_base_scalars(coord_system_type))
+            track_coordinate_system(self._coord_system)
             return
         self._coord_system = inner
 
@@ -102,6 +104,7 @@ def coordinates_transform(
     new_coord_system = from_system.coord_system.create_new(next_name("SYS"),
         variable_names=CoordinateSystem.system_to_base_scalars(coord_system_type),
         transformation=None)
+    track_coordinate_system(new_coord_system)
     return CoordinateSystem(coord_system_type, new_coord_system)
 
 
@@ -110,5 +113,6 @@ def coordinates_rotate(self: CoordinateSystem, angle: Expr, axis: SymVector) ->
         coord_name_from = CoordinateSystem.system_to_transformation_name(self.coord_system_type)
         raise ValueError(
             f"Rotation only supported for cartesian coordinates: got {coord_name_from}")
-    return CoordinateSystem(self.coord_system_type,
-        self.coord_system.orient_new_axis(next_name("C"), angle, axis))
+    new_coord_system = self.coord_system.orient_new_axis(next_name("C"), angle, axis)
+    track_coordinate_system(new_coord_system)
+    return CoordinateSystem(self.coord_system_type, new_coord_system)
@@ -0,0 +1,183 @@
+"""
+This module caches transformations of vectors between coordinate systems.
+
+Rebasing vector to another coordinate system converts its components to the type of the new system,
+eg from cartesian to cylindrical, and rotates them, if the new system is rotated. Transformation
+depends only on the pair of coordinate systems, so it is derived once for placeholder components and
+reused for every vector. Compiled transformations map arrays of N vectors at once.
+
+Transformations are dropped when coordinate system is released, see RegistryScope.
+"""
+
+from __future__ import annotations
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+from sympy import Dummy, Expr, lambdify, sympify
+from sympy.vector import BaseScalar, CoordSys3D, express, Vector as SymVector
+
+from .coordinate_systems import CoordinateSystem
+from ..batch import import_numpy
+from ..dimensions import ScalarValue
+from ..registries import on_coordinate_system_release
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# Vectors are 3 dimensional, as CoordSys3D is
+_SIZE = 3
+_COMPONENTS = tuple(Dummy(f"component{i}") for i in range(_SIZE))
+
+# 'components' are expressions of placeholder components of the rebased vector
+VectorTransformation = namedtuple("VectorTransformation", ["components"])
+
+_TransformationKey = tuple[CoordSys3D, CoordinateSystem.System, CoordSys3D, CoordinateSystem.System]
+_transformations: dict[_TransformationKey, VectorTransformation] = {}
+_kernels: dict[Any, Callable[..., list[Any]]] = {}
+
+# Reference systems for conversions between types of coordinate systems, without rotation
+_reference_systems: dict[CoordinateSystem.System, CoordinateSystem] = {}
+
+
+def _key(from_system: CoordinateSystem, to_system: CoordinateSystem) -> _TransformationKey:
+    return (from_system.coord_system, from_system.coord_system_type, to_system.coord_system,
+        to_system.coord_system_type)
+
+
+def _derive(from_system: CoordinateSystem, to_system: CoordinateSystem) -> VectorTransformation:
+    components: list[Expr] = list(_COMPONENTS)
+    if from_system.coord_system_type != to_system.coord_system_type:
+        new_scalars = from_system.transformation_to_system(to_system.coord_system_type)
+        # assign components of vector to base scalars, eg x, y, z
+        base_scalars = dict(zip(from_system.coord_system.base_scalars(), _COMPONENTS))
+        components = [sympify(s).xreplace(base_scalars) for s in new_scalars]
+    sympy_vector = SymVector.zero
+    for (base_vector, component) in zip(from_system.coord_system.base_vectors(), components):
+        sympy_vector = sympy_vector + base_vector * component
+    # We do not want to maintain own rotation functions, so SymPy does it
+    transformed = express(sympy_vector, to_system.coord_system, None)
+    if transformed == SymVector.zero:
+        return VectorTransformation([sympify(0)] * _SIZE)
+    return VectorTransformation(list(transformed.to_matrix(to_system.coord_system)))
+
+
+def vector_transformation(from_system: CoordinateSystem,
+    to_system: CoordinateSystem) -> VectorTransformation:
+    """
+    Return cached transformation of vector components from one coordinate system to another.
+    """
+
+    key = _key(from_system, to_system)
+    transformation = _transformations.get(key)
+    if transformation is None:
+        transformation = _derive(from_system, to_system)
+        _transformations[key] = transformation
+    return transformation
+
+
+# Replaces base scalars of other coordinate systems with their expressions in 'coord_system',
+# as sympy.vector.express(variables=True) does
+def _express_variables(value: Expr, coord_system: CoordSys3D) -> Expr:
+    systems = {s.system for s in value.atoms(BaseScalar)} - {coord_system}
+    if not systems:
+        return value
+    scalar_map = {}
+    for system in systems:
+        scalar_map.update(system.scalar_map(coord_system))
+    return value.subs(scalar_map)
+
+
+# Returns components of the vector, rebased to 'to_system'. Vectors with less than 3 components
+# are padded with zeroes. If 'variables' is True, base scalars in components, eg C.x, are
+# expressed in base scalars of 'to_system'.
+def transform_components(components: Sequence[ScalarValue],
+    from_system: CoordinateSystem,
+    to_system: CoordinateSystem,
+    *,
+    variables: bool = True) -> list[Expr]:
+    transformation = vector_transformation(from_system, to_system)
+    values = [sympify(c) for c in components] + [sympify(0)] * (_SIZE - len(components))
+    if variables:
+        values = [_express_variables(v, to_system.coord_system) for v in values]
+    placeholders = dict(zip(_COMPONENTS, values))
+    return [c.xreplace(placeholders) for c in transformation.components]
+
+
+def _reference_system(system_type: CoordinateSystem.System) -> CoordinateSystem:
+    system = _reference_systems.get(system_type)
+    if system is None:
+        system = CoordinateSystem(system_type)
+        _reference_systems[system_type] = system
+    return system
+
+
+# Conversion between types of coordinate systems. Conversions, that are not supported by
+# CoordinateSystem.transformation_to_system(), eg from cylindrical to spherical, are done
+# through cartesian coordinates.
+def _type_conversion(from_type: CoordinateSystem.System,
+    to_type: CoordinateSystem.System) -> list[Expr]:
+    cartesian = CoordinateSystem.System.CARTESIAN
+    if cartesian not in (from_type, to_type):
+        to_cartesian = _type_conversion(from_type, cartesian)
+        from_cartesian = _type_conversion(cartesian, to_type)
+        placeholders = dict(zip(_COMPONENTS, to_cartesian))
+        return [c.xreplace(placeholders) for c in from_cartesian]
+    from_system = _reference_system(from_type)
+    to_system = CoordinateSystem(to_type, from_system.coord_system)
+    return vector_transformation(from_system, to_system).components
+
+
+def _compile(components: Sequence[Expr]) -> Callable[..., list[Any]]:
+    for c in components:
+        unknown_symbols = c.free_symbols - set(_COMPONENTS)
+        if unknown_symbols:
+            raise ValueError(f"Transformation '{c}' should be numeric, got {unknown_symbols}")
+    import_numpy()
+    return lambdify(_COMPONENTS, list(components), modules="numpy")
+
+
+def transform_array(values: ArrayLike, from_system: CoordinateSystem | CoordinateSystem.System,
+    to_system: CoordinateSystem | CoordinateSystem.System) -> NDArray[Any]:
+    """
+    Rebase array of shape (3,) or (N, 3) with components of N vectors at once. Systems are either
+    both coordinate systems, or both types of coordinate systems, eg
+    ``CoordinateSystem.System.SPHERICAL``. Types are converted without rotation.
+    """
+
+    np = import_numpy()
+    if isinstance(from_system, CoordinateSystem) and isinstance(to_system, CoordinateSystem):
+        key: Any = _key(from_system, to_system)
+        if key not in _kernels:
+            _kernels[key] = _compile(vector_transformation(from_system, to_system).components)
+    elif isinstance(from_system, CoordinateSystem.System) and isinstance(
+            to_system, CoordinateSystem.System):
+        key = (from_system, to_system)
+        if key not in _kernels:
+            _kernels[key] = _compile(_type_conversion(from_system, to_system))
+    else:
+        raise TypeError("Systems should be both CoordinateSystem or both CoordinateSystem.System, "
+            f"got {type(from_system).__name__} and {type(to_system).__name__}")
+    array = np.asarray(values, dtype=float)
+    if array.ndim not in (1, 2) or array.shape[-1] != _SIZE:
+        raise ValueError(f"Array should have shape ({_SIZE},) or (N, {_SIZE}), got {array.shape}")
+    columns = np.moveaxis(array, -1, 0)
+    results = [np.broadcast_to(r, columns.shape[1:]) for r in _kernels[key](*columns)]
+    return np.stack(results, axis=-1).astype(float)
+
+
+def transformation_cache_clear() -> None:
+    _transformations.clear()
+    _kernels.clear()
+
+
+def transformation_cache_size() -> int:
+    return len(_transformations)
+
+
+def _release(coord_system: CoordSys3D) -> None:
+    for key in [k for k in _transformations if coord_system in (k[0], k[2])]:
+        del _transformations[key]
+    for key in [k for k in _kernels if coord_system in k]:
+        del _kernels[key]
+
+
+on_coordinate_system_release(_release)
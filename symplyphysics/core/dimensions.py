@@ -1,9 +1,10 @@
-from typing import Any, Callable, TypeAlias
+from functools import lru_cache
+from typing import Any, Callable, Optional, TypeAlias
 from sympy import Expr, S, Derivative, Function as SymFunction, Basic
 from sympy.core.add import Add
 from sympy.core.mul import Mul
 from sympy.core.power import Pow
-from sympy.physics.units import Dimension, Quantity as SymQuantity
+from sympy.physics.units import Dimension, Quantity as SymQuantity, radian
 from sympy.physics.units.systems.si import SI
 
 from .errors import UnitsError
@@ -11,90 +12,134 @@ from .errors import UnitsError
 ScalarValue: TypeAlias = Expr | float
 
 
+# Maximum number of expressions with their dimensions kept in cache. Least recently used
+# expressions are dropped first.
+DIMENSIONS_CACHE_MAXSIZE = 8192
+
+
+@lru_cache(maxsize=DIMENSIONS_CACHE_MAXSIZE)
+def _equivalent_dims(dim_a: Dimension, dim_b: Dimension) -> bool:
+    return dim_a == dim_b or SI.get_dimension_system().equivalent_dims(dim_a, dim_b)
+
+
+@lru_cache(maxsize=DIMENSIONS_CACHE_MAXSIZE)
+def _is_dimensionless(dimension: Dimension) -> bool:
+    return SI.get_dimension_system().is_dimensionless(dimension)
+
+
+#HACK: this allows to treat angle type as dimensionless
+@lru_cache(maxsize=DIMENSIONS_CACHE_MAXSIZE)
+def _without_angle(dimension: Dimension) -> Dimension:
+    return dimension.subs("angle", S.One)
+
+
+def _collect_quantity(expr: SymQuantity) -> tuple[Basic, Dimension]:
+    return (expr.scale_factor, expr.dimension)
+
+
+def _collect_mul(expr: Mul) -> tuple[Basic, Dimension]:
+    factor = S.One
+    dimension = dimensionless
+    for arg in expr.args:
+        (arg_factor, arg_dim) = collect_factor_and_dimension(arg)
+        factor *= arg_factor
+        dimension *= arg_dim
+    return (factor, dimension)
+
+
+def _collect_pow(expr: Pow) -> tuple[Basic, Dimension]:
+    pow_expr: Expr = S.One
+    (factor, dim) = collect_factor_and_dimension(expr.base)
+    pow_expr *= factor
+    (exp_factor, exp_dim) = collect_factor_and_dimension(expr.exp)
+    if not _is_dimensionless(exp_dim):
+        raise ValueError(f"Dimension of '{expr.exp}' is {exp_dim}, but it should be dimensionless")
+    exp_dim = S.One
+    return (pow_expr**exp_factor, dim**(exp_factor * exp_dim))
+
+
+def _collect_add(expr: Add) -> tuple[Basic, Dimension]:
+    sum_expr: Expr = S.Zero
+    (factor, dim) = collect_factor_and_dimension(expr.args[0])
+    sum_expr += factor
+    for addend in expr.args[1:]:
+        (addend_factor, addend_dim) = collect_factor_and_dimension(addend)
+        # automatically convert zero to the dimension of it's additives
+        if not _equivalent_dims(dim, addend_dim):
+            if factor == S.Zero:
+                dim = addend_dim
+            elif addend_factor == S.Zero:
+                addend_dim = dim
+        if not _equivalent_dims(dim, addend_dim):
+            raise ValueError(f"Dimension of '{addend}' is {addend_dim}, but it should be {dim}")
+        sum_expr += addend_factor
+    return (sum_expr, dim)
+
+
+def _unsupported_derivative(expr: Derivative):
+    raise ValueError(f"Dimension '{expr}' should not contain unevaluated Derivative")
+
+
+def _collect_function(expr: SymFunction) -> tuple[Basic, Dimension]:
+    factors: list[Basic] = []
+    for arg in expr.args:
+        (f, d) = collect_factor_and_dimension(arg)
+        # only functions with dimensionless arguments are supported
+        if not _is_dimensionless(d):
+            raise ValueError(f"Dimension of '{arg}' is {d}, but it should be dimensionless")
+        factors.append(f)
+    ret = expr.func(*(f for f in factors))
+    return (ret, dimensionless)
+
+
+def _collect_dimension(expr: Dimension) -> tuple[Basic, Dimension]:
+    return (S.One, expr)
+
+
+_cases: dict[type, Callable[[Any], tuple[Basic, Dimension]]] = {
+    SymQuantity: _collect_quantity,
+    Mul: _collect_mul,
+    Pow: _collect_pow,
+    Add: _collect_add,
+    Derivative: _unsupported_derivative,
+    SymFunction: _collect_function,
+    Dimension: _collect_dimension,
+}
+
+
+# Expression types are looked up in _cases by their MRO. Remember the handler found for each
+# type.
+@lru_cache(maxsize=None)
+def _handler_for(type_: type) -> Optional[Callable[[Any], tuple[Basic, Dimension]]]:
+    for base in type_.__mro__:
+        handler = _cases.get(base)
+        if handler is not None:
+            return handler
+    return None
+
+
+# Results depend only on expression structure and scale factors of quantities, so they are
+# cached by expression hash. Subexpressions are cached as well.
+#NOTE: typed=True is required to distinguish 1 and 1.0, which have the same hash.
+@lru_cache(maxsize=DIMENSIONS_CACHE_MAXSIZE, typed=True)
 def collect_factor_and_dimension(expr: Basic) -> tuple[Basic, Dimension]:
     """
     Return tuple with scale factor expression and dimension expression.
     """
 
-    def _collect_quantity(expr: SymQuantity) -> tuple[Basic, Dimension]:
-        return (expr.scale_factor, expr.dimension)
-
-    def _collect_mul(expr: Mul) -> tuple[Basic, Dimension]:
-        factor = S.One
-        dimension = Dimension(S.One)
-        for arg in expr.args:
-            (arg_factor, arg_dim) = collect_factor_and_dimension(arg)
-            factor *= arg_factor
-            dimension *= arg_dim
-        return (factor, dimension)
-
-    def _collect_pow(expr: Pow) -> tuple[Basic, Dimension]:
-        pow_expr: Expr = S.One
-        (factor, dim) = collect_factor_and_dimension(expr.base)
-        pow_expr *= factor
-        (exp_factor, exp_dim) = collect_factor_and_dimension(expr.exp)
-        if not SI.get_dimension_system().is_dimensionless(exp_dim):
-            raise ValueError(
-                f"Dimension of '{expr.exp}' is {exp_dim}, but it should be dimensionless")
-        exp_dim = S.One
-        return (pow_expr**exp_factor, dim**(exp_factor * exp_dim))
-
-    def _collect_add(expr: Add) -> tuple[Basic, Dimension]:
-        sum_expr: Expr = S.Zero
-        (factor, dim) = collect_factor_and_dimension(expr.args[0])
-        sum_expr += factor
-        for addend in expr.args[1:]:
-            (addend_factor, addend_dim) = collect_factor_and_dimension(addend)
-            # automatically convert zero to the dimension of it's additives
-            if dim != addend_dim and not SI.get_dimension_system().equivalent_dims(dim, addend_dim):
-                if factor == S.Zero:
-                    dim = addend_dim
-                elif addend_factor == S.Zero:
-                    addend_dim = dim
-            if dim != addend_dim and not SI.get_dimension_system().equivalent_dims(dim, addend_dim):
-                raise ValueError(f"Dimension of '{addend}' is {addend_dim}, but it should be {dim}")
-            sum_expr += addend_factor
-        return (sum_expr, dim)
-
-    def _unsupported_derivative(expr: Derivative):
-        raise ValueError(f"Dimension '{expr}' should not contain unevaluated Derivative")
-
-    def _collect_function(expr: SymFunction) -> tuple[Basic, Dimension]:
-        factors: list[Basic] = []
-        for arg in expr.args:
-            (f, d) = collect_factor_and_dimension(arg)
-            # only functions with dimensionless arguments are supported
-            if not SI.get_dimension_system().is_dimensionless(d):
-                raise ValueError(f"Dimension of '{arg}' is {d}, but it should be dimensionless")
-            factors.append(f)
-        ret = expr.func(*(f for f in factors))
-        return (ret, dimensionless)
-
-    def _collect_dimension(expr: Dimension) -> tuple[Basic, Dimension]:
-        return (S.One, expr)
-
-    cases: dict[type, Callable[[Any], tuple[Basic, Dimension]]] = {
-        SymQuantity: _collect_quantity,
-        Mul: _collect_mul,
-        Pow: _collect_pow,
-        Add: _collect_add,
-        Derivative: _unsupported_derivative,
-        SymFunction: _collect_function,
-        Dimension: _collect_dimension,
-    }
-
-    for k, v in cases.items():
-        if isinstance(expr, k):
-            return v(expr)
+    expr_type: type = type(expr)
+    handler = _handler_for(expr_type)
+    if handler is not None:
+        return handler(expr)
     return (expr, dimensionless)
 
 
 def assert_equivalent_dimension(arg: SymQuantity | ScalarValue | Dimension, param_name: str,
     func_name: str, expected_unit: Dimension):
     #HACK: this allows to treat angle type as dimensionless
-    expected_dimension = expected_unit.subs("angle", S.One)
+    expected_dimension = _without_angle(expected_unit)
     if isinstance(arg, (float | int)):
-        if SI.get_dimension_system().is_dimensionless(expected_dimension):
+        if _is_dimensionless(expected_dimension):
             return
         raise TypeError(f"Argument '{param_name}' to function '{func_name}'"
             f" is Number but '{expected_dimension}' is not dimensionless")
@@ -103,12 +148,11 @@ def assert_equivalent_dimension(arg: SymQuantity | ScalarValue | Dimension, para
     if scale_factor == S.Zero:
         return
     #HACK: this allows to treat angle type as dimensionless
-    arg_dimension = dimension.subs("angle", S.One)
+    arg_dimension = _without_angle(dimension)
     # angle is dimensionless but equivalent_dims() fails to compare it
-    if SI.get_dimension_system().is_dimensionless(
-            expected_dimension) and SI.get_dimension_system().is_dimensionless(arg_dimension):
+    if _is_dimensionless(expected_dimension) and _is_dimensionless(arg_dimension):
         return
-    if not SI.get_dimension_system().equivalent_dims(arg_dimension, expected_dimension):
+    if not _equivalent_dims(arg_dimension, expected_dimension):
         raise UnitsError(f"Argument '{param_name}' to function '{func_name}' must "
             f"be in units equivalent to '{expected_dimension.name}'")
     if scale_factor.free_symbols:
@@ -116,4 +160,86 @@ def assert_equivalent_dimension(arg: SymQuantity | ScalarValue | Dimension, para
             f"not contain free symbols")
 
 
+@lru_cache(maxsize=None)
+def _si_base_units() -> dict[Dimension, SymQuantity]:
+    # SI.get_dimension_system() describes dimensions with base dimensions only, eg
+    # Dimension(length) instead of Dimension(length, L). Map them to base units.
+    dimension_system = SI.get_dimension_system()
+    units: dict[Dimension, SymQuantity] = {}
+    for unit in SI._base_units:  # pylint: disable=protected-access
+        dependencies = dimension_system.get_dimensional_dependencies(SI.get_quantity_dimension(unit))
+        (base_dimension,) = dependencies.keys()
+        units[base_dimension] = unit
+    return units
+
+
+def _base_unit(base_dimension: Dimension) -> SymQuantity:
+    # Angle is not a SI base dimension but it is treated as base dimension by SymPy
+    return _si_base_units().get(base_dimension, radian)
+
+
+def si_unit(dimension: Dimension) -> Expr:
+    """
+    Return canonical SI unit of the ``dimension``, eg ``kilogram * meter / second**2`` for force.
+    """
+
+    dependencies = SI.get_dimension_system().get_dimensional_dependencies(dimension)
+    unit: Expr = S.One
+    for base_dimension, power in dependencies.items():
+        unit *= _base_unit(base_dimension)**power
+    return unit
+
+
+@lru_cache(maxsize=None)
+def si_scale_factor(dimension: Dimension) -> Expr:
+    """
+    Return SymPy scale factor of the canonical SI unit of the ``dimension``.
+
+    SymPy stores scale factors relative to gram, so values in canonical SI units should be
+    multiplied by this factor to get SymPy scale factor.
+    """
+
+    dependencies = SI.get_dimension_system().get_dimensional_dependencies(dimension)
+    factor: Expr = S.One
+    for base_dimension, power in dependencies.items():
+        factor *= SI.get_quantity_scale_factor(_base_unit(base_dimension))**power
+    return factor
+
+
+# Dimension vector is a tuple of (base dimension name, power) pairs, eg
+# (("length", 1), ("time", -1)) for velocity. Equivalent dimensions have equal vectors.
+DimensionVector: TypeAlias = tuple[tuple[str, Basic], ...]
+
+
+@lru_cache(maxsize=DIMENSIONS_CACHE_MAXSIZE)
+def dimension_vector(dimension: Dimension) -> DimensionVector:
+    dependencies = SI.get_dimension_system().get_dimensional_dependencies(dimension)
+    return tuple(sorted((str(d.name), p) for d, p in dependencies.items()))
+
+
+# Number of distinct dimension vectors is small, so interned dimensions are never dropped.
+_interned_dimensions: dict[DimensionVector, Dimension] = {}
+
+
+def intern_dimension(dimension: Dimension) -> Dimension:
+    """
+    Return the same ``Dimension`` object for all equivalent dimensions.
+    """
+
+    return _interned_dimensions.setdefault(dimension_vector(dimension), dimension)
+
+
+def cache_clear() -> None:
+    """
+    Drop cached dimensions of expressions. Required if scale factor or dimension of some
+    quantity is changed after it was used in calculations.
+    """
+
+    collect_factor_and_dimension.cache_clear()
+    _equivalent_dims.cache_clear()
+    _is_dimensionless.cache_clear()
+    _without_angle.cache_clear()
+    dimension_vector.cache_clear()
+
+
 dimensionless = Dimension(S.One)
@@ -0,0 +1,260 @@
+"""
+This module maintains an opt-in persistent cache of solved forms and derivations.
+
+Every process solves the same laws and runs the same derivations. Persistent cache stores results
+in a directory, so that a new process loads them instead of recomputing. Cache is disabled by
+default, it is enabled with SYMPLYPHYSICS_CACHE_DIR environment variable or with
+enable_disk_cache().
+
+Names of symbols are generated at import time and depend on the import order, so expressions are
+stored with symbols and functions renamed after their display names. Solved forms are keyed by
+this canonical form of the law and SymPy version, and derivations are keyed by the source of the
+law module, sources of symplyphysics modules it imports transitively, including core modules, and
+SymPy version. Entries of changed laws and of laws with changed dependencies are never hit again.
+
+Each entry is written to a temporary file and atomically renamed, so concurrent readers and
+writers on one machine always see complete entries. Entries are pickled, only use directories
+that are not writable by others.
+"""
+
+from __future__ import annotations
+import ast
+import hashlib
+import importlib.util
+import inspect
+import os
+import pickle
+import shutil
+import tempfile
+from types import ModuleType
+from typing import Any, Callable, Optional, TypeVar
+import sympy
+from sympy import Basic, Function as SymFunction, Symbol as SymSymbol, srepr
+from sympy.core.function import AppliedUndef
+from sympy.physics.units import Quantity as SymQuantity
+
+from .symbols.symbols import DimensionSymbol, Function, Symbol
+
+CACHE_DIR_ENVIRONMENT = "SYMPLYPHYSICS_CACHE_DIR"
+# Increase when format of entries changes
+FORMAT_VERSION = 1
+
+T = TypeVar("T")
+
+_MISSING = object()
+_NOT_LOADED = object()
+_active_cache: Any = _NOT_LOADED
+
+
+def _map_structure(value: Any, function: Callable[[Basic], Basic]) -> Any:
+    if isinstance(value, Basic):
+        return function(value)
+    if isinstance(value, dict):
+        return {
+            _map_structure(k, function): _map_structure(v, function) for (k, v) in value.items()
+        }
+    if isinstance(value, (tuple, list)):
+        return type(value)(_map_structure(v, function) for v in value)
+    return value
+
+
+def _collect_atoms(value: Any, atoms: set[Basic]) -> None:
+    if isinstance(value, Basic):
+        atoms.update(value.atoms(SymSymbol, SymQuantity, AppliedUndef))
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _collect_atoms(v, atoms)
+
+
+# Maps symbols and functions of symplyphysics to plain SymPy symbols and functions, named
+# after display names. Returns None if expressions cannot be renamed unambiguously, eg
+# they contain quantities or several symbols with the same display name.
+def _canonical_names(value: Any) -> Optional[tuple[dict[Basic, Basic], dict[Any, Any]]]:
+    atoms: set[Basic] = set()
+    _collect_atoms(value, atoms)
+    plain_names = {
+        a.name for a in atoms if isinstance(a, SymSymbol) and not isinstance(a, DimensionSymbol)
+    }
+    symbols: dict[Basic, Basic] = {}
+    functions: dict[Any, Any] = {}
+    for atom in atoms:
+        if isinstance(atom, Symbol):
+            name = "_" + atom.display_name
+            if name in plain_names or any(s.name == name for s in symbols.values()):
+                return None
+            symbols[atom] = SymSymbol(name, **atom.assumptions0)
+        elif isinstance(atom, DimensionSymbol):
+            return None
+        elif isinstance(atom, AppliedUndef) and isinstance(atom.func, Function):
+            if atom.func in functions:
+                continue
+            name = "_" + atom.func.display_name
+            if any(f.name == name for f in functions.values()):
+                return None
+            functions[atom.func] = SymFunction(name)
+    return (symbols, functions)
+
+
+def _rename(expression: Basic, symbols: dict[Basic, Basic], functions: dict[Any, Any]) -> Basic:
+    for (old, new) in functions.items():
+        expression = expression.replace(old, new)
+    return expression.xreplace(symbols)
+
+
+# Names of modules, that are imported by the source of the module 'name'. Imported names are
+# also listed, as they might be submodules, eg 'from symplyphysics.laws import dynamics'.
+def _imported_names(name: str, source: str, is_package: bool) -> list[str]:
+    package = name if is_package else name.rpartition(".")[0]
+    names: list[str] = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.extend(a.name for a in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level > 0:
+                try:
+                    base = importlib.util.resolve_name("." * node.level + base, package)
+                except ImportError:
+                    continue
+            names.extend([base, *(f"{base}.{a.name}" for a in node.names)])
+    return names
+
+
+# Sources of the module and of all modules it imports transitively, eg inside
+# verify_derivation(), that belong to symplyphysics or to the package of the module. Derivations
+# depend on laws they use and on core modules, eg expr_equals() and solve_for().
+def _module_sources(module: ModuleType) -> list[str]:
+    roots = {"symplyphysics", module.__name__.partition(".")[0]}
+    source = inspect.getsource(module)
+    pending = _imported_names(module.__name__, source, hasattr(module, "__path__"))
+    origins: dict[str, str] = {}
+    while pending:
+        name = pending.pop()
+        if name in origins or name.partition(".")[0] not in roots or name == module.__name__:
+            continue
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+            continue
+        with open(spec.origin, encoding="utf-8") as file:
+            origins[name] = file.read()
+        pending.extend(
+            _imported_names(name, origins[name], spec.submodule_search_locations is not None))
+    return [source, *(origins[n] for n in sorted(origins))]
+
+
+class DiskCache:
+    """
+    Directory of pickled results, keyed by SHA-256 hash of their inputs.
+    """
+
+    directory: str
+    hits: int
+    misses: int
+
+    def __init__(self, directory: str) -> None:
+        self.directory = os.path.join(os.path.abspath(directory), f"v{FORMAT_VERSION}",
+            sympy.__version__)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(kind: str, *parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in (kind, *parts):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".pickle")
+
+    # Returns stored value or _MISSING. Unreadable entries, eg written by incompatible version,
+    # are treated as missing.
+    def get(self, key: str) -> Any:
+        try:
+            with open(self._path(key), "rb") as file:
+                value = pickle.load(file)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.misses += 1
+            return _MISSING
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        (descriptor, temporary_path) = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    # Returns compute(*arguments) with symbols and functions renamed to canonical names, and
+    # renames them back. Result is loaded from the cache if present.
+    def call(self, kind: str, compute: Callable[..., T], *arguments: Any) -> T:
+        names = _canonical_names(arguments)
+        if names is None:
+            return compute(*arguments)
+        (symbols, functions) = names
+        canonical = _map_structure(arguments, lambda e: _rename(e, symbols, functions))
+        key = self.key(kind, srepr(canonical))
+        result = self.get(key)
+        if result is _MISSING:
+            result = compute(*canonical)
+            self.set(key, result)
+        inverse_symbols = {v: k for (k, v) in symbols.items()}
+        inverse_functions = {v: k for (k, v) in functions.items()}
+        return _map_structure(result, lambda e: _rename(e, inverse_symbols, inverse_functions))
+
+    def run_derivation(self, module: ModuleType) -> bool:
+        """
+        Run verify_derivation() of the law module, unless it has already succeeded for the same
+        sources. Return True if derivation was loaded from the cache.
+        """
+
+        key = self.key("derivation", module.__name__, *_module_sources(module))
+        if self.get(key) is not _MISSING:
+            return True
+        module.verify_derivation()
+        self.set(key, True)
+        return False
+
+
+def enable_disk_cache(directory: str) -> DiskCache:
+    global _active_cache  # pylint: disable=global-statement
+    _active_cache = DiskCache(directory)
+    return _active_cache
+
+
+def disable_disk_cache() -> None:
+    global _active_cache  # pylint: disable=global-statement
+    _active_cache = None
+
+
+# Returns active cache. Cache is enabled on first call if SYMPLYPHYSICS_CACHE_DIR environment
+# variable is set.
+def active_disk_cache() -> Optional[DiskCache]:
+    global _active_cache  # pylint: disable=global-statement
+    if _active_cache is _NOT_LOADED:
+        directory = os.environ.get(CACHE_DIR_ENVIRONMENT)
+        _active_cache = DiskCache(directory) if directory else None
+    return _active_cache
+
+
+# Runs verify_derivation() of the module, with the persistent cache if it is enabled
+def run_derivation(module: ModuleType) -> None:
+    cache = active_disk_cache()
+    if cache is None:
+        module.verify_derivation()
+    else:
+        cache.run_derivation(module)
@@ -1,19 +1,166 @@
-from typing import SupportsAbs, Any
-from sympy import simplify
+import cmath
+import random
+from collections import namedtuple
+from typing import SupportsAbs, Any, Optional
+from sympy import (Derivative, DiracDelta, Expr, Heaviside, I, Integral, Integer, Max, Min,
+    Piecewise, Rational, ceiling, floor, sign as sign_function, simplify, sympify, SympifyError)
+from sympy.core.function import AppliedUndef
 from sympy.vector import Vector
 
+## Comparison is done in stages, each stage is more expensive than the previous one:
+## - structural: expressions are equal after automatic evaluation of their difference;
+## - numeric: both sides are evaluated at random points of their free symbols. Different values
+##   prove that expressions are different, same values at all points mean that expressions are
+##   equal with high probability;
+## - simplify: difference of expressions is simplified to zero.
+STRUCTURAL = "structural"
+NUMERIC = "numeric"
+SIMPLIFY = "simplify"
+
+# Number of random points to evaluate expressions at
+PROBES = 4
+# Relative difference of values, that are considered equal. Values are evaluated with
+# _PROBE_PRECISION digits, tolerance only allows for rounding of floating point coefficients.
+PROBE_TOLERANCE = 1e-13
+# Values, that are less than this in magnitude, can not be told apart from rounding errors of
+# zero, eg 'sin(x)**2 + cos(x)**2 - 1'. Numeric stage is undecided for them.
+_PROBE_NEGLIGIBLE = 1e-20
+# Significant digits of evaluated values
+_PROBE_PRECISION = 30
+# Points, where expressions are not finite, are skipped. Numeric stage is undecided when there
+# are not enough valid points.
+_MAX_PROBE_ATTEMPTS = 3 * PROBES
+_SEED = 20240901
+
+ComparisonStats = namedtuple("ComparisonStats", ["structural", "numeric", "simplify"])
+
+_stats = {STRUCTURAL: 0, NUMERIC: 0, SIMPLIFY: 0}
+
+
+def comparison_stats() -> ComparisonStats:
+    """
+    Return number of comparisons decided by each stage.
+    """
+
+    return ComparisonStats(**_stats)
+
+
+def reset_comparison_stats() -> None:
+    for stage in _stats:
+        _stats[stage] = 0
+
+
+def _decided(stage: str, result: bool) -> bool:
+    _stats[stage] += 1
+    return result
+
+
+# Random value, that satisfies assumptions of the symbol, eg positive or integer. Magnitudes of
+# values are spread from 0.01 to 100. Symbols without 'real' assumption get complex values.
+def _sample(symbol: Expr, rng: random.Random) -> Expr:
+    if symbol.is_zero:
+        return Integer(0)
+    if symbol.is_positive or symbol.is_nonnegative:
+        sign = 1
+    elif symbol.is_negative or symbol.is_nonpositive:
+        sign = -1
+    else:
+        sign = rng.choice((-1, 1))
+    if symbol.is_integer:
+        return Integer(sign * rng.randint(1, 20))
+    value = sign * _magnitude(rng)
+    if symbol.is_real:
+        return value
+    return value + rng.choice((-1, 1)) * _magnitude(rng) * I
+
+
+def _magnitude(rng: random.Random) -> Expr:
+    return Rational(rng.randint(100, 999), 100) * Rational(10)**rng.randint(-2, 1)
+
+
+def _evaluate(expr: Expr, point: dict[Expr, Expr]) -> Optional[complex]:
+    value = complex(expr.evalf(_PROBE_PRECISION, subs=point))
+    if not cmath.isfinite(value):
+        return None
+    return value
+
+
+# Expressions, that are not probed: undefined functions have no values, and piecewise functions
+# may have the same values at random points, while being different elsewhere.
+_UNPROBED = (AppliedUndef, Derivative, Integral, Min, Max, Piecewise, Heaviside, DiracDelta,
+    sign_function, floor, ceiling)
+
+
+# Returns False if expressions are different at some point, True if they are the same at all
+# points and None if it cannot be decided, eg expressions contain undefined functions.
+def _probe(lhs: list[Expr], rhs: list[Expr]) -> Optional[bool]:
+    expressions = lhs + rhs
+    if any(e.has(*_UNPROBED) for e in expressions):
+        return None
+    free_symbols = sorted(set().union(*(e.free_symbols for e in expressions)), key=str)
+    rng = random.Random(_SEED)
+    probes = 0
+    for _ in range(_MAX_PROBE_ATTEMPTS):
+        point = {s: _sample(s, rng) for s in free_symbols}
+        values = []
+        for (left, right) in zip(lhs, rhs):
+            left_value = _evaluate(left, point)
+            right_value = _evaluate(right, point)
+            if left_value is None or right_value is None:
+                break
+            values.append((left_value, right_value))
+        else:
+            for (left_value, right_value) in values:
+                if cmath.isclose(left_value, right_value, rel_tol=PROBE_TOLERANCE):
+                    continue
+                if max(abs(left_value), abs(right_value)) < _PROBE_NEGLIGIBLE:
+                    return None
+                return False
+            probes += 1
+            if probes == PROBES or not free_symbols:
+                return True
+    return None
+
+
+# Components of both sides, so that vectors are compared component-wise
+def _components(lhs: Any, rhs: Any) -> Optional[tuple[list[Expr], list[Expr]]]:
+    if isinstance(lhs, Vector) and isinstance(rhs, Vector):
+        base_vectors = set(lhs.components) | set(rhs.components)
+        return ([lhs.components.get(b, Integer(0)) for b in base_vectors],
+            [rhs.components.get(b, Integer(0)) for b in base_vectors])
+    try:
+        (lhs, rhs) = (sympify(lhs), sympify(rhs))
+    except SympifyError:
+        return None
+    if isinstance(lhs, Expr) and isinstance(rhs, Expr):
+        return ([lhs], [rhs])
+    return None
+
 
 ## Do not try to limit type of the input parameters. Allow any object to
 ## be compared, if it can.
-def expr_equals(lhs: Any, rhs: Any) -> bool:
-    val = simplify(lhs - rhs)
+## In strict mode expressions are equal only if their difference is proven to be zero, numeric
+## stage can only prove that expressions are different.
+def expr_equals(lhs: Any, rhs: Any, *, strict: bool = False) -> bool:
+    diff = lhs - rhs
+    if diff in (0, Vector.zero):
+        return _decided(STRUCTURAL, True)
+    components = _components(lhs, rhs)
+    if components is not None:
+        try:
+            equal = _probe(*components)
+        except (TypeError, ValueError, ArithmeticError):
+            equal = None
+        if equal is False or (equal and not strict):
+            return _decided(NUMERIC, equal)
+    val = simplify(diff)
     if val == 0:
-        return True
+        return _decided(SIMPLIFY, True)
     if val == Vector.zero:
-        return True
-    return False
+        return _decided(SIMPLIFY, True)
+    return _decided(SIMPLIFY, False)
 
 
 ## SymPy does not allow to compare Abs with non-Abs values so we apply abs() to both sides.
-def expr_equals_abs(lhs: SupportsAbs, rhs: SupportsAbs) -> bool:
-    return expr_equals(abs(lhs), abs(rhs))
+def expr_equals_abs(lhs: SupportsAbs, rhs: SupportsAbs, *, strict: bool = False) -> bool:
+    return expr_equals(abs(lhs), abs(rhs), strict=strict)
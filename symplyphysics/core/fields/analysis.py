@@ -1,5 +1,9 @@
-from typing import Sequence
-from sympy import Expr, integrate, simplify
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Sequence
+from sympy import Expr, Float, Integral, integrate, simplify
 from symplyphysics import Vector, dot_vectors, vector_magnitude, vector_unit
 from ..dimensions import ScalarValue
 from ..fields.operators import curl_operator, divergence_operator
@@ -7,33 +11,148 @@ from ..fields.vector_field import VectorField
 from ..geometry.elements import curve_element, curve_element_magnitude, volume_element_magnitude
 from ..geometry.normals import curve_normal, parametrized_surface_normal
 from ..fields.parameters import ParameterLimits
+from ..fields.quadrature import DEFAULT_TOLERANCE, QuadratureResult, integrate_numeric
+
+# Integration methods. Symbolic method uses SymPy 'integrate', numeric method uses adaptive
+# Gauss-Kronrod quadrature, see integrate_numeric(). All integrals below accept 'method',
+# 'tolerance' of numeric integration and 'time_budget' of symbolic integration in seconds.
+# Integrals with '_with_error' suffix return QuadratureResult with the value and its error
+# estimate, that is zero for symbolic integrals.
+SYMBOLIC = "symbolic"
+NUMERIC = "numeric"
+
+
+# Derived from BaseException, so that it is not caught by SymPy internals
+class _TimeBudgetExceeded(BaseException):
+    pass
+
+
+# Interrupts the block after 'seconds'. Timer signals are only available in the main thread
+# on Unix, so budget is not applied otherwise. Outer real-time timer, eg a watchdog, is re-armed
+# with its remaining time, and is left intact if it expires before the budget.
+@contextmanager
+def _time_budget(seconds: Optional[float]) -> Iterator[None]:
+    if seconds is None or not hasattr(
+            signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    (outer_delay, outer_interval) = signal.getitimer(signal.ITIMER_REAL)
+    if 0 < outer_delay <= seconds:
+        yield
+        return
+
+    def on_timer(*_args: object) -> None:
+        raise _TimeBudgetExceeded()
+
+    start = time.monotonic()
+    previous_handler = signal.signal(signal.SIGALRM, on_timer)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        if outer_delay > 0:
+            # zero delay disarms the timer, so the expired outer timer fires right away
+            remaining = max(outer_delay - (time.monotonic() - start), 1e-6)
+            signal.setitimer(signal.ITIMER_REAL, remaining, outer_interval)
+
+
+# Integrates with chosen method. When 'time_budget' in seconds is set, symbolic integration
+# falls back to numeric one if it takes longer, or if SymPy cannot take the integral.
+def _integrate(integrand: ScalarValue, limits: Sequence[ParameterLimits], method: str,
+    tolerance: float, time_budget: Optional[float]) -> QuadratureResult:
+    if method not in (SYMBOLIC, NUMERIC):
+        raise ValueError(f"Integration method should be '{SYMBOLIC}' or '{NUMERIC}', got '{method}'")
+    if method == SYMBOLIC:
+        try:
+            with _time_budget(time_budget):
+                result = simplify(integrate(integrand, *limits))
+            if time_budget is None or not result.has(Integral):
+                return QuadratureResult(result, 0)
+        except _TimeBudgetExceeded:
+            pass
+    (value, error) = integrate_numeric(integrand, *limits, tolerance=tolerance)
+    return QuadratureResult(Float(value), error)
 
 
 # trajectory should be array with projections to coordinates, eg [3 * cos(parameter), 3 * sin(parameter)]
-def circulation_along_curve(field: VectorField, trajectory: Sequence[Expr],
-    parameter_limits: ParameterLimits) -> ScalarValue:
+# pylint: disable-next=too-many-arguments
+def circulation_along_curve_with_error(field: VectorField, trajectory: Sequence[Expr],
+    parameter_limits: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> QuadratureResult:
     (parameter, parameter_from, parameter_to) = parameter_limits
     field_applied = field.apply(trajectory)
     curve_element_vector = curve_element(Vector(trajectory, field.coordinate_system), parameter)
     integrand = dot_vectors(field_applied, curve_element_vector)
-    circulation_value = integrate(integrand, (parameter, parameter_from, parameter_to))
-    return simplify(circulation_value)
+    return _integrate(integrand, [(parameter, parameter_from, parameter_to)], method, tolerance,
+        time_budget)
+
+
+# Same as circulation_along_curve_with_error(), but returns only the value of the integral
+# pylint: disable-next=too-many-arguments
+def circulation_along_curve(field: VectorField, trajectory: Sequence[Expr],
+    parameter_limits: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> ScalarValue:
+    return circulation_along_curve_with_error(field, trajectory, parameter_limits,
+        method=method,
+        tolerance=tolerance,
+        time_budget=time_budget).value
 
 
 # calculate circulation along curve using surface that has this curve as a boundary
 # surface should be array with projections to coordinates, eg [parameter1 * cos(parameter2), parameter1 * sin(parameter2)]
-def circulation_along_surface_boundary(field: VectorField, surface: Sequence[Expr],
-    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits) -> ScalarValue:
+# pylint: disable-next=too-many-arguments
+def circulation_along_surface_boundary_with_error(field: VectorField, surface: Sequence[Expr],
+    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> QuadratureResult:
     # circulation over surface is flux of curl of the field
     field_rotor_vector_field = curl_operator(field)
-    return flux_across_surface(field_rotor_vector_field, surface, parameter_and_limits1,
-        parameter_and_limits2)
+    return flux_across_surface_with_error(field_rotor_vector_field,
+        surface,
+        parameter_and_limits1,
+        parameter_and_limits2,
+        method=method,
+        tolerance=tolerance,
+        time_budget=time_budget)
+
+
+# Same as circulation_along_surface_boundary_with_error(), but returns only the value of the
+# integral
+# pylint: disable-next=too-many-arguments
+def circulation_along_surface_boundary(field: VectorField, surface: Sequence[Expr],
+    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> ScalarValue:
+    return circulation_along_surface_boundary_with_error(field,
+        surface,
+        parameter_and_limits1,
+        parameter_and_limits2,
+        method=method,
+        tolerance=tolerance,
+        time_budget=time_budget).value
 
 
 # trajectory should be array with projections to coordinates, eg [3 * cos(parameter), 3 * sin(parameter)]
 # trajectory and field should be 2-dimensional, on XY plane
-def flux_across_curve(field: VectorField, trajectory: Sequence[Expr],
-    parameter_limits: ParameterLimits) -> ScalarValue:
+# pylint: disable-next=too-many-arguments
+def flux_across_curve_with_error(field: VectorField, trajectory: Sequence[Expr],
+    parameter_limits: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> QuadratureResult:
     if len(trajectory) > 2:
         raise ValueError(f"Trajectory should have at most 2 components, got {len(trajectory)}")
     (parameter, parameter_from, parameter_to) = parameter_limits
@@ -43,14 +162,32 @@ def flux_across_curve(field: VectorField, trajectory: Sequence[Expr],
     norm_unit_vector = vector_unit(norm_vector)
     field_dot_norm_value = dot_vectors(field_applied, norm_unit_vector)
     curve_element_magnitude_value = curve_element_magnitude(trajectory_vector, parameter)
-    flux_value = integrate(field_dot_norm_value * curve_element_magnitude_value,
-        (parameter, parameter_from, parameter_to))
-    return simplify(flux_value)
+    return _integrate(field_dot_norm_value * curve_element_magnitude_value,
+        [(parameter, parameter_from, parameter_to)], method, tolerance, time_budget)
+
+
+# Same as flux_across_curve_with_error(), but returns only the value of the integral
+# pylint: disable-next=too-many-arguments
+def flux_across_curve(field: VectorField, trajectory: Sequence[Expr],
+    parameter_limits: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> ScalarValue:
+    return flux_across_curve_with_error(field, trajectory, parameter_limits,
+        method=method,
+        tolerance=tolerance,
+        time_budget=time_budget).value
 
 
 # trajectory should be array with projections to coordinates, eg [3 * cos(parameter), 3 * sin(parameter)]
-def flux_across_surface(field: VectorField, surface: Sequence[Expr],
-    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits) -> ScalarValue:
+# pylint: disable-next=too-many-arguments
+def flux_across_surface_with_error(field: VectorField, surface: Sequence[Expr],
+    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> QuadratureResult:
     (parameter1, parameter1_from, parameter1_to) = parameter_and_limits1
     (parameter2, parameter2_from, parameter2_to) = parameter_and_limits2
     # calculate SurfaceIntegral integrand, which is Dot(Field, dS)
@@ -58,32 +195,75 @@ def flux_across_surface(field: VectorField, surface: Sequence[Expr],
     surface_vector = Vector(surface, field.coordinate_system)
     surface_element_vector = parametrized_surface_normal(surface_vector, parameter1, parameter2)
     integrand = dot_vectors(field_applied, surface_element_vector)
-    flux_value = integrate(integrand, (parameter1, parameter1_from, parameter1_to),
-        (parameter2, parameter2_from, parameter2_to))
-    return simplify(flux_value)
+    return _integrate(integrand, [(parameter1, parameter1_from, parameter1_to),
+        (parameter2, parameter2_from, parameter2_to)], method, tolerance, time_budget)
+
+
+# Same as flux_across_surface_with_error(), but returns only the value of the integral
+# pylint: disable-next=too-many-arguments
+def flux_across_surface(field: VectorField, surface: Sequence[Expr],
+    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> ScalarValue:
+    return flux_across_surface_with_error(field,
+        surface,
+        parameter_and_limits1,
+        parameter_and_limits2,
+        method=method,
+        tolerance=tolerance,
+        time_budget=time_budget).value
 
 
 # flux across some curve, that is a surface boundary is double integral of divergence of the field
-def flux_across_surface_boundary(field: VectorField, surface: Sequence[Expr],
-    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits) -> ScalarValue:
+# pylint: disable-next=too-many-arguments
+def flux_across_surface_boundary_with_error(field: VectorField, surface: Sequence[Expr],
+    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> QuadratureResult:
     (parameter1, parameter1_from, parameter1_to) = parameter_and_limits1
     (parameter2, parameter2_from, parameter2_to) = parameter_and_limits2
     field_divergence = divergence_operator(field)
     surface_vector = Vector(surface, field.coordinate_system)
     surface_element_vector = parametrized_surface_normal(surface_vector, parameter1, parameter2)
     surface_element_magnitude = vector_magnitude(surface_element_vector)
-    flux_value = integrate(field_divergence * surface_element_magnitude,
-        (parameter1, parameter1_from, parameter1_to), (parameter2, parameter2_from, parameter2_to))
-    return simplify(flux_value)
+    return _integrate(field_divergence * surface_element_magnitude,
+        [(parameter1, parameter1_from, parameter1_to),
+        (parameter2, parameter2_from, parameter2_to)], method, tolerance, time_budget)
+
+
+# Same as flux_across_surface_boundary_with_error(), but returns only the value of the integral
+# pylint: disable-next=too-many-arguments
+def flux_across_surface_boundary(field: VectorField, surface: Sequence[Expr],
+    parameter_and_limits1: ParameterLimits, parameter_and_limits2: ParameterLimits,
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> ScalarValue:
+    return flux_across_surface_boundary_with_error(field,
+        surface,
+        parameter_and_limits1,
+        parameter_and_limits2,
+        method=method,
+        tolerance=tolerance,
+        time_budget=time_budget).value
 
 
 # flux across some surface, that is a volume boundary is triple integral of divergence of the field
 # over volume.
 # Parametrized volumes are not supported. We define volume by the integral limits.
 # Integration starts from the last limit, ie z_limits
-def flux_across_volume_boundary(field: VectorField, x_limits: tuple[ScalarValue, ScalarValue],
-    y_limits: tuple[ScalarValue, ScalarValue], z_limits: tuple[ScalarValue,
-    ScalarValue]) -> ScalarValue:
+# pylint: disable-next=too-many-arguments
+def flux_across_volume_boundary_with_error(field: VectorField,
+    x_limits: tuple[ScalarValue, ScalarValue], y_limits: tuple[ScalarValue, ScalarValue],
+    z_limits: tuple[ScalarValue, ScalarValue],
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> QuadratureResult:
     (x_from, x_to) = x_limits
     (y_from, y_to) = y_limits
     (z_from, z_to) = z_limits
@@ -92,6 +272,20 @@ def flux_across_volume_boundary(field: VectorField, x_limits: tuple[ScalarValue,
     y = field.coordinate_system.coord_system.base_scalars()[1]
     z = field.coordinate_system.coord_system.base_scalars()[2]
     volume_element_magnitude_value = volume_element_magnitude(field.coordinate_system)
-    flux_value = integrate(field_divergence * volume_element_magnitude_value, (z, z_from, z_to),
-        (y, y_from, y_to), (x, x_from, x_to))
-    return simplify(flux_value)
+    return _integrate(field_divergence * volume_element_magnitude_value, [(z, z_from, z_to),
+        (y, y_from, y_to), (x, x_from, x_to)], method, tolerance, time_budget)
+
+
+# Same as flux_across_volume_boundary_with_error(), but returns only the value of the integral
+# pylint: disable-next=too-many-arguments
+def flux_across_volume_boundary(field: VectorField, x_limits: tuple[ScalarValue, ScalarValue],
+    y_limits: tuple[ScalarValue, ScalarValue], z_limits: tuple[ScalarValue,
+    ScalarValue],
+    *,
+    method: str = SYMBOLIC,
+    tolerance: float = DEFAULT_TOLERANCE,
+    time_budget: Optional[float] = None) -> ScalarValue:
+    return flux_across_volume_boundary_with_error(field, x_limits, y_limits, z_limits,
+        method=method,
+        tolerance=tolerance,
+        time_budget=time_budget).value
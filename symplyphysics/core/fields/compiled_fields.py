@@ -0,0 +1,102 @@
+"""
+This module compiles field expressions to vectorized NumPy functions.
+
+Applying field to a point substitutes each coordinate of the point into SymPy expression. Compiled
+field is evaluated for arrays of coordinates at once, which is much faster for grids and large sets
+of points. Coordinates are given in the coordinate system of the field, ie (x, y, z) for cartesian,
+(r, theta, z) for cylindrical and (r, theta, phi) for spherical coordinate systems.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+from sympy import Expr, lambdify, sympify
+
+from ..batch import import_numpy
+from ..points.point import Point
+from ..points.cartesian_point import CartesianPoint
+from ..points.sphere_point import SpherePoint
+from ..points.cylinder_point import CylinderPoint
+from ..coordinate_systems.coordinate_systems import CoordinateSystem
+from ...core.dimensions import ScalarValue
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# Fields are applied to 3d coordinate systems only, see CoordSys3D
+_SIZE = 3
+
+CompiledField = Callable[..., list[Any]]
+
+
+# Point with general Point type is not checked against coordinate system.
+# It's up to user to make sure that field function works with general Point type.
+def assert_point_coordinate_system(point_: Point, coordinate_system: CoordinateSystem) -> None:
+    system_type = coordinate_system.coord_system_type
+    if isinstance(point_, CartesianPoint) and system_type != CoordinateSystem.System.CARTESIAN:
+        raise ValueError(f"Unsupported coordinate system for CartesianPoint: {coordinate_system}")
+    if isinstance(point_, SpherePoint) and system_type != CoordinateSystem.System.SPHERICAL:
+        raise ValueError(f"Unsupported coordinate system for SpherePoint: {coordinate_system}")
+    if isinstance(point_, CylinderPoint) and system_type != CoordinateSystem.System.CYLINDRICAL:
+        raise ValueError(f"Unsupported coordinate system for CylinderPoint: {coordinate_system}")
+
+
+# Compiles field components, applied to the basis of coordinate system, to a function of
+# 3 coordinate arrays. Function returns list of arrays, one per component.
+def compile_field(components: Sequence[ScalarValue],
+    coordinate_system: CoordinateSystem) -> CompiledField:
+    base_scalars = list(coordinate_system.coord_system.base_scalars())
+    expressions: list[Expr] = [sympify(c) for c in components]
+    for e in expressions:
+        unknown_symbols = e.free_symbols - set(base_scalars)
+        if unknown_symbols:
+            raise ValueError(f"Field expression '{e}' should only depend on coordinates, "
+                f"got {unknown_symbols}")
+    import_numpy()
+    kernel = lambdify(base_scalars, expressions, modules="numpy")
+
+    def evaluate(*coordinates: NDArray[Any]) -> list[Any]:
+        np = import_numpy()
+        shape = np.broadcast_shapes(*(c.shape for c in coordinates))
+        results = [np.asarray(r, dtype=float) for r in kernel(*coordinates)]
+        # constant components are not broadcast by NumPy
+        return [r if r.shape == shape else np.broadcast_to(r, shape).copy() for r in results]
+
+    return evaluate
+
+
+# Converts (N, k) array of coordinates, or sequence of points to 3 coordinate arrays of
+# size N. Missing coordinates are zeroes, as in Point.
+def points_to_coordinates(points: ArrayLike | Sequence[Point],
+    coordinate_system: CoordinateSystem) -> tuple[NDArray[Any], ...]:
+    np = import_numpy()
+    if isinstance(points, Sequence) and len(points) > 0 and isinstance(points[0], Point):
+        rows = []
+        for p in points:
+            if not isinstance(p, Point):
+                raise TypeError(f"Points should all be Point, got {type(p).__name__}")
+            assert_point_coordinate_system(p, coordinate_system)
+            rows.append([float(p.coordinate(i)) for i in range(_SIZE)])
+        array = np.asarray(rows, dtype=float)
+    else:
+        array = np.asarray(points, dtype=float)
+    if array.ndim == 1:
+        array = array[np.newaxis, :]
+    if array.ndim != 2 or array.shape[1] > _SIZE:
+        raise ValueError(f"Points should have shape (N, k), where k <= {_SIZE}. Got: {array.shape}")
+    if array.shape[1] < _SIZE:
+        array = np.pad(array, [(0, 0), (0, _SIZE - array.shape[1])])
+    return tuple(array[:, i] for i in range(_SIZE))
+
+
+# Converts coordinate axes to 3 coordinate arrays of the grid with shape
+# (len(axes[0]), len(axes[1]), len(axes[2])). Missing axes contain single zero coordinate.
+def grid_to_coordinates(axes: Sequence[ArrayLike]) -> tuple[NDArray[Any], ...]:
+    np = import_numpy()
+    if len(axes) > _SIZE:
+        raise ValueError(f"Grid should have at most {_SIZE} axes. Got: {len(axes)}")
+    arrays = [np.atleast_1d(np.asarray(a, dtype=float)) for a in axes]
+    for i, a in enumerate(arrays):
+        if a.ndim != 1:
+            raise ValueError(f"Grid axis {i} should be 1-dimensional. Got: {a.shape}")
+    arrays.extend(np.zeros(1) for _ in range(_SIZE - len(arrays)))
+    return tuple(np.meshgrid(*arrays, indexing="ij"))
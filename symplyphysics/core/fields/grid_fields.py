@@ -0,0 +1,354 @@
+"""
+This module contains fields, sampled on uniform grids, and their finite-difference operators.
+
+Grid field stores NumPy array of field values at the nodes of a uniform grid in the coordinate
+system of the field, ie (x, y, z) for cartesian, (r, theta, z) for cylindrical and
+(r, theta, phi) for spherical coordinate systems. Axes with a single node are allowed, field is
+considered constant along them, eg for 2-dimensional fields.
+
+Gradient, divergence, curl and Laplacian use the same Lamé coefficients and orientation of
+coordinate systems as symbolic operators, see ``operators.coordinate_system_metric()``.
+Derivatives are second order central differences in the interior of the grid and second order
+one-sided differences at the boundary. Operators of curvilinear coordinate systems are singular
+at r = 0 and at polar angle 0 or pi, values at such nodes are not finite.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from .compiled_fields import assert_point_coordinate_system, compile_field, grid_to_coordinates
+from .operators import coordinate_system_metric
+from .scalar_field import AnyPoint, ScalarField
+from .vector_field import VectorField
+from ..batch import import_numpy
+from ..coordinate_systems.coordinate_systems import CoordinateSystem
+from ..points.point import Point
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+_SIZE = 3
+# Relative deviation of node spacing, that is still considered uniform
+_SPACING_TOLERANCE = 1e-9
+
+
+class UniformGrid:
+    """
+    Nodes of a uniform grid, built from 3 evenly spaced coordinate axes. Missing axes contain
+    single zero coordinate, as in ``ScalarField.evaluate_grid()``.
+    """
+
+    _coordinate_system: CoordinateSystem
+    _axes: tuple[NDArray[Any], ...]
+    # Lamé coefficients at the grid nodes and orientation, see metric()
+    _metric: Optional[tuple[list[NDArray[Any]], int]]
+
+    def __init__(self,
+        *axes: ArrayLike,
+        coordinate_system: CoordinateSystem = CoordinateSystem(CoordinateSystem.System.CARTESIAN)):
+        np = import_numpy()
+        if len(axes) > _SIZE:
+            raise ValueError(f"Grid should have at most {_SIZE} axes. Got: {len(axes)}")
+        arrays = [np.atleast_1d(np.asarray(a, dtype=float)) for a in axes]
+        arrays.extend(np.zeros(1) for _ in range(_SIZE - len(arrays)))
+        for i, a in enumerate(arrays):
+            if a.ndim != 1:
+                raise ValueError(f"Grid axis {i} should be 1-dimensional. Got: {a.shape}")
+            if a.size < 2:
+                continue
+            steps = np.diff(a)
+            if steps[0] <= 0 or not np.allclose(steps, steps[0], rtol=_SPACING_TOLERANCE, atol=0):
+                raise ValueError(f"Grid axis {i} should be increasing and evenly spaced")
+        self._coordinate_system = coordinate_system
+        self._axes = tuple(arrays)
+        self._metric = None
+
+    @property
+    def coordinate_system(self) -> CoordinateSystem:
+        return self._coordinate_system
+
+    @property
+    def axes(self) -> tuple[NDArray[Any], ...]:
+        return self._axes
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(a.size for a in self._axes)
+
+    # Distance between nodes along each axis. Axes with a single node have zero spacing.
+    @property
+    def spacing(self) -> tuple[float, ...]:
+        return tuple(float(a[1] - a[0]) if a.size > 1 else 0.0 for a in self._axes)
+
+    # return - 3 coordinate arrays with the shape of the grid.
+    def coordinates(self) -> tuple[NDArray[Any], ...]:
+        return grid_to_coordinates(self._axes)
+
+    # Derivative of values along the grid axis. Leading dimensions of 'values' are the grid shape.
+    def derivative(self, values: NDArray[Any], axis: int) -> NDArray[Any]:
+        np = import_numpy()
+        nodes = self._axes[axis]
+        if nodes.size == 1:
+            return np.zeros_like(values)
+        return np.gradient(values, nodes, axis=axis, edge_order=2 if nodes.size > 2 else 1)
+
+    # Lamé coefficients of the coordinate system at the grid nodes and orientation of its basis.
+    # Calculated once per grid.
+    def metric(self) -> tuple[list[NDArray[Any]], int]:
+        if self._metric is None:
+            metric = coordinate_system_metric(self._coordinate_system)
+            lame = compile_field(metric.lame_coefficients, self._coordinate_system)
+            self._metric = (lame(*self.coordinates()), metric.orientation)
+        return self._metric
+
+    # Multilinear interpolation weights of points. Points are (N, 3) array of coordinates.
+    # return - list of (indices, weights) for each of 8 corners of the cell, that contains point.
+    def _cells(self, points: NDArray[Any]) -> list[tuple[tuple[NDArray[Any], ...], NDArray[Any]]]:
+        np = import_numpy()
+        lower: list[NDArray[Any]] = []
+        fractions: list[NDArray[Any]] = []
+        for i, nodes in enumerate(self._axes):
+            coordinates = points[:, i]
+            if nodes.size == 1:
+                lower.append(np.zeros(len(points), dtype=int))
+                fractions.append(np.zeros(len(points)))
+                continue
+            step = nodes[1] - nodes[0]
+            position = (coordinates - nodes[0]) / step
+            tolerance = _SPACING_TOLERANCE * (nodes.size - 1)
+            if np.any(position < -tolerance) or np.any(position > nodes.size - 1 + tolerance):
+                raise ValueError(f"Points should be inside the grid along axis {i}, "
+                    f"[{nodes[0]}, {nodes[-1]}]")
+            index = np.clip(np.floor(position).astype(int), 0, nodes.size - 2)
+            lower.append(index)
+            fractions.append(np.clip(position - index, 0.0, 1.0))
+        cells = []
+        for corner in range(2**_SIZE):
+            offsets = [(corner >> i) & 1 for i in range(_SIZE)]
+            indices = tuple(
+                np.minimum(lower[i] + offsets[i], self._axes[i].size - 1) for i in range(_SIZE))
+            weights = np.ones(len(points))
+            for i in range(_SIZE):
+                weights = weights * (fractions[i] if offsets[i] else 1.0 - fractions[i])
+            cells.append((indices, weights))
+        return cells
+
+    # Interpolates values at points. Points are (N, 3) array of coordinates in the grid
+    # coordinate system. Leading dimensions of 'values' are the grid shape.
+    # return - array of interpolated values with leading dimension N.
+    def interpolate(self, values: NDArray[Any], points: ArrayLike) -> NDArray[Any]:
+        np = import_numpy()
+        array = np.asarray(points, dtype=float)
+        if array.ndim == 1:
+            array = array[np.newaxis, :]
+        if array.ndim != 2 or array.shape[1] > _SIZE:
+            raise ValueError(
+                f"Points should have shape (N, k), where k <= {_SIZE}. Got: {array.shape}")
+        if array.shape[1] < _SIZE:
+            array = np.pad(array, [(0, 0), (0, _SIZE - array.shape[1])])
+        result = np.zeros((len(array),) + values.shape[_SIZE:])
+        # weights are broadcast over trailing dimensions of values, eg vector components
+        trailing = (1,) * (values.ndim - _SIZE)
+        for (indices, weights) in self._cells(array):
+            result = result + weights.reshape((-1,) + trailing) * values[indices]
+        return result
+
+
+def _point_coordinates(point_: AnyPoint, coordinate_system: CoordinateSystem) -> list[float]:
+    assert_point_coordinate_system(point_, coordinate_system)
+    return [float(point_.coordinate(i)) for i in range(_SIZE)]
+
+
+# Nodes of the grid as (N, 3) array of coordinates
+def _grid_points(grid: UniformGrid) -> NDArray[Any]:
+    np = import_numpy()
+    return np.stack([c.ravel() for c in grid.coordinates()], axis=-1)
+
+
+def _assert_same_coordinate_system(field_system: CoordinateSystem,
+    grid_system: CoordinateSystem) -> None:
+    if field_system.coord_system_type != grid_system.coord_system_type:
+        raise ValueError(f"Field coordinate system {field_system} should have the same type as "
+            f"grid coordinate system {grid_system}")
+
+
+# Scalar field, sampled at the nodes of uniform grid.
+class GridScalarField:
+    _grid: UniformGrid
+    # Array with the grid shape
+    _values: NDArray[Any]
+
+    def __init__(self, grid: UniformGrid, values: ArrayLike):
+        np = import_numpy()
+        array = np.asarray(values, dtype=float)
+        if array.shape != grid.shape:
+            raise ValueError(f"Values should have grid shape {grid.shape}. Got: {array.shape}")
+        self._grid = grid
+        self._values = array
+
+    @property
+    def grid(self) -> UniformGrid:
+        return self._grid
+
+    @property
+    def values(self) -> NDArray[Any]:
+        return self._values
+
+    @property
+    def coordinate_system(self) -> CoordinateSystem:
+        return self._grid.coordinate_system
+
+    # Samples field at the grid nodes. Field and grid should have the same type of coordinate
+    # system. Gridded fields, converted with to_field(), are interpolated.
+    @staticmethod
+    def from_field(field: ScalarField, grid: UniformGrid) -> GridScalarField:
+        _assert_same_coordinate_system(field.coordinate_system, grid.coordinate_system)
+        if isinstance(field.field_function, GridScalarField):
+            values = field.field_function.evaluate_points(_grid_points(grid))
+            return GridScalarField(grid, values.reshape(grid.shape))
+        return GridScalarField(grid, field.evaluate_grid(*grid.axes))
+
+    # Interpolates field at points. Points are (N, 3) array of coordinates.
+    # return - array of N field values.
+    def evaluate_points(self, points: ArrayLike) -> NDArray[Any]:
+        return self._grid.interpolate(self._values, points)
+
+    def __call__(self, point_: AnyPoint) -> float:
+        coordinates = _point_coordinates(point_, self.coordinate_system)
+        return float(self.evaluate_points([coordinates])[0])
+
+    # Converts to ScalarField, that interpolates values between grid nodes. Field can only be
+    # applied to points with numeric coordinates.
+    def to_field(self) -> ScalarField:
+        return ScalarField(self, self.coordinate_system)
+
+
+# Vector field, sampled at the nodes of uniform grid.
+class GridVectorField:
+    _grid: UniformGrid
+    # Array with the grid shape and trailing dimension of 3 components
+    _values: NDArray[Any]
+
+    def __init__(self, grid: UniformGrid, values: ArrayLike):
+        np = import_numpy()
+        array = np.asarray(values, dtype=float)
+        if array.shape != grid.shape + (_SIZE,):
+            raise ValueError(
+                f"Values should have shape {grid.shape + (_SIZE,)}. Got: {array.shape}")
+        self._grid = grid
+        self._values = array
+
+    @property
+    def grid(self) -> UniformGrid:
+        return self._grid
+
+    @property
+    def values(self) -> NDArray[Any]:
+        return self._values
+
+    @property
+    def coordinate_system(self) -> CoordinateSystem:
+        return self._grid.coordinate_system
+
+    def component(self, index: int) -> NDArray[Any]:
+        return self._values[..., index]
+
+    # Samples field at the grid nodes. Field and grid should have the same type of coordinate
+    # system. Gridded fields, converted with to_field(), are interpolated.
+    @staticmethod
+    def from_field(field: VectorField, grid: UniformGrid) -> GridVectorField:
+        _assert_same_coordinate_system(field.coordinate_system, grid.coordinate_system)
+        if isinstance(field.field_function, GridVectorField):
+            values = field.field_function.evaluate_points(_grid_points(grid))
+            return GridVectorField(grid, values.reshape(grid.shape + (_SIZE,)))
+        return GridVectorField(grid, field.evaluate_grid(*grid.axes))
+
+    # Interpolates field at points. Points are (N, 3) array of coordinates.
+    # return - (N, 3) array of field components.
+    def evaluate_points(self, points: ArrayLike) -> NDArray[Any]:
+        return self._grid.interpolate(self._values, points)
+
+    def __call__(self, point_: Point) -> list[float]:
+        coordinates = _point_coordinates(point_, self.coordinate_system)
+        return [float(c) for c in self.evaluate_points([coordinates])[0]]
+
+    # Converts to VectorField, that interpolates values between grid nodes. Field can only be
+    # applied to points with numeric coordinates.
+    def to_field(self) -> VectorField:
+        return VectorField(self, self.coordinate_system)
+
+
+def _components(field: GridVectorField) -> list[NDArray[Any]]:
+    return [field.component(i) for i in range(_SIZE)]
+
+
+def _gradient(grid: UniformGrid, values: NDArray[Any]) -> list[NDArray[Any]]:
+    (lame, _) = grid.metric()
+    return [grid.derivative(values, i) / lame[i] for i in range(_SIZE)]
+
+
+def _divergence(grid: UniformGrid, components: Sequence[NDArray[Any]]) -> NDArray[Any]:
+    (lame, _) = grid.metric()
+    volume = lame[0] * lame[1] * lame[2]
+    result = sum(grid.derivative(volume / lame[i] * components[i], i) for i in range(_SIZE))
+    return result / volume
+
+
+def _curl(grid: UniformGrid, components: Sequence[NDArray[Any]]) -> list[NDArray[Any]]:
+    (lame, orientation) = grid.metric()
+    result = []
+    for i in range(_SIZE):
+        (j, k) = ((i + 1) % _SIZE, (i + 2) % _SIZE)
+        rotation = (grid.derivative(lame[k] * components[k], j) -
+            grid.derivative(lame[j] * components[j], k))
+        result.append(orientation * rotation / (lame[j] * lame[k]))
+    return result
+
+
+def _laplacian(grid: UniformGrid, values: NDArray[Any]) -> NDArray[Any]:
+    (lame, _) = grid.metric()
+    volume = lame[0] * lame[1] * lame[2]
+    result = sum(
+        grid.derivative(volume / lame[i]**2 * grid.derivative(values, i), i)
+        for i in range(_SIZE))
+    return result / volume
+
+
+def _stack(grid: UniformGrid, components: Sequence[NDArray[Any]]) -> GridVectorField:
+    np = import_numpy()
+    return GridVectorField(grid, np.stack(components, axis=-1))
+
+
+# Gradient of the gridded scalar field, which is Nabla * Field
+def grid_gradient(field: GridScalarField) -> GridVectorField:
+    np = import_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _stack(field.grid, _gradient(field.grid, field.values))
+
+
+# Divergence of the gridded vector field, which is Dot(Nabla, Field)
+def grid_divergence(field: GridVectorField) -> GridScalarField:
+    np = import_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return GridScalarField(field.grid, _divergence(field.grid, _components(field)))
+
+
+# Curl of the gridded vector field, which is Cross(Nabla, Field)
+def grid_curl(field: GridVectorField) -> GridVectorField:
+    np = import_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _stack(field.grid, _curl(field.grid, _components(field)))
+
+
+# Laplacian of the gridded field, which is Dot(Nabla, Nabla) * Field. Laplacian of the vector
+# field is grad(div F) - curl(curl F).
+def grid_laplacian(
+        field: GridScalarField | GridVectorField) -> GridScalarField | GridVectorField:
+    np = import_numpy()
+    grid = field.grid
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if isinstance(field, GridScalarField):
+            return GridScalarField(grid, _laplacian(grid, field.values))
+        gradient = _gradient(grid, _divergence(grid, _components(field)))
+        curl_curl = _curl(grid, _curl(grid, _components(field)))
+        return _stack(grid, [g - c for (g, c) in zip(gradient, curl_curl)])
@@ -1,88 +1,213 @@
-from sympy import diff, sin, tan
+"""
+This module contains differential operators of fields: gradient, divergence, curl and Laplacian.
+
+Operators are defined for orthogonal coordinate systems by their Lamé coefficients h1, h2, h3,
+eg (1, r, 1) for cylindrical coordinates (r, theta, z). Coefficients of operator terms depend only
+on the coordinate system, so they are derived once per coordinate system. Results are cached per
+field expression, so repeated and nested operators, eg curl of curl or divergence of gradient, are
+computed once.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Optional, Sequence
+from sympy import Expr, S, diff, simplify, sin, sympify
+from sympy.vector import BaseScalar, CoordSys3D
 
 from ..dimensions import ScalarValue
+from ..fields.scalar_field import ScalarField
 from ..fields.vector_field import VectorField
 from ..coordinate_systems.coordinate_systems import CoordinateSystem
 from ..vectors.vectors import Vector
 
+# Maximum number of cached operator results, per operator
+OPERATORS_MAXSIZE = 1024
 
-def divergence_operator(field: VectorField) -> ScalarValue:
+_DIMENSIONS = 3
+
+# 'base_scalars' and 'lame_coefficients' are tuples of 3 expressions. 'orientation' is -1 for
+# left-handed order of base vectors.
+Metric = namedtuple("Metric", ["base_scalars", "lame_coefficients", "orientation"])
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def coordinate_system_metric(coordinate_system: CoordinateSystem) -> Metric:
+    base_scalars = tuple(coordinate_system.coord_system.base_scalars())
+    if coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
+        return Metric(base_scalars, (S.One, S.One, S.One), 1)
+    if coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+        (r, _, _) = base_scalars
+        return Metric(base_scalars, (S.One, r, S.One), 1)
+    if coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
+        # theta - azimuthal angle, phi - polar angle. Base vectors (r, theta, phi) are
+        # left-handed in this order.
+        (r, _, phi) = base_scalars
+        return Metric(base_scalars, (S.One, r * sin(phi), r), -1)
+    raise ValueError(f"Unsupported coordinate system: {coordinate_system}")
+
+
+# Metric of SymPy coordinate system, eg CoordSys3D("C", transformation="spherical")
+def coord_system_metric(coord_system: CoordSys3D) -> Metric:
+    return Metric(tuple(coord_system.base_scalars()), tuple(coord_system.lame_coefficients()), 1)
+
+
+def _volume_factor(metric: Metric) -> Expr:
+    (h1, h2, h3) = metric.lame_coefficients
+    return h1 * h2 * h3
+
+
+# Terms of divergence: div F = sum(a_i * dF_i/dq_i + b_i * F_i)
+@lru_cache(maxsize=OPERATORS_MAXSIZE)
+def _divergence_coefficients(metric: Metric) -> tuple[tuple[Expr, Expr], ...]:
+    volume = _volume_factor(metric)
+    coefficients = []
+    for (q, h) in zip(metric.base_scalars, metric.lame_coefficients):
+        coefficients.append((simplify(1 / h), simplify(diff(volume / h, q) / volume)))
+    return tuple(coefficients)
+
+
+# Terms of curl: curl F_i = o * (a * dF_k/dq_j + b * F_k - c * dF_j/dq_k - d * F_j),
+# where (i, j, k) is cyclic permutation of (0, 1, 2)
+@lru_cache(maxsize=OPERATORS_MAXSIZE)
+def _curl_coefficients(metric: Metric) -> tuple[tuple[Expr, Expr, Expr, Expr], ...]:
+    (q, h) = (metric.base_scalars, metric.lame_coefficients)
+    coefficients = []
+    for i in range(_DIMENSIONS):
+        (j, k) = ((i + 1) % _DIMENSIONS, (i + 2) % _DIMENSIONS)
+        coefficients.append((simplify(1 / h[j]), simplify(diff(h[k], q[j]) / (h[j] * h[k])),
+            simplify(1 / h[k]), simplify(diff(h[j], q[k]) / (h[j] * h[k]))))
+    return tuple(coefficients)
+
+
+# Terms of Laplacian: lap f = sum(a_i * d2f/dq_i2 + b_i * df/dq_i)
+@lru_cache(maxsize=OPERATORS_MAXSIZE)
+def _laplacian_coefficients(metric: Metric) -> tuple[tuple[Expr, Expr], ...]:
+    volume = _volume_factor(metric)
+    coefficients = []
+    for (q, h) in zip(metric.base_scalars, metric.lame_coefficients):
+        coefficients.append((simplify(1 / h**2), simplify(diff(volume / h**2, q) / volume)))
+    return tuple(coefficients)
+
+
+@lru_cache(maxsize=OPERATORS_MAXSIZE)
+def _gradient(expression: Expr, metric: Metric) -> tuple[Expr, ...]:
+    return tuple(
+        diff(expression, q) / h for (q, h) in zip(metric.base_scalars, metric.lame_coefficients))
+
+
+@lru_cache(maxsize=OPERATORS_MAXSIZE)
+def _divergence(components: tuple[Expr, ...], metric: Metric) -> Expr:
+    result = S.Zero
+    for (q, f, (a, b)) in zip(metric.base_scalars, components,
+            _divergence_coefficients(metric)):
+        result = result + a * diff(f, q) + b * f
+    return result
+
+
+@lru_cache(maxsize=OPERATORS_MAXSIZE)
+def _curl(components: tuple[Expr, ...], metric: Metric) -> tuple[Expr, ...]:
+    q = metric.base_scalars
+    result = []
+    for (i, (a, b, c, d)) in enumerate(_curl_coefficients(metric)):
+        (j, k) = ((i + 1) % _DIMENSIONS, (i + 2) % _DIMENSIONS)
+        (f_j, f_k) = (components[j], components[k])
+        result.append(metric.orientation *
+            (a * diff(f_k, q[j]) + b * f_k - c * diff(f_j, q[k]) - d * f_j))
+    return tuple(result)
+
+
+@lru_cache(maxsize=OPERATORS_MAXSIZE)
+def _laplacian(expression: Expr, metric: Metric) -> Expr:
+    result = S.Zero
+    for (q, (a, b)) in zip(metric.base_scalars, _laplacian_coefficients(metric)):
+        result = result + a * diff(expression, q, 2) + b * diff(expression, q)
+    return result
+
+
+def _vector_laplacian(components: tuple[Expr, ...], metric: Metric) -> tuple[Expr, ...]:
+    # lap F = grad(div F) - curl(curl F)
+    gradient = _gradient(_divergence(components, metric), metric)
+    curl_curl = _curl(_curl(components, metric), metric)
+    return tuple(g - c for (g, c) in zip(gradient, curl_curl))
+
+
+def _field_components(field: VectorField) -> tuple[Expr, ...]:
     field_space = field.apply_to_basis()
+    if len(field_space.components) > _DIMENSIONS:
+        raise ValueError(f"Operators are only defined for {_DIMENSIONS} dimensions. "
+            f"Got: {len(field_space.components)}")
     # extend missing components with zeroes
-    field_components = list(field_space.components) + [0] * (3 - len(field_space.components))
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
-        x = field_space.coordinate_system.coord_system.base_scalars()[0]
-        y = field_space.coordinate_system.coord_system.base_scalars()[1]
-        z = field_space.coordinate_system.coord_system.base_scalars()[2]
-        field_x = field_components[0]
-        field_y = field_components[1]
-        field_z = field_components[2]
-        return diff(field_x, x) + diff(field_y, y) + diff(field_z, z)
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
-        r = field_space.coordinate_system.coord_system.base_scalars()[0]
-        theta = field_space.coordinate_system.coord_system.base_scalars()[1]
-        z = field_space.coordinate_system.coord_system.base_scalars()[2]
-        field_r = field_components[0]
-        field_theta = field_components[1]
-        field_z = field_components[2]
-        return diff(field_r, r) + field_r / r + diff(field_theta, theta) / r + diff(field_z, z)
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
-        r = field_space.coordinate_system.coord_system.base_scalars()[0]
-        theta = field_space.coordinate_system.coord_system.base_scalars()[1]
-        phi = field_space.coordinate_system.coord_system.base_scalars()[2]
-        field_r = field_components[0]
-        field_theta = field_components[1]
-        field_phi = field_components[2]
-        return diff(field_r, r) + 2 * field_r / r + diff(field_theta,
-            theta) / (r * sin(phi)) + diff(field_phi, phi) / r + field_phi / (r * tan(phi))
-    raise ValueError(f"Unsupported coordinate system: {field.coordinate_system}")
+    components = list(field_space.components) + [0] * (_DIMENSIONS - len(field_space.components))
+    return tuple(sympify(c) for c in components)
+
+
+def _to_field(components: Sequence[Expr], coordinate_system: CoordinateSystem) -> VectorField:
+    return VectorField.from_vector(Vector(list(components), coordinate_system))
+
+
+# Calculate Gradient of the scalar field, which is Nabla * Field
+def gradient_operator(field: ScalarField) -> VectorField:
+    metric = coordinate_system_metric(field.coordinate_system)
+    gradient = _gradient(sympify(field.apply_to_basis()), metric)
+    return _to_field(gradient, field.coordinate_system)
+
+
+# Calculate Divergence of the field, which is Dot(Nabla, Field)
+def divergence_operator(field: VectorField) -> ScalarValue:
+    metric = coordinate_system_metric(field.coordinate_system)
+    return _divergence(_field_components(field), metric)
 
 
 # Calculate Curl of the field, which is Cross(Nabla, Field)
 def curl_operator(field: VectorField) -> VectorField:
-    field_space = field.apply_to_basis()
-    dimensions = 3
-    if len(field_space.components) > dimensions:
-        raise ValueError(
-            f"Curl is only defined for {dimensions} dimensions. Got: {len(field_space.components)}")
-    # extend missing components with zeroes
-    field_components = list(field_space.components) + [0] * (3 - len(field_space.components))
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
-        x = field_space.coordinate_system.coord_system.base_scalars()[0]
-        y = field_space.coordinate_system.coord_system.base_scalars()[1]
-        z = field_space.coordinate_system.coord_system.base_scalars()[2]
-        field_x = field_components[0]
-        field_y = field_components[1]
-        field_z = field_components[2]
-        field_rotor_vector = Vector([
-            diff(field_z, y) - diff(field_y, z),
-            diff(field_x, z) - diff(field_z, x),
-            diff(field_y, x) - diff(field_x, y)
-        ], field_space.coordinate_system)
-        return VectorField.from_vector(field_rotor_vector)
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
-        r = field_space.coordinate_system.coord_system.base_scalars()[0]
-        theta = field_space.coordinate_system.coord_system.base_scalars()[1]
-        z = field_space.coordinate_system.coord_system.base_scalars()[2]
-        field_r = field_components[0]
-        field_theta = field_components[1]
-        field_z = field_components[2]
-        field_rotor_vector = Vector([
-            diff(field_z, theta) / r - diff(field_theta, z),
-            diff(field_r, z) - diff(field_z, r),
-            (diff(r * field_theta, r) - diff(field_r, theta)) / r
-        ], field_space.coordinate_system)
-        return VectorField.from_vector(field_rotor_vector)
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
-        r = field_space.coordinate_system.coord_system.base_scalars()[0]
-        theta = field_space.coordinate_system.coord_system.base_scalars()[1]
-        phi = field_space.coordinate_system.coord_system.base_scalars()[2]
-        field_r = field_components[0]
-        field_theta = field_components[1]
-        field_phi = field_components[2]
-        field_rotor_vector = Vector([(diff(sin(phi) * field_theta, phi) - diff(field_phi, theta)) /
-            (r * sin(phi)), (diff(r * field_phi, r) - diff(field_r, phi)) / r,
-            (diff(field_r, theta) / sin(phi) - diff(r * field_theta, r)) / r],
-            field_space.coordinate_system)
-        return VectorField.from_vector(field_rotor_vector)
-    raise ValueError(f"Unsupported coordinate system: {field.coordinate_system}")
+    metric = coordinate_system_metric(field.coordinate_system)
+    return _to_field(_curl(_field_components(field), metric), field.coordinate_system)
+
+
+# Calculate Laplacian of the field, which is Dot(Nabla, Nabla) * Field. Laplacian of the scalar
+# field is scalar value, Laplacian of the vector field is vector field.
+def laplacian_operator(field: ScalarField | VectorField) -> ScalarValue | VectorField:
+    metric = coordinate_system_metric(field.coordinate_system)
+    if isinstance(field, ScalarField):
+        return _laplacian(sympify(field.apply_to_basis()), metric)
+    return _to_field(_vector_laplacian(_field_components(field), metric),
+        field.coordinate_system)
+
+
+# Calculate Laplacian of the expression of base scalars of SymPy coordinate system, like
+# sympy.vector.Laplacian(expression).doit() does. Metric is taken from CoordSys3D, unless
+# 'coordinate_system' is given.
+def expression_laplacian(expression: Expr,
+    coordinate_system: Optional[CoordinateSystem] = None) -> Expr:
+    expression = sympify(expression)
+    if coordinate_system is not None:
+        return _laplacian(expression, coordinate_system_metric(coordinate_system))
+    coord_systems = {s.system for s in expression.atoms(BaseScalar)}
+    if len(coord_systems) > 1:
+        coord_sys_names = [str(c) for c in coord_systems]
+        raise TypeError(f"Different coordinate systems in expression: {str(coord_sys_names)}")
+    if not coord_systems:
+        return S.Zero
+    return _laplacian(expression, coord_system_metric(next(iter(coord_systems))))
+
+
+_CACHED = (_gradient, _divergence, _curl, _laplacian, _divergence_coefficients,
+    _curl_coefficients, _laplacian_coefficients)
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return hit / miss statistics of cached operator results.
+    """
+
+    infos = [f.cache_info() for f in _CACHED]  # pylint: disable=no-value-for-parameter
+    return CacheInfo(hits=sum(i.hits for i in infos),
+        misses=sum(i.misses for i in infos),
+        maxsize=OPERATORS_MAXSIZE,
+        currsize=sum(i.currsize for i in infos))
+
+
+def cache_clear() -> None:
+    for f in _CACHED:
+        f.cache_clear()
@@ -0,0 +1,166 @@
+"""
+This module integrates expressions numerically.
+
+Integration limits are mapped to the unit hypercube, so inner limits can depend on outer
+integration variables, like in SymPy ``integrate``. Integral over the hypercube is calculated
+with adaptive tensor product Gauss-Kronrod rule: the box with the largest error estimate is
+split in half along the axis with the largest error, until the total error estimate is within
+tolerance.
+"""
+
+from __future__ import annotations
+import heapq
+import math
+from collections import namedtuple
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+from sympy import Dummy, Expr, lambdify, oo, sympify
+
+from ..batch import import_numpy
+from .parameters import ParameterLimits
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+QuadratureResult = namedtuple("QuadratureResult", ["value", "error"])
+
+# Nodes and weights of 15-point Kronrod and embedded 7-point Gauss rules on [-1, 1].
+# Only non-negative nodes are listed, from the largest one to zero.
+_KRONROD_NODES = (0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0)
+_KRONROD_WEIGHTS = (0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714)
+# Gauss nodes are odd Kronrod nodes, ie 0.949..., 0.741..., 0.405... and 0
+_GAUSS_WEIGHTS = (0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327)
+
+DEFAULT_TOLERANCE = 1e-8
+DEFAULT_MAX_SUBDIVISIONS = 500
+
+
+# Returns nodes on [0, 1] and weights of Kronrod and Gauss rules. Gauss weights are zero at
+# nodes, that only belong to Kronrod rule.
+def _unit_rules() -> tuple[NDArray[Any], NDArray[Any], NDArray[Any]]:
+    np = import_numpy()
+    nodes = np.array([-x for x in _KRONROD_NODES[:-1]] + list(reversed(_KRONROD_NODES)))
+    kronrod = np.array(list(_KRONROD_WEIGHTS[:-1]) + list(reversed(_KRONROD_WEIGHTS)))
+    gauss_half = [0.0, _GAUSS_WEIGHTS[0], 0.0, _GAUSS_WEIGHTS[1], 0.0, _GAUSS_WEIGHTS[2], 0.0]
+    gauss = np.array(gauss_half + [_GAUSS_WEIGHTS[3]] + list(reversed(gauss_half)))
+    return ((nodes + 1) / 2, kronrod / 2, gauss / 2)
+
+
+# Maps integration limits to the unit hypercube. Limits are given in SymPy order, ie innermost
+# integral first.
+# return - integrand over the unit hypercube, and new variables from innermost to outermost.
+def _to_unit_hypercube(integrand: Expr,
+    limits: Sequence[ParameterLimits]) -> tuple[Expr, list[Any]]:
+    variables = [sympify(v) for (v, _, _) in limits]
+    unit_variables = [Dummy(str(v)) for v in variables]
+    result = sympify(integrand)
+    # outer variables are substituted first, so that inner limits can depend on them
+    outer_substitutions: dict[Any, Expr] = {}
+    for (variable, unit_variable, (_, lower, upper)) in reversed(
+            list(zip(variables, unit_variables, limits))):
+        lower_expr = sympify(lower).subs(outer_substitutions)
+        upper_expr = sympify(upper).subs(outer_substitutions)
+        if lower_expr.has(oo, -oo) or upper_expr.has(oo, -oo):
+            raise ValueError(
+                f"Numeric integration over infinite limits is not supported: {variable}")
+        width = upper_expr - lower_expr
+        outer_substitutions[variable] = lower_expr + unit_variable * width
+        result = result * width
+    result = result.subs(outer_substitutions)
+    unknown_symbols = result.free_symbols - set(unit_variables)
+    if unknown_symbols:
+        raise ValueError(f"Integrand should only depend on integration variables, "
+            f"got {unknown_symbols}")
+    return (result, unit_variables)
+
+
+def _box_rule(kernel: Callable[..., Any], lower: NDArray[Any], width: NDArray[Any],
+    rules: tuple[NDArray[Any], NDArray[Any], NDArray[Any]]) -> tuple[float, float, int]:
+    np = import_numpy()
+    (nodes, kronrod, gauss) = rules
+    dimensions = len(lower)
+    axes = [lower[i] + width[i] * nodes for i in range(dimensions)]
+    grid = np.meshgrid(*axes, indexing="ij")
+    # non-finite values are reported below
+    with np.errstate(invalid="ignore", divide="ignore"):
+        values = np.broadcast_to(np.asarray(kernel(*grid), dtype=float), grid[0].shape)
+    volume = float(np.prod(width))
+
+    def contract(weights: Sequence[NDArray[Any]]) -> float:
+        result = values
+        for w in weights:
+            result = np.tensordot(result, w, axes=([0], [0]))
+        return float(result) * volume
+
+    kronrod_value = contract([kronrod] * dimensions)
+    # error along each axis is estimated by replacing Kronrod rule with Gauss rule on that axis
+    axis_errors = [
+        abs(kronrod_value - contract([gauss if j == i else kronrod
+        for j in range(dimensions)]))
+        for i in range(dimensions)
+    ]
+    if not math.isfinite(kronrod_value):
+        raise ValueError(f"Integrand is not finite in the integration domain: {kronrod_value}")
+    worst_axis = int(np.argmax(axis_errors))
+    return (kronrod_value, float(sum(axis_errors)), worst_axis)
+
+
+def integrate_numeric(integrand: Expr,
+    *limits: ParameterLimits,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_subdivisions: int = DEFAULT_MAX_SUBDIVISIONS) -> QuadratureResult:
+    """
+    Integrate expression numerically. Limits are given in the same order as in SymPy
+    ``integrate``, ie ``(x, 0, 1), (y, 0, x)`` integrates over ``x`` first.
+
+    Integration stops when error estimate is less than ``tolerance``, or relative error is less
+    than ``tolerance`` for integrals larger than 1.
+    Raises ``ValueError`` if tolerance is not reached after ``max_subdivisions`` subdivisions.
+    """
+
+    if len(limits) == 0:
+        raise ValueError("At least one integration variable is required")
+    if tolerance <= 0:
+        raise ValueError(f"Tolerance should be positive, got {tolerance}")
+    np = import_numpy()
+    (unit_integrand, unit_variables) = _to_unit_hypercube(integrand, limits)
+    kernel = lambdify(unit_variables, unit_integrand, modules="numpy")
+    rules = _unit_rules()
+    dimensions = len(unit_variables)
+
+    # heap of boxes with the largest error first
+    lower = np.zeros(dimensions)
+    width = np.ones(dimensions)
+    (value, error, axis) = _box_rule(kernel, lower, width, rules)
+    boxes = [(-error, 0, value, lower, width, axis)]
+    (total_value, total_error) = (value, error)
+    counter = 1
+    subdivisions = 0
+    while total_error > tolerance * max(1.0, abs(total_value)):
+        if subdivisions == max_subdivisions:
+            raise ValueError(f"Numeric integration did not converge after {max_subdivisions} "
+                f"subdivisions: value is {total_value}, error estimate is {total_error}")
+        (negative_error, _, value, lower, width, axis) = heapq.heappop(boxes)
+        subdivisions += 1
+        total_value -= value
+        total_error += negative_error
+        half_width = width.copy()
+        half_width[axis] /= 2
+        upper_lower = lower.copy()
+        upper_lower[axis] += half_width[axis]
+        for box_lower in (lower, upper_lower):
+            (value, error, axis) = _box_rule(kernel, box_lower, half_width, rules)
+            total_value += value
+            total_error += error
+            heapq.heappush(boxes, (-error, counter, value, box_lower, half_width, axis))
+            counter += 1
+    # sum again to reduce accumulated rounding errors
+    total_value = math.fsum(b[2] for b in boxes)
+    total_error = math.fsum(-b[0] for b in boxes)
+    return QuadratureResult(value=total_value, error=total_error)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 from functools import partial
-from typing import Callable, Sequence, TypeAlias
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, TypeAlias
 from sympy import Expr, sympify
 from sympy.vector import express
 
+from .compiled_fields import (CompiledField, assert_point_coordinate_system, compile_field,
+    grid_to_coordinates, points_to_coordinates)
+
 from ..points.point import Point
 from ..points.cartesian_point import CartesianPoint
 from ..points.sphere_point import SpherePoint
@@ -11,6 +14,9 @@ from ..points.cylinder_point import CylinderPoint
 from ..coordinate_systems.coordinate_systems import CoordinateSystem
 from ...core.dimensions import ScalarValue
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
 AnyPoint: TypeAlias = Point | CartesianPoint | SpherePoint | CylinderPoint
 FieldFunction: TypeAlias = Callable[[AnyPoint], ScalarValue] | ScalarValue
 
@@ -37,33 +43,20 @@ class ScalarField:
     #NOTE: 4 and higher dimensional fields are not supported cause of using CoordSys3D
     #      to maintain ScalarField invariant.
     _coordinate_system: CoordinateSystem
+    # Field applied to basis and compiled to NumPy function, see evaluator()
+    _evaluator: Optional[CompiledField]
 
     def __init__(self,
         point_function: FieldFunction = 0,
         coordinate_system: CoordinateSystem = CoordinateSystem(CoordinateSystem.System.CARTESIAN)):
         self._point_function = point_function
         self._coordinate_system = coordinate_system
+        self._evaluator = None
 
     def __call__(self, point_: AnyPoint) -> ScalarValue:
         if not callable(self._point_function):
             return self._point_function
-        # Point with general Point type is not checked against coordinate system.
-        # It's up to user to make sure that field function works with general Point type.
-        if isinstance(
-                point_, CartesianPoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.CARTESIAN:
-            raise ValueError(
-                f"Unsupported coordinate system for CartesianPoint: {self._coordinate_system}")
-        if isinstance(
-                point_, SpherePoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.SPHERICAL:
-            raise ValueError(
-                f"Unsupported coordinate system for SpherePoint: {self._coordinate_system}")
-        if isinstance(
-                point_, CylinderPoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.CYLINDRICAL:
-            raise ValueError(
-                f"Unsupported coordinate system for CylinderPoint: {self._coordinate_system}")
+        assert_point_coordinate_system(point_, self._coordinate_system)
         return self._point_function(point_)
 
     @property
@@ -111,6 +104,26 @@ class ScalarField:
     def to_expression(self) -> Expr:
         return sympify(self.apply_to_basis())
 
+    # Returns compiled field function. It accepts 3 arrays of coordinates in the field coordinate
+    # system and returns list with array of field values. Field is compiled once and cached.
+    def evaluator(self) -> CompiledField:
+        if self._evaluator is None:
+            self._evaluator = compile_field([self.apply_to_basis()], self._coordinate_system)
+        return self._evaluator
+
+    # Evaluates field at points. Points are (N, 3) array of coordinates in the field coordinate
+    # system, or sequence of points.
+    # return - array of N field values.
+    def evaluate_points(self, points: ArrayLike | Sequence[AnyPoint]) -> NDArray[Any]:
+        coordinates = points_to_coordinates(points, self._coordinate_system)
+        return self.evaluator()(*coordinates)[0]
+
+    # Evaluates field on the grid, that is built from coordinate axes, eg
+    # evaluate_grid(xs, ys, zs). Missing axes contain single zero coordinate.
+    # return - array of field values with shape (len(xs), len(ys), len(zs)).
+    def evaluate_grid(self, *axes: ArrayLike) -> NDArray[Any]:
+        return self.evaluator()(*grid_to_coordinates(axes))[0]
+
     # Convert field coordinate system to new basis and construct new field.
     # Scalar field invariant (coordinate system independence) should hold.
     def rebase(self, coordinate_system: CoordinateSystem) -> ScalarField:
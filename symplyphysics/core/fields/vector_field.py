@@ -1,18 +1,24 @@
 from __future__ import annotations
 from functools import partial
-from typing import Callable, Sequence, TypeAlias
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, TypeAlias
 from sympy import Expr, sympify
 from sympy.vector import Vector as SymVector
 
+from .compiled_fields import (CompiledField, assert_point_coordinate_system, compile_field,
+    grid_to_coordinates, points_to_coordinates)
 from .scalar_field import AnyPoint
 from ..points.point import Point
 from ..points.cartesian_point import CartesianPoint
 from ..points.sphere_point import SpherePoint
 from ..points.cylinder_point import CylinderPoint
 from ..coordinate_systems.coordinate_systems import CoordinateSystem
+from ..batch import import_numpy
 from ..vectors.vectors import Vector
 from ...core.dimensions import ScalarValue
 
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
 FieldFunction: TypeAlias = Callable[[AnyPoint], Sequence[ScalarValue]] | Sequence[ScalarValue]
 
 
@@ -28,6 +34,11 @@ def _subs_with_point(expr: Sequence[ScalarValue], coordinate_system: CoordinateS
     return result
 
 
+def _stack_components(components: list[Any]) -> NDArray[Any]:
+    np = import_numpy()
+    return np.stack(components, axis=-1)
+
+
 # Contains mapping of point to vector in _point_function, eg P(Point).
 # Vector field is coordinate system dependent, because generally vectors are not coordinate
 # system invariant.
@@ -37,33 +48,20 @@ class VectorField:
     #NOTE: 4 and higher dimensional fields are not supported cause of using CoordSys3D
     #      that allows rebasing vector field to different coordinate systems.
     _coordinate_system: CoordinateSystem
+    # Field applied to basis and compiled to NumPy function, see evaluator()
+    _evaluator: Optional[CompiledField]
 
     def __init__(self,
         point_function: FieldFunction,
         coordinate_system: CoordinateSystem = CoordinateSystem(CoordinateSystem.System.CARTESIAN)):
         self._point_function = point_function
         self._coordinate_system = coordinate_system
+        self._evaluator = None
 
     def __call__(self, point_: Point) -> Vector:
         if not callable(self._point_function):
             return Vector(self._point_function, self._coordinate_system)
-        # Point with general Point type is not checked against coordinate system.
-        # It's up to user to make sure that field function works with general Point type.
-        if isinstance(
-                point_, CartesianPoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.CARTESIAN:
-            raise ValueError(
-                f"Unsupported coordinate system for CartesianPoint: {self._coordinate_system}")
-        if isinstance(
-                point_, SpherePoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.SPHERICAL:
-            raise ValueError(
-                f"Unsupported coordinate system for SpherePoint: {self._coordinate_system}")
-        if isinstance(
-                point_, CylinderPoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.CYLINDRICAL:
-            raise ValueError(
-                f"Unsupported coordinate system for CylinderPoint: {self._coordinate_system}")
+        assert_point_coordinate_system(point_, self._coordinate_system)
         result = self._point_function(point_)
         return Vector(result, self._coordinate_system)
 
@@ -117,4 +115,26 @@ class VectorField:
         field_space = self.apply_to_basis()
         return field_space.to_sympy_vector()
 
+    # Returns compiled field function. It accepts 3 arrays of coordinates in the field coordinate
+    # system and returns list of 3 arrays with field components. Field is compiled once and cached.
+    def evaluator(self) -> CompiledField:
+        if self._evaluator is None:
+            components = list(self.apply_to_basis().components)
+            components.extend([0] * (3 - len(components)))
+            self._evaluator = compile_field(components, self._coordinate_system)
+        return self._evaluator
+
+    # Evaluates field at points. Points are (N, 3) array of coordinates in the field coordinate
+    # system, or sequence of points.
+    # return - (N, 3) array of field components.
+    def evaluate_points(self, points: ArrayLike | Sequence[AnyPoint]) -> NDArray[Any]:
+        coordinates = points_to_coordinates(points, self._coordinate_system)
+        return _stack_components(self.evaluator()(*coordinates))
+
+    # Evaluates field on the grid, that is built from coordinate axes, eg
+    # evaluate_grid(xs, ys, zs). Missing axes contain single zero coordinate.
+    # return - array of field components with shape (len(xs), len(ys), len(zs), 3).
+    def evaluate_grid(self, *axes: ArrayLike) -> NDArray[Any]:
+        return _stack_components(self.evaluator()(*grid_to_coordinates(axes)))
+
     # rebase() for curvilinear coordinate systems is quite complex. Not implemented for the moment.
@@ -4,11 +4,20 @@ from ..dimensions import ScalarValue
 from ..vectors.vectors import Vector
 
 
+# Derivative of the vector over parameter. Derivative is taken component-wise, without converting
+# to SymPy vector, but result is the same as for Vector.from_sympy_vector(): zero vector has no
+# components, other vectors have 3 components.
+def vector_derivative(vector_: Vector, parameter: Expr) -> Vector:
+    components = [diff(c, parameter) for c in vector_.components]
+    if all(c == 0 for c in components):
+        return Vector([], vector_.coordinate_system)
+    components.extend([0] * (3 - len(components)))
+    return Vector(components, vector_.coordinate_system)
+
+
 # Curve element is its tangent vector
 def curve_element(trajectory: Vector, parameter: Expr) -> Vector:
-    trajectory_sympy_vector = trajectory.to_sympy_vector()
-    trajectory_element_sympy_vector = diff(trajectory_sympy_vector, parameter)
-    return Vector.from_sympy_vector(trajectory_element_sympy_vector, trajectory.coordinate_system)
+    return vector_derivative(trajectory, parameter)
 
 
 def curve_element_magnitude(trajectory: Vector, parameter: Expr) -> ScalarValue:
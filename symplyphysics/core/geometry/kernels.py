@@ -0,0 +1,209 @@
+"""
+This module compiles geometry elements of parametrized curves and surfaces to NumPy kernels.
+
+Symbolic elements, eg curve_element() and parametrized_surface_normal(), are differentiated for
+every call. Kernel differentiates parametrization once, compiles points, tangents, normals and
+length / area elements to a NumPy function and evaluates them over whole arrays of parameters,
+eg parameter meshes of numeric line and surface integrals. Kernels are cached per parametrization
+and coordinate system.
+
+Parametrizations should only depend on their parameters. Normals and area elements are only
+defined for cartesian coordinate systems, as cross_cartesian_vectors() is.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+from sympy import Expr, lambdify, sqrt, sympify
+from sympy.vector import CoordSys3D
+
+from ..batch import import_numpy
+from ..coordinate_systems.coordinate_systems import CoordinateSystem
+from ..registries import on_coordinate_system_release
+from ..vectors.vectors import Vector
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+_SIZE = 3
+
+# Kernels are keyed by coordinate system and parametrization. Kernels are dropped when
+# coordinate system is released, see RegistryScope.
+_curve_kernels: dict[tuple[Any, ...], CurveKernel] = {}
+_surface_kernels: dict[tuple[Any, ...], SurfaceKernel] = {}
+
+
+# Components of the vector, padded with zeroes to 3 dimensions
+def _components(vector_: Vector) -> tuple[Expr, ...]:
+    if len(vector_.components) > _SIZE:
+        raise ValueError(
+            f"Vector should have at most {_SIZE} components. Got: {len(vector_.components)}")
+    components = list(vector_.components) + [0] * (_SIZE - len(vector_.components))
+    return tuple(sympify(c) for c in components)
+
+
+def _cross(left: Sequence[Expr], right: Sequence[Expr]) -> list[Expr]:
+    (ax, ay, az) = left
+    (bx, by, bz) = right
+    return [ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx]
+
+
+def _magnitude(components: Sequence[Expr]) -> Expr:
+    return sqrt(sum(c**2 for c in components))
+
+
+# Compiles expressions to a function of parameter arrays. Function returns (..., k) array of
+# k expressions, broadcast to the shape of parameters.
+def _compile(parameters: Sequence[Expr],
+    expressions: Sequence[Expr]) -> Callable[..., NDArray[Any]]:
+    for e in expressions:
+        unknown_symbols = e.free_symbols - set(parameters)
+        if unknown_symbols:
+            raise ValueError(f"Parametrization '{e}' should only depend on parameters, "
+                f"got {unknown_symbols}")
+    import_numpy()
+    kernel = lambdify(list(parameters), list(expressions), modules="numpy")
+
+    def evaluate(*arguments: ArrayLike) -> NDArray[Any]:
+        np = import_numpy()
+        arrays = [np.asarray(a, dtype=float) for a in arguments]
+        shape = np.broadcast_shapes(*(a.shape for a in arrays))
+        # constant expressions are not broadcast by NumPy
+        results = [np.broadcast_to(np.asarray(r, dtype=float), shape) for r in kernel(*arrays)]
+        return np.stack(results, axis=-1)
+
+    return evaluate
+
+
+def _assert_cartesian(coordinate_system: CoordinateSystem) -> None:
+    if coordinate_system.coord_system_type != CoordinateSystem.System.CARTESIAN:
+        coord_name_from = CoordinateSystem.system_to_transformation_name(
+            coordinate_system.coord_system_type)
+        raise ValueError(
+            f"Normals are only supported for cartesian coordinates: got {coord_name_from}")
+
+
+class CurveKernel:
+    """
+    Compiled geometry of the curve, parametrized with a single parameter. Methods accept array of
+    parameter values and return arrays with the same leading shape.
+    """
+
+    _coordinate_system: CoordinateSystem
+    # Points and tangents
+    _evaluate: Callable[..., NDArray[Any]]
+
+    def __init__(self, components: Sequence[Expr], parameter: Expr,
+        coordinate_system: CoordinateSystem):
+        tangent = [c.diff(parameter) for c in components]
+        self._coordinate_system = coordinate_system
+        self._evaluate = _compile([parameter], [*components, *tangent])
+
+    @property
+    def coordinate_system(self) -> CoordinateSystem:
+        return self._coordinate_system
+
+    # return - (..., 3) array of curve points.
+    def points(self, parameters: ArrayLike) -> NDArray[Any]:
+        return self._evaluate(parameters)[..., :_SIZE]
+
+    # Tangents are curve elements, see curve_element().
+    # return - (..., 3) array of tangent vectors.
+    def tangents(self, parameters: ArrayLike) -> NDArray[Any]:
+        return self._evaluate(parameters)[..., _SIZE:]
+
+    # Length elements are magnitudes of tangents, see curve_element_magnitude().
+    # return - array of length elements.
+    def length_elements(self, parameters: ArrayLike) -> NDArray[Any]:
+        np = import_numpy()
+        return np.linalg.norm(self.tangents(parameters), axis=-1)
+
+
+class SurfaceKernel:
+    """
+    Compiled geometry of the surface, parametrized with 2 parameters. Methods accept arrays of
+    both parameters, eg parameter mesh, and return arrays with their broadcast shape.
+    """
+
+    _coordinate_system: CoordinateSystem
+    # Points, tangents along both parameters and normals
+    _evaluate: Callable[..., NDArray[Any]]
+
+    def __init__(self, components: Sequence[Expr], parameter1: Expr, parameter2: Expr,
+        coordinate_system: CoordinateSystem):
+        tangent1 = [c.diff(parameter1) for c in components]
+        tangent2 = [c.diff(parameter2) for c in components]
+        normal = _cross(tangent1, tangent2)
+        self._coordinate_system = coordinate_system
+        self._evaluate = _compile([parameter1, parameter2],
+            [*components, *tangent1, *tangent2, *normal, _magnitude(normal)])
+
+    @property
+    def coordinate_system(self) -> CoordinateSystem:
+        return self._coordinate_system
+
+    # return - (..., 3) array of surface points.
+    def points(self, parameters1: ArrayLike, parameters2: ArrayLike) -> NDArray[Any]:
+        return self._evaluate(parameters1, parameters2)[..., :_SIZE]
+
+    # return - tuple of (..., 3) arrays of tangent vectors along first and second parameters.
+    def tangents(self, parameters1: ArrayLike,
+        parameters2: ArrayLike) -> tuple[NDArray[Any], NDArray[Any]]:
+        values = self._evaluate(parameters1, parameters2)
+        return (values[..., _SIZE:2 * _SIZE], values[..., 2 * _SIZE:3 * _SIZE])
+
+    # Normals are cross products of tangents, see parametrized_surface_normal().
+    # return - (..., 3) array of normal vectors.
+    def normals(self, parameters1: ArrayLike, parameters2: ArrayLike) -> NDArray[Any]:
+        _assert_cartesian(self._coordinate_system)
+        return self._evaluate(parameters1, parameters2)[..., 3 * _SIZE:4 * _SIZE]
+
+    # Area elements are magnitudes of normals.
+    # return - array of area elements.
+    def area_elements(self, parameters1: ArrayLike, parameters2: ArrayLike) -> NDArray[Any]:
+        _assert_cartesian(self._coordinate_system)
+        return self._evaluate(parameters1, parameters2)[..., 4 * _SIZE]
+
+
+def _key(coordinate_system: CoordinateSystem, *parts: Any) -> tuple[Any, ...]:
+    return (coordinate_system.coord_system, coordinate_system.coord_system_type, *parts)
+
+
+# Returns cached kernel of the curve, eg Vector([cos(t), sin(t)]) parametrized with 't'
+def curve_kernel(trajectory: Vector, parameter: Expr) -> CurveKernel:
+    components = _components(trajectory)
+    key = _key(trajectory.coordinate_system, components, parameter)
+    kernel = _curve_kernels.get(key)
+    if kernel is None:
+        kernel = CurveKernel(components, parameter, trajectory.coordinate_system)
+        _curve_kernels[key] = kernel
+    return kernel
+
+
+# Returns cached kernel of the surface, eg Vector([u * cos(v), u * sin(v), u]) parametrized
+# with 'u' and 'v'
+def surface_kernel(surface: Vector, parameter1: Expr, parameter2: Expr) -> SurfaceKernel:
+    components = _components(surface)
+    key = _key(surface.coordinate_system, components, parameter1, parameter2)
+    kernel = _surface_kernels.get(key)
+    if kernel is None:
+        kernel = SurfaceKernel(components, parameter1, parameter2, surface.coordinate_system)
+        _surface_kernels[key] = kernel
+    return kernel
+
+
+def kernels_cache_clear() -> None:
+    _curve_kernels.clear()
+    _surface_kernels.clear()
+
+
+def kernels_cache_size() -> int:
+    return len(_curve_kernels) + len(_surface_kernels)
+
+
+def _release(coord_system: CoordSys3D) -> None:
+    for kernels in (_curve_kernels, _surface_kernels):
+        for key in [k for k in kernels if k[0] == coord_system]:
+            del kernels[key]
+
+
+on_coordinate_system_release(_release)
@@ -1,6 +1,6 @@
-from sympy import Expr, diff
+from sympy import Expr
 
-from ..geometry.elements import curve_element
+from ..geometry.elements import curve_element, vector_derivative
 from ..vectors.vectors import Vector
 from ..vectors.arithmetics import cross_cartesian_vectors
 
@@ -16,11 +16,6 @@ def curve_normal(trajectory: Vector, parameter: Expr) -> Vector:
 # Calculate surface normal, which is Cross(Derivative(Surface, x), Derivative(Surface, y)) for Surface
 # parametrized with 2 parameters
 def parametrized_surface_normal(surface: Vector, parameter1: Expr, parameter2: Expr) -> Vector:
-    surface_sympy_vector = surface.to_sympy_vector()
-    surface_element_x = diff(surface_sympy_vector, parameter1)
-    surface_element_vector_x = Vector.from_sympy_vector(surface_element_x,
-        surface.coordinate_system)
-    surface_element_y = diff(surface_sympy_vector, parameter2)
-    surface_element_vector_y = Vector.from_sympy_vector(surface_element_y,
-        surface.coordinate_system)
+    surface_element_vector_x = vector_derivative(surface, parameter1)
+    surface_element_vector_y = vector_derivative(surface, parameter2)
     return cross_cartesian_vectors(surface_element_vector_x, surface_element_vector_y)
@@ -0,0 +1,270 @@
+"""
+This module profiles import time of law modules.
+
+Profiler imports every module of a package and reports inclusive (with nested imports) and
+exclusive import time of each newly loaded module, the chain of imports, that caused the load,
+and time of each top-level statement of modules within the package. Modules, that are already
+imported, eg SymPy and core of symplyphysics, are not reported.
+
+Usage:
+python -m symplyphysics.core.import_profiler symplyphysics.laws.nuclear --sort exclusive
+python -m symplyphysics.core.import_profiler symplyphysics.laws --folded imports.folded
+
+Folded file can be rendered with flamegraph.pl or speedscope.
+"""
+
+from __future__ import annotations
+import argparse
+import ast
+import importlib
+import importlib.abc
+import importlib.machinery
+import pkgutil
+import sys
+import time
+from collections import namedtuple
+from types import ModuleType
+from typing import Any, Optional, Sequence
+
+# Times are in seconds. Statement times include imports made by the statement, exclusive times
+# do not include them.
+StatementTime = namedtuple("StatementTime", ["module", "line", "source", "inclusive", "exclusive"])
+ModuleImport = namedtuple("ModuleImport",
+    ["name", "parent", "inclusive", "exclusive", "statements"])
+
+SORT_KEYS = ("inclusive", "exclusive", "name", "order")
+_SOURCE_LENGTH = 60
+
+
+class _Frame:  # pylint: disable=too-few-public-methods
+    __slots__ = ("name", "children_time")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.children_time = 0.0
+
+
+class _ProfilingLoader(importlib.abc.Loader):
+
+    def __init__(self, loader: Any, profiler: ImportProfiler) -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # pylint: disable-next=protected-access
+        self._profiler._exec_module(self._loader, module)
+
+    # other loader methods, eg get_source(), are used by inspect and pkgutil
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _ProfilingFinder(importlib.abc.MetaPathFinder):
+
+    def __init__(self, profiler: ImportProfiler) -> None:
+        self._profiler = profiler
+
+    def find_spec(self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None) -> Optional[importlib.machinery.ModuleSpec]:
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _ProfilingLoader(spec.loader, self._profiler)
+        return spec
+
+
+# Records import time of modules, imported within the block. Top-level statements of modules
+# with 'statements_prefix' prefix are timed one by one.
+# Example:
+# with ImportProfiler("symplyphysics.laws") as profiler:
+#     import symplyphysics.laws.dynamics.acceleration_from_force
+# print(format_table(profiler.records))
+class ImportProfiler:
+    _statements_prefix: Optional[str]
+    _finder: _ProfilingFinder
+    _stack: list[_Frame]
+    _records: dict[str, ModuleImport]
+
+    def __init__(self, statements_prefix: Optional[str] = None) -> None:
+        self._statements_prefix = statements_prefix
+        self._finder = _ProfilingFinder(self)
+        self._stack = []
+        self._records = {}
+
+    @property
+    def records(self) -> list[ModuleImport]:
+        return list(self._records.values())
+
+    def __enter__(self) -> ImportProfiler:
+        sys.meta_path.insert(0, self._finder)
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        sys.meta_path.remove(self._finder)
+
+    def _profile_statements(self, name: str) -> bool:
+        prefix = self._statements_prefix
+        return prefix is not None and (name == prefix or name.startswith(prefix + "."))
+
+    def _exec_module(self, loader: Any, module: ModuleType) -> None:
+        name = module.__name__
+        parent = self._stack[-1].name if self._stack else None
+        # reserve position, so that records are in the order of import
+        self._records[name] = ModuleImport(name, parent, 0.0, 0.0, ())
+        frame = _Frame(name)
+        self._stack.append(frame)
+        statements: list[StatementTime] = []
+        start = time.perf_counter()
+        try:
+            source = loader.get_source(name) if self._profile_statements(name) and hasattr(
+                loader, "get_source") else None
+            if source is None:
+                loader.exec_module(module)
+            else:
+                self._exec_statements(module, source, statements)
+        finally:
+            inclusive = time.perf_counter() - start
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1].children_time += inclusive
+            self._records[name] = ModuleImport(name, parent, inclusive,
+                inclusive - frame.children_time, tuple(statements))
+
+    # Executes top-level statements one by one, the same way as module code is executed
+    def _exec_statements(self, module: ModuleType, source: str,
+        statements: list[StatementTime]) -> None:
+        filename = getattr(module, "__file__", None) or module.__name__
+        tree = ast.parse(source, filename)
+        frame = self._stack[-1]
+        flags = 0
+        for statement in tree.body:
+            if isinstance(statement, ast.ImportFrom) and statement.module == "__future__":
+                for alias in statement.names:
+                    flags |= getattr(__import__("__future__"), alias.name).compiler_flag
+            code = compile(ast.Module(body=[statement], type_ignores=[]),
+                filename,
+                "exec",
+                flags=flags,
+                dont_inherit=True)
+            children_before = frame.children_time
+            start = time.perf_counter()
+            exec(code, module.__dict__)  # pylint: disable=exec-used
+            inclusive = time.perf_counter() - start
+            text = (ast.get_source_segment(source, statement) or "").split("\n", 1)[0]
+            statements.append(
+                StatementTime(module.__name__, statement.lineno, text[:_SOURCE_LENGTH], inclusive,
+                inclusive - (frame.children_time - children_before)))
+
+
+def profile_imports(package_name: str, *, statements: bool = True) -> list[ModuleImport]:
+    """
+    Import package and all its modules, and return import times of newly loaded modules.
+    """
+
+    with ImportProfiler(package_name if statements else None) as profiler:
+        package = importlib.import_module(package_name)
+        for info in pkgutil.walk_packages(getattr(package, "__path__", []), package_name + "."):
+            importlib.import_module(info.name)
+    return profiler.records
+
+
+# Returns chain of imports from the first imported module to the module with 'name'
+def import_chain(records: Sequence[ModuleImport], name: str) -> list[str]:
+    by_name = {r.name: r for r in records}
+    chain: list[str] = []
+    current: Optional[str] = name
+    while current is not None and current in by_name:
+        chain.append(current)
+        current = by_name[current].parent
+    return list(reversed(chain))
+
+
+def _sorted(records: Sequence[ModuleImport], sort: str) -> list[ModuleImport]:
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Sort key should be one of {SORT_KEYS}, got '{sort}'")
+    if sort == "order":
+        return list(records)
+    if sort == "name":
+        return sorted(records, key=lambda r: r.name)
+    return sorted(records, key=lambda r: getattr(r, sort), reverse=True)
+
+
+def format_table(records: Sequence[ModuleImport],
+    *,
+    sort: str = "inclusive",
+    limit: Optional[int] = None) -> str:
+    rows = _sorted(records, sort)[:limit]
+    width = max((len(r.name) for r in rows), default=0)
+    lines = [f"{'inclusive ms':>12} {'exclusive ms':>12}  {'module':<{width}}  imported by"]
+    for r in rows:
+        lines.append(f"{r.inclusive * 1000:>12.1f} {r.exclusive * 1000:>12.1f}  "
+            f"{r.name:<{width}}  {r.parent or '-'}")
+    return "\n".join(lines)
+
+
+def format_statements(records: Sequence[ModuleImport], *, limit: Optional[int] = None) -> str:
+    statements = sorted((s for r in records for s in r.statements),
+        key=lambda s: s.exclusive,
+        reverse=True)[:limit]
+    lines = [f"{'exclusive ms':>12} {'inclusive ms':>12}  statement"]
+    for s in statements:
+        lines.append(f"{s.exclusive * 1000:>12.1f} {s.inclusive * 1000:>12.1f}  "
+            f"{s.module}:{s.line}  {s.source}")
+    return "\n".join(lines)
+
+
+# Returns lines of folded stacks, eg "a;b;c 123", with exclusive time in microseconds.
+# Top-level statements are leaf frames of their modules.
+def folded_stacks(records: Sequence[ModuleImport]) -> list[str]:
+    lines = []
+    for r in records:
+        stack = ";".join(import_chain(records, r.name))
+        statements_time = 0.0
+        for s in r.statements:
+            statements_time += s.exclusive
+            microseconds = round(s.exclusive * 1e6)
+            if microseconds > 0:
+                frame = f"{s.line}: {s.source}".replace(";", ",")
+                lines.append(f"{stack};{frame} {microseconds}")
+        microseconds = round(max(r.exclusive - statements_time, 0.0) * 1e6)
+        if microseconds > 0:
+            lines.append(f"{stack} {microseconds}")
+    return lines
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m symplyphysics.core.import_profiler")
+    parser.add_argument("package", help="package or module to import, eg symplyphysics.laws")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="inclusive")
+    parser.add_argument("--limit", type=int, default=None, help="number of rows to print")
+    parser.add_argument("--no-statements",
+        action="store_true",
+        help="do not time top-level statements")
+    parser.add_argument("--folded", help="write folded stacks for flame graph to the file")
+    args = parser.parse_args(arguments)
+
+    records = profile_imports(args.package, statements=not args.no_statements)
+    print(format_table(records, sort=args.sort, limit=args.limit))
+    if not args.no_statements:
+        print()
+        print(format_statements(records, limit=args.limit))
+    if args.folded:
+        with open(args.folded, "w", encoding="utf-8") as file:
+            file.write("\n".join(folded_stacks(records)) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
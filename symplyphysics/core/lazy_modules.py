@@ -0,0 +1,37 @@
+"""
+This module allows packages to resolve their submodules lazily.
+
+Laws are organized in packages, and importing a single law should not import all its neighbours.
+Packages that use `lazy_submodules` import submodule only when it is accessed as an attribute
+of the package, eg `symplyphysics.laws.dynamics.acceleration_from_force`.
+"""
+
+import importlib
+import pkgutil
+from types import ModuleType
+from typing import Callable, Iterable
+
+
+def _submodule_names(package_path: Iterable[str]) -> list[str]:
+    return sorted(info.name for info in pkgutil.iter_modules(package_path))
+
+
+# Returns (__getattr__, __dir__) pair for the package module. Usage in package __init__.py:
+#   __getattr__, __dir__ = lazy_submodules(__name__, __path__)
+def lazy_submodules(
+    package_name: str, package_path: Iterable[str]
+) -> tuple[Callable[[str], ModuleType], Callable[[], list[str]]]:
+    package_path = list(package_path)
+
+    def __getattr__(name: str) -> ModuleType:
+        if name not in _submodule_names(package_path):
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        # import_module() also sets submodule as an attribute of the package, so
+        # __getattr__ is not called for it again
+        return importlib.import_module(f"{package_name}.{name}")
+
+    def __dir__() -> list[str]:
+        package = importlib.import_module(package_name)
+        return sorted(set(vars(package)) | set(_submodule_names(package_path)))
+
+    return __getattr__, __dir__
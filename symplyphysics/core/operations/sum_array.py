@@ -1,7 +1,14 @@
-from functools import reduce
-import operator
-from typing import Any, Self
-from sympy import Expr, Basic, flatten
+import math
+from typing import Any, Iterable, Self, Sequence
+from sympy import Add, Dummy, Expr, Basic, S, flatten, sympify
+from sympy.physics.units import Dimension
+
+from ..dimensions import collect_factor_and_dimension, si_scale_factor, si_unit
+from ..solved_forms import solve_for
+from ..symbols.symbols import Symbol
+
+# Placeholder of the sum in solved forms of laws with SumArray
+_TOTAL = Dummy("total")
 
 
 class SumArray(Expr):
@@ -19,5 +26,46 @@ class SumArray(Expr):
     def _eval_nseries(self, x: Any, n: Any, logx: Any, cdir: Any) -> Any:
         pass
 
+    # Single flat Add of all elements, instead of adding elements one by one
     def doit(self, **_hints: Any) -> Basic:
-        return reduce(operator.add, self.args)
+        return Add(*self.args)
+
+
+# Sums numbers with compensated summation, so that the result is correctly rounded regardless of
+# the number of elements and their order. Complex numbers are summed by real and imaginary parts.
+def compensated_sum(values: Iterable[complex]) -> complex:
+    values = list(values)
+    real = math.fsum(v.real for v in values)
+    if all(isinstance(v, (int, float)) for v in values):
+        return real
+    return complex(real, math.fsum(v.imag for v in values))
+
+
+# Sum of quantities with equivalent dimensions, in canonical SI units of 'dimension', eg
+# 'ohm' for impedance. Numeric quantities are summed with compensated summation in O(n),
+# symbolic ones are summed with a single Add. Empty sum is dimensionless zero.
+def sum_quantities(values: Sequence[Basic], dimension: Dimension) -> Expr:
+    if len(values) == 0:
+        return S.Zero
+    factors = [collect_factor_and_dimension(sympify(v))[0] for v in values]
+    if all(f.is_number for f in factors):
+        total = sympify(compensated_sum(complex(f) if not f.is_real else float(f) for f in factors))
+    else:
+        total = Add(*factors)
+    return total / si_scale_factor(dimension) * si_unit(dimension)
+
+
+# Law, that contains SumArray(components), solved for the unknown. Solution depends on the sum of
+# components, which is replaced with 'total' placeholder. If unknown is 'components', it is the
+# missing element of the array, eg the current in Kirchhoff law.
+def solve_sum_law(law: Basic, unknown: Symbol, components: Symbol, total: Expr = _TOTAL) -> Expr:
+    total_with_unknown = total + components if unknown == components else total
+    return solve_for(law.subs(SumArray(components), total_with_unknown), unknown)
+
+
+# Calculates the unknown of the law with SumArray(components) for the list of component values.
+# Law is solved once and the sum is calculated in O(n), see sum_quantities().
+def evaluate_sum_law(law: Basic, unknown: Symbol, components: Symbol,
+    values: Sequence[Basic]) -> Expr:
+    solved = solve_sum_law(law, unknown, components)
+    return solved.subs(_TOTAL, sum_quantities(values, components.dimension))
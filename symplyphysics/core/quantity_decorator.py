@@ -1,21 +1,125 @@
 import functools
 import inspect
-from typing import Any, Callable, Sequence
+import os
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Iterator, Optional, Sequence
+from sympy import S
 from sympy.physics.units import Quantity as SymQuantity, Dimension
 
 from .symbols.symbols import DimensionSymbol, Function, Symbol
+from .symbols.numeric_quantities import NumericQuantity
+from .vectors.numeric_vectors import NumericVector
 from .dimensions import assert_equivalent_dimension, ScalarValue
 
+# Validation of units can be disabled or sampled for trusted pipelines, where inputs are known
+# to be correct. Set SYMPLYPHYSICS_VALIDATION environment variable to "off" to disable
+# validation, or to a number N to validate every N-th call only. Use validation() context
+# manager to change it for a block of code.
+VALIDATION_ENV = "SYMPLYPHYSICS_VALIDATION"
 
-def _assert_expected_unit(value: ScalarValue | SymQuantity | DimensionSymbol |
-    Sequence[ScalarValue | SymQuantity],
-    expected_units: Dimension | Symbol | Function | Sequence[Dimension | Symbol | Function],
-    param_name: str, function_name: str):
+ValidationStats = namedtuple("ValidationStats", ["checked", "skipped"])
+
+
+def _sample_rate_from_env() -> int:
+    value = os.environ.get(VALIDATION_ENV, "").strip().lower()
+    if value in ("", "on", "1"):
+        return 1
+    if value in ("off", "0"):
+        return 0
+    try:
+        return max(int(value), 0)
+    except ValueError as e:
+        raise ValueError(f"{VALIDATION_ENV} should be 'on', 'off' or a number, got '{value}'") from e
+
+
+# 1 - validate every call, N - validate every N-th call, 0 - do not validate
+_sample_rate: ContextVar[int] = ContextVar("validation_sample_rate",
+    default=_sample_rate_from_env())
+_counters = {"checked": 0, "skipped": 0}
+# Sampling decision of the current call: (undecorated function, decision). All validation
+# decorators of the function share the decision of the outermost one.
+_call_decision: ContextVar[Optional[tuple[Callable[..., Any], bool]]] = ContextVar(
+    "validation_call_decision", default=None)
+
+
+@contextmanager
+def validation(enabled: bool = True, sample_every: int = 1) -> Iterator[None]:
+    """
+    Enable, disable or sample validation of units in decorated functions within the block.
+
+    Example:
+    with validation(enabled=False):
+        calculate_force(mass_, acceleration_)
+    """
+
+    if sample_every < 1:
+        raise ValueError(f"sample_every should be positive, got {sample_every}")
+    token = _sample_rate.set(sample_every if enabled else 0)
+    try:
+        yield
+    finally:
+        _sample_rate.reset(token)
+
+
+def validation_stats() -> ValidationStats:
+    """
+    Return number of validations performed and skipped by decorators.
+    """
+
+    return ValidationStats(checked=_counters["checked"], skipped=_counters["skipped"])
+
+
+def reset_validation_stats() -> None:
+    for key in _counters:
+        _counters[key] = 0
+
+
+# Decides whether the call of 'function' is validated. Sampled validation checks every N-th
+# call of each function, 'calls' is the counter of calls of the decorated function.
+# return - (decision, token to reset the shared decision after the call, if it was set)
+def _should_validate(function: Callable[..., Any],
+    calls: list[int]) -> tuple[bool, Optional[Token[Optional[tuple[Callable[..., Any], bool]]]]]:
+    rate = _sample_rate.get()
+    token = None
+    if rate in (0, 1):
+        decision = rate == 1
+    else:
+        shared = _call_decision.get()
+        if shared is not None and shared[0] is function:
+            decision = shared[1]
+        else:
+            calls[0] += 1
+            decision = calls[0] % rate == 0
+            token = _call_decision.set((function, decision))
+    _counters["checked" if decision else "skipped"] += 1
+    return (decision, token)
+
+
+# Reduces expected units to the list of dimensions once, when function is decorated.
+def _expected_dimensions(
+    expected_units: Dimension | Symbol | Function | Sequence[Dimension | Symbol | Function]
+) -> tuple[bool, list[Dimension]]:
+    is_tuple = isinstance(expected_units, Sequence)
+    units: list[Dimension | Symbol | Function] = (list(expected_units) if isinstance(
+        expected_units, Sequence) else [expected_units])
+    dimensions: list[Dimension] = []
+    for u in units:
+        d = u.dimension if isinstance(u, DimensionSymbol) else u
+        #HACK: this allows to treat angle type as dimensionless
+        dimensions.append(d.subs("angle", S.One))
+    return (is_tuple, dimensions)
+
+
+def _assert_expected_dimensions(value: ScalarValue | SymQuantity | DimensionSymbol |
+    NumericQuantity | NumericVector | Sequence[ScalarValue | SymQuantity],
+    expected: tuple[bool, list[Dimension]], param_name: str, function_name: str):
     components: list[ScalarValue | SymQuantity | Dimension] = []
     indexed = False
     if isinstance(value, SymQuantity):
         components.append(value)
-    elif isinstance(value, DimensionSymbol):
+    elif isinstance(value, (DimensionSymbol, NumericQuantity, NumericVector)):
         components.append(value.dimension)
     elif isinstance(value, Sequence):
         components = list(value)
@@ -23,17 +127,7 @@ def _assert_expected_unit(value: ScalarValue | SymQuantity | DimensionSymbol |
     else:
         components.append(value)
 
-    is_tuple = False
-    if isinstance(expected_units, Sequence):
-        is_tuple = True
-    else:
-        expected_units = [expected_units]
-
-    expected_unit_dimensions: list[Dimension] = []
-    for u in list(expected_units):
-        d = u.dimension if isinstance(u, DimensionSymbol) else u
-        expected_unit_dimensions.append(d)
-
+    (is_tuple, expected_unit_dimensions) = expected
     for idx, c in enumerate(components):
         param_name_indexed = f"{param_name}[{idx}]" if indexed else param_name
         expected_dimension = expected_unit_dimensions[
@@ -41,8 +135,43 @@ def _assert_expected_unit(value: ScalarValue | SymQuantity | DimensionSymbol |
         assert_equivalent_dimension(c, param_name_indexed, function_name, expected_dimension)
 
 
-# Validates the input quantities. Input parameters should be sympy.physics.units.Quantity, list of Quantity or
-# Vector of Quantity type.
+def _assert_expected_unit(value: ScalarValue | SymQuantity | DimensionSymbol |
+    Sequence[ScalarValue | SymQuantity],
+    expected_units: Dimension | Symbol | Function | Sequence[Dimension | Symbol | Function],
+    param_name: str, function_name: str):
+    _assert_expected_dimensions(value, _expected_dimensions(expected_units), param_name,
+        function_name)
+
+
+# Returns function that finds argument of the function call by parameter name without binding
+# the whole signature.
+def _argument_getter(signature: inspect.Signature,
+    name: str) -> Callable[[tuple[Any, ...], dict[str, Any]], Any]:
+    index: Optional[int] = None
+    for idx, param in enumerate(signature.parameters.values()):
+        if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD,
+                inspect.Parameter.KEYWORD_ONLY):
+            break
+        if param.name == name:
+            index = idx
+            break
+    default = signature.parameters[name].default
+
+    def get_argument(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        if index is not None and index < len(args):
+            return args[index]
+        if name in kwargs:
+            return kwargs[name]
+        if default is not inspect.Parameter.empty:
+            return default
+        # raises TypeError with missing argument
+        return signature.bind(*args, **kwargs).arguments[name]
+
+    return get_argument
+
+
+# Validates the input quantities. Input parameters should be sympy.physics.units.Quantity, list of Quantity,
+# NumericQuantity, NumericVector or Vector of Quantity type.
 # Unit should be should be Symbol with dimension property, or Dimension.
 # Example:
 # @validate_input(param1_=units.length, param2_=(1 / units.length))
@@ -50,18 +179,29 @@ def _assert_expected_unit(value: ScalarValue | SymQuantity | DimensionSymbol |
 def validate_input(**decorator_kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
 
     def validate_func(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+        validated = [(name, _argument_getter(signature, name),
+            _expected_dimensions(decorator_kwargs[name]))
+            for name in signature.parameters
+            if name in decorator_kwargs]
+        (function, calls) = (inspect.unwrap(func), [0])
 
         @functools.wraps(func)
         def wrapper_validate(*args: Any, **kwargs: Any) -> Any:
-            wrapped_signature = inspect.signature(func)
-            bound_args = wrapped_signature.bind(*args, **kwargs)
-            for param in wrapped_signature.parameters.values():
-                if param.name in decorator_kwargs:
-                    arg = bound_args.arguments[param.name]
-                    _assert_expected_unit(arg, decorator_kwargs[param.name], param.name,
-                        func.__name__)
-            return func(*args, **kwargs)
+            (should_validate, token) = _should_validate(function, calls)
+            try:
+                if should_validate:
+                    for (name, get_argument, expected) in validated:
+                        _assert_expected_dimensions(get_argument(args, kwargs), expected, name,
+                            func.__name__)
+                return func(*args, **kwargs)
+            finally:
+                if token is not None:
+                    _call_decision.reset(token)
 
+        # Expected units of parameters are kept for introspection, eg by benchmarks. Outer
+        # decorators copy them with functools.wraps().
+        setattr(wrapper_validate, "validated_inputs", dict(decorator_kwargs))
         return wrapper_validate
 
     return validate_func
@@ -77,13 +217,23 @@ def validate_output(
         expected_unit: Dimension | Symbol | Function) -> Callable[[Any], Callable[..., Any]]:
 
     def validate_func(func: Callable[..., Any]) -> Callable[..., Any]:
+        expected = _expected_dimensions(expected_unit)
+        (function, calls) = (inspect.unwrap(func), [0])
 
         @functools.wraps(func)
         def wrapper_validate(*args: Any, **kwargs: Any) -> Any:
-            ret = func(*args, **kwargs)
-            _assert_expected_unit(ret, expected_unit, "return", func.__name__)
+            (should_validate, token) = _should_validate(function, calls)
+            try:
+                ret = func(*args, **kwargs)
+            finally:
+                if token is not None:
+                    _call_decision.reset(token)
+            if should_validate:
+                _assert_expected_dimensions(ret, expected, "return", func.__name__)
             return ret
 
+        # Expected unit of the result is kept for introspection, eg by the law catalog
+        setattr(wrapper_validate, "validated_output", expected_unit)
         return wrapper_validate
 
     return validate_func
@@ -96,23 +246,23 @@ def validate_output(
 def validate_output_same(param_name: str) -> Callable[[Any], Callable[..., Any]]:
 
     def validate_func(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+        if param_name not in signature.parameters:
+            raise TypeError(f"Argument '{param_name}' to decorator 'validate_output_same'"
+                f" should be in function parameters")
+        get_argument = _argument_getter(signature, param_name)
+        (function, calls) = (inspect.unwrap(func), [0])
 
         @functools.wraps(func)
         def wrapper_validate(*args: Any, **kwargs: Any) -> Any:
-            wrapped_signature = inspect.signature(func)
-            bound_args = wrapped_signature.bind(*args, **kwargs)
-            expected_unit = None
-            for param in wrapped_signature.parameters.values():
-                if param.name == param_name:
-                    arg = bound_args.arguments[param.name]
-                    expected_unit = arg
-                    break
-            if expected_unit is None:
-                raise TypeError(f"Argument '{param_name}' to decorator 'validate_output_same'"
-                    f" should be in function parameters")
-            ret = func(*args, **kwargs)
-
-            _assert_expected_unit(ret, expected_unit, "return", func.__name__)
+            (should_validate, token) = _should_validate(function, calls)
+            try:
+                ret = func(*args, **kwargs)
+            finally:
+                if token is not None:
+                    _call_decision.reset(token)
+            if should_validate:
+                _assert_expected_unit(ret, get_argument(args, kwargs), "return", func.__name__)
             return ret
 
         return wrapper_validate
@@ -0,0 +1,159 @@
+"""
+This module tracks objects, that are stored in global registries, and releases them.
+
+Every ``Quantity`` registers its dimension and scale factor in the global ``SI`` unit system,
+and every ``CoordinateSystem`` creates new ``CoordSys3D``. Long-running processes create many of
+them and never release. ``RegistryScope`` tracks quantities and coordinate systems created within
+it, and unregisters them on exit.
+"""
+
+from __future__ import annotations
+import sys
+from collections import namedtuple
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Optional
+from weakref import WeakSet
+from sympy.physics.units import Quantity as SymQuantity
+from sympy.physics.units.systems.si import SI
+from sympy.vector import CoordSys3D
+
+from . import solved_forms
+from .dimensions import collect_factor_and_dimension
+from .symbols import id_generator
+
+RegistryReport = namedtuple("RegistryReport", [
+    "quantity_dimensions", "quantity_scale_factors", "generated_id_bases", "generated_ids",
+    "coordinate_systems", "cached_dimensions", "cached_solved_forms", "size_bytes"
+])
+
+_current_scope: ContextVar[Optional[RegistryScope]] = ContextVar("registry_scope", default=None)
+
+# All alive coordinate systems, for the report only
+_coordinate_systems: WeakSet[CoordSys3D] = WeakSet()
+
+# Functions, that drop cached data of released coordinate systems
+_coordinate_system_release_hooks: list[Callable[[CoordSys3D], None]] = []
+
+
+def on_coordinate_system_release(hook: Callable[[CoordSys3D], None]) -> None:
+    """
+    Register function, that should be called when coordinate system is released by scope.
+    Modules that cache data per coordinate system should drop it in the hook.
+    """
+
+    _coordinate_system_release_hooks.append(hook)
+
+
+def track_quantity(quantity: SymQuantity) -> None:
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.track_quantity(quantity)
+
+
+def track_coordinate_system(coord_system: CoordSys3D) -> None:
+    _coordinate_systems.add(coord_system)
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.track_coordinate_system(coord_system)
+
+
+def release_quantity(quantity: SymQuantity) -> None:
+    # pylint: disable=protected-access
+    SI._quantity_dimension_map.pop(quantity, None)
+    SI._quantity_scale_factors.pop(quantity, None)
+
+
+def release_coordinate_system(coord_system: CoordSys3D) -> None:
+    _coordinate_systems.discard(coord_system)
+    for hook in _coordinate_system_release_hooks:
+        hook(coord_system)
+
+
+# Scope of temporary quantities and coordinate systems. Quantities and coordinate systems created
+# within the scope are released on exit, unless kept with keep(). Released quantities are removed
+# from SI and should not be used after the scope exits.
+# Scopes can be nested. Objects kept in the inner scope are passed to the outer one.
+# Example:
+# with RegistryScope() as scope:
+#     mass = Quantity(2 * units.kilogram)
+#     result = calculate_force(mass, acceleration)
+#     scope.keep(result)
+class RegistryScope:
+    _quantities: dict[SymQuantity, None]
+    _coordinate_systems: dict[CoordSys3D, None]
+    _parent: Optional[RegistryScope]
+    _token: Optional[Token[Optional[RegistryScope]]]
+
+    def __init__(self) -> None:
+        # dicts are used as ordered sets
+        self._quantities = {}
+        self._coordinate_systems = {}
+        self._parent = None
+        self._token = None
+
+    @property
+    def quantities_count(self) -> int:
+        return len(self._quantities)
+
+    @property
+    def coordinate_systems_count(self) -> int:
+        return len(self._coordinate_systems)
+
+    def track_quantity(self, quantity: SymQuantity) -> None:
+        self._quantities[quantity] = None
+
+    def track_coordinate_system(self, coord_system: CoordSys3D) -> None:
+        self._coordinate_systems[coord_system] = None
+
+    # Keeps quantities and coordinate systems alive after the scope exits. Accepts Quantity,
+    # CoordinateSystem, CoordSys3D or any object with 'coord_system' property.
+    def keep(self, *objects: Any) -> None:
+        for obj in objects:
+            coord_system = getattr(obj, "coord_system", obj)
+            if isinstance(obj, SymQuantity):
+                self._quantities.pop(obj, None)
+                if self._parent is not None:
+                    self._parent.track_quantity(obj)
+            elif isinstance(coord_system, CoordSys3D):
+                self._coordinate_systems.pop(coord_system, None)
+                if self._parent is not None:
+                    self._parent.track_coordinate_system(coord_system)
+
+    def release(self) -> None:
+        for quantity in self._quantities:
+            release_quantity(quantity)
+        for coord_system in self._coordinate_systems:
+            release_coordinate_system(coord_system)
+        self._quantities.clear()
+        self._coordinate_systems.clear()
+
+    def __enter__(self) -> RegistryScope:
+        self._parent = _current_scope.get()
+        self._token = _current_scope.set(self)
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        if self._token is not None:
+            _current_scope.reset(self._token)
+            self._token = None
+        self.release()
+
+
+def registry_report() -> RegistryReport:
+    """
+    Return sizes of global registries and caches. ``size_bytes`` is an approximate memory usage
+    of registry containers, not including registered objects.
+    """
+
+    # pylint: disable=protected-access
+    containers: list[Any] = [
+        SI._quantity_dimension_map, SI._quantity_scale_factors, id_generator._ids
+    ]
+    return RegistryReport(quantity_dimensions=len(SI._quantity_dimension_map),
+        quantity_scale_factors=len(SI._quantity_scale_factors),
+        generated_id_bases=len(id_generator._ids),
+        generated_ids=sum(id_generator._ids.values()),
+        coordinate_systems=len(_coordinate_systems),
+        cached_dimensions=collect_factor_and_dimension.cache_info().currsize,
+        cached_solved_forms=solved_forms.cache_info().currsize,
+        size_bytes=sum(sys.getsizeof(c) for c in containers))
@@ -0,0 +1,96 @@
+"""
+This module maintains a global registry of solved forms of laws.
+
+Laws never change after they are defined, so solving a law for some unknown gives the same
+result every time. Registry solves each (law, unknown) pair once and returns cached result on
+subsequent calls. Laws are SymPy expressions, so they are keyed by their structural hash.
+Registry misses are loaded from the persistent cache, when it is enabled, see disk_cache module.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Callable, Sequence, TypeVar
+from sympy import Basic, Equality, Expr, dsolve, solve
+from .disk_cache import active_disk_cache
+
+# Maximum number of solved forms kept in the registry. Least recently used
+# forms are dropped first.
+SOLVED_FORMS_MAXSIZE = 4096
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+T = TypeVar("T")
+
+
+# Computes the value, or loads it from the persistent cache if it is enabled
+def _compute(kind: str, compute: Callable[..., T], *arguments: Any) -> T:
+    disk_cache = active_disk_cache()
+    if disk_cache is None:
+        return compute(*arguments)
+    return disk_cache.call(kind, compute, *arguments)
+
+
+def _solve_all(law: Basic | tuple[Basic, ...],
+    unknowns: Basic | tuple[Basic, ...]) -> tuple[dict[Basic, Expr], ...]:
+    return tuple(solve(law, unknowns, dict=True))
+
+
+@lru_cache(maxsize=SOLVED_FORMS_MAXSIZE)
+def _solve(law: Basic | tuple[Basic, ...],
+    unknowns: Basic | tuple[Basic, ...]) -> tuple[dict[Basic, Expr], ...]:
+    return _compute("solve", _solve_all, law, unknowns)
+
+
+@lru_cache(maxsize=SOLVED_FORMS_MAXSIZE)
+def _dsolve(law: Basic, function: Basic) -> Equality:
+    return _compute("dsolve", dsolve, law, function)
+
+
+def _as_key(value: Basic | Sequence[Basic]) -> Basic | tuple[Basic, ...]:
+    # lists are not hashable, convert them to tuples
+    if isinstance(value, Basic):
+        return value
+    return tuple(value)
+
+
+# Returns all solutions of the law. This is the cached version of
+# solve(law, unknowns, dict=True).
+#NOTE: returned dictionaries are shared between calls and should not be modified.
+def solutions_for(law: Basic | Sequence[Basic],
+    unknowns: Basic | Sequence[Basic]) -> tuple[dict[Basic, Expr], ...]:
+    return _solve(_as_key(law), _as_key(unknowns))
+
+
+# Solves law for the unknown and returns the solution with the given index. This is
+# the cached version of solve(law, unknown, dict=True)[index][unknown].
+def solve_for(law: Basic, unknown: Basic, index: int = 0) -> Expr:
+    return solutions_for(law, unknown)[index][unknown]
+
+
+# Cached version of dsolve(law, function)
+def dsolve_for(law: Basic, function: Basic) -> Equality:
+    return _dsolve(law, function)
+
+
+def cache_info() -> CacheInfo:
+    """
+    Return hit / miss statistics of the solved forms registry.
+    """
+
+    # pylint: disable-next=no-value-for-parameter
+    solve_info = _solve.cache_info()
+    # pylint: disable-next=no-value-for-parameter
+    dsolve_info = _dsolve.cache_info()
+    return CacheInfo(hits=solve_info.hits + dsolve_info.hits,
+        misses=solve_info.misses + dsolve_info.misses,
+        maxsize=SOLVED_FORMS_MAXSIZE,
+        currsize=solve_info.currsize + dsolve_info.currsize)
+
+
+def cache_clear() -> None:
+    """
+    Drop all solved forms and reset statistics.
+    """
+
+    _solve.cache_clear()
+    _dsolve.cache_clear()
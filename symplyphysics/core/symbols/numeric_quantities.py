@@ -0,0 +1,150 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Sequence
+from sympy import Basic, sympify
+from sympy.physics.units import Dimension, Quantity as SymQuantity
+
+from .quantities import Quantity
+from ..dimensions import (collect_factor_and_dimension, dimensionless, intern_dimension,
+    si_scale_factor, si_unit)
+from ..errors import UnitsError
+
+
+# Dimensions of numeric quantities are interned, so results of operations on them are cached
+# by identity.
+@lru_cache(maxsize=1024)
+def _multiply(dim_a: Dimension, dim_b: Dimension) -> Dimension:
+    return intern_dimension(dim_a * dim_b)
+
+
+@lru_cache(maxsize=1024)
+def _divide(dim_a: Dimension, dim_b: Dimension) -> Dimension:
+    return intern_dimension(dim_a / dim_b)
+
+
+@lru_cache(maxsize=1024)
+def _power(dimension: Dimension, exponent: Basic) -> Dimension:
+    return intern_dimension(dimension**exponent)
+
+
+# Lightweight numeric counterpart of Quantity. Holds a number or NumPy array in canonical SI
+# units (see si_unit()) and a dimension. Unlike Quantity, it is not a SymPy object and is not
+# registered in SI, so it is cheap to create and does not grow global state.
+# Use it for intermediate numeric results. Convert to Quantity with to_quantity() when symbolic
+# work is needed.
+# Example:
+# speed = NumericQuantity(3.0, units.velocity)
+# time = NumericQuantity.from_quantity(Quantity(2 * units.hour))
+# distance = speed * time
+class NumericQuantity:
+    __slots__ = ("_value", "_dimension")
+
+    _value: Any
+    _dimension: Dimension
+
+    def __init__(self, value: Any, dimension: Dimension = dimensionless) -> None:
+        self._value = value
+        self._dimension = intern_dimension(dimension)
+
+    @staticmethod
+    def from_quantity(quantity: SymQuantity | Basic) -> NumericQuantity:
+        """
+        Create numeric quantity from ``Quantity`` or expression with units, eg ``3 * units.meter``.
+        """
+
+        (scale_factor, dimension) = collect_factor_and_dimension(sympify(quantity))
+        if scale_factor.free_symbols:
+            raise UnitsError(f"Quantity '{quantity}' should not contain free symbols")
+        return NumericQuantity(float(scale_factor / si_scale_factor(dimension)), dimension)
+
+    # Returns Quantity for scalar value, or list of Quantity for arrays
+    def to_quantity(self) -> Quantity | Sequence[Quantity]:
+        unit = si_unit(self._dimension)
+        if hasattr(self._value, "tolist"):
+            values = self._value.tolist()
+            if isinstance(values, list):
+                return [Quantity(v * unit, dimension=self._dimension) for v in values]
+            return Quantity(values * unit, dimension=self._dimension)
+        return Quantity(self._value * unit, dimension=self._dimension)
+
+    # Allows to use scalar numeric quantities in SymPy expressions, eg in law.subs()
+    def _sympy_(self) -> Quantity:
+        quantity = self.to_quantity()
+        if not isinstance(quantity, Quantity):
+            raise TypeError("Only scalar NumericQuantity can be converted to SymPy expression")
+        return quantity
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @property
+    def dimension(self) -> Dimension:
+        return self._dimension
+
+    def _same_dimension(self, other: NumericQuantity, operation: str) -> None:
+        if self._dimension is other.dimension:
+            return
+        raise UnitsError(f"Cannot {operation} quantities with dimensions "
+            f"'{self._dimension}' and '{other.dimension}'")
+
+    def __add__(self, other: Any) -> NumericQuantity:
+        if not isinstance(other, NumericQuantity):
+            return NotImplemented
+        self._same_dimension(other, "add")
+        return NumericQuantity(self._value + other.value, self._dimension)
+
+    def __sub__(self, other: Any) -> NumericQuantity:
+        if not isinstance(other, NumericQuantity):
+            return NotImplemented
+        self._same_dimension(other, "subtract")
+        return NumericQuantity(self._value - other.value, self._dimension)
+
+    def __mul__(self, other: Any) -> NumericQuantity:
+        if isinstance(other, NumericQuantity):
+            return NumericQuantity(self._value * other.value,
+                _multiply(self._dimension, other.dimension))
+        if isinstance(other, Basic):
+            return NotImplemented
+        return NumericQuantity(self._value * other, self._dimension)
+
+    def __rmul__(self, other: Any) -> NumericQuantity:
+        return self.__mul__(other)
+
+    def __truediv__(self, other: Any) -> NumericQuantity:
+        if isinstance(other, NumericQuantity):
+            return NumericQuantity(self._value / other.value,
+                _divide(self._dimension, other.dimension))
+        if isinstance(other, Basic):
+            return NotImplemented
+        return NumericQuantity(self._value / other, self._dimension)
+
+    def __rtruediv__(self, other: Any) -> NumericQuantity:
+        if isinstance(other, Basic):
+            return NotImplemented
+        return NumericQuantity(other / self._value, _divide(dimensionless, self._dimension))
+
+    def __pow__(self, exponent: Any) -> NumericQuantity:
+        if isinstance(exponent, (NumericQuantity, Basic)):
+            return NotImplemented
+        return NumericQuantity(self._value**exponent, _power(self._dimension, sympify(exponent)))
+
+    def __neg__(self) -> NumericQuantity:
+        return NumericQuantity(-self._value, self._dimension)
+
+    def __abs__(self) -> NumericQuantity:
+        return NumericQuantity(abs(self._value), self._dimension)
+
+    # Numeric quantities are equal if they have the same dimension and values. Comparison of arrays
+    # is element-wise, like in NumPy.
+    def __eq__(self, other: Any) -> Any:
+        if not isinstance(other, NumericQuantity):
+            return NotImplemented
+        if self._dimension is not other.dimension:
+            return False
+        return self._value == other.value
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"NumericQuantity({self._value!r}, {si_unit(self._dimension)})"
@@ -1,11 +1,16 @@
+from __future__ import annotations
 from functools import partial
-from typing import Any, Optional, Self, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Self, Sequence
 from sympy import S, Basic, Expr, sympify
 from sympy.physics.units import Dimension, Quantity as SymQuantity
 from sympy.physics.units.systems.si import SI
 
 from .symbols import DimensionSymbol, next_name
 from ..dimensions import collect_factor_and_dimension
+from ..registries import track_quantity
+
+if TYPE_CHECKING:
+    from .numeric_quantities import NumericQuantity
 
 
 class Quantity(DimensionSymbol, SymQuantity):  # pylint: disable=too-many-ancestors
@@ -29,6 +34,7 @@ class Quantity(DimensionSymbol, SymQuantity):  # pylint: disable=too-many-ancest
         super().__init__(self.name, dimension)
         SI.set_quantity_dimension(self, dimension)
         SI.set_quantity_scale_factor(self, scale)
+        track_quantity(self)
 
     # This is required for integration to work properly
     @property
@@ -39,6 +45,7 @@ class Quantity(DimensionSymbol, SymQuantity):  # pylint: disable=too-many-ancest
         return self
 
 
-def list_of_quantities(input_: Sequence[Expr | float], subs_: dict[Expr,
-    Quantity]) -> Sequence[Quantity]:
+# Scalar NumericQuantity values of 'subs_' are converted to Quantity by SymPy.
+def list_of_quantities(input_: Sequence[Expr | float],
+    subs_: dict[Expr, Quantity | NumericQuantity]) -> Sequence[Quantity]:
     return [Quantity(sympify(c).subs(subs_)) for c in input_]
@@ -5,6 +5,7 @@ from sympy.physics.units import Dimension
 from sympy.core.function import UndefinedFunction
 from sympy.printing.pretty.pretty import PrettyPrinter
 from sympy.printing.pretty.stringpict import prettyForm
+from sympy.printing.str import StrPrinter
 from sympy.printing.pretty.pretty_symbology import pretty_symbol, pretty_use_unicode
 from .id_generator import next_id
 
@@ -120,6 +121,26 @@ def print_expression(expr: Expr | Equality | Sequence[Expr | Equality]) -> str:
         pretty_use_unicode(uflag)
 
 
+# Same as SymbolPrinter, but prints expressions in a single line, eg 'force = acceleration*mass'
+class SymbolLinePrinter(StrPrinter):
+
+    def _print_Symbol(self, expr: Expr) -> str:
+        return expr.display_name if isinstance(expr, Symbol) else getattr(expr, "name")
+
+    def _print_Function(self, expr: Expr) -> str:
+        func = expr.func
+        func_name = func.display_name if isinstance(func, Function) else func.__name__
+        return f"{func_name}({self.stringify(expr.args, ', ')})"
+
+    # pylint: disable-next=invalid-name
+    def _print_Equality(self, expr: Equality) -> str:
+        return f"{self._print(expr.lhs)} = {self._print(expr.rhs)}"
+
+
+def print_expression_line(expr: Expr | Equality) -> str:
+    return SymbolLinePrinter().doprint(expr)
+
+
 # Helper method for easier interaction with SumArray
 def tuple_of_symbols(display_name: str,
     dimension: Dimension = Dimension(S.One),
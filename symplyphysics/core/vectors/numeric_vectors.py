@@ -0,0 +1,214 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Sequence
+from sympy import sympify
+from sympy.physics.units import Dimension
+
+from .vectors import QuantityVector, Vector
+from ..batch import import_numpy
+from ..coordinate_systems.coordinate_systems import CoordinateSystem
+from ..dimensions import dimensionless, intern_dimension, si_scale_factor, si_unit
+from ..errors import UnitsError
+from ..symbols.numeric_quantities import NumericQuantity
+from ..symbols.quantities import Quantity
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# All numeric vectors have 3 components, as CoordSys3D does
+_SIZE = 3
+
+
+# Numeric vector or batch of numeric vectors. Contains NumPy array of shape (3,) for a single vector,
+# or (N, 3) for a batch of N vectors, in canonical SI units (see si_unit()). All vectors in the batch
+# share the same dimension and coordinate system.
+# Vectors with less than 3 components are padded with zeroes.
+# Use it to process many vectors at once. Convert to QuantityVector with to_quantity_vector()
+# when symbolic work is needed.
+class NumericVector:
+    __slots__ = ("_values", "_dimension", "_coordinate_system")
+
+    _values: NDArray[Any]
+    _dimension: Dimension
+    _coordinate_system: CoordinateSystem
+
+    def __init__(self,
+        values: ArrayLike,
+        dimension: Dimension = dimensionless,
+        coordinate_system: CoordinateSystem = CoordinateSystem(CoordinateSystem.System.CARTESIAN)):
+        np = import_numpy()
+        array = np.asarray(values, dtype=float)
+        if array.ndim not in (1, 2) or array.shape[-1] > _SIZE:
+            raise ValueError(f"Numeric vector should have shape (k,) or (N, k), where k <= {_SIZE}. "
+                f"Got: {array.shape}")
+        if array.shape[-1] < _SIZE:
+            padding = [(0, 0)] * (array.ndim - 1) + [(0, _SIZE - array.shape[-1])]
+            array = np.pad(array, padding)
+        self._values = array
+        self._dimension = intern_dimension(dimension)
+        self._coordinate_system = coordinate_system
+
+    @staticmethod
+    def from_vector(vector_: Vector, dimension: Dimension = dimensionless) -> NumericVector:
+        """
+        Create numeric vector from ``Vector`` of numbers in canonical SI units.
+        """
+
+        return NumericVector([float(sympify(c)) for c in vector_.components], dimension,
+            vector_.coordinate_system)
+
+    @staticmethod
+    def from_quantity_vector(vector_: QuantityVector) -> NumericVector:
+        factor = si_scale_factor(vector_.dimension)
+        values = [float(sympify(c) / factor) for c in vector_.scale_factors]
+        return NumericVector(values, vector_.dimension, vector_.coordinate_system)
+
+    @staticmethod
+    def from_quantity_vectors(vectors: Sequence[QuantityVector]) -> NumericVector:
+        """
+        Create batch of numeric vectors. All vectors should have the same dimension and coordinate
+        system.
+        """
+
+        if len(vectors) == 0:
+            raise ValueError("At least one vector is required")
+        first = vectors[0]
+        dimension = intern_dimension(first.dimension)
+        for v in vectors[1:]:
+            if v.coordinate_system != first.coordinate_system:
+                raise TypeError(f"Different coordinate systems in vectors: "
+                    f"{str(first.coordinate_system)} vs {str(v.coordinate_system)}")
+            if intern_dimension(v.dimension) is not dimension:
+                raise UnitsError(f"Different dimensions in vectors: '{first.dimension}' vs "
+                    f"'{v.dimension}'")
+        np = import_numpy()
+        rows = [NumericVector.from_quantity_vector(v).values for v in vectors]
+        return NumericVector(np.stack(rows), dimension, first.coordinate_system)
+
+    # Returns QuantityVector for a single vector, or list of QuantityVector for a batch
+    def to_quantity_vector(self) -> QuantityVector | list[QuantityVector]:
+        unit = si_unit(self._dimension)
+        if self.is_batch:
+            return [
+                QuantityVector([Quantity(c * unit, dimension=self._dimension)
+                for c in row], self._coordinate_system)
+                for row in self._values.tolist()
+            ]
+        return QuantityVector([
+            Quantity(c * unit, dimension=self._dimension) for c in self._values.tolist()
+        ], self._coordinate_system)
+
+    @property
+    def values(self) -> NDArray[Any]:
+        return self._values
+
+    @property
+    def dimension(self) -> Dimension:
+        return self._dimension
+
+    @property
+    def coordinate_system(self) -> CoordinateSystem:
+        return self._coordinate_system
+
+    @property
+    def is_batch(self) -> bool:
+        return self._values.ndim == 2
+
+    def __len__(self) -> int:
+        return len(self._values) if self.is_batch else 1
+
+    def __getitem__(self, index: Any) -> NumericVector:
+        if not self.is_batch:
+            raise TypeError("Single numeric vector cannot be indexed")
+        return NumericVector(self._values[index], self._dimension, self._coordinate_system)
+
+    def __repr__(self) -> str:
+        return f"NumericVector({self._values!r}, {si_unit(self._dimension)})"
+
+
+def _assert_same_coordinate_system(vector_left: NumericVector, vector_right: NumericVector):
+    if vector_left.coordinate_system != vector_right.coordinate_system:
+        raise TypeError(f"Different coordinate systems in vectors: "
+            f"{str(vector_left.coordinate_system)} vs {str(vector_right.coordinate_system)}")
+
+
+def _assert_cartesian(vector_: NumericVector, operation: str):
+    if vector_.coordinate_system.coord_system_type != CoordinateSystem.System.CARTESIAN:
+        coord_name_from = CoordinateSystem.system_to_transformation_name(
+            vector_.coordinate_system.coord_system_type)
+        raise ValueError(
+            f"{operation} is only supported for cartesian coordinates: got {coord_name_from}")
+
+
+# Scalars are numbers, arrays of N numbers, or NumericQuantity
+def _scalar_values(scalar_value: Any) -> tuple[Any, Dimension]:
+    np = import_numpy()
+    if isinstance(scalar_value, NumericQuantity):
+        (value, dimension) = (scalar_value.value, scalar_value.dimension)
+    else:
+        (value, dimension) = (scalar_value, dimensionless)
+    value = np.asarray(value, dtype=float)
+    # align batch of scalars with batch of vectors
+    return (value[..., np.newaxis] if value.ndim > 0 else value, dimension)
+
+
+# Sum of two vectors or batches of vectors
+def add_numeric_vectors(vector_left: NumericVector, vector_right: NumericVector) -> NumericVector:
+    _assert_same_coordinate_system(vector_left, vector_right)
+    _assert_cartesian(vector_left, "Addition")
+    if vector_left.dimension is not vector_right.dimension:
+        raise UnitsError(f"Cannot add vectors with dimensions '{vector_left.dimension}' and "
+            f"'{vector_right.dimension}'")
+    return NumericVector(vector_left.values + vector_right.values, vector_left.dimension,
+        vector_left.coordinate_system)
+
+
+# Change magnitude of vectors. Scalar value can be an array of N numbers to scale each vector in
+# the batch with its own value.
+def scale_numeric_vector(scalar_value: Any, vector_: NumericVector) -> NumericVector:
+    (value, dimension) = _scalar_values(scalar_value)
+    values = vector_.values
+    if vector_.coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
+        values = values * value
+    else:
+        np = import_numpy()
+        # only radial components are scaled, see scale_vector()
+        scaled = [0, 2] if vector_.coordinate_system.coord_system_type == (
+            CoordinateSystem.System.CYLINDRICAL) else [0]
+        mask = np.zeros(_SIZE, dtype=bool)
+        mask[scaled] = True
+        values = np.where(mask, values * value, values)
+    return NumericVector(values, intern_dimension(vector_.dimension * dimension),
+        vector_.coordinate_system)
+
+
+# Dot product of two vectors or batches of vectors
+def dot_numeric_vectors(vector_left: NumericVector, vector_right: NumericVector) -> NumericQuantity:
+    _assert_same_coordinate_system(vector_left, vector_right)
+    _assert_cartesian(vector_left, "Dot product")
+    np = import_numpy()
+    return NumericQuantity(np.einsum("...i,...i->...", vector_left.values, vector_right.values),
+        intern_dimension(vector_left.dimension * vector_right.dimension))
+
+
+# Cross product of two vectors or batches of vectors
+def cross_numeric_vectors(vector_left: NumericVector, vector_right: NumericVector) -> NumericVector:
+    _assert_same_coordinate_system(vector_left, vector_right)
+    _assert_cartesian(vector_left, "Cross product")
+    np = import_numpy()
+    return NumericVector(np.cross(vector_left.values, vector_right.values),
+        intern_dimension(vector_left.dimension * vector_right.dimension),
+        vector_left.coordinate_system)
+
+
+def numeric_vector_magnitude(vector_: NumericVector) -> NumericQuantity:
+    _assert_cartesian(vector_, "Magnitude")
+    np = import_numpy()
+    return NumericQuantity(np.linalg.norm(vector_.values, axis=-1), vector_.dimension)
+
+
+# Make unit vectors (vectors of size 1 and same direction as original vectors)
+def numeric_vector_unit(vector_: NumericVector) -> NumericVector:
+    magnitude = numeric_vector_magnitude(vector_)
+    np = import_numpy()
+    values = magnitude.value[..., np.newaxis] if vector_.is_batch else magnitude.value
+    return NumericVector(vector_.values / values, dimensionless, vector_.coordinate_system)
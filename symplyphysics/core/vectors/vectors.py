@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Optional, Sequence
-from sympy.vector import express, Vector as SymVector
+from sympy.vector import Vector as SymVector
 from sympy.vector.operators import _get_coord_systems
 from sympy.physics.units import Dimension
 
@@ -8,6 +8,7 @@ from ..dimensions import assert_equivalent_dimension, dimensionless, ScalarValue
 from ..symbols.quantities import Quantity
 from ..symbols.symbols import DimensionSymbol, next_name
 from ..coordinate_systems.coordinate_systems import CoordinateSystem
+from ..coordinate_systems.transformations import transform_components
 
 
 # Contains list of SymPy expressions or any numbers as components.
@@ -69,31 +70,19 @@ class Vector:
 
     # Convert vector coordinate system to new basis and construct new vector.
     # Rebased vector should be the same as old vector but in new coordinate system.
+    # Transformation is derived once for each pair of coordinate systems, see
+    # transformations module.
     def rebase(self, coordinate_system: CoordinateSystem) -> Vector:
-        vector_: Vector = self
-        if self.coordinate_system.coord_system_type != coordinate_system.coord_system_type:
-            new_scalars = list(
-                self.coordinate_system.transformation_to_system(
-                coordinate_system.coord_system_type))
-            # now take each component of vector and assign them to base_scalars, eg x, y, z
-            # replace each component of new_scalars with assigned x, y, z, eg r -> x, theta -> y
-            # build new vector from these components
-            for i, scalar in enumerate(self.coordinate_system.coord_system.base_scalars()):
-                new_component = 0 if i >= len(self.components) else self.components[i]
-                for j, old_scalar in enumerate(new_scalars):
-                    new_scalars[j] = old_scalar.subs(scalar, new_component)
-            vector_ = Vector(new_scalars, self.coordinate_system)
-        # We do not want to maintain own vector transformation functions, so
-        # we convert our vector to SymPy format, transform it and convert back to Vector.
-        sympy_vector = vector_.to_sympy_vector()
-        transformed_vector_sympy = express(sympy_vector,
-            coordinate_system.coord_system,
-            None,
-            variables=True)
-        return Vector.from_sympy_vector(transformed_vector_sympy, coordinate_system)
+        components = transform_components(self.components, self.coordinate_system,
+            coordinate_system)
+        if all(c == 0 for c in components):
+            return Vector([], coordinate_system)
+        return Vector(components, coordinate_system)
 
 
 class QuantityVector(Vector, DimensionSymbol):
+    # Components are created on first access and reused
+    _quantities: Optional[list[Quantity]]
 
     def __init__(self,
         components: Sequence[Quantity | ScalarValue],
@@ -112,10 +101,17 @@ class QuantityVector(Vector, DimensionSymbol):
             scale_factors.append(c.scale_factor)
         DimensionSymbol.__init__(self, next_name("VEC"), dimension)
         Vector.__init__(self, scale_factors, coordinate_system)
+        self._quantities = None
 
     @property
     def components(self) -> Sequence[Quantity]:
-        return [Quantity(c, dimension=self.dimension) for c in self._components]
+        if self._quantities is None:
+            self._quantities = [Quantity(c, dimension=self.dimension) for c in self._components]
+        return self._quantities
+
+    @property
+    def scale_factors(self) -> Sequence[ScalarValue]:
+        return self._components
 
     @staticmethod
     def _expr_to_quantities(components: Sequence[ScalarValue | Quantity],
@@ -138,6 +134,26 @@ class QuantityVector(Vector, DimensionSymbol):
     # Quantities should not contain free symbols, eg coordinate_system.x, so they cannot be
     # properly rebased. Only coordinate system rotation and type conversion is supported.
     def rebase(self, coordinate_system: CoordinateSystem) -> QuantityVector:
+        if self.coordinate_system.coord_system_type == coordinate_system.coord_system_type:
+            # rotation does not change dimension, so scale factors are rebased without creating
+            # quantities. Free symbols of quantities are not rebased.
+            scale_factors = transform_components(self.scale_factors,
+                self.coordinate_system,
+                coordinate_system,
+                variables=False)
+            if all(c == 0 for c in scale_factors):
+                scale_factors = []
+            return QuantityVector._from_scale_factors(scale_factors, coordinate_system,
+                self.dimension)
         vector_ = Vector(self.components, self.coordinate_system)
         rebased = vector_.rebase(coordinate_system)
         return QuantityVector(rebased.components, coordinate_system)
+
+    @staticmethod
+    def _from_scale_factors(scale_factors: Sequence[ScalarValue],
+        coordinate_system: CoordinateSystem, dimension: Dimension) -> QuantityVector:
+        vector_ = QuantityVector.__new__(QuantityVector)
+        DimensionSymbol.__init__(vector_, next_name("VEC"), dimension)
+        Vector.__init__(vector_, scale_factors, coordinate_system)
+        vector_._quantities = None  # pylint: disable=protected-access
+        return vector_
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Admittance (a.k.a. complex conductance) is ability of dipole to conduct electrical signal.
@@ -24,6 +26,12 @@ def print_law() -> str:
 @validate_input(impedance_=dipole_impedance)
 @validate_output(dipole_admittance)
 def calculate_admittance(impedance_: Quantity) -> Quantity:
-    solved = solve(definition, dipole_admittance, dict=True)[0][dipole_admittance]
+    solved = solve_for(definition, dipole_admittance)
     result_expr = solved.subs({dipole_impedance: impedance_})
     return Quantity(result_expr)
+
+
+calculate_admittance_batch = BatchLaw(definition,
+    dipole_admittance,
+    function=calculate_admittance,
+    impedance_=dipole_impedance)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The electrical capacitance of a capacitor is
@@ -28,6 +30,13 @@ def print_law() -> str:
 @validate_input(charge_=charge, voltage_=voltage)
 @validate_output(capacitance)
 def calculate_capacitance(charge_: Quantity, voltage_: Quantity) -> Quantity:
-    solved = solve(definition, capacitance, dict=True)[0][capacitance]
+    solved = solve_for(definition, capacitance)
     result_expr = solved.subs({charge: charge_, voltage: voltage_})
     return Quantity(result_expr)
+
+
+calculate_capacitance_batch = BatchLaw(definition,
+    capacitance,
+    function=calculate_capacitance,
+    charge_=charge,
+    voltage_=voltage)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The density (more precisely, the volumetric mass density), of a substance
@@ -28,6 +30,13 @@ def print_law() -> str:
 @validate_input(mass_=mass, volume_=volume)
 @validate_output(density)
 def calculate_density(mass_: Quantity, volume_: Quantity) -> Quantity:
-    solved = solve(definition, density, dict=True)[0][density]
+    solved = solve_for(definition, density)
     result_expr = solved.subs({mass: mass_, volume: volume_})
     return Quantity(result_expr)
+
+
+calculate_density_batch = BatchLaw(definition,
+    density,
+    function=calculate_density,
+    mass_=mass,
+    volume_=volume)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Conductivity is ability of medium to conduct electrical current.
@@ -25,6 +27,12 @@ def print_law() -> str:
 @validate_input(resistance_=object_resistance)
 @validate_output(object_conductivity)
 def calculate_conductivity(resistance_: Quantity) -> Quantity:
-    solved = solve(definition, object_conductivity, dict=True)[0][object_conductivity]
+    solved = solve_for(definition, object_conductivity)
     result_expr = solved.subs({object_resistance: resistance_})
     return Quantity(result_expr)
+
+
+calculate_conductivity_batch = BatchLaw(definition,
+    object_conductivity,
+    function=calculate_conductivity,
+    resistance_=object_resistance)
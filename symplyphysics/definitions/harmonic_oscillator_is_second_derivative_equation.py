@@ -42,20 +42,23 @@ amplitude = symbols("amplitude")
 initial_phase = symbols("initial_phase")
 displacement_function_eq = Eq(displacement_function(time),
     amplitude * cos(angular_frequency * time + initial_phase))
-dsolved = definition.subs(displacement_function(time), displacement_function_eq.rhs)
-assert expr_equals(dsolved.lhs, dsolved.rhs)
-
-## There are many solutions for harmonic_oscillation_eq. Add condition, that at initial point of time (time = 0)
-## there is max displacement (displacement(time) = amplitude).
-## Let's prove that initial phase of cosine function (displacement_function_eq) should be zero.
-
-initial_condition = Eq(displacement_function(0), amplitude)
-displacement_function_at_zero_time_eq = displacement_function_eq.subs(time, 0)
-## Initial phase solutions have period of 2*pi. Take first solution.
-initial_phase_solved = solve([displacement_function_at_zero_time_eq, initial_condition],
-    (amplitude, initial_phase),
-    dict=True)[0][initial_phase]
-assert expr_equals(initial_phase_solved, 0)
+
+
+def verify_derivation() -> None:
+    dsolved = definition.subs(displacement_function(time), displacement_function_eq.rhs)
+    assert expr_equals(dsolved.lhs, dsolved.rhs)
+
+    ## There are many solutions for harmonic_oscillation_eq. Add condition, that at initial point of time (time = 0)
+    ## there is max displacement (displacement(time) = amplitude).
+    ## Let's prove that initial phase of cosine function (displacement_function_eq) should be zero.
+
+    initial_condition = Eq(displacement_function(0), amplitude)
+    displacement_function_at_zero_time_eq = displacement_function_eq.subs(time, 0)
+    ## Initial phase solutions have period of 2*pi. Take first solution.
+    initial_phase_solved = solve([displacement_function_at_zero_time_eq, initial_condition],
+        (amplitude, initial_phase),
+        dict=True)[0][initial_phase]
+    assert expr_equals(initial_phase_solved, 0)
 
 
 def print_law() -> str:
@@ -1,6 +1,7 @@
-from sympy import (I, Eq, solve)
+from sympy import (I, Eq)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Impedance is the combination of resistance and reactance (both inductive and capacitive) and is
@@ -30,7 +31,7 @@ def print_law() -> str:
 @validate_input(resistance_=resistance, reactance_=reactance)
 @validate_output(impedance)
 def calculate_impedance_magnitude(resistance_: Quantity, reactance_: Quantity) -> Quantity:
-    solved = solve(definition, impedance, dict=True)[0][impedance]
+    solved = solve_for(definition, impedance)
     result_expr = solved.subs({resistance: resistance_, reactance: reactance_})
     result_magnitude = abs(result_expr)
     return Quantity(result_magnitude)
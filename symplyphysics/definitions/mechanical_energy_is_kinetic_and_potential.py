@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The mechanical energy of the system is defined as the total kinetic energy plus the total potential energy.
@@ -27,9 +29,16 @@ def print_law() -> str:
 @validate_input(kinetic_energy_=kinetic_energy, potential_energy_=potential_energy)
 @validate_output(mechanical_energy)
 def calculate_mechanical_energy(kinetic_energy_: Quantity, potential_energy_: Quantity) -> Quantity:
-    solved = solve(definition, mechanical_energy, dict=True)[0][mechanical_energy]
+    solved = solve_for(definition, mechanical_energy)
     result_expr = solved.subs({
         kinetic_energy: kinetic_energy_,
         potential_energy: potential_energy_
     })
     return Quantity(result_expr)
+
+
+calculate_mechanical_energy_batch = BatchLaw(definition,
+    mechanical_energy,
+    function=calculate_mechanical_energy,
+    kinetic_energy_=kinetic_energy,
+    potential_energy_=potential_energy)
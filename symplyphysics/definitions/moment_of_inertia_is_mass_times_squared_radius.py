@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## If the particle is about to spin around axle, it has moment of inertia.
@@ -29,6 +31,13 @@ def print_law() -> str:
 @validate_input(mass_=particle_mass, radius_=spinning_radius)
 @validate_output(moment_of_inertia)
 def calculate_moment_of_inertia(mass_: Quantity, radius_: Quantity) -> Quantity:
-    result_inertia_expr = solve(definition, moment_of_inertia, dict=True)[0][moment_of_inertia]
+    result_inertia_expr = solve_for(definition, moment_of_inertia)
     result_expr = result_inertia_expr.subs({particle_mass: mass_, spinning_radius: radius_})
     return Quantity(result_expr)
+
+
+calculate_moment_of_inertia_batch = BatchLaw(definition,
+    moment_of_inertia,
+    function=calculate_moment_of_inertia,
+    mass_=particle_mass,
+    radius_=spinning_radius)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Momentum is the multiplication of velocity and mass. As velocity is vector, momentum is vector as well and it is collinear with velocity.
@@ -27,6 +29,13 @@ def print_law() -> str:
 @validate_input(velocity_=velocity, mass_=mass)
 @validate_output(momentum)
 def calculate_momentum(mass_: Quantity, velocity_: Quantity) -> Quantity:
-    solved = solve(definition, momentum, dict=True)[0][momentum]
+    solved = solve_for(definition, momentum)
     result_expr = solved.subs({mass: mass_, velocity: velocity_})
     return Quantity(result_expr)
+
+
+calculate_momentum_batch = BatchLaw(definition,
+    momentum,
+    function=calculate_momentum,
+    mass_=mass,
+    velocity_=velocity)
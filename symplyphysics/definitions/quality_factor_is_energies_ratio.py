@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Quality factor is the property of oscillatiing system. It shows the ratio between amount of energy stored in system and power losses.
@@ -30,10 +32,18 @@ def print_law() -> str:
 @validate_input(frequency_=resonant_frequency, energy_=stored_energy, power_=dissipated_power)
 @validate_output(quality_factor)
 def calculate_quality_factor(frequency_: Quantity, energy_: Quantity, power_: Quantity) -> Quantity:
-    result_factor_expr = solve(definition, quality_factor, dict=True)[0][quality_factor]
+    result_factor_expr = solve_for(definition, quality_factor)
     result_expr = result_factor_expr.subs({
         resonant_frequency: frequency_,
         stored_energy: energy_,
         dissipated_power: power_
     })
     return Quantity(result_expr)
+
+
+calculate_quality_factor_batch = BatchLaw(definition,
+    quality_factor,
+    function=calculate_quality_factor,
+    frequency_=resonant_frequency,
+    energy_=stored_energy,
+    power_=dissipated_power)
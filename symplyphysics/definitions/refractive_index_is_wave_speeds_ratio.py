@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## If wave transfers from one medium to another, it refracts. That's because of different propagation speeds in different mediums.
@@ -40,10 +42,17 @@ def print_law() -> str:
 @validate_input(outer_speed_=outer_speed, refracting_speed_=refracting_speed)
 @validate_output(refractive_index)
 def calculate_refractive_index(outer_speed_: Quantity, refracting_speed_: Quantity) -> float:
-    result_index_expr = solve(definition, refractive_index, dict=True)[0][refractive_index]
+    result_index_expr = solve_for(definition, refractive_index)
     result_expr = result_index_expr.subs({
         outer_speed: outer_speed_,
         refracting_speed: refracting_speed_
     })
     result = Quantity(result_expr)
     return float(convert_to(result, S.One).evalf())
+
+
+calculate_refractive_index_batch = BatchLaw(definition,
+    refractive_index,
+    function=calculate_refractive_index,
+    outer_speed_=outer_speed,
+    refracting_speed_=refracting_speed)
@@ -1,6 +1,7 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (dimensionless, units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Frequency is the number of occurrences of a repeating event per unit of time.
@@ -28,6 +29,6 @@ def print_law() -> str:
 @validate_input(time_=time)
 @validate_output(temporal_frequency)
 def calculate_frequency(events_: float, time_: Quantity) -> Quantity:
-    solved = solve(definition, temporal_frequency, dict=True)[0][temporal_frequency]
+    solved = solve_for(definition, temporal_frequency)
     result_expr = solved.subs({time: time_, events: events_})
     return Quantity(result_expr)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Volume number density is the number of specified objects per unit volume.
@@ -26,6 +28,13 @@ def print_law() -> str:
 @validate_input(objects_=objects, volume_=volume)
 @validate_output(number_density)
 def calculate_number_density(objects_: int, volume_: Quantity) -> Quantity:
-    solved = solve(definition, number_density, dict=True)[0][number_density]
+    solved = solve_for(definition, number_density)
     result_expr = solved.subs({objects: objects_, volume: volume_})
     return Quantity(result_expr)
+
+
+calculate_number_density_batch = BatchLaw(definition,
+    number_density,
+    function=calculate_number_density,
+    objects_=objects,
+    volume_=volume)
@@ -1,10 +1,8 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
-from symplyphysics.definitions import volume_number_density
-from symplyphysics.definitions import density_from_mass_volume
-from symplyphysics.laws.chemistry import avogadro_number_from_mole_count
-from symplyphysics.laws.chemistry import atomic_weight_from_mass_mole_count
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The atomic number density (N; atoms/cm^3) is the number of atoms of a given type per unit volume (V; cm^3)
@@ -26,31 +24,38 @@ atomic_weight = Symbol("atomic_weight", units.mass / units.amount_of_substance)
 
 law = Eq(atomic_number_density, material_density * units.avogadro / atomic_weight)
 
+
 # Derive the same law from volume number density law
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.definitions import volume_number_density
+    from symplyphysics.definitions import density_from_mass_volume
+    from symplyphysics.laws.chemistry import avogadro_number_from_mole_count
+    from symplyphysics.laws.chemistry import atomic_weight_from_mass_mole_count
 
-density_law = density_from_mass_volume.definition.subs({
-    density_from_mass_volume.volume: volume_number_density.volume,
-    density_from_mass_volume.density: material_density
-})
+    density_law = density_from_mass_volume.definition.subs({
+        density_from_mass_volume.volume: volume_number_density.volume,
+        density_from_mass_volume.density: material_density
+    })
 
-avogadro_law = avogadro_number_from_mole_count.law.subs(
-    {avogadro_number_from_mole_count.particles_count: volume_number_density.objects})
+    avogadro_law = avogadro_number_from_mole_count.law.subs(
+        {avogadro_number_from_mole_count.particles_count: volume_number_density.objects})
 
-atomic_weight_law = atomic_weight_from_mass_mole_count.law.subs({
-    atomic_weight_from_mass_mole_count.atomic_weight: atomic_weight,
-    atomic_weight_from_mass_mole_count.substance_mass: density_from_mass_volume.mass,
-    atomic_weight_from_mass_mole_count.mole_count: avogadro_number_from_mole_count.mole_count
-})
+    atomic_weight_law = atomic_weight_from_mass_mole_count.law.subs({
+        atomic_weight_from_mass_mole_count.atomic_weight: atomic_weight,
+        atomic_weight_from_mass_mole_count.substance_mass: density_from_mass_volume.mass,
+        atomic_weight_from_mass_mole_count.mole_count: avogadro_number_from_mole_count.mole_count
+    })
 
-derived_law = [volume_number_density.definition, density_law, avogadro_law, atomic_weight_law]
+    derived_law = [volume_number_density.definition, density_law, avogadro_law, atomic_weight_law]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_number_density = solve(derived_law,
-    (density_from_mass_volume.mass, volume_number_density.objects,
-    volume_number_density.number_density, avogadro_number_from_mole_count.mole_count),
-    dict=True)[0][volume_number_density.number_density]
-assert solve(law, atomic_number_density,
-    dict=True)[0][atomic_number_density] == derived_number_density
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_number_density = solve(derived_law,
+        (density_from_mass_volume.mass, volume_number_density.objects,
+        volume_number_density.number_density, avogadro_number_from_mole_count.mole_count),
+        dict=True)[0][volume_number_density.number_density]
+    assert solve(law, atomic_number_density,
+        dict=True)[0][atomic_number_density] == derived_number_density
 
 
 def print_law() -> str:
@@ -61,6 +66,13 @@ def print_law() -> str:
 @validate_output(atomic_number_density)
 def calculate_atomic_number_density(material_density_: Quantity,
     atomic_weight_: Quantity) -> Quantity:
-    solved = solve(law, atomic_number_density, dict=True)[0][atomic_number_density]
+    solved = solve_for(law, atomic_number_density)
     result_expr = solved.subs({material_density: material_density_, atomic_weight: atomic_weight_})
     return Quantity(result_expr)
+
+
+calculate_atomic_number_density_batch = BatchLaw(law,
+    atomic_number_density,
+    function=calculate_atomic_number_density,
+    material_density_=material_density,
+    atomic_weight_=atomic_weight)
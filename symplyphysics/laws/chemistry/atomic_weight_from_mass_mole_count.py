@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The molar mass of a chemical compound is defined as the mass of a sample of that compound divided
@@ -26,6 +28,13 @@ def print_law() -> str:
 @validate_input(substance_mass_=substance_mass, mole_count_=mole_count)
 @validate_output(atomic_weight)
 def calculate_atomic_weight(substance_mass_: Quantity, mole_count_: Quantity) -> Quantity:
-    solved = solve(law, atomic_weight, dict=True)[0][atomic_weight]
+    solved = solve_for(law, atomic_weight)
     result_expr = solved.subs({substance_mass: substance_mass_, mole_count: mole_count_})
     return Quantity(result_expr)
+
+
+calculate_atomic_weight_batch = BatchLaw(law,
+    atomic_weight,
+    function=calculate_atomic_weight,
+    substance_mass_=substance_mass,
+    mole_count_=mole_count)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The Avogadro constant is the proportionality factor that relates the number of constituent particles
@@ -33,7 +35,13 @@ def print_law() -> str:
 @validate_input(mole_count_=mole_count)
 @validate_output(particles_count)
 def calculate_particles_count(mole_count_: Quantity) -> int:
-    solved = solve(law, particles_count, dict=True)[0][particles_count]
+    solved = solve_for(law, particles_count)
     result_expr = solved.subs(mole_count, mole_count_)
     result = Quantity(result_expr)
     return int(convert_to(result, S.One).evalf())
+
+
+calculate_particles_count_batch = BatchLaw(law,
+    particles_count,
+    function=calculate_particles_count,
+    mole_count_=mole_count)
@@ -2,7 +2,7 @@ from sympy import (Eq, solve, dsolve)
 from symplyphysics import (units, Quantity, Symbol, Function, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.laws.conservation import momentum_of_colliding_objects_is_constant as constant_momentum
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## If there is no external force applied to system of objects, the summary momentum of this system remains constant
@@ -21,21 +21,25 @@ momentum = Function("momentum", units.momentum)
 
 law = Eq(momentum(time_after), momentum(time_before))
 
+
 # Derive the same law from constant momentum
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.conservation import momentum_of_colliding_objects_is_constant as constant_momentum
 
-## dsolve() shows that solution is constant C1
-dsolved = dsolve(constant_momentum.law, constant_momentum.momentum(constant_momentum.time))
+    ## dsolve() shows that solution is constant C1
+    dsolved = dsolve(constant_momentum.law, constant_momentum.momentum(constant_momentum.time))
 
-energy_before_eq = dsolved.subs(constant_momentum.time, time_before)
-energy_before_eq = energy_before_eq.subs(constant_momentum.momentum(time_before),
-    momentum(time_before))
-energy_after_eq = dsolved.subs(constant_momentum.time, time_after)
-energy_after_eq = energy_after_eq.subs(constant_momentum.momentum(time_after), momentum(time_after))
+    energy_before_eq = dsolved.subs(constant_momentum.time, time_before)
+    energy_before_eq = energy_before_eq.subs(constant_momentum.momentum(time_before),
+        momentum(time_before))
+    energy_after_eq = dsolved.subs(constant_momentum.time, time_after)
+    energy_after_eq = energy_after_eq.subs(constant_momentum.momentum(time_after), momentum(time_after))
 
-## Show that when energy is constant, energy_before equals to energy_after
-energy_after_solved = solve([energy_after_eq, energy_before_eq], (momentum(time_after), "C1"),
-    dict=True)[0][momentum(time_after)]
-assert expr_equals(energy_after_solved, law.rhs)
+    ## Show that when energy is constant, energy_before equals to energy_after
+    energy_after_solved = solve([energy_after_eq, energy_before_eq], (momentum(time_after), "C1"),
+        dict=True)[0][momentum(time_after)]
+    assert expr_equals(energy_after_solved, law.rhs)
 
 
 def print_law() -> str:
@@ -45,6 +49,6 @@ def print_law() -> str:
 @validate_input(momentum_before_=momentum)
 @validate_output(momentum)
 def calculate_momentum_after(momentum_before_: Quantity) -> Quantity:
-    solved = solve(law, momentum(time_after), dict=True)[0][momentum(time_after)]
+    solved = solve_for(law, momentum(time_after))
     result_expr = solved.subs(momentum(time_before), momentum_before_)
     return Quantity(result_expr)
@@ -1,6 +1,7 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Newton's third law: Fr = -Fa
@@ -21,6 +22,6 @@ def print_law() -> str:
 @validate_input(force_action_=force_action)
 @validate_output(force_reaction)
 def calculate_force_reaction(force_action_: Quantity) -> Quantity:
-    result_force_expr = solve(law, force_reaction, dict=True)[0][force_reaction]
+    result_force_expr = solve_for(law, force_reaction)
     result_expr = result_force_expr.subs({force_action: force_action_})
     return Quantity(abs(result_expr))
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless,
     validate_input, validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Friction force is tangential interaction between two objects, which impedes there relative movement.
@@ -26,6 +28,13 @@ def print_law() -> str:
 @validate_input(friction_factor_=friction_factor,  normal_reaction_=normal_reaction)
 @validate_output(friction_force)
 def calculate_friction_force(friction_factor_: float, normal_reaction_: Quantity) -> Quantity:
-    result_expr = solve(law, friction_force, dict=True)[0][friction_force]
+    result_expr = solve_for(law, friction_force)
     friction_force_applied = result_expr.subs({friction_factor: friction_factor_, normal_reaction: normal_reaction_})
     return Quantity(friction_force_applied)
+
+
+calculate_friction_force_batch = BatchLaw(law,
+    friction_force,
+    function=calculate_friction_force,
+    friction_factor_=friction_factor,
+    normal_reaction_=normal_reaction)
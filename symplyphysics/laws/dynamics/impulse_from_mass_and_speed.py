@@ -1,8 +1,10 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import Dimension
 from sympy.physics.units import meter, kilogram, second
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # The momentum of a body is a vector quantity 
 # equal to the product of the mass of a body and its velocity:
@@ -23,8 +25,11 @@ def print_law() -> str:
 @validate_input(v = velocity,  m = mass)
 @validate_output(impulse)
 def calculate_impulse(v: Quantity, m: Quantity):
-    result_expr = solve(law, impulse, dict=True)[0][impulse]
+    result_expr = solve_for(law, impulse)
     impulse_applied = result_expr.subs({mass : m, velocity : v})
     return Quantity(impulse_applied)
 
+
+calculate_impulse_batch = BatchLaw(law, impulse, function=calculate_impulse, v=velocity, m=mass)
+
 print(impulse, mass, law)
\ No newline at end of file
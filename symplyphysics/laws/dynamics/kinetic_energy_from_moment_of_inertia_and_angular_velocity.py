@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, angle_type, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## If an object has a inertia moment and spins with some angular velocity, it bears kinetic energy.
@@ -23,9 +25,16 @@ def print_law() -> str:
 @validate_input(inertia_moment_=object_inertia_moment, angular_velocity_=angular_velocity)
 @validate_output(kinetic_energy)
 def calculate_energy(inertia_moment_: Quantity, angular_velocity_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, kinetic_energy, dict=True)[0][kinetic_energy]
+    result_energy_expr = solve_for(law, kinetic_energy)
     result_expr = result_energy_expr.subs({
         object_inertia_moment: inertia_moment_,
         angular_velocity: angular_velocity_
     })
     return Quantity(result_expr)
+
+
+calculate_energy_batch = BatchLaw(law,
+    kinetic_energy,
+    function=calculate_energy,
+    inertia_moment_=object_inertia_moment,
+    angular_velocity_=angular_velocity)
@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.vector import Dot
 from symplyphysics import (units, Quantity, Symbol, print_expression, angle_type, Vector,
     validate_input, validate_output)
 from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem, coordinates_transform
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Work is measured result of force applied. Mechanical work is the only reason for the object energy to be changed.
@@ -28,7 +29,7 @@ def print_law() -> str:
 @validate_output(work)
 def calculate_work(force_: Quantity, distance_: Quantity, force_angle: Quantity | float,
     distance_angle: Quantity | float) -> Quantity:
-    result_work_expr = solve(law, work, dict=True)[0][work]
+    result_work_expr = solve_for(law, work)
     coordinates_polar = CoordinateSystem(CoordinateSystem.System.CYLINDRICAL)
     coordinates_cartesian = coordinates_transform(coordinates_polar,
         CoordinateSystem.System.CARTESIAN)
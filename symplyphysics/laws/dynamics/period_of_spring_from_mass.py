@@ -3,11 +3,8 @@ from sympy import (Derivative, Eq, Function as SymFunction, diff, solve, pi, sqr
 from symplyphysics import (Quantity, units, Symbol, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.laws.dynamics import potential_energy_from_deformation as spring_energy
-from symplyphysics.laws.dynamics import kinetic_energy_from_mass_and_velocity as kinetic_energy
-from symplyphysics.definitions import velocity_is_movement_derivative as velocity_def
-from symplyphysics.laws.kinematic import period_from_angular_frequency as period_definition
-from symplyphysics.definitions import harmonic_oscillator_is_second_derivative_equation as oscillator
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Mass on spring is a system of object with mass m and spring with elasticity k. It starts oscillating after been pushed out of balance.
@@ -36,61 +33,75 @@ def print_law() -> str:
 
 
 # Derive this law from conservation of energy
-
-## Spring displacement is distance between current and balanced positions.
-spring_displacement = symbols("spring_displacement", cls=SymFunction)
-time = symbols("time")
-
-## Spring oscillation is cyclic transfer of energy from kinetic to potential. To set oscillation up we have to input some energy. Usually it is done by biasing the spring and letting it go.
-## Biasing the spring is giving to it some amount of potential energy.
-
-amount_of_potential_energy = spring_energy.law.subs({
-    spring_energy.elastic_koefficient: spring_elasticity,
-    spring_energy.deformation: spring_displacement(time)
-}).rhs
-
-## Kinetic energy of the pendulum is:
-## object_mass * (linear_velocity)**2 / 2
-velocity_def_eq = velocity_def.definition.subs(velocity_def.moving_time, time)
-linear_velocity = velocity_def_eq.subs(velocity_def.movement(time), spring_displacement(time)).rhs
-amount_of_kinetic_energy = kinetic_energy.law.subs({
-    kinetic_energy.body_mass: object_mass,
-    kinetic_energy.body_velocity: linear_velocity
-}).rhs
-
-## Total energy is constant and any of it's derivatives is 0.
-total_energy = symbols("total_energy", constant=True)
-total_energy_eq = Eq(total_energy, amount_of_kinetic_energy + amount_of_potential_energy)
-
-## Differentiate twice both sides of equation
-total_energy_diff_eq = Eq(diff(total_energy_eq.lhs, time), diff(total_energy_eq.rhs, time))
-
-## The second derivative of displacement is acceleration
-spring_acceleration_derived_from_energy = solve(total_energy_diff_eq,
-    Derivative(spring_displacement(time), (time, 2)),
-    dict=True)[0][Derivative(spring_displacement(time), (time, 2))]
-spring_acceleration_diff_eq = Eq(Derivative(spring_displacement(time), (time, 2)),
-    spring_acceleration_derived_from_energy)
-
-oscillator_eq = oscillator.definition.subs(oscillator.time, time)
-oscillator_eq = oscillator_eq.subs(oscillator.displacement_function(time),
-    spring_displacement(time))
-angular_frequency_solved = simplify(
-    solve([oscillator_eq, spring_acceleration_diff_eq],
-    (oscillator.angular_frequency, spring_displacement(time)),
-    dict=True)[0][oscillator.angular_frequency])
-
-# 6. Derive period from frequency
-period_law = period_definition.law.subs(period_definition.circular_frequency,
-    angular_frequency_solved)
-period_solved = solve(period_law, period_definition.period, dict=True)[0][period_definition.period]
-## Square roots fail to compare with each other. Raise both parts to power of 2 before checking for equality.
-assert expr_equals(period_solved**2, law.rhs**2)
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.dynamics import potential_energy_from_deformation as spring_energy
+    from symplyphysics.laws.dynamics import kinetic_energy_from_mass_and_velocity as kinetic_energy
+    from symplyphysics.definitions import velocity_is_movement_derivative as velocity_def
+    from symplyphysics.laws.kinematic import period_from_angular_frequency as period_definition
+    from symplyphysics.definitions import harmonic_oscillator_is_second_derivative_equation as oscillator
+
+    ## Spring displacement is distance between current and balanced positions.
+    spring_displacement = symbols("spring_displacement", cls=SymFunction)
+    time = symbols("time")
+
+    ## Spring oscillation is cyclic transfer of energy from kinetic to potential. To set oscillation up we have to input some energy. Usually it is done by biasing the spring and letting it go.
+    ## Biasing the spring is giving to it some amount of potential energy.
+
+    amount_of_potential_energy = spring_energy.law.subs({
+        spring_energy.elastic_koefficient: spring_elasticity,
+        spring_energy.deformation: spring_displacement(time)
+    }).rhs
+
+    ## Kinetic energy of the pendulum is:
+    ## object_mass * (linear_velocity)**2 / 2
+    velocity_def_eq = velocity_def.definition.subs(velocity_def.moving_time, time)
+    linear_velocity = velocity_def_eq.subs(velocity_def.movement(time), spring_displacement(time)).rhs
+    amount_of_kinetic_energy = kinetic_energy.law.subs({
+        kinetic_energy.body_mass: object_mass,
+        kinetic_energy.body_velocity: linear_velocity
+    }).rhs
+
+    ## Total energy is constant and any of it's derivatives is 0.
+    total_energy = symbols("total_energy", constant=True)
+    total_energy_eq = Eq(total_energy, amount_of_kinetic_energy + amount_of_potential_energy)
+
+    ## Differentiate twice both sides of equation
+    total_energy_diff_eq = Eq(diff(total_energy_eq.lhs, time), diff(total_energy_eq.rhs, time))
+
+    ## The second derivative of displacement is acceleration
+    spring_acceleration_derived_from_energy = solve(total_energy_diff_eq,
+        Derivative(spring_displacement(time), (time, 2)),
+        dict=True)[0][Derivative(spring_displacement(time), (time, 2))]
+    spring_acceleration_diff_eq = Eq(Derivative(spring_displacement(time), (time, 2)),
+        spring_acceleration_derived_from_energy)
+
+    oscillator_eq = oscillator.definition.subs(oscillator.time, time)
+    oscillator_eq = oscillator_eq.subs(oscillator.displacement_function(time),
+        spring_displacement(time))
+    angular_frequency_solved = simplify(
+        solve([oscillator_eq, spring_acceleration_diff_eq],
+        (oscillator.angular_frequency, spring_displacement(time)),
+        dict=True)[0][oscillator.angular_frequency])
+
+    # 6. Derive period from frequency
+    period_law = period_definition.law.subs(period_definition.circular_frequency,
+        angular_frequency_solved)
+    period_solved = solve(period_law, period_definition.period, dict=True)[0][period_definition.period]
+    ## Square roots fail to compare with each other. Raise both parts to power of 2 before checking for equality.
+    assert expr_equals(period_solved**2, law.rhs**2)
 
 
 @validate_input(spring_elasticity_=spring_elasticity, object_mass_=object_mass)
 @validate_output(oscillation_period)
 def calculate_period(spring_elasticity_: Quantity, object_mass_: Quantity) -> Quantity:
-    solved = solve(law, oscillation_period, dict=True)[0][oscillation_period]
+    solved = solve_for(law, oscillation_period)
     result_expr = solved.subs({spring_elasticity: spring_elasticity_, object_mass: object_mass_})
     return Quantity(result_expr)
+
+
+calculate_period_batch = BatchLaw(law,
+    oscillation_period,
+    function=calculate_period,
+    spring_elasticity_=spring_elasticity,
+    object_mass_=object_mass)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Spring accumulates energy while being deformated. This law is known as Hooke's law.
@@ -26,9 +28,16 @@ def print_law() -> str:
 @validate_input(elastic_koefficient_=elastic_koefficient, deformation_=deformation)
 @validate_output(spring_energy)
 def calculate_energy(elastic_koefficient_: Quantity, deformation_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, spring_energy, dict=True)[0][spring_energy]
+    result_energy_expr = solve_for(law, spring_energy)
     result_expr = result_energy_expr.subs({
         elastic_koefficient: elastic_koefficient_,
         deformation: deformation_
     })
     return Quantity(result_expr)
+
+
+calculate_energy_batch = BatchLaw(law,
+    spring_energy,
+    function=calculate_energy,
+    elastic_koefficient_=elastic_koefficient,
+    deformation_=deformation)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Potential energy of body EP = m * g * h
@@ -24,7 +26,13 @@ def print_law() -> str:
 @validate_input(body_mass_=body_mass, height_=height)
 @validate_output(potential_energy_of_body)
 def calculate_potential_energy(body_mass_: Quantity, height_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, potential_energy_of_body,
-        dict=True)[0][potential_energy_of_body]
+    result_energy_expr = solve_for(law, potential_energy_of_body)
     result_expr = result_energy_expr.subs({body_mass: body_mass_, height: height_})
     return Quantity(result_expr)
+
+
+calculate_potential_energy_batch = BatchLaw(law,
+    potential_energy_of_body,
+    function=calculate_potential_energy,
+    body_mass_=body_mass,
+    height_=height)
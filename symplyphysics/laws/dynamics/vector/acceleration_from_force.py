@@ -1,5 +1,6 @@
-from symplyphysics import (units, Quantity, Symbol, QuantityVector, Vector, scale_vector,
-    validate_input, validate_output, list_of_quantities)
+from symplyphysics import (units, Quantity, NumericQuantity, Symbol, QuantityVector, Vector,
+    NumericVector, scale_vector, scale_numeric_vector, validate_input, validate_output,
+    list_of_quantities)
 
 # Description
 ## Newton's second law in vector form: a = 1/m * F
@@ -20,9 +21,18 @@ def force_law(acceleration_: Vector) -> Vector:
     return scale_vector(mass, acceleration_)
 
 
+def _numeric_mass(mass_: Quantity | NumericQuantity) -> NumericQuantity:
+    return mass_ if isinstance(mass_, NumericQuantity) else NumericQuantity.from_quantity(mass_)
+
+
+# Numeric vectors are processed in batch. Mass can be a single value or NumericQuantity
+# with an array of masses, one per vector.
 @validate_input(mass_=mass, acceleration_=units.acceleration)
 @validate_output(units.force)
-def calculate_force(mass_: Quantity, acceleration_: QuantityVector) -> QuantityVector:
+def calculate_force(mass_: Quantity | NumericQuantity,
+    acceleration_: QuantityVector | NumericVector) -> QuantityVector | NumericVector:
+    if isinstance(acceleration_, NumericVector):
+        return scale_numeric_vector(_numeric_mass(mass_), acceleration_)
     result_force = force_law(acceleration_)
     force_components = list_of_quantities(result_force.components, {mass: mass_})
     return QuantityVector(force_components, acceleration_.coordinate_system)
@@ -30,7 +40,10 @@ def calculate_force(mass_: Quantity, acceleration_: QuantityVector) -> QuantityV
 
 @validate_input(mass_=mass, force_=units.force)
 @validate_output(units.acceleration)
-def calculate_acceleration(mass_: Quantity, force_: QuantityVector) -> QuantityVector:
+def calculate_acceleration(mass_: Quantity | NumericQuantity,
+    force_: QuantityVector | NumericVector) -> QuantityVector | NumericVector:
+    if isinstance(force_, NumericVector):
+        return scale_numeric_vector(1 / _numeric_mass(mass_), force_)
     result_acceleration = acceleration_law(force_)
     acceleration_components = list_of_quantities(result_acceleration.components, {mass: mass_})
     return QuantityVector(acceleration_components, force_.coordinate_system)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 # The amount of energy released by a conductor with a current is directly proportional
@@ -29,6 +31,14 @@ def print_law() -> str:
 @validate_input(voltage_=voltage, time_=time, resistance_=resistance)
 @validate_output(amount_energy)
 def calculate_amount_energy(voltage_: Quantity, time_: Quantity, resistance_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, amount_energy, dict=True)[0][amount_energy]
+    result_energy_expr = solve_for(law, amount_energy)
     result_expr = result_energy_expr.subs({voltage: voltage_, time: time_, resistance: resistance_})
     return Quantity(result_expr)
+
+
+calculate_amount_energy_batch = BatchLaw(law,
+    amount_energy,
+    function=calculate_amount_energy,
+    voltage_=voltage,
+    time_=time,
+    resistance_=resistance)
@@ -1,7 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import electric_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The basic characteristic of a capacitor is its capacitance - the ability of the capacitor to accumulate an electric charge.
@@ -32,7 +33,7 @@ def print_law() -> str:
 @validate_output(capacitor_capacitance)
 def calculate_capacitance(dielectric_permeability_: float, plate_area_: Quantity,
     distance_between_plates_: Quantity) -> Quantity:
-    result_capacitance_expr = solve(law, capacitor_capacitance, dict=True)[0][capacitor_capacitance]
+    result_capacitance_expr = solve_for(law, capacitor_capacitance)
     result_expr = result_capacitance_expr.subs({
         dielectric_permeability: dielectric_permeability_,
         plate_area: plate_area_,
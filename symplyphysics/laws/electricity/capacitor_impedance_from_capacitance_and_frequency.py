@@ -1,6 +1,8 @@
-from sympy import (I, Eq, solve)
+from sympy import (I, Eq)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## While the serial resistance of ideal capacitor is zero, its reactance depends on its capacitance and frequency.
@@ -24,9 +26,16 @@ def print_law() -> str:
 @validate_input(capacitance_=capacitor_capacitance, circular_frequency_=circular_frequency)
 @validate_output(capacitor_impedance)
 def calculate_impedance(capacitance_: Quantity, circular_frequency_: Quantity) -> Quantity:
-    result_impedance_expr = solve(law, capacitor_impedance, dict=True)[0][capacitor_impedance]
+    result_impedance_expr = solve_for(law, capacitor_impedance)
     result_expr = result_impedance_expr.subs({
         capacitor_capacitance: capacitance_,
         circular_frequency: circular_frequency_
     })
     return Quantity(result_expr)
+
+
+calculate_impedance_batch = BatchLaw(law,
+    capacitor_impedance,
+    function=calculate_impedance,
+    capacitance_=capacitor_capacitance,
+    circular_frequency_=circular_frequency)
@@ -1,8 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solved_forms import solve_for
 from symplyphysics.definitions import electrical_conductivity_is_inversed_resistance as conductance_definition
-from symplyphysics.laws.electricity.circuits import conductivity_of_parallel_resistors as parallel_resistors_law
 
 # Description
 ## If two resistors are connected in parallel, total conductance is a sum of conductances of each resistor.
@@ -17,11 +17,15 @@ second_conductance = Symbol("second_conductance", units.conductance)
 
 law = Eq(parallel_conductance, first_conductance + second_conductance)
 
+
 # Derive the same law from more general law for any number of resistors
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.electricity.circuits import conductivity_of_parallel_resistors as parallel_resistors_law
 
-two_resistors_law = parallel_resistors_law.law.subs(parallel_resistors_law.conductances,
-    (first_conductance, second_conductance)).doit()
-assert two_resistors_law.rhs == law.rhs
+    two_resistors_law = parallel_resistors_law.law.subs(parallel_resistors_law.conductances,
+        (first_conductance, second_conductance)).doit()
+    assert two_resistors_law.rhs == law.rhs
 
 
 def print_law() -> str:
@@ -33,22 +37,18 @@ def print_law() -> str:
 def calculate_resistance(first_resistance_: Quantity, second_resistance_: Quantity) -> Quantity:
     first_resistance = Symbol("first_resistance", units.impedance)
     second_resistance = Symbol("second_resistance", units.impedance)
-    conductance1 = solve(conductance_definition.definition,
-        conductance_definition.object_conductivity,
-        dict=True)[0][conductance_definition.object_conductivity].subs(
+    conductance1 = solve_for(conductance_definition.definition,
+        conductance_definition.object_conductivity).subs(
         {conductance_definition.object_resistance: first_resistance})
-    conductance2 = solve(conductance_definition.definition,
-        conductance_definition.object_conductivity,
-        dict=True)[0][conductance_definition.object_conductivity].subs(
+    conductance2 = solve_for(conductance_definition.definition,
+        conductance_definition.object_conductivity).subs(
         {conductance_definition.object_resistance: second_resistance})
-    result_conductance_expr = solve(law, parallel_conductance,
-        dict=True)[0][parallel_conductance].subs({
+    result_conductance_expr = solve_for(law, parallel_conductance).subs({
         first_conductance: conductance1,
         second_conductance: conductance2
         })
-    result_resistance = solve(conductance_definition.definition,
-        conductance_definition.object_resistance,
-        dict=True)[0][conductance_definition.object_resistance].subs(
+    result_resistance = solve_for(conductance_definition.definition,
+        conductance_definition.object_resistance).subs(
         {conductance_definition.object_conductivity: result_conductance_expr})
 
     result_expr = result_resistance.subs({
@@ -1,8 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
-from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.batch import BatchSum
+from symplyphysics.core.operations.sum_array import SumArray, evaluate_sum_law
 
 # Description
 ## If inductors are connected in series, total inductance is a sum of inductances of each inductor.
@@ -25,9 +25,11 @@ def print_law() -> str:
 @validate_input(inductances_=inductances)
 @validate_output(units.inductance)
 def calculate_serial_inductance(inductances_: list[Quantity]) -> Quantity:
-    inductance_symbols = tuple_of_symbols("inductance", units.inductance, len(inductances_))
-    inductances_law = law.subs(inductances, inductance_symbols).doit()
-    solved = solve(inductances_law, serial_inductance, dict=True)[0][serial_inductance]
-    for (from_, to_) in zip(inductance_symbols, inductances_):
-        solved = solved.subs(from_, to_)
-    return Quantity(solved)
+    result = evaluate_sum_law(law, serial_inductance, inductances, inductances_)
+    return Quantity(result)
+
+
+calculate_serial_inductance_batch = BatchSum(law,
+    serial_inductance,
+    function=calculate_serial_inductance,
+    inductances_=inductances)
@@ -1,8 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
-from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.batch import BatchSum
+from symplyphysics.core.operations.sum_array import SumArray, evaluate_sum_law
 
 # Description
 ## If resistors are connected in series, total resistance is a sum of resistances of each resistor.
@@ -22,9 +22,11 @@ def print_law() -> str:
 @validate_input(resistances_=resistances)
 @validate_output(units.impedance)
 def calculate_serial_resistance(resistances_: list[Quantity]) -> Quantity:
-    resistance_symbols = tuple_of_symbols("resistance", units.impedance, len(resistances_))
-    resistances_law = law.subs(resistances, resistance_symbols).doit()
-    solved = solve(resistances_law, serial_resistance, dict=True)[0][serial_resistance]
-    for (from_, to_) in zip(resistance_symbols, resistances_):
-        solved = solved.subs(from_, to_)
-    return Quantity(solved)
+    result = evaluate_sum_law(law, serial_resistance, resistances, resistances_)
+    return Quantity(result)
+
+
+calculate_serial_resistance_batch = BatchSum(law,
+    serial_resistance,
+    function=calculate_serial_resistance,
+    resistances_=resistances)
@@ -1,8 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (Symbol, units, Quantity, print_expression, validate_input,
     validate_output)
-from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.batch import BatchSum
+from symplyphysics.core.operations.sum_array import SumArray, evaluate_sum_law
 
 # Description
 ## sum(I) = 0
@@ -25,10 +25,11 @@ def print_law() -> str:
 @validate_input(currents_=currents)
 @validate_output(units.current)
 def calculate_current_from_array(currents_: list[Quantity]) -> Quantity:
-    current_symbols = tuple_of_symbols("current", units.current, len(currents_) + 1)
-    unknown_current = current_symbols[len(currents_)]
-    currents_law = law.subs(currents, current_symbols).doit()
-    solved = solve(currents_law, unknown_current, dict=True)[0][unknown_current]
-    for (from_, to_) in zip(current_symbols, currents_):
-        solved = solved.subs(from_, to_)
-    return Quantity(solved)
+    result = evaluate_sum_law(law, currents, currents, currents_)
+    return Quantity(result)
+
+
+calculate_current_from_array_batch = BatchSum(law,
+    currents,
+    function=calculate_current_from_array,
+    currents_=currents)
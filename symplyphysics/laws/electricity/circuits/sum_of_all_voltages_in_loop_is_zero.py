@@ -1,8 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, print_expression, Symbol, validate_input,
     validate_output)
-from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.batch import BatchSum
+from symplyphysics.core.operations.sum_array import SumArray, evaluate_sum_law
 
 # Description
 ## sum(U) = 0
@@ -23,10 +23,11 @@ def print_law() -> str:
 @validate_input(voltages_=voltages)
 @validate_output(units.voltage)
 def calculate_voltage(voltages_: list[Quantity]) -> Quantity:
-    voltage_symbols = tuple_of_symbols("voltage", units.voltage, len(voltages_) + 1)
-    unknown_voltage = voltage_symbols[len(voltages_)]
-    voltages_law = law.subs(voltages, voltage_symbols).doit()
-    solved = solve(voltages_law, unknown_voltage, dict=True)[0][unknown_voltage]
-    for (from_, to_) in zip(voltage_symbols, voltages_):
-        solved = solved.subs(from_, to_)
-    return Quantity(solved)
+    result = evaluate_sum_law(law, voltages, voltages, voltages_)
+    return Quantity(result)
+
+
+calculate_voltage_batch = BatchSum(law,
+    voltages,
+    function=calculate_voltage,
+    voltages_=voltages)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Current flowing through the resistor is proportional to applied voltage and reversly proportional to impedance of that resistor
@@ -23,6 +25,13 @@ def print_law() -> str:
 @validate_input(voltage_=voltage, resistance_=resistance)
 @validate_output(current)
 def calculate_current(voltage_: Quantity, resistance_: Quantity) -> Quantity:
-    result_current_expr = solve(law, current, dict=True)[0][current]
+    result_current_expr = solve_for(law, current)
     result_expr = result_current_expr.subs({voltage: voltage_, resistance: resistance_})
     return Quantity(result_expr)
+
+
+calculate_current_batch = BatchLaw(law,
+    current,
+    function=calculate_current,
+    voltage_=voltage,
+    resistance_=resistance)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Q_after = Q_before
@@ -21,6 +23,12 @@ def print_law() -> str:
 @validate_input(charge_before_=charge_before)
 @validate_output(charge_after)
 def calculate_charge_after(charge_before_: Quantity) -> Quantity:
-    solved = solve(law, charge_after, dict=True)[0][charge_after]
+    solved = solve_for(law, charge_after)
     result_expr = solved.subs(charge_before, charge_before_)
     return Quantity(result_expr)
+
+
+calculate_charge_after_batch = BatchLaw(law,
+    charge_after,
+    function=calculate_charge_after,
+    charge_before_=charge_before)
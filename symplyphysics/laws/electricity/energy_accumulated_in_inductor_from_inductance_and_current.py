@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Inductor can accumlate energy in the magnetic field inside it.
@@ -23,6 +25,13 @@ def print_law() -> str:
 @validate_input(inductance_=inductance, current_=current)
 @validate_output(accumulated_energy)
 def calculate_accumulated_energy(inductance_: Quantity, current_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, accumulated_energy, dict=True)[0][accumulated_energy]
+    result_energy_expr = solve_for(law, accumulated_energy)
     result_expr = result_energy_expr.subs({inductance: inductance_, current: current_})
     return Quantity(result_expr)
+
+
+calculate_accumulated_energy_batch = BatchLaw(law,
+    accumulated_energy,
+    function=calculate_accumulated_energy,
+    inductance_=inductance,
+    current_=current)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Coulomb's law states that the force F between two point charges, q1 and q2, in a vacuum is proportional to their product
@@ -38,10 +40,18 @@ def print_law() -> str:
 @validate_output(force)
 def calculate_force(first_charge_: Quantity, second_charge_: Quantity,
     distance_: Quantity) -> Quantity:
-    solved = solve(law, force, dict=True)[0][force]
+    solved = solve_for(law, force)
     result_expr = solved.subs({
         first_charge: first_charge_,
         second_charge: second_charge_,
         distance: distance_,
     })
     return Quantity(result_expr)
+
+
+calculate_force_batch = BatchLaw(law,
+    force,
+    function=calculate_force,
+    first_charge_=first_charge,
+    second_charge_=second_charge,
+    distance_=distance)
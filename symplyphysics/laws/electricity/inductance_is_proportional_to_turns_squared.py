@@ -1,7 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The basic characteristic of a coil is its inductance - the ability of the coil to accumulate energy as magnetic field.
@@ -31,7 +32,7 @@ def print_law() -> str:
 @validate_output(coil_inductance)
 def calculate_inductance(magnetic_permeability_: float, number_of_turns_: float,
     turn_area_: Quantity, coil_length_: Quantity) -> Quantity:
-    result_inductance_expr = solve(law, coil_inductance, dict=True)[0][coil_inductance]
+    result_inductance_expr = solve_for(law, coil_inductance)
     result_expr = result_inductance_expr.subs({
         magnetic_permeability: magnetic_permeability_,
         number_of_turns: number_of_turns_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Power factor is property of any AC consumer. Commonly not all power consumed from source makes useful work.
@@ -25,6 +27,13 @@ def print_law() -> str:
 @validate_input(active_power_=active_power, full_power_=full_power)
 @validate_output(power_factor)
 def calculate_power_factor(active_power_: Quantity, full_power_: Quantity) -> Quantity:
-    result_factor_expr = solve(law, power_factor, dict=True)[0][power_factor]
+    result_factor_expr = solve_for(law, power_factor)
     result_expr = result_factor_expr.subs({active_power: active_power_, full_power: full_power_})
     return Quantity(result_expr)
+
+
+calculate_power_factor_batch = BatchLaw(law,
+    power_factor,
+    function=calculate_power_factor,
+    active_power_=active_power,
+    full_power_=full_power)
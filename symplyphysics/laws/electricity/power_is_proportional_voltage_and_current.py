@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 # Power of current is proportional to current and voltage
@@ -23,6 +25,13 @@ def print_law() -> str:
 @validate_input(current_=current, voltage_=voltage)
 @validate_output(power)
 def calculate_power(current_: Quantity, voltage_: Quantity) -> Quantity:
-    result_power_expr = solve(law, power, dict=True)[0][power]
+    result_power_expr = solve_for(law, power)
     result_expr = result_power_expr.subs({current: current_, voltage: voltage_})
     return Quantity(result_expr)
+
+
+calculate_power_batch = BatchLaw(law,
+    power,
+    function=calculate_power,
+    current_=current,
+    voltage_=voltage)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Resistance of the wire is proportional to its length and resistivity and inversely proportional to its cross-sectional area.
@@ -26,10 +28,18 @@ def print_law() -> str:
 @validate_output(resistance)
 def calculate_resistance(resistivity_: Quantity, wire_length_: Quantity,
     cross_section_: Quantity) -> Quantity:
-    result_resistance_expr = solve(law, resistance, dict=True)[0][resistance]
+    result_resistance_expr = solve_for(law, resistance)
     result_expr = result_resistance_expr.subs({
         resistivity: resistivity_,
         wire_length: wire_length_,
         cross_section: cross_section_
     })
     return Quantity(result_expr)
+
+
+calculate_resistance_batch = BatchLaw(law,
+    resistance,
+    function=calculate_resistance,
+    resistivity_=resistivity,
+    wire_length_=wire_length,
+    cross_section_=cross_section)
@@ -0,0 +1,3 @@
+from symplyphysics.core.lazy_modules import lazy_submodules
+
+__getattr__, __dir__ = lazy_submodules(__name__, __path__)
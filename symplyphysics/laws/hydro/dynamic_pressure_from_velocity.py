@@ -1,5 +1,7 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input, validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## When liquid flows, it causes additional pressure, known as dynamic pressure.
@@ -24,6 +26,13 @@ def print_law() -> str:
 @validate_input(density_=liquid_density, velocity_=flow_velocity)
 @validate_output(dynamic_pressure)
 def calculate_pressure(density_: Quantity, velocity_: Quantity) -> Quantity:
-    result_pressure_expr = solve(law, dynamic_pressure, dict=True)[0][dynamic_pressure]
+    result_pressure_expr = solve_for(law, dynamic_pressure)
     result_expr = result_pressure_expr.subs({liquid_density: density_, flow_velocity: velocity_})
     return Quantity(result_expr)
+
+
+calculate_pressure_batch = BatchLaw(law,
+    dynamic_pressure,
+    function=calculate_pressure,
+    density_=liquid_density,
+    velocity_=flow_velocity)
@@ -1,5 +1,7 @@
-from sympy import Eq, solve
+from sympy import Eq
 from symplyphysics import units, Quantity, Symbol, print_expression, validate_input, validate_output
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 # Law: P = ρ * g * h
@@ -20,6 +22,13 @@ def print_law():
 @validate_input(density_=density, depth_=depth)
 @validate_output(hydrostatic_pressure)
 def calculate_hydrostatic_pressure(density_: Quantity, depth_: Quantity) -> Quantity:
-    result_pressure_expr = solve(law, hydrostatic_pressure, dict=True)[0][hydrostatic_pressure]
+    result_pressure_expr = solve_for(law, hydrostatic_pressure)
     result_expr = result_pressure_expr.subs({density: density_, depth: depth_})
     return Quantity(result_expr)
+
+
+calculate_hydrostatic_pressure_batch = BatchLaw(law,
+    hydrostatic_pressure,
+    function=calculate_hydrostatic_pressure,
+    density_=density,
+    depth_=depth)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units, Quantity, Symbol, print_expression, validate_input, validate_output, dimensionless, convert_to)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 
 # Description
@@ -38,7 +40,7 @@ def print_law() -> str:
 @validate_output(reynolds_number)
 def calculate_reynolds_number(diameter_: Quantity, density_: Quantity,
                               velocity_: Quantity, dynamic_viscosity_: Quantity) -> float:
-    result_expr = solve(law, reynolds_number, dict=True)[0][reynolds_number]
+    result_expr = solve_for(law, reynolds_number)
     result_applied = result_expr.subs({
         diameter: diameter_,
         density: density_,
@@ -47,3 +49,12 @@ def calculate_reynolds_number(diameter_: Quantity, density_: Quantity,
     })
     result = Quantity(result_applied)
     return float(convert_to(result, S.One).evalf())
+
+
+calculate_reynolds_number_batch = BatchLaw(law,
+    reynolds_number,
+    function=calculate_reynolds_number,
+    diameter_=diameter,
+    density_=density,
+    velocity_=velocity,
+    dynamic_viscosity_=dynamic_viscosity)
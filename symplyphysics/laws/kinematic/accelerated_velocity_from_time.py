@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Accelerated velocity is time dependent and increases with time if acceleration is co-directed with velocity and decreases if they are counter-directed.
@@ -28,10 +30,18 @@ def print_law() -> str:
 @validate_output(velocity)
 def calculate_velocity(initial_velocity_: Quantity, acceleration_: Quantity,
     time_: Quantity) -> Quantity:
-    result_velocity_expression = solve(law, velocity, dict=True)[0][velocity]
+    result_velocity_expression = solve_for(law, velocity)
     result_expr = result_velocity_expression.subs({
         initial_velocity: initial_velocity_,
         acceleration: acceleration_,
         time: time_
     })
     return Quantity(result_expr)
+
+
+calculate_velocity_batch = BatchLaw(law,
+    velocity,
+    function=calculate_velocity,
+    initial_velocity_=initial_velocity,
+    acceleration_=acceleration,
+    time_=time)
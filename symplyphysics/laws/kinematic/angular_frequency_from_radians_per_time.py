@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (angle_type, units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.definitions import temporal_frequency_is_events_per_time as frequency_def
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Angular frequency "ω" (also referred to by the terms angular speed and angular rate) is a scalar measure of the angular displacement per unit time.
@@ -20,13 +21,17 @@ angular_frequency = Symbol("angular_frequency", angle_type / units.time)
 
 law = Eq(angular_frequency, radians / time)
 
+
 # Derive the same law from temporal frequency definition
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.definitions import temporal_frequency_is_events_per_time as frequency_def
 
-frequency_of_radian = frequency_def.definition.subs({
-    frequency_def.events: radians,
-    frequency_def.time: time
-}).rhs
-assert expr_equals(frequency_of_radian, law.rhs)
+    frequency_of_radian = frequency_def.definition.subs({
+        frequency_def.events: radians,
+        frequency_def.time: time
+    }).rhs
+    assert expr_equals(frequency_of_radian, law.rhs)
 
 
 def print_law() -> str:
@@ -38,6 +43,13 @@ def print_law() -> str:
 def calculate_frequency(radians_: float | Quantity, time_: Quantity) -> Quantity:
     #HACK: SymPy angles are always in radians
     angle_radians = radians_.scale_factor if isinstance(radians_, Quantity) else radians_
-    solved = solve(law, angular_frequency, dict=True)[0][angular_frequency]
+    solved = solve_for(law, angular_frequency)
     result_expr = solved.subs({time: time_, radians: angle_radians})
     return Quantity(result_expr)
+
+
+calculate_frequency_batch = BatchLaw(law,
+    angular_frequency,
+    function=calculate_frequency,
+    radians_=radians,
+    time_=time)
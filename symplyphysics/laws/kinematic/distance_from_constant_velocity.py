@@ -1,8 +1,8 @@
-from sympy import (Eq, solve, dsolve)
+from sympy import (Eq, dsolve)
 from symplyphysics import (units, Quantity, Symbol, Function, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.definitions import velocity_is_movement_derivative as velocity_definition
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The velocity of a particle is constant if an object is moving equal distances at equal intervals of time and does not change its direction.
@@ -26,17 +26,21 @@ distance = Function("distance_function", units.length)
 
 law = Eq(distance(movement_time), initial_position + constant_velocity * movement_time)
 
+
 # Derive the same law from velocity definition
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.definitions import velocity_is_movement_derivative as velocity_definition
 
-constant_velocity_movement_definition = velocity_definition.definition.subs({
-    velocity_definition.velocity(velocity_definition.moving_time): constant_velocity,
-    velocity_definition.moving_time: movement_time
-})
-dsolved_movement = dsolve(constant_velocity_movement_definition,
-    velocity_definition.movement(movement_time))
+    constant_velocity_movement_definition = velocity_definition.definition.subs({
+        velocity_definition.velocity(velocity_definition.moving_time): constant_velocity,
+        velocity_definition.moving_time: movement_time
+    })
+    dsolved_movement = dsolve(constant_velocity_movement_definition,
+        velocity_definition.movement(movement_time))
 
-# Prove that derived movement function equals to law.rhs, given C1 = initial_position
-assert (expr_equals(dsolved_movement.rhs.subs("C1", initial_position), law.rhs))
+    # Prove that derived movement function equals to law.rhs, given C1 = initial_position
+    assert (expr_equals(dsolved_movement.rhs.subs("C1", initial_position), law.rhs))
 
 
 def print_law() -> str:
@@ -49,7 +53,7 @@ def print_law() -> str:
 @validate_output(distance)
 def calculate_distance(initial_distance_: Quantity, velocity_: Quantity,
     time_: Quantity) -> Quantity:
-    result_expr = solve(law, distance(movement_time), dict=True)[0][distance(movement_time)]
+    result_expr = solve_for(law, distance(movement_time))
     result_expr_substituted = result_expr.subs({
         initial_position: initial_distance_,
         constant_velocity: velocity_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, angle_type, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Angular velocity is the rate of change of the angular position of a rotating body. We can define the angular velocity of a particle as the rate
@@ -27,6 +29,13 @@ def print_law() -> str:
 @validate_input(angular_velocity_=angular_velocity, curve_radius_=curve_radius)
 @validate_output(linear_velocity)
 def calculate_linear_velocity(angular_velocity_: Quantity, curve_radius_: Quantity) -> Quantity:
-    solved = solve(law, linear_velocity, dict=True)[0][linear_velocity]
+    solved = solve_for(law, linear_velocity)
     result_expr = solved.subs({angular_velocity: angular_velocity_, curve_radius: curve_radius_})
     return Quantity(result_expr)
+
+
+calculate_linear_velocity_batch = BatchLaw(law,
+    linear_velocity,
+    function=calculate_linear_velocity,
+    angular_velocity_=angular_velocity,
+    curve_radius_=curve_radius)
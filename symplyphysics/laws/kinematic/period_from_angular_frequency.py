@@ -2,7 +2,8 @@ from sympy import (Eq, solve, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.laws.kinematic import angular_frequency_from_radians_per_time as frequency_def
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Circular (angular) frequency w is scalar measure of spinning or oscillation speed. Angular frequency is
@@ -20,16 +21,20 @@ circular_frequency = Symbol("circular_frequency", units.frequency)
 
 law = Eq(period, 2 * pi / circular_frequency)
 
+
 # Derive the same law from angular frequency
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.kinematic import angular_frequency_from_radians_per_time as frequency_def
 
-# 2 * pi radians is a full cycle and 'period' is time to complete full cycle rotation
-frequency_of_full_cycle_def = frequency_def.law.subs({
-    frequency_def.radians: 2 * pi,
-    frequency_def.time: period,
-    frequency_def.angular_frequency: circular_frequency
-})
-full_cycle_period = solve(frequency_of_full_cycle_def, period, dict=True)[0][period]
-assert expr_equals(full_cycle_period, law.rhs)
+    # 2 * pi radians is a full cycle and 'period' is time to complete full cycle rotation
+    frequency_of_full_cycle_def = frequency_def.law.subs({
+        frequency_def.radians: 2 * pi,
+        frequency_def.time: period,
+        frequency_def.angular_frequency: circular_frequency
+    })
+    full_cycle_period = solve(frequency_of_full_cycle_def, period, dict=True)[0][period]
+    assert expr_equals(full_cycle_period, law.rhs)
 
 
 def print_law() -> str:
@@ -39,6 +44,12 @@ def print_law() -> str:
 @validate_input(frequency_=circular_frequency)
 @validate_output(period)
 def calculate_period(frequency_: Quantity) -> Quantity:
-    solved = solve(law, period, dict=True)[0][period]
+    solved = solve_for(law, period)
     result_expr = solved.subs(circular_frequency, frequency_)
     return Quantity(result_expr)
+
+
+calculate_period_batch = BatchLaw(law,
+    period,
+    function=calculate_period,
+    frequency_=circular_frequency)
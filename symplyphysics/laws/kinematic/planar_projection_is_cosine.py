@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, symbols, cos)
+from sympy import (Eq, symbols, cos)
 from symplyphysics import (
     Quantity,
     Symbol,
@@ -7,6 +7,7 @@ from symplyphysics import (
     validate_input,
 )
 from symplyphysics.core.quantity_decorator import validate_output_same
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Most of cases might be represented in 2-dimensional space with two orthogonal axis - vertical Y and horizontal X. Any vector in this space (velocity, force etc) can be easily
@@ -31,7 +32,7 @@ def print_law() -> str:
 @validate_input(angle_=vector_angle)
 @validate_output_same("vector_length_")
 def calculate_projection(vector_length_: Quantity, angle_: Quantity | float) -> Quantity:
-    result_projection_expr = solve(law, projection, dict=True)[0][projection]
+    result_projection_expr = solve_for(law, projection)
     #HACK: sympy angles are always in radians
     angle_radians = angle_.scale_factor if isinstance(angle_, Quantity) else angle_
     result_expr = result_projection_expr.subs({
@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.definitions import temporal_frequency_is_events_per_time as frequency_def
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The period is the interval of time between events, so the period is the reciprocal of the frequency.
@@ -18,14 +19,18 @@ temporal_frequency = Symbol("temporal_frequency", units.frequency)
 
 law = Eq(temporal_frequency, 1 / period)
 
+
 # Derive the same law from temporal frequency definition
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.definitions import temporal_frequency_is_events_per_time as frequency_def
 
-# Period is time span between events, so we are having 1 event per 'period' time
-frequency_of_single_event = frequency_def.definition.subs({
-    frequency_def.events: 1,
-    frequency_def.time: period
-}).rhs
-assert expr_equals(frequency_of_single_event, law.rhs)
+    # Period is time span between events, so we are having 1 event per 'period' time
+    frequency_of_single_event = frequency_def.definition.subs({
+        frequency_def.events: 1,
+        frequency_def.time: period
+    }).rhs
+    assert expr_equals(frequency_of_single_event, law.rhs)
 
 
 def print_law() -> str:
@@ -35,6 +40,12 @@ def print_law() -> str:
 @validate_input(period_=period)
 @validate_output(temporal_frequency)
 def calculate_frequency(period_: Quantity) -> Quantity:
-    solved = solve(law, temporal_frequency, dict=True)[0][temporal_frequency]
+    solved = solve_for(law, temporal_frequency)
     result_expr = solved.subs(period, period_)
     return Quantity(result_expr)
+
+
+calculate_frequency_batch = BatchLaw(law,
+    temporal_frequency,
+    function=calculate_frequency,
+    period_=period)
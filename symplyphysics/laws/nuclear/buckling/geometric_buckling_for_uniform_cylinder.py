@@ -1,7 +1,8 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
-from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_cylinder as cylinder_flux
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Geometric buckling for the uniform cylindrical reactor of physical radius R and height H.
@@ -21,18 +22,22 @@ geometric_buckling_squared = Symbol("geometric_buckling_squared", 1 / units.area
 
 law = Eq(geometric_buckling_squared, (2.405 / cylinder_radius)**2 + (pi / cylinder_height)**2)
 
+
 # This law is derived from geometric buckling definition (see geometric_buckling_from_neutron_flux.py),
 # neutron flux laplacian in cylindrical coordinates and boundary conditions.
-
-# Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
-# solution for the neutron flux:
-# See [neutron flux for uniform cylinder](./neutron_flux_for_uniform_cylinder.py)
-geometric_buckling_cylinder_squared = cylinder_flux.radial_constant**2 + cylinder_flux.axial_constant**2
-geometric_buckling_cylinder_solved = geometric_buckling_cylinder_squared.subs({
-    cylinder_flux.cylinder_radius: cylinder_radius,
-    cylinder_flux.cylinder_height: cylinder_height
-})
-assert geometric_buckling_cylinder_solved.evalf(7) == law.rhs.evalf(7)
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_cylinder as cylinder_flux
+
+    # Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
+    # solution for the neutron flux:
+    # See [neutron flux for uniform cylinder](./neutron_flux_for_uniform_cylinder.py)
+    geometric_buckling_cylinder_squared = cylinder_flux.radial_constant**2 + cylinder_flux.axial_constant**2
+    geometric_buckling_cylinder_solved = geometric_buckling_cylinder_squared.subs({
+        cylinder_flux.cylinder_radius: cylinder_radius,
+        cylinder_flux.cylinder_height: cylinder_height
+    })
+    assert geometric_buckling_cylinder_solved.evalf(7) == law.rhs.evalf(7)
 
 
 def print_law() -> str:
@@ -43,9 +48,16 @@ def print_law() -> str:
 @validate_output(geometric_buckling_squared)
 def calculate_geometric_buckling_squared(cylinder_radius_: Quantity,
     cylinder_height_: Quantity) -> Quantity:
-    solved = solve(law, geometric_buckling_squared, dict=True)[0][geometric_buckling_squared]
+    solved = solve_for(law, geometric_buckling_squared)
     result_expr = solved.subs({
         cylinder_radius: cylinder_radius_,
         cylinder_height: cylinder_height_
     })
     return Quantity(result_expr)
+
+
+calculate_geometric_buckling_squared_batch = BatchLaw(law,
+    geometric_buckling_squared,
+    function=calculate_geometric_buckling_squared,
+    cylinder_radius_=cylinder_radius,
+    cylinder_height_=cylinder_height)
@@ -1,7 +1,8 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
-from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_parallelepiped as parallelepiped_flux
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Geometric buckling for the uniform parallelepiped reactor of physical dimensions a * b * c.
@@ -24,20 +25,24 @@ geometric_buckling_squared = Symbol("geometric_buckling_squared", 1 / units.area
 law = Eq(geometric_buckling_squared, (pi / parallelepiped_width)**2 +
     (pi / parallelepiped_length)**2 + (pi / parallelepiped_height)**2)
 
+
 # This law is derived from geometric buckling definition (see geometric_buckling_from_neutron_flux.py),
 # neutron flux laplacian in cartesian coordinates and boundary conditions.
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_parallelepiped as parallelepiped_flux
 
-# Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
-# solution for the neutron flux:
-# See [neutron flux for uniform parallelepiped](./neutron_flux_for_uniform_parallelepiped.py)
-geometric_buckling_parallelepiped_squared = (parallelepiped_flux.width_constant**2 +
-    parallelepiped_flux.length_constant**2 + parallelepiped_flux.height_constant**2)
-geometric_buckling_parallelepiped_solved = geometric_buckling_parallelepiped_squared.subs({
-    parallelepiped_flux.parallelepiped_width: parallelepiped_width,
-    parallelepiped_flux.parallelepiped_length: parallelepiped_length,
-    parallelepiped_flux.parallelepiped_height: parallelepiped_height
-})
-assert geometric_buckling_parallelepiped_solved == law.rhs
+    # Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
+    # solution for the neutron flux:
+    # See [neutron flux for uniform parallelepiped](./neutron_flux_for_uniform_parallelepiped.py)
+    geometric_buckling_parallelepiped_squared = (parallelepiped_flux.width_constant**2 +
+        parallelepiped_flux.length_constant**2 + parallelepiped_flux.height_constant**2)
+    geometric_buckling_parallelepiped_solved = geometric_buckling_parallelepiped_squared.subs({
+        parallelepiped_flux.parallelepiped_width: parallelepiped_width,
+        parallelepiped_flux.parallelepiped_length: parallelepiped_length,
+        parallelepiped_flux.parallelepiped_height: parallelepiped_height
+    })
+    assert geometric_buckling_parallelepiped_solved == law.rhs
 
 
 def print_law() -> str:
@@ -50,10 +55,18 @@ def print_law() -> str:
 @validate_output(geometric_buckling_squared)
 def calculate_geometric_buckling_squared(parallelepiped_width_: Quantity,
     parallelepiped_length_: Quantity, parallelepiped_height_: Quantity) -> Quantity:
-    solved = solve(law, geometric_buckling_squared, dict=True)[0][geometric_buckling_squared]
+    solved = solve_for(law, geometric_buckling_squared)
     result_expr = solved.subs({
         parallelepiped_width: parallelepiped_width_,
         parallelepiped_length: parallelepiped_length_,
         parallelepiped_height: parallelepiped_height_
     })
     return Quantity(result_expr)
+
+
+calculate_geometric_buckling_squared_batch = BatchLaw(law,
+    geometric_buckling_squared,
+    function=calculate_geometric_buckling_squared,
+    parallelepiped_width_=parallelepiped_width,
+    parallelepiped_length_=parallelepiped_length,
+    parallelepiped_height_=parallelepiped_height)
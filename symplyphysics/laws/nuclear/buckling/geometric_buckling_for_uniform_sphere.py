@@ -1,7 +1,8 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
-from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_sphere as sphere_flux
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Geometric buckling for the uniform spherical reactor. The spherical reactor is situated in spherical
@@ -19,16 +20,20 @@ geometric_buckling_squared = Symbol("geometric_buckling_squared", 1 / units.area
 
 law = Eq(geometric_buckling_squared, (pi / sphere_radius)**2)
 
+
 # This law is derived from geometric buckling definition (see geometric_buckling_from_neutron_flux.py),
 # neutron flux laplacian in spherical coordinates and boundary condtitions.
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_sphere as sphere_flux
 
-# Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
-# solution for the neutron flux:
-# See [neutron flux for uniform sphere](./neutron_flux_for_uniform_sphere.py)
-geometric_buckling_sphere_squared = sphere_flux.radial_constant**2
-geometric_buckling_sphere_flux_solved = geometric_buckling_sphere_squared.subs(
-    sphere_flux.sphere_radius, sphere_radius)
-assert geometric_buckling_sphere_flux_solved == law.rhs
+    # Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
+    # solution for the neutron flux:
+    # See [neutron flux for uniform sphere](./neutron_flux_for_uniform_sphere.py)
+    geometric_buckling_sphere_squared = sphere_flux.radial_constant**2
+    geometric_buckling_sphere_flux_solved = geometric_buckling_sphere_squared.subs(
+        sphere_flux.sphere_radius, sphere_radius)
+    assert geometric_buckling_sphere_flux_solved == law.rhs
 
 
 def print_law() -> str:
@@ -38,6 +43,12 @@ def print_law() -> str:
 @validate_input(sphere_radius_=sphere_radius)
 @validate_output(geometric_buckling_squared)
 def calculate_geometric_buckling_squared(sphere_radius_: Quantity) -> Quantity:
-    solved = solve(law, geometric_buckling_squared, dict=True)[0][geometric_buckling_squared]
+    solved = solve_for(law, geometric_buckling_squared)
     result_expr = solved.subs(sphere_radius, sphere_radius_)
     return Quantity(result_expr)
+
+
+calculate_geometric_buckling_squared_batch = BatchLaw(law,
+    geometric_buckling_squared,
+    function=calculate_geometric_buckling_squared,
+    sphere_radius_=sphere_radius)
@@ -2,8 +2,8 @@ from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.laws.nuclear import diffusion_equation_from_neutron_flux as diffusion_equation_law
-from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_neutron_flux as buckling_law
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The quantity Bg^2 is called the geometrical buckling of the reactor and depends only on the geometry.
@@ -33,37 +33,42 @@ law = Eq(geometric_buckling_squared,
     ((neutrons_per_fission / effective_multiplication_factor) * macroscopic_fission_cross_section -
     macroscopic_absorption_cross_section) / diffusion_coefficient)
 
+
 # Derive the same law from the diffusion equation and geometric buckling from neutron flux law
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.nuclear import diffusion_equation_from_neutron_flux as diffusion_equation_law
+    from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_neutron_flux as buckling_law
 
-diffusion_eq1 = diffusion_equation_law.law.subs({
-    diffusion_equation_law.effective_multiplication_factor:
-        effective_multiplication_factor,
-    diffusion_equation_law.diffusion_coefficient:
-        diffusion_coefficient,
-    diffusion_equation_law.macroscopic_absorption_cross_section:
-        macroscopic_absorption_cross_section,
-    diffusion_equation_law.macroscopic_fission_cross_section:
-        macroscopic_fission_cross_section,
-    diffusion_equation_law.neutrons_per_fission:
-        neutrons_per_fission
-})
-buckling_eq2 = buckling_law.law.subs({
-    buckling_law.geometric_buckling_squared: geometric_buckling_squared,
-    buckling_law.neutron_flux: diffusion_equation_law.neutron_flux,
-    buckling_law.flux_position: diffusion_equation_law.flux_position,
-    buckling_law.neutron_flux_laplacian: diffusion_equation_law.neutron_flux_laplacian
-})
+    diffusion_eq1 = diffusion_equation_law.law.subs({
+        diffusion_equation_law.effective_multiplication_factor:
+            effective_multiplication_factor,
+        diffusion_equation_law.diffusion_coefficient:
+            diffusion_coefficient,
+        diffusion_equation_law.macroscopic_absorption_cross_section:
+            macroscopic_absorption_cross_section,
+        diffusion_equation_law.macroscopic_fission_cross_section:
+            macroscopic_fission_cross_section,
+        diffusion_equation_law.neutrons_per_fission:
+            neutrons_per_fission
+    })
+    buckling_eq2 = buckling_law.law.subs({
+        buckling_law.geometric_buckling_squared: geometric_buckling_squared,
+        buckling_law.neutron_flux: diffusion_equation_law.neutron_flux,
+        buckling_law.flux_position: diffusion_equation_law.flux_position,
+        buckling_law.neutron_flux_laplacian: diffusion_equation_law.neutron_flux_laplacian
+    })
 
-derived_law = [
-    diffusion_eq1, buckling_eq2, diffusion_equation_law.neutron_flux_laplacian_definition
-]
+    derived_law = [
+        diffusion_eq1, buckling_eq2, diffusion_equation_law.neutron_flux_laplacian_definition
+    ]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_geometric_buckling_squared = solve(derived_law, (geometric_buckling_squared,
-    diffusion_equation_law.neutron_flux(diffusion_equation_law.flux_position),
-    diffusion_equation_law.neutron_flux_laplacian(diffusion_equation_law.flux_position)),
-    dict=True)[0][geometric_buckling_squared]
-assert expr_equals(law.rhs, derived_geometric_buckling_squared)
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_geometric_buckling_squared = solve(derived_law, (geometric_buckling_squared,
+        diffusion_equation_law.neutron_flux(diffusion_equation_law.flux_position),
+        diffusion_equation_law.neutron_flux_laplacian(diffusion_equation_law.flux_position)),
+        dict=True)[0][geometric_buckling_squared]
+    assert expr_equals(law.rhs, derived_geometric_buckling_squared)
 
 
 def print_law() -> str:
@@ -79,8 +84,7 @@ def print_law() -> str:
 def calculate_buckling(neutrons_per_fission_: float, effective_multiplication_factor_: float,
     macroscopic_fission_cross_section_: Quantity, macroscopic_absorption_cross_section_: Quantity,
     diffusion_coefficient_: Quantity) -> Quantity:
-    result_buckling_expr = solve(law, geometric_buckling_squared,
-        dict=True)[0][geometric_buckling_squared]
+    result_buckling_expr = solve_for(law, geometric_buckling_squared)
     result_expr = result_buckling_expr.subs({
         neutrons_per_fission: neutrons_per_fission_,
         effective_multiplication_factor: effective_multiplication_factor_,
@@ -89,3 +93,13 @@ def calculate_buckling(neutrons_per_fission_: float, effective_multiplication_fa
         diffusion_coefficient: diffusion_coefficient_
     })
     return Quantity(result_expr)
+
+
+calculate_buckling_batch = BatchLaw(law,
+    geometric_buckling_squared,
+    function=calculate_buckling,
+    neutrons_per_fission_=neutrons_per_fission,
+    effective_multiplication_factor_=effective_multiplication_factor,
+    macroscopic_fission_cross_section_=macroscopic_fission_cross_section,
+    macroscopic_absorption_cross_section_=macroscopic_absorption_cross_section,
+    diffusion_coefficient_=diffusion_coefficient)
@@ -1,8 +1,9 @@
-from sympy import (Eq, solve, Expr, symbols, simplify, Equality)
+from sympy import (Eq, Expr, symbols, simplify, Equality)
 from sympy.vector import Laplacian
 from symplyphysics import (SI, Function, units, Quantity, Symbol, print_expression, validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.laws.nuclear import diffusion_equation_from_neutron_flux as diffusion_equation
+from symplyphysics.core.fields.operators import expression_laplacian
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The quantity Bg^2 is called the geometrical buckling of the reactor and depends only on the geometry.
@@ -24,10 +25,6 @@ neutron_flux = Function("neutron_flux", 1 / units.area / units.time)
 geometric_buckling_squared = Symbol("geometric_buckling_squared", 1 / units.area)
 neutron_flux_laplacian = Function("neutron_flux_laplacian", 1 / units.length**4 / units.time)
 
-# As Laplacian is a second derivative over space coordinates (x, y, z), resulting dimension should be
-# original dimension / units.length**2
-assert neutron_flux_laplacian.dimension == diffusion_equation.neutron_flux_laplacian.dimension
-
 neutron_flux_laplacian_definition = Eq(neutron_flux_laplacian(flux_position),
     Laplacian(neutron_flux(flux_position)),
     evaluate=False)
@@ -38,11 +35,19 @@ neutron_flux_laplacian_definition = Eq(neutron_flux_laplacian(flux_position),
 law = Eq(geometric_buckling_squared,
     -1 * neutron_flux_laplacian(flux_position) / neutron_flux(flux_position))
 
-# Check laplacian definition is the same as in diffusion equation
 
-diffusion_equation_laplacian = diffusion_equation.neutron_flux_laplacian_definition.rhs.subs(
-    diffusion_equation.neutron_flux(diffusion_equation.flux_position), neutron_flux(flux_position))
-assert expr_equals(diffusion_equation_laplacian, neutron_flux_laplacian_definition.rhs)
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.nuclear import diffusion_equation_from_neutron_flux as diffusion_equation
+
+    # As Laplacian is a second derivative over space coordinates (x, y, z), resulting dimension should be
+    # original dimension / units.length**2
+    assert neutron_flux_laplacian.dimension == diffusion_equation.neutron_flux_laplacian.dimension
+
+    # Check laplacian definition is the same as in diffusion equation
+    diffusion_equation_laplacian = diffusion_equation.neutron_flux_laplacian_definition.rhs.subs(
+        diffusion_equation.neutron_flux(diffusion_equation.flux_position), neutron_flux(flux_position))
+    assert expr_equals(diffusion_equation_laplacian, neutron_flux_laplacian_definition.rhs)
 
 
 def print_law() -> str:
@@ -55,8 +60,7 @@ def apply_neutron_flux_function(neutron_flux_function_: Expr) -> Equality:
     # Manually divide to unit_length to get Laplacian dimension. CoordSys3D coordinates are dimensionless, hence
     # Laplacian cannot properly calculate resulting dimension.
     unit_length = Quantity(1, dimension=units.length)
-    neutron_flux_laplacian_eval = neutron_flux_laplacian_definition.rhs.subs(
-        neutron_flux(flux_position), neutron_flux_function_).doit() / unit_length**2
+    neutron_flux_laplacian_eval = expression_laplacian(neutron_flux_function_) / unit_length**2
     applied_law = law.subs(neutron_flux_laplacian(flux_position), neutron_flux_laplacian_eval)
     applied_law = applied_law.subs(neutron_flux(flux_position), neutron_flux_function_)
     return simplify(applied_law)
@@ -72,6 +76,5 @@ def calculate_geometric_buckling_squared(neutron_flux_function_: Expr) -> Quanti
         neutron_flux.dimension)
 
     result_expr = apply_neutron_flux_function(neutron_flux_function_)
-    result_buckling_expr = solve(result_expr, geometric_buckling_squared,
-        dict=True)[0][geometric_buckling_squared]
+    result_buckling_expr = solve_for(result_expr, geometric_buckling_squared)
     return Quantity(result_buckling_expr)
@@ -2,7 +2,8 @@ from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_macroscopic_fission_cross_section_diffusion_coefficient as buckling_law
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Material buckling (Bm^2) describes the difference between neutron production and neutron absorption.
@@ -28,24 +29,28 @@ material_buckling_squared = Symbol("material_buckling_squared", 1 / units.area)
 law = Eq(material_buckling_squared, (neutrons_per_fission * macroscopic_fission_cross_section -
     macroscopic_absorption_cross_section) / diffusion_coefficient)
 
+
 # Derive the same law from the geometric buckling and critical reactor condition
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_macroscopic_fission_cross_section_diffusion_coefficient as buckling_law
 
-buckling_eq1 = buckling_law.law.subs({
-    buckling_law.geometric_buckling_squared: material_buckling_squared,
-    buckling_law.neutrons_per_fission: neutrons_per_fission,
-    buckling_law.macroscopic_fission_cross_section: macroscopic_fission_cross_section,
-    buckling_law.macroscopic_absorption_cross_section: macroscopic_absorption_cross_section,
-    buckling_law.diffusion_coefficient: diffusion_coefficient
-})
-critical_condition_eq2 = Eq(buckling_law.effective_multiplication_factor, 1)
+    buckling_eq1 = buckling_law.law.subs({
+        buckling_law.geometric_buckling_squared: material_buckling_squared,
+        buckling_law.neutrons_per_fission: neutrons_per_fission,
+        buckling_law.macroscopic_fission_cross_section: macroscopic_fission_cross_section,
+        buckling_law.macroscopic_absorption_cross_section: macroscopic_absorption_cross_section,
+        buckling_law.diffusion_coefficient: diffusion_coefficient
+    })
+    critical_condition_eq2 = Eq(buckling_law.effective_multiplication_factor, 1)
 
-derived_law = [buckling_eq1, critical_condition_eq2]
+    derived_law = [buckling_eq1, critical_condition_eq2]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_material_buckling_squared = solve(derived_law,
-    (material_buckling_squared, buckling_law.effective_multiplication_factor),
-    dict=True)[0][material_buckling_squared]
-assert expr_equals(law.rhs, derived_material_buckling_squared)
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_material_buckling_squared = solve(derived_law,
+        (material_buckling_squared, buckling_law.effective_multiplication_factor),
+        dict=True)[0][material_buckling_squared]
+    assert expr_equals(law.rhs, derived_material_buckling_squared)
 
 
 def print_law() -> str:
@@ -59,8 +64,7 @@ def print_law() -> str:
 @validate_output(material_buckling_squared)
 def calculate_buckling(neutrons_per_fission_: float, macroscopic_fission_cross_section_: Quantity,
     macroscopic_absorption_cross_section_: Quantity, diffusion_coefficient_: Quantity) -> Quantity:
-    result_buckling_expr = solve(law, material_buckling_squared,
-        dict=True)[0][material_buckling_squared]
+    result_buckling_expr = solve_for(law, material_buckling_squared)
     result_expr = result_buckling_expr.subs({
         neutrons_per_fission: neutrons_per_fission_,
         macroscopic_fission_cross_section: macroscopic_fission_cross_section_,
@@ -68,3 +72,12 @@ def calculate_buckling(neutrons_per_fission_: float, macroscopic_fission_cross_s
         diffusion_coefficient: diffusion_coefficient_
     })
     return Quantity(result_expr)
+
+
+calculate_buckling_batch = BatchLaw(law,
+    material_buckling_squared,
+    function=calculate_buckling,
+    neutrons_per_fission_=neutrons_per_fission,
+    macroscopic_fission_cross_section_=macroscopic_fission_cross_section,
+    macroscopic_absorption_cross_section_=macroscopic_absorption_cross_section,
+    diffusion_coefficient_=diffusion_coefficient)
@@ -1,4 +1,4 @@
-from sympy import (Eq, Expr, solve, symbols, S, simplify)
+from sympy import (Eq, Expr, symbols, S, simplify)
 from sympy.vector import Laplacian
 from symplyphysics import (
     SI,
@@ -12,6 +12,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.fields.operators import expression_laplacian
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The diffusion equation, based on Fick's law, provides an analytical solution of spatial neutron flux
@@ -57,10 +59,12 @@ law = Eq(
     (1 / effective_multiplication_factor) * neutrons_per_fission *
     macroscopic_fission_cross_section * neutron_flux(flux_position))
 
+
 # As Laplacian is a second derivative over space coordinates (x, y, z), resulting dimension should be
 # original dimension / units.length**2
-assert SI.get_dimension_system().equivalent_dims(neutron_flux_laplacian.dimension,
-    neutron_flux.dimension / units.length**2)
+def verify_derivation() -> None:
+    assert SI.get_dimension_system().equivalent_dims(neutron_flux_laplacian.dimension,
+        neutron_flux.dimension / units.length**2)
 
 
 def print_law() -> str:
@@ -72,8 +76,7 @@ def apply_neutron_flux_function(neutron_flux_function_: Expr) -> Expr:
     # Manually divide to unit_length to get Laplacian dimension. CoordSys3D coordinates are dimensionless, hence
     # Laplacian cannot properly calculate resulting dimension.
     unit_length = Quantity(1, dimension=units.length)
-    neutron_flux_laplacian_eval = neutron_flux_laplacian_definition.rhs.subs(
-        neutron_flux(flux_position), neutron_flux_function_).doit() / unit_length**2
+    neutron_flux_laplacian_eval = expression_laplacian(neutron_flux_function_) / unit_length**2
     applied_law = law.subs(neutron_flux_laplacian(flux_position), neutron_flux_laplacian_eval)
     applied_law = applied_law.subs(neutron_flux(flux_position), neutron_flux_function_)
     return simplify(applied_law)
@@ -102,7 +105,6 @@ def calculate_multiplication_factor(neutron_flux_function_: Expr, neutrons_per_f
         macroscopic_absorption_cross_section: macroscopic_absorption_cross_section_,
         diffusion_coefficient: diffusion_coefficient_
     })
-    result_factor_expr = solve(result_expr, effective_multiplication_factor,
-        dict=True)[0][effective_multiplication_factor]
+    result_factor_expr = solve_for(result_expr, effective_multiplication_factor)
     result_factor = Quantity(result_factor_expr)
     return float(convert_to(result_factor, S.One).evalf())
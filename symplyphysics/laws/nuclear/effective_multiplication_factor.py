@@ -1,6 +1,7 @@
-from sympy import (Eq, solve, symbols)
+from sympy import (Eq, symbols)
 from symplyphysics import print_expression
 from symplyphysics.core.symbols.probability import Probability
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Effective multiplication factor: k_effective = k_infinite * Pf * Pt
@@ -35,8 +36,7 @@ def calculate_multiplication_factor(infinite_multiplication_factor_: float,
     fast_non_leakage_probability_: Probability,
     thermal_non_leakage_probability_: Probability) -> float:
 
-    result_factor_expr = solve(law, effective_multiplication_factor,
-        dict=True)[0][effective_multiplication_factor]
+    result_factor_expr = solve_for(law, effective_multiplication_factor)
     result_expr = result_factor_expr.subs({
         infinite_multiplication_factor: infinite_multiplication_factor_,
         fast_non_leakage_probability: fast_non_leakage_probability_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, exp, S)
+from sympy import (Eq, exp, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -10,6 +10,8 @@ from symplyphysics import (
     validate_output,
 )
 from symplyphysics.core.symbols.probability import Probability
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Ptnl (fast non-leakage factor) is the ratio of the number of fast neutrons that do not leak from the reactor
@@ -40,11 +42,17 @@ def print_law() -> str:
 @validate_output(fast_non_leakage_probability)
 def calculate_probability(geometric_buckling_: Quantity,
     neutron_fermi_age_: Quantity) -> Probability:
-    result_probability_expr = solve(law, fast_non_leakage_probability,
-        dict=True)[0][fast_non_leakage_probability]
+    result_probability_expr = solve_for(law, fast_non_leakage_probability)
     result_expr = result_probability_expr.subs({
         geometric_buckling: geometric_buckling_,
         neutron_fermi_age: neutron_fermi_age_
     })
     result_factor = Quantity(result_expr)
     return Probability(convert_to(result_factor, S.One).evalf())
+
+
+calculate_probability_batch = BatchLaw(law,
+    fast_non_leakage_probability,
+    function=calculate_probability,
+    geometric_buckling_=geometric_buckling,
+    neutron_fermi_age_=neutron_fermi_age)
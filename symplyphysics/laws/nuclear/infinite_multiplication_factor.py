@@ -1,6 +1,7 @@
-from sympy import (Eq, solve, symbols)
+from sympy import (Eq, symbols)
 from symplyphysics import print_expression
 from symplyphysics.core.symbols.probability import Probability
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Infinite multiplication factor: k_infinite = η * ε * p * f
@@ -35,8 +36,7 @@ def print_law() -> str:
 def calculate_multiplication_factor(neutron_reproduction_: float, fast_fission_: float,
     resonance_escape_probability_: Probability, thermal_utilisation_: Probability) -> float:
 
-    result_factor_expr = solve(law, infinite_multiplication_factor,
-        dict=True)[0][infinite_multiplication_factor]
+    result_factor_expr = solve_for(law, infinite_multiplication_factor)
     result_expr = result_factor_expr.subs({
         neutron_reproduction: neutron_reproduction_,
         fast_fission: fast_fission_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Infinite multiplication factor: k_infinite = v * Σf / Σa
@@ -43,8 +45,7 @@ def calculate_multiplication_factor(neutrons_per_fission_: float,
     macroscopic_fission_cross_section_: Quantity,
     macroscopic_absorption_cross_section_: Quantity) -> float:
 
-    result_factor_expr = solve(law, infinite_multiplication_factor,
-        dict=True)[0][infinite_multiplication_factor]
+    result_factor_expr = solve_for(law, infinite_multiplication_factor)
     result_expr = result_factor_expr.subs({
         neutrons_per_fission: neutrons_per_fission_,
         macroscopic_fission_cross_section: macroscopic_fission_cross_section_,
@@ -52,3 +53,11 @@ def calculate_multiplication_factor(neutrons_per_fission_: float,
     })
     result_factor = Quantity(result_expr)
     return float(convert_to(result_factor, S.One).evalf())
+
+
+calculate_multiplication_factor_batch = BatchLaw(law,
+    infinite_multiplication_factor,
+    function=calculate_multiplication_factor,
+    neutrons_per_fission_=neutrons_per_fission,
+    macroscopic_fission_cross_section_=macroscopic_fission_cross_section,
+    macroscopic_absorption_cross_section_=macroscopic_absorption_cross_section)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Macroscopic cross-section - represents the effective target area of all of the nuclei contained
@@ -36,10 +38,16 @@ def print_law() -> str:
 @validate_output(macroscopic_cross_section)
 def calculate_cross_section(microscopic_cross_section_: Quantity,
     atomic_number_density_: Quantity) -> Quantity:
-    result_cross_section_expr = solve(law, macroscopic_cross_section,
-        dict=True)[0][macroscopic_cross_section]
+    result_cross_section_expr = solve_for(law, macroscopic_cross_section)
     result_expr = result_cross_section_expr.subs({
         microscopic_cross_section: microscopic_cross_section_,
         atomic_number_density: atomic_number_density_
     })
     return Quantity(result_expr)
+
+
+calculate_cross_section_batch = BatchLaw(law,
+    macroscopic_cross_section,
+    function=calculate_cross_section,
+    microscopic_cross_section_=microscopic_cross_section,
+    atomic_number_density_=atomic_number_density)
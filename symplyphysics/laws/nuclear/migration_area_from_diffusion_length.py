@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Migration area (M^2) is equal to one-sixth of the square of the average distance (in all dimensions) between
@@ -36,9 +38,16 @@ def print_law() -> str:
 @validate_input(diffusion_area_=diffusion_area, neutron_fermi_age_=neutron_fermi_age)
 @validate_output(migration_area)
 def calculate_migration_area(diffusion_area_: Quantity, neutron_fermi_age_: Quantity) -> Quantity:
-    result_area_expr = solve(law, migration_area, dict=True)[0][migration_area]
+    result_area_expr = solve_for(law, migration_area)
     result_expr = result_area_expr.subs({
         diffusion_area: diffusion_area_,
         neutron_fermi_age: neutron_fermi_age_
     })
     return Quantity(result_expr)
+
+
+calculate_migration_area_batch = BatchLaw(law,
+    migration_area,
+    function=calculate_migration_area,
+    diffusion_area_=diffusion_area,
+    neutron_fermi_age_=neutron_fermi_age)
@@ -1,5 +1,6 @@
-from sympy import (Eq, solve, symbols)
+from sympy import (Eq, symbols)
 from symplyphysics import print_expression
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Average value of the cosine of the angle in the lab system at which neutrons are scattered in the medium.
@@ -21,8 +22,7 @@ def print_law() -> str:
 
 
 def calculate_average_scattering_angle_cosine(target_nucleus_mass_number_: int) -> float:
-    result_angle_cosine_expr = solve(law, average_scattering_angle_cosine,
-        dict=True)[0][average_scattering_angle_cosine]
+    result_angle_cosine_expr = solve_for(law, average_scattering_angle_cosine)
     result_expr = result_angle_cosine_expr.subs(target_nucleus_mass_number,
         target_nucleus_mass_number_)
     return result_expr.evalf()
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The reproduction factor η represents the number of fast neutrons produced per thermal neutron absorbed in the fuel.
@@ -52,8 +53,7 @@ def calculate_reproduction_factor(neutrons_per_fission_: float,
             f"macroscopic_fuel_absorption_cross_section_ ({macroscopic_fuel_absorption_cross_section_.scale_factor})"
         )
 
-    result_factor_expr = solve(law, neutron_reproduction_factor,
-        dict=True)[0][neutron_reproduction_factor]
+    result_factor_expr = solve_for(law, neutron_reproduction_factor)
     result_expr = result_factor_expr.subs({
         neutrons_per_fission: neutrons_per_fission_,
         macroscopic_fuel_fission_cross_section: macroscopic_fuel_fission_cross_section_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, exp, S)
+from sympy import (Eq, exp, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -10,6 +10,8 @@ from symplyphysics import (
     validate_output,
 )
 from symplyphysics.core.symbols.probability import Probability
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The resonance escape probability, symbolized by p, is the probability that a neutron will be
@@ -61,8 +63,7 @@ def calculate_resonance_escape_probability(
         average_lethargy_change_: float,
         macroscopic_scattering_cross_section_moderator_: Quantity) -> Probability:
 
-    result_factor_expr = solve(law, resonance_escape_probability,
-        dict=True)[0][resonance_escape_probability]
+    result_factor_expr = solve_for(law, resonance_escape_probability)
     result_expr = result_factor_expr.subs({
         absorber_atomic_number_density:
             absorber_atomic_number_density_,
@@ -75,3 +76,12 @@ def calculate_resonance_escape_probability(
     })
     result_factor = Quantity(result_expr)
     return Probability(convert_to(result_factor, S.One).evalf())
+
+
+calculate_resonance_escape_probability_batch = BatchLaw(law,
+    resonance_escape_probability,
+    function=calculate_resonance_escape_probability,
+    absorber_atomic_number_density_=absorber_atomic_number_density,
+    effective_resonance_integral_=effective_resonance_integral,
+    average_lethargy_change_=average_lethargy_change,
+    macroscopic_scattering_cross_section_moderator_=macroscopic_scattering_cross_section_moderator)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -10,6 +10,8 @@ from symplyphysics import (
     validate_output,
 )
 from symplyphysics.core.symbols.probability import Probability
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Ptnl (thermal non-leakage factor) is the ratio of the number of thermal neutrons that do not leak from the
@@ -39,11 +41,17 @@ def print_law() -> str:
 @validate_output(thermal_non_leakage_probability)
 def calculate_probability(thermal_diffusion_area_: Quantity,
     geometric_buckling_: Quantity) -> Probability:
-    result_probability_expr = solve(law, thermal_non_leakage_probability,
-        dict=True)[0][thermal_non_leakage_probability]
+    result_probability_expr = solve_for(law, thermal_non_leakage_probability)
     result_expr = result_probability_expr.subs({
         thermal_diffusion_area: thermal_diffusion_area_,
         geometric_buckling: geometric_buckling_
     })
     result_factor = Quantity(result_expr)
     return Probability(convert_to(result_factor, S.One).evalf())
+
+
+calculate_probability_batch = BatchLaw(law,
+    thermal_non_leakage_probability,
+    function=calculate_probability,
+    thermal_diffusion_area_=thermal_diffusion_area,
+    geometric_buckling_=geometric_buckling)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -10,6 +10,7 @@ from symplyphysics import (
     validate_output,
 )
 from symplyphysics.core.symbols.probability import Probability
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Thermal neutron utilization factor (f), is the ratio of the number of neutrons absorbed in the fuel
@@ -50,8 +51,7 @@ def calculate_utilisation_factor(
             f"macroscopic_total_absorption_cross_section_ ({macroscopic_total_absorption_cross_section_.scale_factor})"
         )
 
-    result_factor_expr = solve(law, thermal_utilisation_factor,
-        dict=True)[0][thermal_utilisation_factor]
+    result_factor_expr = solve_for(law, thermal_utilisation_factor)
     result_expr = result_factor_expr.subs({
         macroscopic_fuel_absorption_cross_section: macroscopic_fuel_absorption_cross_section_,
         macroscopic_total_absorption_cross_section: macroscopic_total_absorption_cross_section_
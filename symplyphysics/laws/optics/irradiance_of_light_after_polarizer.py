@@ -1,4 +1,4 @@
-from sympy import Eq, solve, cos
+from sympy import Eq, cos
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,8 @@ from symplyphysics import (
     dimensionless,
     angle_type,
 )
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Malus's law states that the irradiance of linearly polarized light that passes through a polarizer
@@ -48,10 +50,18 @@ def calculate_irradiance(
     transparency_coefficient_: float,
     polarization_angle_: Quantity | float,
 ) -> Quantity:
-    result_expr = solve(law, irradiance_final, dict=True)[0][irradiance_final]
+    result_expr = solve_for(law, irradiance_final)
     irradiance_applied = result_expr.subs({
             irradiance_initial: irradiance_initial_,
             transparency_coefficient: transparency_coefficient_,
             polarization_angle: polarization_angle_,
     })
     return Quantity(irradiance_applied)
+
+
+calculate_irradiance_batch = BatchLaw(law,
+    irradiance_final,
+    function=calculate_irradiance,
+    irradiance_initial_=irradiance_initial,
+    transparency_coefficient_=transparency_coefficient,
+    polarization_angle_=polarization_angle)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Any optic lens creates image of an object. Distances lens-object and lens-image depend on lens optical strength.
@@ -29,9 +31,16 @@ def print_law() -> str:
 @validate_input(object_distance_=distance_to_object, image_distance_=distance_to_image)
 @validate_output(focus_distance)
 def calculate_focus(object_distance_: Quantity, image_distance_: Quantity) -> Quantity:
-    result_expr = solve(law, focus_distance, dict=True)[0][focus_distance]
+    result_expr = solve_for(law, focus_distance)
     focus_applied = result_expr.subs({
         distance_to_object: object_distance_,
         distance_to_image: image_distance_
     })
     return Quantity(focus_applied)
+
+
+calculate_focus_batch = BatchLaw(law,
+    focus_distance,
+    function=calculate_focus,
+    object_distance_=distance_to_object,
+    image_distance_=distance_to_image)
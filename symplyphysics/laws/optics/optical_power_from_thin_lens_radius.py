@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Optical power is the degree to which a lens, mirror, or other optical system converges or diverges light.
@@ -44,7 +46,7 @@ def print_law() -> str:
 @validate_output(optical_power)
 def calculate_optical_power(lens_refractive_index_: float, medium_refractive_index_: float,
     front_radius_: Quantity, back_radius_: Quantity) -> Quantity:
-    result_expr = solve(law, optical_power, dict=True)[0][optical_power]
+    result_expr = solve_for(law, optical_power)
     optical_power_applied = result_expr.subs({
         lens_refractive_index: lens_refractive_index_,
         medium_refractive_index: medium_refractive_index_,
@@ -52,3 +54,12 @@ def calculate_optical_power(lens_refractive_index_: float, medium_refractive_ind
         back_radius: back_radius_
     })
     return Quantity(optical_power_applied)
+
+
+calculate_optical_power_batch = BatchLaw(law,
+    optical_power,
+    function=calculate_optical_power,
+    lens_refractive_index_=lens_refractive_index,
+    medium_refractive_index_=medium_refractive_index,
+    front_radius_=front_radius,
+    back_radius_=back_radius)
@@ -1,6 +1,7 @@
-from sympy import (Eq, solve, sin, pi)
+from sympy import (Eq, sin, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, angle_type,
     validate_input, validate_output)
+from symplyphysics.core.solved_forms import solutions_for
 
 # Description
 ## If ray of light comes from one media to another, it refracts.
@@ -44,7 +45,7 @@ def calculate_refraction_angle(incedence_angle_: Quantity | float,
     # Check for boundary conditions
     assert incedence_angle_radians <= pi / 2
     assert incedence_angle_radians >= -pi / 2
-    solutions = solve(law, refraction_angle, dict=True)
+    solutions = solutions_for(law, refraction_angle)
     result_expr = solutions[0][refraction_angle]
     angle_applied = result_expr.subs({
         incedence_angle: incedence_angle_radians,
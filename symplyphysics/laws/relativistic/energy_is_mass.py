@@ -1,6 +1,8 @@
-from sympy import Eq, solve
+from sympy import Eq
 from sympy.physics.units import speed_of_light as c
 from symplyphysics import units, Quantity, Symbol, print_expression, validate_input, validate_output
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Fundamentally inner energy of an object is synonimical to its mass.
@@ -23,6 +25,12 @@ def print_law() -> str:
 @validate_input(rest_mass_=rest_mass)
 @validate_output(rest_energy)
 def calculate_rest_energy(rest_mass_: Quantity) -> Quantity:
-    result_expr = solve(law, rest_energy, dict=True)[0][rest_energy]
+    result_expr = solve_for(law, rest_energy)
     energy_applied = result_expr.subs({rest_mass: rest_mass_})
     return Quantity(energy_applied)
+
+
+calculate_rest_energy_batch = BatchLaw(law,
+    rest_energy,
+    function=calculate_rest_energy,
+    rest_mass_=rest_mass)
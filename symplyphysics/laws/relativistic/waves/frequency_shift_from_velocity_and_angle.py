@@ -1,7 +1,9 @@
-from sympy import (Eq, cos, solve, sqrt)
+from sympy import (Eq, cos, sqrt)
 from sympy.physics.units import speed_of_light
 from symplyphysics import (angle_type, units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## See [doppler effect](./longitudinal_frequency_shift_from_velocity.py) description. When objects are not moving collinear, one
@@ -47,10 +49,18 @@ def calculate_observed_frequency(real_frequency_: Quantity, relative_speed_: Qua
     #HACK: sympy angles are always in radians
     source_angle_radians = source_angle_.scale_factor if isinstance(source_angle_,
         Quantity) else source_angle_
-    result_expr = solve(law, observed_frequency, dict=True)[0][observed_frequency]
+    result_expr = solve_for(law, observed_frequency)
     frequency_applied = result_expr.subs({
         real_frequency: real_frequency_,
         relative_speed: relative_speed_,
         source_angle: source_angle_radians
     })
     return Quantity(frequency_applied)
+
+
+calculate_observed_frequency_batch = BatchLaw(law,
+    observed_frequency,
+    function=calculate_observed_frequency,
+    real_frequency_=real_frequency,
+    relative_speed_=relative_speed,
+    source_angle_=source_angle)
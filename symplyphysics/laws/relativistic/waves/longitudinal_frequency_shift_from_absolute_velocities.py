@@ -1,7 +1,9 @@
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
 from sympy.physics.units import speed_of_light
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## General relativistic Doppler effect that is classical Doppler effect with relativistic coefficient. This law is not
@@ -63,7 +65,7 @@ def print_law() -> str:
 def calculate_observed_frequency(real_frequency_: Quantity, wave_velocity_: Quantity,
     source_velocity_: Quantity, observer_velocity_: Quantity) -> Quantity:
 
-    result_expr = solve(law, observed_frequency, dict=True)[0][observed_frequency]
+    result_expr = solve_for(law, observed_frequency)
     frequency_applied = result_expr.subs({
         real_frequency: real_frequency_,
         wave_velocity: wave_velocity_,
@@ -71,3 +73,12 @@ def calculate_observed_frequency(real_frequency_: Quantity, wave_velocity_: Quan
         observer_velocity: observer_velocity_
     })
     return Quantity(frequency_applied)
+
+
+calculate_observed_frequency_batch = BatchLaw(law,
+    observed_frequency,
+    function=calculate_observed_frequency,
+    real_frequency_=real_frequency,
+    wave_velocity_=wave_velocity,
+    source_velocity_=source_velocity,
+    observer_velocity_=observer_velocity)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Inner energy of ideal gas is sum of kinetic energy of all it's molecules.
@@ -31,10 +33,18 @@ def print_law() -> str:
 @validate_output(inner_energy)
 def calculate_inner_energy(mass_of_gas_: Quantity, temperature_: Quantity,
     mole_mass_: Quantity) -> Quantity:
-    solved = solve(law, inner_energy, dict=True)[0][inner_energy]
+    solved = solve_for(law, inner_energy)
     result_expr = solved.subs({
         mass_of_gas: mass_of_gas_,
         temperature: temperature_,
         mole_mass: mole_mass_
     })
     return Quantity(result_expr)
+
+
+calculate_inner_energy_batch = BatchLaw(law,
+    inner_energy,
+    function=calculate_inner_energy,
+    mass_of_gas_=mass_of_gas,
+    temperature_=temperature,
+    mole_mass_=mole_mass)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Ideal gas law: P * V = n * R * T
@@ -27,6 +29,14 @@ def print_law() -> str:
 @validate_output(pressure)
 def calculate_pressure(volume_: Quantity, temperature_: Quantity,
     mole_count_: Quantity) -> Quantity:
-    solved = solve(law, pressure, dict=True)[0][pressure]
+    solved = solve_for(law, pressure)
     result_expr = solved.subs({volume: volume_, temperature: temperature_, mole_count: mole_count_})
     return Quantity(result_expr)
+
+
+calculate_pressure_batch = BatchLaw(law,
+    pressure,
+    function=calculate_pressure,
+    volume_=volume,
+    temperature_=temperature,
+    mole_count_=mole_count)
@@ -1,7 +1,8 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
-from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as thermodynamics_law
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Gay-Lussac's law (Isobaric process): P = const, T1 / V1 = T2 / V2
@@ -19,31 +20,35 @@ volume_end = Symbol("volume_end", units.volume)
 
 law = Eq(temperature_start / volume_start, temperature_end / volume_end)
 
-## Derive the same law from the general ideal gas law
 
-pressure_start = Symbol("pressure_start", units.pressure)
-pressure_end = Symbol("pressure_end", units.pressure)
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as thermodynamics_law
 
-isobaric_condition = Eq(pressure_start, pressure_end)
+    ## Derive the same law from the general ideal gas law
+    pressure_start = Symbol("pressure_start", units.pressure)
+    pressure_end = Symbol("pressure_end", units.pressure)
 
-eq_start = thermodynamics_law.law.subs({
-    thermodynamics_law.temperature: temperature_start,
-    thermodynamics_law.volume: volume_start,
-    thermodynamics_law.pressure: pressure_start
-})
+    isobaric_condition = Eq(pressure_start, pressure_end)
 
-eq_end = thermodynamics_law.law.subs({
-    thermodynamics_law.temperature: temperature_end,
-    thermodynamics_law.volume: volume_end,
-    thermodynamics_law.pressure: pressure_end
-})
+    eq_start = thermodynamics_law.law.subs({
+        thermodynamics_law.temperature: temperature_start,
+        thermodynamics_law.volume: volume_start,
+        thermodynamics_law.pressure: pressure_start
+    })
+
+    eq_end = thermodynamics_law.law.subs({
+        thermodynamics_law.temperature: temperature_end,
+        thermodynamics_law.volume: volume_end,
+        thermodynamics_law.pressure: pressure_end
+    })
 
-derived_law = [eq_start, eq_end, isobaric_condition]
+    derived_law = [eq_start, eq_end, isobaric_condition]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_temperature_end = solve(derived_law, (pressure_start, pressure_end, temperature_end),
-    dict=True)[0][temperature_end]
-assert solve(law, temperature_end, dict=True)[0][temperature_end] == derived_temperature_end
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_temperature_end = solve(derived_law, (pressure_start, pressure_end, temperature_end),
+        dict=True)[0][temperature_end]
+    assert solve(law, temperature_end, dict=True)[0][temperature_end] == derived_temperature_end
 
 
 def print_law() -> str:
@@ -56,10 +61,18 @@ def print_law() -> str:
 @validate_output(volume_end)
 def calculate_volume(temperature_start_: Quantity, volume_start_: Quantity,
     temperature_end_: Quantity) -> Quantity:
-    solved = solve(law, volume_end, dict=True)[0][volume_end]
+    solved = solve_for(law, volume_end)
     result_expr = solved.subs({
         temperature_start: temperature_start_,
         volume_start: volume_start_,
         temperature_end: temperature_end_
     })
     return Quantity(result_expr)
+
+
+calculate_volume_batch = BatchLaw(law,
+    volume_end,
+    function=calculate_volume,
+    temperature_start_=temperature_start,
+    volume_start_=volume_start,
+    temperature_end_=temperature_end)
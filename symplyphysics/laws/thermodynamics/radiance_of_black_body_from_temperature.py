@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The Stefan–Boltzmann law, also known as Stefan's law, states that the total energy radiated per
@@ -29,6 +31,12 @@ def print_law() -> str:
 @validate_input(temperature_=temperature)
 @validate_output(radiance)
 def calculate_radiance(temperature_: Quantity) -> Quantity:
-    solved = solve(law, radiance, dict=True)[0][radiance]
+    solved = solve_for(law, radiance)
     result_expr = solved.subs(temperature, temperature_)
     return Quantity(result_expr)
+
+
+calculate_radiance_batch = BatchLaw(law,
+    radiance,
+    function=calculate_radiance,
+    temperature_=temperature)
@@ -1,6 +1,8 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as thermodynamics_law
 
 # Description
@@ -19,6 +21,7 @@ volume_end = Symbol("volume_end", units.volume)
 
 law = Eq(pressure_start * volume_start, pressure_end * volume_end)
 
+
 ## Derive the same law from the general ideal gas law
 
 temperature_start = Symbol("temperature_start", units.temperature)
@@ -40,10 +43,12 @@ eq_end = thermodynamics_law.law.subs({
 
 derived_law = [eq_start, eq_end, isothermal_condition]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_pressure_end = solve(derived_law, (temperature_start, temperature_end, pressure_end),
-    dict=True)[0][pressure_end]
-assert solve(law, pressure_end, dict=True)[0][pressure_end] == derived_pressure_end
+
+def verify_derivation() -> None:
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_pressure_end = solve(derived_law, (temperature_start, temperature_end, pressure_end),
+        dict=True)[0][pressure_end]
+    assert solve(law, pressure_end, dict=True)[0][pressure_end] == derived_pressure_end
 
 
 def print_law() -> str:
@@ -56,10 +61,18 @@ def print_law() -> str:
 @validate_output(volume_end)
 def calculate_volume(pressure_start_: Quantity, volume_start_: Quantity,
     pressure_end_: Quantity) -> Quantity:
-    solved = solve(law, volume_end, dict=True)[0][volume_end]
+    solved = solve_for(law, volume_end)
     result_expr = solved.subs({
         pressure_start: pressure_start_,
         volume_start: volume_start_,
         pressure_end: pressure_end_
     })
     return Quantity(result_expr)
+
+
+calculate_volume_batch = BatchLaw(law,
+    volume_end,
+    function=calculate_volume,
+    pressure_start_=pressure_start,
+    volume_start_=volume_start,
+    pressure_end_=pressure_end)
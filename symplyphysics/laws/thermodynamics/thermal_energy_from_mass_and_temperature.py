@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 # Amount of energy for body heat Q = C * m * (t2 - t1)
@@ -36,7 +38,7 @@ def print_law() -> str:
 def calculate_amount_energy(specific_heat_capacity_: Quantity, body_mass_: Quantity,
     temperature_end_: Quantity, temperature_origin_: Quantity) -> Quantity:
 
-    result_amount_energy_expr = solve(law, amount_energy, dict=True)[0][amount_energy]
+    result_amount_energy_expr = solve_for(law, amount_energy)
     result_expr = result_amount_energy_expr.subs({
         specific_heat_capacity: specific_heat_capacity_,
         body_mass: body_mass_,
@@ -44,3 +46,12 @@ def calculate_amount_energy(specific_heat_capacity_: Quantity, body_mass_: Quant
         temperature_origin: temperature_origin_
     })
     return Quantity(result_expr)
+
+
+calculate_amount_energy_batch = BatchLaw(law,
+    amount_energy,
+    function=calculate_amount_energy,
+    specific_heat_capacity_=specific_heat_capacity,
+    body_mass_=body_mass,
+    temperature_end_=temperature_end,
+    temperature_origin_=temperature_origin)
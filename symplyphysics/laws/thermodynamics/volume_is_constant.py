@@ -1,7 +1,8 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
-from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as thermodynamics_law
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Isochoric process: V = const, P1 * T2 = P2 * T1
@@ -19,31 +20,35 @@ temperature_end = Symbol("temperature_end", units.temperature)
 
 law = Eq(pressure_start * temperature_end, pressure_end * temperature_start)
 
-## Derive the same law from the general ideal gas law
 
-volume_start = Symbol("volume_start", units.volume)
-volume_end = Symbol("volume_end", units.volume)
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as thermodynamics_law
 
-isochoric_condition = Eq(volume_start, volume_end)
+    ## Derive the same law from the general ideal gas law
+    volume_start = Symbol("volume_start", units.volume)
+    volume_end = Symbol("volume_end", units.volume)
 
-eq_start = thermodynamics_law.law.subs({
-    thermodynamics_law.temperature: temperature_start,
-    thermodynamics_law.volume: volume_start,
-    thermodynamics_law.pressure: pressure_start
-})
+    isochoric_condition = Eq(volume_start, volume_end)
 
-eq_end = thermodynamics_law.law.subs({
-    thermodynamics_law.temperature: temperature_end,
-    thermodynamics_law.volume: volume_end,
-    thermodynamics_law.pressure: pressure_end
-})
+    eq_start = thermodynamics_law.law.subs({
+        thermodynamics_law.temperature: temperature_start,
+        thermodynamics_law.volume: volume_start,
+        thermodynamics_law.pressure: pressure_start
+    })
+
+    eq_end = thermodynamics_law.law.subs({
+        thermodynamics_law.temperature: temperature_end,
+        thermodynamics_law.volume: volume_end,
+        thermodynamics_law.pressure: pressure_end
+    })
 
-derived_law = [eq_start, eq_end, isochoric_condition]
+    derived_law = [eq_start, eq_end, isochoric_condition]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_pressure_end = solve(derived_law, (volume_start, volume_end, pressure_end),
-    dict=True)[0][pressure_end]
-assert solve(law, pressure_end, dict=True)[0][pressure_end] == derived_pressure_end
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_pressure_end = solve(derived_law, (volume_start, volume_end, pressure_end),
+        dict=True)[0][pressure_end]
+    assert solve(law, pressure_end, dict=True)[0][pressure_end] == derived_pressure_end
 
 
 def print_law() -> str:
@@ -56,10 +61,18 @@ def print_law() -> str:
 @validate_output(pressure_end)
 def calculate_pressure(temperature_start_: Quantity, pressure_start_: Quantity,
     temperature_end_: Quantity) -> Quantity:
-    solved = solve(law, pressure_end, dict=True)[0][pressure_end]
+    solved = solve_for(law, pressure_end)
     result_expr = solved.subs({
         pressure_start: pressure_start_,
         temperature_start: temperature_start_,
         temperature_end: temperature_end_
     })
     return Quantity(result_expr)
+
+
+calculate_pressure_batch = BatchLaw(law,
+    pressure_end,
+    function=calculate_pressure,
+    temperature_start_=temperature_start,
+    pressure_start_=pressure_start,
+    temperature_end_=temperature_end)
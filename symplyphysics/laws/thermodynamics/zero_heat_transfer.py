@@ -1,6 +1,7 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.solved_forms import solutions_for
 from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as thermodynamics_law
 
 # Description
@@ -53,7 +54,7 @@ def print_law() -> str:
 def calculate_pressure(mole_count_: Quantity, temperature_start_: Quantity, volume_start_: Quantity,
     volume_end_: Quantity, specific_heats_ratio_: float) -> Quantity:
 
-    solved = solve(law, (pressure_start, temperature_end, pressure_end), dict=True)[0][pressure_end]
+    solved = solutions_for(law, (pressure_start, temperature_end, pressure_end))[0][pressure_end]
     result_pressure = solved.subs({
         thermodynamics_law.mole_count: mole_count_,
         temperature_start: temperature_start_,
@@ -1,10 +1,10 @@
-from sympy import (Eq, pi, solve)
+from sympy import (Eq, pi)
 from sympy.physics.units import speed_of_light
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.laws.waves import frequency_shift_from_velocity_and_angle as classical_doppler_with_angle
-from symplyphysics.laws.relativistic.waves import longitudinal_frequency_shift_from_absolute_velocities as general_doppler_law
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## The Doppler effect or Doppler shift is the apparent change in frequency of a wave in relation to an observer moving relative to the wave source.
@@ -41,38 +41,43 @@ observer_velocity = Symbol("observer_velocity", units.velocity)
 law = Eq(observed_frequency,
     real_frequency * (wave_velocity - observer_velocity) / (wave_velocity + source_velocity))
 
+
 # Confirm that classical Doppler effect is a special case of relativistic Doppler effect
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.waves import frequency_shift_from_velocity_and_angle as classical_doppler_with_angle
+    from symplyphysics.laws.relativistic.waves import longitudinal_frequency_shift_from_absolute_velocities as general_doppler_law
+
+    # This is a general formula for Doppler effect that has both classical and relativistic parts of equation.
+
+    # Relativistic part is zero for velocities much less than speed of light
+    classical_law = general_doppler_law.law.subs({
+        general_doppler_law.real_frequency: real_frequency,
+        general_doppler_law.wave_velocity: wave_velocity,
+        general_doppler_law.source_velocity: source_velocity,
+        general_doppler_law.observer_velocity: observer_velocity,
+        (general_doppler_law.source_velocity / speed_of_light)**2: 0,
+        (general_doppler_law.observer_velocity / speed_of_light)**2: 0
+    })
+    assert expr_equals(classical_law.rhs, law.rhs)
+
+    # Confirm that Doppler effect for collinear movement is a subset of Doppler effect with angles
 
-# This is a general formula for Doppler effect that has both classical and relativistic parts of equation.
-
-# Relativistic part is zero for velocities much less than speed of light
-classical_law = general_doppler_law.law.subs({
-    general_doppler_law.real_frequency: real_frequency,
-    general_doppler_law.wave_velocity: wave_velocity,
-    general_doppler_law.source_velocity: source_velocity,
-    general_doppler_law.observer_velocity: observer_velocity,
-    (general_doppler_law.source_velocity / speed_of_light)**2: 0,
-    (general_doppler_law.observer_velocity / speed_of_light)**2: 0
-})
-assert expr_equals(classical_law.rhs, law.rhs)
-
-# Confirm that Doppler effect for collinear movement is a subset of Doppler effect with angles
-
-## Classical Doppler effect angles are calculated with respect to the signal vector, directed
-## from source to observer. Hence source moving directly towards observer has 0 angle. Therefore
-## its cosine is positive, when moving towards observer.
-## This law has reverse notation - source velocity is positive when moving away from the observer.
-## Therefore we should use opposite direction for source - set pi as source angle.
-observed_frequency_zero_angles = classical_doppler_with_angle.law.subs({
-    classical_doppler_with_angle.observer_angle: 0,
-    classical_doppler_with_angle.source_angle: pi,
-    classical_doppler_with_angle.observer_speed: observer_velocity,
-    classical_doppler_with_angle.source_speed: source_velocity,
-    classical_doppler_with_angle.real_frequency: real_frequency,
-    classical_doppler_with_angle.wave_velocity: wave_velocity
-}).rhs
-
-assert expr_equals(observed_frequency_zero_angles, law.rhs)
+    ## Classical Doppler effect angles are calculated with respect to the signal vector, directed
+    ## from source to observer. Hence source moving directly towards observer has 0 angle. Therefore
+    ## its cosine is positive, when moving towards observer.
+    ## This law has reverse notation - source velocity is positive when moving away from the observer.
+    ## Therefore we should use opposite direction for source - set pi as source angle.
+    observed_frequency_zero_angles = classical_doppler_with_angle.law.subs({
+        classical_doppler_with_angle.observer_angle: 0,
+        classical_doppler_with_angle.source_angle: pi,
+        classical_doppler_with_angle.observer_speed: observer_velocity,
+        classical_doppler_with_angle.source_speed: source_velocity,
+        classical_doppler_with_angle.real_frequency: real_frequency,
+        classical_doppler_with_angle.wave_velocity: wave_velocity
+    }).rhs
+
+    assert expr_equals(observed_frequency_zero_angles, law.rhs)
 
 
 def print_law() -> str:
@@ -86,7 +91,7 @@ def print_law() -> str:
 @validate_output(observed_frequency)
 def calculate_observed_frequency(real_frequency_: Quantity, wave_velocity_: Quantity,
     source_velocity_: Quantity, observer_velocity_: Quantity) -> Quantity:
-    result_expr = solve(law, observed_frequency, dict=True)[0][observed_frequency]
+    result_expr = solve_for(law, observed_frequency)
     frequency_applied = result_expr.subs({
         real_frequency: real_frequency_,
         wave_velocity: wave_velocity_,
@@ -94,3 +99,12 @@ def calculate_observed_frequency(real_frequency_: Quantity, wave_velocity_: Quan
         observer_velocity: observer_velocity_
     })
     return Quantity(frequency_applied)
+
+
+calculate_observed_frequency_batch = BatchLaw(law,
+    observed_frequency,
+    function=calculate_observed_frequency,
+    real_frequency_=real_frequency,
+    wave_velocity_=wave_velocity,
+    source_velocity_=source_velocity,
+    observer_velocity_=observer_velocity)
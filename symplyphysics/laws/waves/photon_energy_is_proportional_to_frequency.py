@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import planck as planck_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Photon is the elementary part of any electromagnetical radiation which has no mass and always moves with speed of light.
@@ -24,6 +26,12 @@ def print_law() -> str:
 @validate_input(photon_frequency_=photon_frequency)
 @validate_output(photon_energy)
 def calculate_energy(photon_frequency_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, photon_energy, dict=True)[0][photon_energy]
+    result_energy_expr = solve_for(law, photon_energy)
     result_expr = result_energy_expr.subs({photon_frequency: photon_frequency_})
     return Quantity(result_expr)
+
+
+calculate_energy_batch = BatchLaw(law,
+    photon_energy,
+    function=calculate_energy,
+    photon_frequency_=photon_frequency)
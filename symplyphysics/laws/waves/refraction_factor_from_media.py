@@ -1,5 +1,6 @@
-from sympy import (Eq, solve, sqrt, symbols)
+from sympy import (Eq, sqrt, symbols)
 from symplyphysics import print_expression
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## How media refracts electromagnetical waves depends on how this media transfers electrical and magnetical fields.
@@ -22,7 +23,7 @@ def print_law() -> str:
 
 def calculate_refraction_factor(relative_dielectric_permeability_: float,
     relative_magnetic_permeability_: float) -> float:
-    result_expr = solve(law, refraction_factor, dict=True)[0][refraction_factor]
+    result_expr = solve_for(law, refraction_factor)
     factor_applied = result_expr.subs({
         relative_dielectric_permeability: relative_dielectric_permeability_,
         relative_magnetic_permeability: relative_magnetic_permeability_
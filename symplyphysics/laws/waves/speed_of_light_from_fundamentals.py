@@ -1,6 +1,6 @@
 from sympy import (Eq, sqrt)
 from sympy.physics.units import speed_of_light, magnetic_constant, electric_constant
-from symplyphysics import units, print_expression, convert_to
+from symplyphysics import units, Quantity, print_expression, convert_to
 
 # Description
 ## Speed of light in vacuum is fundamental but still might be calculated from other fundamentals.
@@ -17,5 +17,6 @@ def print_law() -> str:
     return print_expression(law)
 
 
-assert convert_to(law.lhs, units.meter / units.second) == convert_to(law.rhs,
-    units.meter / units.second)
+def verify_derivation() -> None:
+    assert convert_to(Quantity(law.lhs), units.meter / units.second) == convert_to(
+        Quantity(law.rhs), units.meter / units.second)
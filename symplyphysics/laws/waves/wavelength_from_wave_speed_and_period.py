@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.laws.kinematic import distance_from_constant_velocity as velocity_definition
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Wavelength is the spatial period of a periodic wave — the distance over which the wave's shape repeats.
@@ -21,17 +22,21 @@ oscillation_period = Symbol("oscillation_period", units.time)
 
 law = Eq(wavelength, propagation_speed * oscillation_period)
 
+
 # Derive the same law from constant velocity motion, assuming wave length is a distance that wave travels
 # during oscillation period.
-
-# Prove that derived movement function equals to law.rhs, given initial position = 0
-# and propagation_speed is constant_velocity
-constant_velocity_movement_definition = velocity_definition.law.subs({
-    velocity_definition.constant_velocity: propagation_speed,
-    velocity_definition.movement_time: oscillation_period,
-    velocity_definition.initial_position: 0
-})
-assert expr_equals(constant_velocity_movement_definition.rhs, law.rhs)
+def verify_derivation() -> None:
+    # pylint: disable=import-outside-toplevel
+    from symplyphysics.laws.kinematic import distance_from_constant_velocity as velocity_definition
+
+    # Prove that derived movement function equals to law.rhs, given initial position = 0
+    # and propagation_speed is constant_velocity
+    constant_velocity_movement_definition = velocity_definition.law.subs({
+        velocity_definition.constant_velocity: propagation_speed,
+        velocity_definition.movement_time: oscillation_period,
+        velocity_definition.initial_position: 0
+    })
+    assert expr_equals(constant_velocity_movement_definition.rhs, law.rhs)
 
 
 def print_law() -> str:
@@ -41,9 +46,16 @@ def print_law() -> str:
 @validate_input(velocity_=propagation_speed, period_=oscillation_period)
 @validate_output(wavelength)
 def calculate_wavelength(velocity_: Quantity, period_: Quantity) -> Quantity:
-    applied_definition = solve(law, wavelength, dict=True)[0][wavelength]
+    applied_definition = solve_for(law, wavelength)
     result_expr = applied_definition.subs({
         propagation_speed: velocity_,
         oscillation_period: period_
     })
     return Quantity(result_expr)
+
+
+calculate_wavelength_batch = BatchLaw(law,
+    wavelength,
+    function=calculate_wavelength,
+    velocity_=propagation_speed,
+    period_=oscillation_period)
@@ -1,7 +1,9 @@
 from sympy.physics.units import speed_of_light
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.batch import BatchLaw
+from symplyphysics.core.solved_forms import solve_for
 
 # Description
 ## Wavespeed differs in different medium. Electromagnetic wave propagation speed depends on relative permittivity and relative permeability of medium.
@@ -28,9 +30,16 @@ def print_law() -> str:
 @validate_input(permittivity_=relative_permittivity, permeability_=relative_permeability)
 @validate_output(wave_speed_in_medium)
 def calculate_wavespeed(permittivity_: float, permeability_: float) -> Quantity:
-    result_expr = solve(law, wave_speed_in_medium, dict=True)[0][wave_speed_in_medium]
+    result_expr = solve_for(law, wave_speed_in_medium)
     wavespeed_applied = result_expr.subs({
         relative_permittivity: permittivity_,
         relative_permeability: permeability_
     })
     return Quantity(wavespeed_applied)
+
+
+calculate_wavespeed_batch = BatchLaw(law,
+    wave_speed_in_medium,
+    function=calculate_wavespeed,
+    permittivity_=relative_permittivity,
+    permeability_=relative_permeability)
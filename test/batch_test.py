@@ -0,0 +1,74 @@
+import importlib
+import pkgutil
+import random
+from pytest import approx, importorskip, mark
+from sympy import N
+from sympy.physics.units import Dimension
+import symplyphysics.definitions
+import symplyphysics.laws
+from symplyphysics import Quantity
+from symplyphysics.core.batch import BatchLaw, BatchSum
+from symplyphysics.core.dimensions import si_scale_factor, si_unit
+
+importorskip("numpy")
+
+# Batch versions of calculate_* functions should give the same results as scalar ones.
+
+
+def _batch_functions() -> list[tuple[str, str]]:
+    names = []
+    for package in (symplyphysics.laws, symplyphysics.definitions):
+        for info in pkgutil.walk_packages(package.__path__, package.__name__ + "."):
+            if info.ispkg:
+                continue
+            module = importlib.import_module(info.name)
+            for name, value in vars(module).items():
+                if isinstance(value, BatchLaw):
+                    names.append((info.name, name))
+    return names
+
+
+def _quantities(value: float | list[float], dimension: Dimension) -> Quantity | list[Quantity]:
+    if isinstance(value, list):
+        return [Quantity(v * si_unit(dimension)) for v in value]
+    return Quantity(value * si_unit(dimension))
+
+
+@mark.parametrize("module_name,batch_name", _batch_functions())
+def test_batch_matches_scalar(module_name: str, batch_name: str) -> None:
+    module = importlib.import_module(module_name)
+    batch = getattr(module, batch_name)
+    scalar = getattr(module, batch_name.removesuffix("_batch"))
+    rng = random.Random(batch_name)
+    values: list[dict[str, float | list[float]]]
+    if isinstance(batch, BatchSum):
+        # sum laws take list of components, batch calculates sum of each row
+        values = [{name: [rng.uniform(0.2, 0.9) for _ in range(4)] for name in batch.inputs}
+            for _ in range(3)]
+    else:
+        values = [{name: rng.uniform(0.2, 0.9) for name in batch.inputs} for _ in range(3)]
+    results = batch(**{name: [v[name] for v in values] for name in batch.inputs})
+    for value, result in zip(values, results):
+        arguments = {
+            name: _quantities(v, batch.inputs[name].dimension) for name, v in value.items()
+        }
+        expected = scalar(**arguments)
+        if isinstance(expected, Quantity):
+            expected = expected.scale_factor / si_scale_factor(expected.dimension)
+        assert result == approx(complex(N(expected)), rel=1e-9)
+
+
+def test_complex_sum_matches_scalar() -> None:
+    # admittances are complex, sums of their rows keep imaginary parts
+    module = importlib.import_module(
+        "symplyphysics.laws.electricity.circuits.admittance_of_parallel_dipoles")
+    rows = [[0.1 + 0.2j, 0.3 - 0.1j], [0.5 + 0.0j, -0.2 + 0.7j]]
+    results = module.calculate_parallel_admittance_batch(rows)
+    dimension = module.parallel_admittance.dimension
+    for row, result in zip(rows, results):
+        expected = module.calculate_parallel_admittance(
+            [Quantity(v * si_unit(dimension)) for v in row])
+        expected = expected.scale_factor / si_scale_factor(expected.dimension)
+        assert result == approx(complex(N(expected)), rel=1e-9)
+    quantities = [Quantity(v * si_unit(dimension)) for v in rows[0]]
+    assert module.calculate_parallel_admittance_batch(quantities) == approx(0.4 + 0.1j)
@@ -0,0 +1,63 @@
+from pytest import raises
+from benchmarks.laws import discover_law_benchmarks
+from benchmarks.runner import (Benchmark, compare_results, load_results, measure, run_benchmarks,
+    save_results)
+
+
+def _results(medians: dict[str, float]) -> dict:
+    benchmarks = [Benchmark(name, lambda: None) for name in medians]
+    results = run_benchmarks(benchmarks, min_time=0.0001, rounds=2)
+    for (name, median) in medians.items():
+        results["benchmarks"][name]["median"] = median
+    return results
+
+
+def test_measure():
+    stats = measure(lambda: sum(range(100)), min_time=0.001, rounds=3)
+    assert stats.rounds == 3
+    assert stats.number >= 1
+    assert 0 < stats.min <= stats.median <= stats.max
+
+
+def test_run_benchmarks_reports_failures():
+
+    def fail():
+        raise ValueError("bad input")
+
+    results = run_benchmarks([Benchmark("ok", lambda: None),
+        Benchmark("fail", fail)],
+        min_time=0.0001,
+        rounds=2,
+        skipped={"other": "reason"})
+    assert list(results["benchmarks"]) == ["ok"]
+    assert results["skipped"] == {"fail": "ValueError: bad input", "other": "reason"}
+
+
+def test_save_and_load(tmp_path):
+    results = _results({"a": 1.0})
+    path = str(tmp_path / "results.json")
+    save_results(results, path)
+    assert load_results(path) == results
+    results["version"] = 0
+    save_results(results, path)
+    with raises(ValueError):
+        load_results(path)
+
+
+def test_compare_results():
+    baseline = _results({"core.a": 1.0, "core.b": 1.0, "laws.c": 1.0})
+    current = _results({"core.a": 1.1, "core.b": 1.5, "laws.c": 1.5, "laws.d": 1.0})
+    regressions = compare_results(current, baseline, threshold=0.2)
+    assert [r.name for r in regressions] == ["core.b", "laws.c"]
+    assert regressions[0].ratio == 1.5
+    regressions = compare_results(current, baseline, threshold=0.2, thresholds={"laws.*": 0.6})
+    assert [r.name for r in regressions] == ["core.b"]
+    assert not compare_results(current, baseline, threshold=0.05, thresholds={"*": 1.0})
+
+
+def test_discover_law_benchmarks():
+    (benchmarks, skipped) = discover_law_benchmarks(["symplyphysics.laws.dynamics"])
+    names = [b.name for b in benchmarks]
+    assert "laws.dynamics.acceleration_from_force.calculate_force" in names
+    assert "laws.dynamics.acceleration_from_force.calculate_force_batch" in names
+    assert not set(names) & set(skipped)
@@ -0,0 +1,103 @@
+from pytest import approx, importorskip, raises
+from sympy import I
+from symplyphysics import units, Quantity, prefixes, errors, convert_to
+from symplyphysics.circuits import (Capacitor, Inductor, Parallel, Resistor, Series,
+    find_resonances, frequency_sweep, lc_resonant_frequency)
+from symplyphysics.definitions import admittance_is_inversed_impedance as admittance_definition
+from symplyphysics.definitions import impedance_is_resistance_and_reactance as impedance_definition
+from symplyphysics.laws.electricity import (capacitor_impedance_from_capacitance_and_frequency as
+    capacitor_law)
+
+np = importorskip("numpy")
+
+INDUCTANCE = 1e-3
+CAPACITANCE = 1e-6
+# 1 / sqrt(L * C)
+RESONANCE = 31622.776601683792
+
+
+def test_basic_sweep():
+    network = Series(Resistor(Quantity(10 * units.ohm)),
+        Capacitor(Quantity(1 * prefixes.micro * units.farad)))
+    frequencies = np.logspace(2, 6, 101)
+    sweep = frequency_sweep(network, frequencies)
+    for i in (0, 50, 100):
+        omega = Quantity(frequencies[i] * units.radian / units.second)
+        capacitor_impedance = capacitor_law.calculate_impedance(
+            Quantity(CAPACITANCE * units.farad), omega)
+        impedance = 10 + complex(convert_to(capacitor_impedance, units.ohm))
+        assert sweep.impedance[i] == approx(impedance)
+        admittance = admittance_definition.calculate_admittance(
+            Quantity(impedance.real * units.ohm + I * impedance.imag * units.ohm))
+        assert sweep.admittance[i] == approx(complex(convert_to(admittance, units.siemens)))
+        magnitude = impedance_definition.calculate_impedance_magnitude(
+            Quantity(impedance.real * units.ohm), Quantity(impedance.imag * units.ohm))
+        assert sweep.magnitude[i] == approx(float(convert_to(magnitude, units.ohm)))
+        assert sweep.phase[i] == approx(np.arctan2(impedance.imag, impedance.real))
+        assert sweep.quality_factor[i] == approx(abs(impedance.imag) / 10)
+
+
+def test_series_resonance():
+    network = Series(Resistor(10), Inductor(INDUCTANCE), Capacitor(CAPACITANCE))
+    sweep = frequency_sweep(network, (np.logspace(2, 6, 10**5), units.radian / units.second))
+    (resonance,) = sweep.resonances()
+    assert resonance.series
+    assert resonance.circular_frequency == approx(RESONANCE, rel=1e-12)
+    assert resonance.circular_frequency == approx(lc_resonant_frequency(INDUCTANCE, CAPACITANCE))
+    # Q = sqrt(L / C) / R
+    assert resonance.quality_factor == approx(np.sqrt(INDUCTANCE / CAPACITANCE) / 10, rel=1e-6)
+    assert sweep.magnitude.min() == approx(10, rel=1e-6)
+
+
+def test_parallel_resonance():
+    network = Parallel(Inductor(INDUCTANCE), Capacitor(CAPACITANCE), Resistor(1000))
+    (resonance,) = find_resonances(network, 100, Quantity(10**6 * units.radian / units.second))
+    assert not resonance.series
+    assert resonance.circular_frequency == approx(RESONANCE, rel=1e-12)
+    # Q = R * sqrt(C / L)
+    assert resonance.quality_factor == approx(1000 * np.sqrt(CAPACITANCE / INDUCTANCE), rel=1e-6)
+
+
+def test_lossless_resonances():
+    for network in (Series(Inductor(INDUCTANCE), Capacitor(CAPACITANCE)),
+            Parallel(Inductor(INDUCTANCE), Capacitor(CAPACITANCE))):
+        (resonance,) = find_resonances(network, 100, 10**6)
+        assert resonance.circular_frequency == approx(RESONANCE, rel=1e-12)
+        assert resonance.quality_factor == np.inf
+
+
+def test_several_resonances():
+    # series resonance of L1 with the capacitive tank, above the tank resonance
+    network = Series(Inductor(INDUCTANCE), Parallel(Inductor(INDUCTANCE), Capacitor(CAPACITANCE)))
+    resonances = find_resonances(network, 100, 10**6, points=50)
+    assert [r.series for r in resonances] == [False, True]
+    assert [r.circular_frequency for r in resonances] == approx([RESONANCE, RESONANCE * np.sqrt(2)])
+    assert lc_resonant_frequency([INDUCTANCE, INDUCTANCE / 2],
+        CAPACITANCE) == approx([RESONANCE, RESONANCE * np.sqrt(2)])
+
+
+def test_resistive_network():
+    # purely resistive networks have zero reactance at all frequencies, but no resonances
+    assert not find_resonances(Resistor(10), 1, 1e6)
+    assert not find_resonances(Parallel(Resistor(10), Series(Resistor(5), Resistor(5))), 1, 1e6)
+    # exact zero between reactances of opposite signs is a resonance
+    network = Series(Resistor(1), Inductor(1), Capacitor(1))
+    (resonance,) = frequency_sweep(network, [0.5, 1.0, 2.0]).resonances()
+    assert resonance.series
+    assert resonance.circular_frequency == 1.0
+
+
+def test_bad_sweep():
+    network = Series(Resistor(1), Capacitor(1e-6))
+    with raises(ValueError):
+        frequency_sweep(network, [0, 1])
+    with raises(errors.UnitsError):
+        frequency_sweep(network, Quantity(1 * units.meter))
+    with raises(errors.UnitsError):
+        Inductor(Quantity(1 * units.farad))
+    with raises(ValueError):
+        Resistor([1, 2])
+    with raises(ValueError):
+        Parallel()
+    with raises(ValueError):
+        find_resonances(network, 10, 1)
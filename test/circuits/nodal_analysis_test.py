@@ -0,0 +1,113 @@
+from pytest import approx, importorskip, raises
+from symplyphysics import units, Quantity, prefixes, errors, convert_to
+from symplyphysics.circuits import ElementKind, Netlist, solve_circuit
+from symplyphysics.circuits import nodal_analysis
+from symplyphysics.core.dimensions import assert_equivalent_dimension
+
+np = importorskip("numpy")
+
+
+# Voltage divider with inductor, that is shorted at DC
+def _divider() -> Netlist:
+    netlist = Netlist()
+    netlist.add_voltage_source("V1", "in", "0", Quantity(10 * units.volt))
+    netlist.add_resistor("R1", "in", "out", Quantity(1 * prefixes.kilo * units.ohm))
+    netlist.add_resistor("R2", "out", "0", 1000.0)
+    netlist.add_inductor("L1", "out", "x", Quantity(1 * prefixes.milli * units.henry))
+    netlist.add_resistor("R3", "x", "0", 1000.0)
+    return netlist
+
+
+def test_basic_dc():
+    solution = solve_circuit(_divider())
+    assert_equivalent_dimension(solution.voltage("out"), "voltage", "test_basic_dc", units.voltage)
+    assert_equivalent_dimension(solution.current("R1"), "current", "test_basic_dc", units.current)
+    assert convert_to(solution.voltage("out"), units.volt).evalf() == approx(10 / 3)
+    assert convert_to(solution.voltage("x"), units.volt).evalf() == approx(10 / 3)
+    assert convert_to(solution.element_voltage("R1"), units.volt).evalf() == approx(20 / 3)
+    assert convert_to(solution.current("R1"), units.ampere).evalf() == approx(20 / 3 / 1000)
+    assert convert_to(solution.current("L1"), units.ampere).evalf() == approx(10 / 3 / 1000)
+    # source current flows from its positive node through the source
+    assert convert_to(solution.current("V1"), units.ampere).evalf() == approx(-20 / 3 / 1000)
+    assert not np.iscomplexobj(solution.node_voltages)
+
+
+def test_basic_ac():
+    netlist = _divider()
+    netlist.add_capacitor("C1", "out", "0", Quantity(1 * prefixes.micro * units.farad))
+    omega = 1000.0
+    solution = solve_circuit(netlist, Quantity(omega * units.radian / units.second))
+    assert solution.circular_frequency == approx(omega)
+    load = 1 / (1 / 1000 + 1j * omega * 1e-6 + 1 / (1000 + 1j * omega * 1e-3))
+    out = 10 * load / (1000 + load)
+    assert solution.node_voltages[netlist.node_index("out")] == approx(out)
+    # Kirchhoff current law at the output node
+    currents = solution.element_currents
+    (r1, r2, l1, c1) = (netlist.element_index(n) for n in ("R1", "R2", "L1", "C1"))
+    assert currents[r1] == approx(currents[r2] + currents[l1] + currents[c1])
+    assert currents[c1] == approx(out * 1j * omega * 1e-6)
+
+
+def test_current_source():
+    netlist = Netlist(ground="gnd")
+    netlist.add_current_source("I1", "gnd", "a", Quantity(2 * units.ampere))
+    netlist.add_resistor("R1", "a", "b", 3.0)
+    netlist.add_resistor("R2", "b", "gnd", 2.0)
+    netlist.add_resistor("R3", "b", "gnd", 2.0)
+    solution = solve_circuit(netlist)
+    assert convert_to(solution.voltage("a"), units.volt).evalf() == approx(8.0)
+    assert convert_to(solution.voltage("a", "b"), units.volt).evalf() == approx(6.0)
+    assert convert_to(solution.current("R3"), units.ampere).evalf() == approx(1.0)
+    assert convert_to(solution.current("I1"), units.ampere).evalf() == approx(2.0)
+
+
+def test_resistor_ladder():
+    # chain of resistors divides voltage evenly
+    count = 1000
+    netlist = Netlist()
+    netlist.add_voltage_source("V", 1, "0", float(count))
+    netlist.add_elements(ElementKind.RESISTOR, [f"R{i}" for i in range(count)],
+        list(range(1, count + 1)), [*range(2, count + 1), "0"], (np.full(count, 2.0), units.ohm))
+    solution = solve_circuit(netlist)
+    expected = np.arange(count, 0, -1)
+    assert solution.node_voltages[1:] == approx(expected)
+    assert solution.element_currents[1:] == approx(np.full(count, 0.5))
+
+
+def test_sparse_and_dense_solvers(monkeypatch):
+    netlist = _divider()
+    netlist.add_capacitor("C1", "x", "0", 1e-6)
+    dense = None
+    with monkeypatch.context() as m:
+        m.setattr(nodal_analysis, "_import_sparse", lambda: None)
+        dense = solve_circuit(netlist, 500.0)
+        m.setattr(nodal_analysis, "DENSE_SIZE_LIMIT", 2)
+        with raises(ImportError):
+            solve_circuit(netlist, 500.0)
+    importorskip("scipy")
+    sparse = solve_circuit(netlist, 500.0)
+    assert sparse.node_voltages == approx(dense.node_voltages)
+    assert sparse.element_currents == approx(dense.element_currents)
+
+
+def test_bad_netlist():
+    netlist = Netlist()
+    netlist.add_resistor("R1", "a", "0", 1.0)
+    with raises(ValueError):
+        netlist.add_resistor("R1", "a", "b", 1.0)
+    with raises(ValueError):
+        netlist.add_resistor("R2", "a", "b", 0.0)
+    with raises(errors.UnitsError):
+        netlist.add_capacitor("C1", "a", "b", Quantity(1 * units.henry))
+    with raises(ValueError):
+        netlist.add_elements(ElementKind.RESISTOR, ["R3", "R4"], ["a"], ["b"], 1.0)
+    assert netlist.names == ["R1"]
+    # capacitor is open at DC, so node 'b' is floating
+    netlist.add_capacitor("C1", "a", "b", 1e-6)
+    netlist.add_current_source("I1", "0", "a", 1.0)
+    with raises(ValueError):
+        solve_circuit(netlist)
+    current = convert_to(solve_circuit(netlist, 1.0).current("C1"), units.ampere)
+    assert complex(current) == approx(0.0, abs=1e-12)
+    with raises(ValueError):
+        solve_circuit(netlist, 1.0).voltage("c")
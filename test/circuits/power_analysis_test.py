@@ -0,0 +1,120 @@
+from pytest import approx, importorskip, raises
+from symplyphysics import units, Quantity, prefixes, errors, convert_to
+from symplyphysics.circuits import PowerAnalyzer, analyze_power
+from symplyphysics.laws.electricity import (dissipated_heat_power_is_proportional_to_current_square
+    as heat_law)
+from symplyphysics.laws.electricity import (amount_energy_from_voltage_time_resistance as
+    joule_lenz_law)
+
+np = importorskip("numpy")
+
+SAMPLE_RATE = 10000.0
+# 10 cycles of 50 Hz line
+WINDOW = 2000
+
+
+def _samples(count: int, phase: float, current: float = 10.0) -> tuple:
+    times = np.arange(count) / SAMPLE_RATE
+    voltages = 230 * np.sqrt(2) * np.sin(2 * np.pi * 50 * times)
+    currents = current * np.sqrt(2) * np.sin(2 * np.pi * 50 * times - phase)
+    return (voltages, currents)
+
+
+def test_basic_windows():
+    (voltages, currents) = _samples(5 * WINDOW, np.pi / 3)
+    analyzer = PowerAnalyzer(Quantity(10 * prefixes.kilo * units.hertz), WINDOW)
+    assert analyzer.sample_rate == approx(SAMPLE_RATE)
+    result = analyzer.update(voltages, currents)
+    assert result.times == approx(np.arange(1, 6) * 0.2)
+    assert result.rms_voltage == approx(np.full(5, 230.0))
+    assert result.rms_current == approx(np.full(5, 10.0))
+    assert result.apparent_power == approx(np.full(5, 2300.0))
+    assert result.active_power == approx(np.full(5, 2300.0 * 0.5))
+    assert result.reactive_power == approx(np.full(5, 2300.0 * np.sqrt(3) / 2))
+    assert result.power_factor == approx(np.full(5, 0.5))
+    assert result.energy == approx(np.arange(1, 6) * 0.2 * 1150.0)
+    assert analyzer.samples == 5 * WINDOW
+    assert analyzer.energy == approx(1150.0)
+
+
+def test_blocks_of_any_size():
+    (voltages, currents) = _samples(10 * WINDOW + 123, np.pi / 6)
+    whole = PowerAnalyzer(SAMPLE_RATE, WINDOW).update(voltages, currents)
+    # blocks are not aligned with windows, and some of them are shorter than the window
+    edges = [0, 7, 1500, 1999, 4001, 4002, 13000, len(voltages)]
+    blocks = ((voltages[a:b], currents[a:b]) for (a, b) in zip(edges[:-1], edges[1:]))
+    analyzer = PowerAnalyzer(SAMPLE_RATE, WINDOW)
+    results = list(analyzer.stream(blocks))
+    assert [len(r.times) for r in results] == [0, 0, 0, 2, 0, 4, 4]
+    streamed = np.concatenate([r.active_power for r in results])
+    assert streamed == approx(whole.active_power)
+    assert analyzer.samples == len(voltages)
+    # energy includes samples of the incomplete window
+    total = np.sum(voltages * currents) / SAMPLE_RATE
+    assert analyzer.energy == approx(total)
+    assert whole.energy[-1] == approx(np.sum((voltages * currents)[:10 * WINDOW]) / SAMPLE_RATE)
+
+
+def test_analyze_power():
+    (voltages, currents) = _samples(4 * WINDOW + 100, 0.0)
+
+    def blocks():
+        for start in range(0, len(voltages), 1000):
+            yield ((voltages[start:start + 1000], units.volt),
+                (currents[start:start + 1000] * 1000, prefixes.milli * units.ampere))
+
+    result = analyze_power(blocks(), SAMPLE_RATE, WINDOW)
+    assert len(result.times) == 4
+    assert result.power_factor == approx(np.ones(4))
+    # rounding errors of apparent and active powers are amplified by square root
+    assert result.reactive_power == approx(np.zeros(4), abs=1e-3)
+    empty = analyze_power([], SAMPLE_RATE, WINDOW)
+    assert len(empty.energy) == 0
+
+
+def test_resistive_load_matches_laws():
+    # resistive load dissipates the same power and energy as with DC of RMS values
+    resistance = 23.0
+    (voltages, _) = _samples(3 * WINDOW, 0.0)
+    analyzer = PowerAnalyzer(SAMPLE_RATE, WINDOW)
+    result = analyzer.update(voltages, voltages / resistance)
+    heat_power = heat_law.calculate_heat_power_batch(result.rms_current, resistance)
+    assert result.active_power == approx(heat_power)
+    law_energy = joule_lenz_law.calculate_amount_energy(
+        Quantity(float(result.rms_voltage[0]) * units.volt),
+        Quantity(result.times[-1] * units.second), Quantity(resistance * units.ohm))
+    assert analyzer.energy == approx(float(convert_to(law_energy, units.joule).evalf()))
+
+
+def test_distorted_current():
+    # third harmonic adds to RMS current and apparent power, but not to active power
+    (voltages, currents) = _samples(WINDOW, 0.0)
+    times = np.arange(WINDOW) / SAMPLE_RATE
+    currents = currents + 5 * np.sqrt(2) * np.sin(2 * np.pi * 150 * times)
+    result = PowerAnalyzer(SAMPLE_RATE, WINDOW).update(voltages, currents)
+    assert result.rms_current[0] == approx(np.sqrt(10**2 + 5**2))
+    assert result.active_power[0] == approx(2300.0)
+    assert result.power_factor[0] == approx(10 / np.sqrt(10**2 + 5**2))
+    assert result.reactive_power[0] == approx(230 * 5)
+
+
+def test_bad_analyzer():
+    with raises(ValueError):
+        PowerAnalyzer(0, WINDOW)
+    with raises(ValueError):
+        PowerAnalyzer(SAMPLE_RATE, 0)
+    with raises(ValueError):
+        PowerAnalyzer(SAMPLE_RATE, 1.5)
+    with raises(errors.UnitsError):
+        PowerAnalyzer(Quantity(1 * units.second), WINDOW)
+    analyzer = PowerAnalyzer(SAMPLE_RATE, WINDOW)
+    with raises(ValueError):
+        analyzer.update(np.zeros(10), np.zeros(11))
+    with raises(ValueError):
+        analyzer.update(np.zeros((2, 10)), np.zeros((2, 10)))
+    with raises(errors.UnitsError):
+        analyzer.update((np.zeros(10), units.ampere), np.zeros(10))
+    # zero voltage and current have no power factor
+    result = analyzer.update(np.zeros(WINDOW), np.zeros(WINDOW))
+    assert np.isnan(result.power_factor[0])
+    assert result.energy[0] == 0
@@ -0,0 +1,164 @@
+from pytest import approx, importorskip, raises
+from symplyphysics import units, Quantity, prefixes, errors, convert_to
+from symplyphysics.circuits import (Integrator, Netlist, simulate_transient,
+    simulate_transient_adaptive)
+from symplyphysics.circuits import transient
+from symplyphysics.laws.electricity.circuits import (resistor_and_capacitor_as_integrator_node as
+    rc_law)
+
+np = importorskip("numpy")
+
+RESISTANCE = 1000.0
+CAPACITANCE = 1e-6
+# R * C
+TIME_CONSTANT = 1e-3
+
+
+def _integrator(voltage: float = 5.0) -> Netlist:
+    netlist = Netlist()
+    netlist.add_voltage_source("V", "in", "0", voltage)
+    netlist.add_resistor("R", "in", "out", Quantity(1 * prefixes.kilo * units.ohm))
+    netlist.add_capacitor("C", "out", "0", Quantity(1 * prefixes.micro * units.farad))
+    return netlist
+
+
+def test_rc_integrator_matches_law():
+    solution = simulate_transient(_integrator(),
+        Quantity(5 * units.millisecond),
+        Quantity(1 * units.microsecond))
+    assert len(solution.times) == 5001
+    expected = rc_law.calculate_capacitor_voltage_batch(5.0, CAPACITANCE, RESISTANCE,
+        solution.times)
+    assert solution.voltages("out") == approx(expected, abs=1e-6)
+    # scalar law at one time constant
+    index = 1000
+    law_voltage = rc_law.calculate_capacitor_voltage(Quantity(5 * units.volt),
+        Quantity(CAPACITANCE * units.farad), Quantity(RESISTANCE * units.ohm),
+        Quantity(solution.times[index] * units.second))
+    assert solution.voltages("out")[index] == approx(
+        float(convert_to(law_voltage, units.volt).evalf()), rel=1e-6)
+    # capacitor current is the same as resistor current, source current is opposite
+    assert solution.currents("C") == approx(solution.currents("R"), abs=1e-12)
+    assert solution.currents("V") == approx(-solution.currents("R"))
+    assert solution.currents("R")[0] == approx(5.0 / RESISTANCE)
+
+
+def test_backward_euler():
+    solution = simulate_transient(_integrator(),
+        5e-3,
+        1e-6,
+        integrator=Integrator.BACKWARD_EULER)
+    expected = rc_law.calculate_capacitor_voltage_batch(5.0, CAPACITANCE, RESISTANCE,
+        solution.times)
+    # first order method
+    assert np.max(np.abs(solution.voltages("out") - expected)) < 1e-3
+
+
+def test_millions_of_steps():
+    solution = simulate_transient(_integrator(), 2e-3, 1e-9)
+    assert solution.times.shape == (2 * 10**6 + 1,)
+    assert solution.times[-1] == approx(2e-3)
+    expected = rc_law.calculate_capacitor_voltage_batch(5.0, CAPACITANCE, RESISTANCE,
+        solution.times[::1000])
+    assert solution.voltages("out")[::1000] == approx(expected, abs=1e-9)
+
+
+def test_adaptive_step():
+    solution = simulate_transient_adaptive(_integrator(), 10 * TIME_CONSTANT)
+    assert solution.times[0] == 0
+    assert solution.times[-1] == approx(10 * TIME_CONSTANT)
+    # steps grow, while capacitor saturates
+    steps = np.diff(solution.times)
+    assert steps[-2] > 10 * steps[0]
+    expected = rc_law.calculate_capacitor_voltage_batch(5.0, CAPACITANCE, RESISTANCE,
+        solution.times)
+    # local errors accumulate over steps
+    assert solution.voltages("out") == approx(expected, abs=1e-4)
+
+
+def test_lc_oscillations():
+    netlist = Netlist()
+    netlist.add_inductor("L", "a", "0", 1e-3)
+    netlist.add_capacitor("C", "a", "0", 1e-6)
+    period = 2 * np.pi * np.sqrt(1e-3 * 1e-6)
+    solution = simulate_transient(netlist,
+        10 * period,
+        period / 1000,
+        initial_conditions={"C": Quantity(1 * units.volt)})
+    voltages = solution.voltages("a")
+    assert voltages[::1000] == approx(np.ones(11), abs=1e-4)
+    assert voltages[250] == approx(0, abs=1e-4)
+    # energy is conserved by trapezoidal method
+    energy = 1e-6 * voltages**2 / 2 + 1e-3 * solution.currents("L")**2 / 2
+    assert energy == approx(np.full_like(energy, 0.5e-6))
+
+
+def test_rl_waveform():
+    # sinusoidal source drives RL circuit, steady state is the AC phasor
+    omega = 1000.0
+    netlist = Netlist()
+    netlist.add_voltage_source("V", "in", "0", 0.0)
+    netlist.add_resistor("R", "in", "out", 1.0)
+    netlist.add_inductor("L", "out", "0", 1e-3)
+    solution = simulate_transient(netlist,
+        0.03,
+        1e-6,
+        waveforms={"V": lambda t: np.sin(omega * t)})
+    impedance = 1.0 + 1j * omega * 1e-3
+    phasor = 1 / impedance
+    # transient decays in 20 time constants L / R
+    steady = solution.times > 0.02
+    expected = np.abs(phasor) * np.sin(omega * solution.times[steady] + np.angle(phasor))
+    assert solution.currents("L")[steady] == approx(expected, abs=1e-6)
+    adaptive = simulate_transient_adaptive(netlist,
+        0.03,
+        waveforms={"V": lambda t: np.sin(omega * t)})
+    steady = adaptive.times > 0.02
+    expected = np.abs(phasor) * np.sin(omega * adaptive.times[steady] + np.angle(phasor))
+    assert adaptive.currents("L")[steady] == approx(expected, abs=1e-4)
+
+
+def test_current_source():
+    netlist = Netlist()
+    netlist.add_current_source("I", "0", "a", Quantity(2 * prefixes.milli * units.ampere))
+    netlist.add_resistor("R", "a", "0", RESISTANCE)
+    netlist.add_capacitor("C", "a", "0", CAPACITANCE)
+    solution = simulate_transient(netlist, 5e-3, 1e-6)
+    expected = rc_law.calculate_capacitor_voltage_batch(2.0, CAPACITANCE, RESISTANCE,
+        solution.times)
+    assert solution.voltages("a") == approx(expected, abs=1e-6)
+    assert solution.currents("I") == approx(np.full(len(solution.times), 2e-3))
+
+
+def test_sparse_stepping(monkeypatch):
+    importorskip("scipy")
+    dense = simulate_transient(_integrator(), 5e-3, 1e-5)
+    dense_adaptive = simulate_transient_adaptive(_integrator(), 5e-3)
+    monkeypatch.setattr(transient, "DENSE_STEP_LIMIT", 0)
+    sparse = simulate_transient(_integrator(), 5e-3, 1e-5)
+    assert sparse.voltages("out") == approx(dense.voltages("out"), abs=1e-12)
+    assert sparse.currents("V") == approx(dense.currents("V"), abs=1e-12)
+    sparse_adaptive = simulate_transient_adaptive(_integrator(), 5e-3)
+    assert sparse_adaptive.times == approx(dense_adaptive.times)
+    # rounding errors of solvers change accepted steps slightly
+    assert sparse_adaptive.voltages("out") == approx(dense_adaptive.voltages("out"), abs=1e-9)
+
+
+def test_bad_simulation():
+    netlist = _integrator()
+    with raises(ValueError):
+        simulate_transient(netlist, 1e-3, 0)
+    with raises(errors.UnitsError):
+        simulate_transient(netlist, Quantity(1 * units.meter), 1e-6)
+    with raises(ValueError):
+        simulate_transient(netlist, 1e-3, 1e-6, waveforms={"R": 1.0})
+    with raises(ValueError):
+        simulate_transient(netlist, 1e-3, 1e-6, initial_conditions={"R": 1.0})
+    with raises(errors.UnitsError):
+        simulate_transient(netlist, 1e-3, 1e-6, initial_conditions={"C": Quantity(units.ampere)})
+    with raises(ValueError):
+        simulate_transient_adaptive(netlist, 1e-3, max_steps=2)
+    # capacitor in parallel with voltage source can not have zero initial voltage
+    netlist.add_capacitor("C2", "in", "0", 1e-6)
+    with raises(ValueError):
+        simulate_transient(netlist, 1e-3, 1e-6)
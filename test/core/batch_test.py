@@ -0,0 +1,171 @@
+from pytest import approx, importorskip, raises
+from sympy import Eq
+from symplyphysics import errors, units, Quantity, Symbol
+from symplyphysics.core.batch import BatchLaw, BatchSum
+from symplyphysics.core.dimensions import si_scale_factor, si_unit
+from symplyphysics.core.operations.sum_array import SumArray
+from symplyphysics.laws.gravity import gravity_force_from_mass_and_distance as gravity_law
+
+np = importorskip("numpy")
+
+
+def test_si_unit():
+    assert si_unit(units.force) == units.kilogram * units.meter / units.second**2
+    assert si_unit(units.length) == units.meter
+    assert si_unit(units.mass / units.length**3) == units.kilogram / units.meter**3
+
+
+def test_si_scale_factor():
+    # SymPy scale factors are relative to gram
+    assert si_scale_factor(units.mass) == 1000
+    assert si_scale_factor(units.length) == 1
+    assert si_scale_factor(units.energy) == 1000
+
+
+def test_basic_batch():
+    force = Symbol("force", units.force)
+    mass = Symbol("mass", units.mass)
+    acceleration = Symbol("acceleration", units.acceleration)
+    batch = BatchLaw(Eq(force, mass * acceleration),
+        force,
+        mass_=mass,
+        acceleration_=acceleration)
+    result = batch(np.array([1.0, 2.0, 3.0]), 2.0)
+    assert result == approx([2.0, 4.0, 6.0])
+    result = batch(acceleration_=[1.0, 2.0], mass_=3.0)
+    assert result == approx([3.0, 6.0])
+    assert batch.unit == units.kilogram * units.meter / units.second**2
+
+
+def test_batch_with_units():
+    force = Symbol("force", units.force)
+    mass = Symbol("mass", units.mass)
+    acceleration = Symbol("acceleration", units.acceleration)
+    batch = BatchLaw(Eq(force, mass * acceleration),
+        force,
+        mass_=mass,
+        acceleration_=acceleration)
+    result = batch(([1000.0, 2000.0], units.gram), Quantity(2 * units.meter / units.second**2))
+    assert result == approx([2.0, 4.0])
+    result = batch(([1.0, 2.0], units.kilogram), (100, units.centimeter / units.second**2))
+    assert result == approx([1.0, 2.0])
+
+
+def test_batch_with_constants():
+    energy = Symbol("energy", units.energy)
+    mass = Symbol("mass", units.mass)
+    batch = BatchLaw(Eq(energy, mass * units.speed_of_light**2), energy, mass_=mass)
+    assert batch([1.0]) == approx([299792458.0**2])
+
+
+def test_constant_solution_is_broadcast():
+    force = Symbol("force", units.force)
+    mass = Symbol("mass", units.mass)
+    batch = BatchLaw(Eq(force, Quantity(units.newton)), force, mass_=mass)
+    assert batch([1.0, 2.0, 3.0]) == approx([1.0, 1.0, 1.0])
+
+
+def test_bad_batch_units():
+    force = Symbol("force", units.force)
+    mass = Symbol("mass", units.mass)
+    acceleration = Symbol("acceleration", units.acceleration)
+    batch = BatchLaw(Eq(force, mass * acceleration),
+        force,
+        mass_=mass,
+        acceleration_=acceleration)
+    with raises(errors.UnitsError):
+        batch(([1.0, 2.0], units.meter), 1.0)
+    with raises(errors.UnitsError):
+        batch(Quantity(1 * units.second), 1.0)
+
+
+def test_bad_batch_arguments():
+    force = Symbol("force", units.force)
+    mass = Symbol("mass", units.mass)
+    acceleration = Symbol("acceleration", units.acceleration)
+    batch = BatchLaw(Eq(force, mass * acceleration),
+        force,
+        mass_=mass,
+        acceleration_=acceleration)
+    with raises(TypeError):
+        batch(1.0)
+    with raises(TypeError):
+        batch(1.0, 2.0, 3.0)
+    with raises(TypeError):
+        batch(1.0, 2.0, mass_=1.0)
+    with raises(TypeError):
+        batch(1.0, velocity_=2.0)
+
+
+def test_batch_is_named_after_function():
+    batch = gravity_law.calculate_force_batch
+    with raises(errors.UnitsError, match="calculate_force_batch"):
+        batch((1.0, units.second), 1.0, 1.0)
+    with raises(TypeError, match="calculate_force_batch"):
+        batch(1.0)
+
+
+def test_missing_inputs():
+    force = Symbol("force", units.force)
+    mass = Symbol("mass", units.mass)
+    acceleration = Symbol("acceleration", units.acceleration)
+    batch = BatchLaw(Eq(force, mass * acceleration), force, mass_=mass)
+    with raises(ValueError):
+        batch(1.0)
+
+
+def test_bad_law_dimension():
+    force = Symbol("force", units.force)
+    mass = Symbol("mass", units.mass)
+    batch = BatchLaw(Eq(force, mass), force, mass_=mass)
+    with raises(errors.UnitsError):
+        batch(1.0)
+
+
+def test_batch_sum():
+    lengths = Symbol("lengths", units.length)
+    total_length = Symbol("total_length", units.length)
+    batch = BatchSum(Eq(total_length, SumArray(lengths)), total_length, lengths_=lengths)
+    assert batch(np.arange(1.0, 1001.0)) == approx(500500.0)
+    assert batch(np.ones((4, 10))) == approx(np.full(4, 10.0))
+    assert batch(([1.0, 2.0], units.centimeter)) == approx(0.03)
+    assert batch([Quantity(1 * units.meter), Quantity(50 * units.centimeter)]) == approx(1.5)
+    assert batch([]) == approx(0.0)
+
+
+def test_batch_sum_is_compensated():
+    lengths = Symbol("lengths", units.length)
+    total_length = Symbol("total_length", units.length)
+    batch = BatchSum(Eq(total_length, SumArray(lengths)), total_length, lengths_=lengths)
+    # naive summation loses small components next to large ones
+    components = np.array([1e16, 1.0, -1e16] * 1000)
+    assert batch(components) == 1000.0
+
+
+def test_batch_sum_missing_component():
+    currents = Symbol("currents", units.current)
+    batch = BatchSum(Eq(SumArray(currents), 0), currents, currents_=currents)
+    assert batch([1.0, 2.0, -4.0]) == approx(1.0)
+
+
+def test_bad_batch_sum():
+    lengths = Symbol("lengths", units.length)
+    total_length = Symbol("total_length", units.length)
+    total_mass = Symbol("total_mass", units.mass)
+    with raises(TypeError):
+        BatchSum(Eq(total_length, SumArray(lengths)), total_length)
+    batch = BatchSum(Eq(total_mass, SumArray(lengths)), total_mass, lengths_=lengths)
+    with raises(errors.UnitsError):
+        batch([1.0])
+    batch = BatchSum(Eq(total_length, SumArray(lengths)), total_length, lengths_=lengths)
+    with raises(errors.UnitsError):
+        batch(([1.0], units.second))
+    with raises(TypeError):
+        batch([1.0], [2.0])
+
+
+def test_sum_array_is_flat():
+    lengths = [Symbol(f"length{i}", units.length) for i in range(100)]
+    total = SumArray(*lengths).doit()
+    assert len(total.args) == 100
+    assert set(total.args) == set(lengths)
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+from symplyphysics import units
+from symplyphysics.core.catalog import (LawCatalog, build_catalog, dimension_key, load_catalog)
+
+
+def _summary(catalog: LawCatalog) -> list[tuple]:
+    return [(law.module, law.kind, law.output, law.inputs, law.functions) for law in catalog.laws]
+
+
+def test_dimension_key():
+    assert dimension_key(units.force) == "length*mass*time**-2"
+    assert dimension_key(units.length / units.length) == ""
+    assert dimension_key(units.velocity) == dimension_key(units.length / units.time)
+    assert dimension_key("length") == "length"
+
+
+def test_find_by_output_dimension():
+    catalog = load_catalog()
+    modules = [law.module for law in catalog.find_by_output_dimension(units.pressure)]
+    assert "symplyphysics.laws.hydro.hydrostatic_pressure_from_density_and_depth" in modules
+    for law in catalog.find_by_output_dimension(units.pressure):
+        assert law.output is None or law.output.dimension == dimension_key(units.pressure)
+
+
+def test_find_by_symbol():
+    catalog = load_catalog()
+    law = catalog.get("symplyphysics.laws.dynamics.acceleration_from_force")
+    assert law is not None
+    assert law.kind == "law"
+    assert law.output.name == "acceleration"
+    assert {s.name for s in law.inputs} == {"force", "mass"}
+    assert law in catalog.find_by_symbol("force")
+    assert law in catalog.find_by_dimension(units.mass)
+    assert [f.name for f in law.functions] == ["calculate_force"]
+    assert law.equation == "acceleration = force/mass"
+    # output of the function is taken from @validate_output, when it is not named after it
+    admittance = catalog.get("symplyphysics.definitions.admittance_is_inversed_impedance")
+    assert admittance is not None
+    assert [(f.name, f.output) for f in admittance.functions] == [("calculate_admittance",
+        "dipole_admittance")]
+    assert catalog.get("symplyphysics.laws.unknown") is None
+    assert not catalog.find_by_symbol("unknown_symbol")
+
+
+# Catalog module is loaded by its path, so that neither the package nor SymPy are imported
+def test_load_without_package():
+    code = """
+import importlib.util
+import os
+import sys
+
+spec = importlib.util.find_spec("symplyphysics")
+path = os.path.join(spec.submodule_search_locations[0], "core", "catalog.py")
+spec = importlib.util.spec_from_file_location("symplyphysics_catalog", path)
+catalog = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(catalog)
+laws = catalog.load_catalog().find_by_output_dimension("length**-1*mass*time**-2")
+print(len(laws), "symplyphysics" in sys.modules, "sympy" in sys.modules)
+"""
+    result = subprocess.run([sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True)
+    (count, package_imported, sympy_imported) = result.stdout.split()
+    assert int(count) == len(load_catalog().find_by_output_dimension(units.pressure))
+    assert package_imported == "False"
+    assert sympy_imported == "False"
+
+
+def test_save_and_load(tmp_path):
+    catalog = load_catalog()
+    path = str(tmp_path / "catalog.json")
+    catalog.save(path)
+    assert _summary(LawCatalog.load(path)) == _summary(catalog)
+
+
+# Catalog file should be regenerated with 'python -m symplyphysics.core.catalog' when laws change
+def test_catalog_is_up_to_date():
+    assert _summary(build_catalog()) == _summary(load_catalog())
@@ -0,0 +1,89 @@
+from pytest import approx, importorskip, raises
+from sympy import Eq
+from symplyphysics import units, Quantity, Symbol, errors
+from symplyphysics.core.composition import compose_laws
+from symplyphysics.laws.dynamics import acceleration_from_force as newton_law
+from symplyphysics.laws.kinematic import centripetal_acceleration_is_squared_velocity_by_radius as centripetal_law
+from symplyphysics.laws.gravity import free_fall_acceleration_from_height as free_fall_law
+
+np = importorskip("numpy")
+
+_LINKS = {
+    centripetal_law.centripetal_acceleration: free_fall_law.free_fall_acceleration,
+    centripetal_law.curve_radius: free_fall_law.planet_radius + free_fall_law.height_above_surface,
+}
+
+
+def _satellite_velocity_law():
+    return compose_laws([centripetal_law, free_fall_law],
+        centripetal_law.linear_velocity,
+        links=_LINKS,
+        solutions={centripetal_law.linear_velocity: 1},
+        planet_mass_=free_fall_law.planet_mass,
+        planet_radius_=free_fall_law.planet_radius,
+        height_=free_fall_law.height_above_surface)
+
+
+def test_basic_composition():
+    law = _satellite_velocity_law()
+    assert [s.symbol for s in law.steps
+           ] == [free_fall_law.free_fall_acceleration, centripetal_law.linear_velocity]
+    assert law.steps[1].dependencies == (free_fall_law.free_fall_acceleration,)
+    assert law.expression.free_symbols == {
+        free_fall_law.planet_mass, free_fall_law.planet_radius, free_fall_law.height_above_surface
+    }
+    result = law(Quantity(5.9722e24 * units.kilogram), (6371, units.kilometer),
+        (np.array([100, 35786]), units.kilometer))
+    assert result == approx([7848.5, 3074.7], rel=1e-4)
+
+
+def test_unused_laws_are_dropped():
+    law = compose_laws([newton_law, centripetal_law, free_fall_law],
+        centripetal_law.linear_velocity,
+        links=_LINKS,
+        solutions={centripetal_law.linear_velocity: 1},
+        planet_mass_=free_fall_law.planet_mass,
+        planet_radius_=free_fall_law.planet_radius,
+        height_=free_fall_law.height_above_surface,
+        mass_=newton_law.mass,
+        force_=newton_law.force)
+    assert [s.symbol for s in law.steps
+           ] == [free_fall_law.free_fall_acceleration, centripetal_law.linear_velocity]
+
+
+def test_equations_composition():
+    x = Symbol("x", units.length)
+    y = Symbol("y", units.length)
+    z = Symbol("z", units.area)
+    law = compose_laws([Eq(z, x * y), Eq(y, 2 * x)], z, x_=x)
+    assert law(np.array([1.0, 3.0])) == approx([2.0, 18.0])
+
+
+def test_bad_composition():
+    with raises(ValueError):
+        compose_laws([centripetal_law, free_fall_law],
+            centripetal_law.linear_velocity,
+            planet_mass_=free_fall_law.planet_mass)
+    with raises(ValueError):
+        compose_laws([centripetal_law, free_fall_law],
+            centripetal_law.linear_velocity,
+            links=_LINKS,
+            solutions={centripetal_law.linear_velocity: 2},
+            planet_mass_=free_fall_law.planet_mass,
+            planet_radius_=free_fall_law.planet_radius,
+            height_=free_fall_law.height_above_surface)
+    with raises(ValueError):
+        compose_laws([newton_law], newton_law.force, force_=newton_law.force)
+    # wrong link makes dimension of the result incorrect
+    law = compose_laws([centripetal_law, free_fall_law],
+        centripetal_law.linear_velocity,
+        links={
+        centripetal_law.centripetal_acceleration: free_fall_law.free_fall_acceleration,
+        centripetal_law.curve_radius: free_fall_law.planet_mass,
+        },
+        solutions={centripetal_law.linear_velocity: 1},
+        planet_mass_=free_fall_law.planet_mass,
+        planet_radius_=free_fall_law.planet_radius,
+        height_=free_fall_law.height_above_surface)
+    with raises(errors.UnitsError):
+        law(1, 1, 1)
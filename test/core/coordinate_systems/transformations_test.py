@@ -0,0 +1,93 @@
+from pytest import fixture, importorskip, raises
+from sympy import atan, cos, pi, sin, sqrt, symbols
+from symplyphysics import units, Quantity, QuantityVector, Vector
+from symplyphysics.core.coordinate_systems.coordinate_systems import (CoordinateSystem,
+    coordinates_rotate, coordinates_transform)
+from symplyphysics.core.coordinate_systems.transformations import (transform_array,
+    transformation_cache_clear, transformation_cache_size, vector_transformation)
+from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.registries import RegistryScope
+
+
+@fixture(name="cartesian")
+def cartesian_fixture() -> CoordinateSystem:
+    transformation_cache_clear()
+    return CoordinateSystem()
+
+
+def test_transformation_is_cached(cartesian: CoordinateSystem) -> None:
+    spherical = coordinates_transform(cartesian, CoordinateSystem.System.SPHERICAL)
+    transformation = vector_transformation(cartesian, spherical)
+    assert vector_transformation(cartesian, spherical) is transformation
+    assert transformation_cache_size() == 1
+
+    first = Vector([1, 2], cartesian).rebase(spherical)
+    second = Vector([2, 4], cartesian).rebase(spherical)
+    assert transformation_cache_size() == 1
+    assert first.components == [sqrt(5), atan(2), pi / 2]
+    assert expr_equals(second.components[0], 2 * sqrt(5))
+
+
+def test_rotated_system(cartesian: CoordinateSystem) -> None:
+    theta = symbols("theta")
+    rotated = coordinates_rotate(cartesian, theta, cartesian.coord_system.k)
+    (x, y, _) = vector_transformation(cartesian, rotated).components
+    assert expr_equals(y.diff(theta), -x)
+    vector = Vector([1, 2], cartesian).rebase(rotated)
+    assert vector.coordinate_system == rotated
+    assert expr_equals(vector.components[0], cos(theta) + 2 * sin(theta))
+    assert expr_equals(vector.components[1], 2 * cos(theta) - sin(theta))
+
+    # scale factors are rotated without creating quantities
+    force = QuantityVector([Quantity(3 * units.newton), Quantity(4 * units.newton)], cartesian)
+    rebased = force.rebase(rotated)
+    assert rebased.dimension == units.force
+    assert expr_equals(rebased.scale_factors[0]**2 + rebased.scale_factors[1]**2,
+        force.scale_factors[0]**2 + force.scale_factors[1]**2)
+
+
+def test_released_system_is_dropped(cartesian: CoordinateSystem) -> None:
+    with RegistryScope():
+        rotated = coordinates_rotate(cartesian, pi / 3, cartesian.coord_system.k)
+        Vector([1, 0], cartesian).rebase(rotated)
+        assert transformation_cache_size() == 1
+    assert transformation_cache_size() == 0
+
+
+def test_transform_array(cartesian: CoordinateSystem) -> None:
+    np = importorskip("numpy")
+    points = np.array([[1.0, 1.0, 2.0], [0.0, -3.0, 0.5], [2.0, 0.0, -1.0]])
+    cylindrical = transform_array(points, CoordinateSystem.System.CARTESIAN,
+        CoordinateSystem.System.CYLINDRICAL)
+    assert np.allclose(cylindrical[0], [np.sqrt(2), np.pi / 4, 2.0])
+    back = transform_array(cylindrical, CoordinateSystem.System.CYLINDRICAL,
+        CoordinateSystem.System.CARTESIAN)
+    assert np.allclose(back, points)
+
+    # cylindrical to spherical goes through cartesian coordinates
+    spherical = transform_array(cylindrical, CoordinateSystem.System.CYLINDRICAL,
+        CoordinateSystem.System.SPHERICAL)
+    assert np.allclose(
+        spherical,
+        transform_array(points, CoordinateSystem.System.CARTESIAN,
+        CoordinateSystem.System.SPHERICAL))
+    assert transform_array([0.0, 2.0, 0.0], CoordinateSystem.System.CARTESIAN,
+        CoordinateSystem.System.SPHERICAL).shape == (3,)
+
+    rotated = coordinates_rotate(cartesian, pi / 2, cartesian.coord_system.k)
+    assert np.allclose(transform_array(points, cartesian, rotated)[0], [1.0, -1.0, 2.0])
+    for (point, vector) in zip(transform_array(points, cartesian, rotated), points):
+        rebased = Vector(list(vector), cartesian).rebase(rotated)
+        assert np.allclose(point, [float(c) for c in rebased.components])
+
+
+def test_bad_transform_array(cartesian: CoordinateSystem) -> None:
+    importorskip("numpy")
+    rotated = coordinates_rotate(cartesian, symbols("theta"), cartesian.coord_system.k)
+    with raises(ValueError):
+        transform_array([1.0, 2.0, 3.0], cartesian, rotated)
+    with raises(ValueError):
+        transform_array([[1.0, 2.0]], CoordinateSystem.System.CARTESIAN,
+            CoordinateSystem.System.CYLINDRICAL)
+    with raises(TypeError):
+        transform_array([1.0, 2.0, 3.0], cartesian, CoordinateSystem.System.CYLINDRICAL)
@@ -0,0 +1,54 @@
+from pytest import raises
+from sympy import S, Float, Integer, exp
+from symplyphysics import errors, units, Quantity, SI, dimensionless
+from symplyphysics.core.dimensions import (assert_equivalent_dimension, cache_clear,
+    collect_factor_and_dimension)
+
+
+def test_collect_quantity():
+    q = Quantity(2 * units.meter)
+    (factor, dimension) = collect_factor_and_dimension(q)
+    assert factor == 2
+    assert dimension == units.length
+
+
+def test_collect_expression():
+    expr = 3 * units.kilogram * units.meter / units.second**2 + 2 * units.newton
+    (factor, dimension) = collect_factor_and_dimension(expr)
+    assert factor == 5000
+    assert SI.get_dimension_system().equivalent_dims(dimension, units.force)
+
+
+def test_collect_is_cached():
+    cache_clear()
+    expr = 4 * units.meter / units.second
+    first = collect_factor_and_dimension(expr)
+    misses = collect_factor_and_dimension.cache_info().misses
+    second = collect_factor_and_dimension(4 * units.meter / units.second)
+    assert first is second
+    assert collect_factor_and_dimension.cache_info().misses == misses
+
+
+def test_collect_number_types():
+    assert isinstance(collect_factor_and_dimension(Float(1.0))[0], Float)
+    assert isinstance(collect_factor_and_dimension(Integer(1))[0], Integer)
+    assert collect_factor_and_dimension(S.One)[1] == dimensionless
+
+
+def test_collect_bad_dimensions():
+    with raises(ValueError):
+        collect_factor_and_dimension(units.meter + units.second)
+    with raises(ValueError):
+        collect_factor_and_dimension(exp(units.meter))
+    with raises(ValueError):
+        collect_factor_and_dimension(units.meter**units.second)
+
+
+def test_assert_equivalent_dimension():
+    assert_equivalent_dimension(Quantity(units.newton), "arg", "f",
+        units.mass * units.acceleration)
+    assert_equivalent_dimension(Quantity(units.radian), "arg", "f", dimensionless)
+    with raises(errors.UnitsError):
+        assert_equivalent_dimension(Quantity(units.newton), "arg", "f", units.energy)
+    with raises(TypeError):
+        assert_equivalent_dimension(1, "arg", "f", units.energy)
@@ -0,0 +1,157 @@
+import importlib
+import importlib.util
+import inspect
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+from pytest import MonkeyPatch, fixture
+from sympy import Derivative, Eq, Symbol as SymSymbol
+from symplyphysics import units, Function, Quantity, Symbol
+from symplyphysics.core import dimensions, disk_cache, expr_comparisons, solved_forms
+from symplyphysics.core.disk_cache import (DiskCache, active_disk_cache, disable_disk_cache,
+    enable_disk_cache, run_derivation)
+from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.solved_forms import cache_clear, dsolve_for, solve_for
+
+
+# Restores the cache, that might be enabled for the test run
+@fixture(autouse=True)
+def restore_cache_fixture(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(disk_cache, "_active_cache", active_disk_cache())
+
+
+@fixture(name="cache")
+def cache_fixture(tmp_path: Path) -> Iterator[DiskCache]:
+    cache_clear()
+    yield enable_disk_cache(str(tmp_path / "cache"))
+    cache_clear()
+
+
+def _entries(cache: DiskCache) -> list[str]:
+    return [name for (_, _, files) in os.walk(cache.directory) for name in files]
+
+
+def test_solved_form_is_loaded_for_new_symbols(cache: DiskCache) -> None:
+    force = Symbol("force", units.force)
+    mass = Symbol("mass", units.mass)
+    acceleration = Symbol("acceleration", units.acceleration)
+    assert expr_equals(solve_for(Eq(force, mass * acceleration), mass), force / acceleration)
+    assert cache.misses == 1
+    assert len(_entries(cache)) == 1
+
+    # symbols of another process have different generated names
+    cache_clear()
+    other_force = Symbol("force", units.force)
+    other_mass = Symbol("mass", units.mass)
+    other_acceleration = Symbol("acceleration", units.acceleration)
+    assert other_force.name != force.name
+    solved = solve_for(Eq(other_force, other_mass * other_acceleration), other_mass)
+    assert cache.hits == 1
+    assert solved == other_force / other_acceleration
+    assert solved.free_symbols == {other_force, other_acceleration}
+
+
+def test_changed_law_is_not_hit(cache: DiskCache) -> None:
+    x = Symbol("x")
+    y = Symbol("y")
+    solve_for(Eq(y, 2 * x), x)
+    cache_clear()
+    assert expr_equals(solve_for(Eq(y, 3 * x), x), y / 3)
+    assert cache.hits == 0
+    assert len(_entries(cache)) == 2
+
+
+def test_dsolve_is_cached(cache: DiskCache) -> None:
+    time = Symbol("time", units.time)
+    energy = Function("energy", units.energy)
+    solved = dsolve_for(Eq(Derivative(energy(time), time), 0), energy(time))
+    cache_clear()
+    assert dsolve_for(Eq(Derivative(energy(time), time), 0), energy(time)) == solved
+    assert cache.hits == 1
+    assert solved.lhs == energy(time)
+
+
+def test_ambiguous_names_are_not_cached(cache: DiskCache) -> None:
+    first = Symbol("mass", units.mass)
+    second = Symbol("mass", units.mass)
+    assert expr_equals(solve_for(Eq(first, 2 * second), second), first / 2)
+    quantity = Quantity(units.newton)
+    force = Symbol("force", units.force)
+    solve_for(Eq(force, quantity), force)
+    plain = SymSymbol("_force")
+    solve_for(Eq(force, plain), force)
+    assert not _entries(cache)
+
+
+def test_concurrent_writes(cache: DiskCache) -> None:
+    key = cache.key("test", "value")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: cache.set(key, i), range(64)))
+    assert cache.get(key) in range(64)
+    assert [n for n in _entries(cache) if not n.endswith(".pickle")] == []
+
+
+def test_corrupted_entry_is_missing(cache: DiskCache) -> None:
+    key = cache.key("test", "value")
+    cache.set(key, 1)
+    path = next(Path(cache.directory).rglob("*.pickle"))
+    path.write_bytes(b"not a pickle")
+    assert cache.get(key) != 1
+    cache.clear()
+    assert not _entries(cache)
+
+
+def test_derivation_is_run_once(cache: DiskCache, tmp_path: Path) -> None:
+    law_path = tmp_path / "law_with_derivation.py"
+    law_path.write_text("runs = []\n\n\ndef verify_derivation():\n    runs.append(1)\n")
+    spec = importlib.util.spec_from_file_location("law_with_derivation", law_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert not cache.run_derivation(module)
+    assert cache.run_derivation(module)
+    run_derivation(module)
+    assert module.runs == [1]
+
+    # derivation is run again when the source changes
+    law_path.write_text(law_path.read_text() + "# changed\n")
+    importlib.invalidate_caches()
+    spec.loader.exec_module(module)
+    run_derivation(module)
+    assert module.runs == [1]
+
+
+def test_derivation_is_run_when_dependency_changes(cache: DiskCache, tmp_path: Path,
+    monkeypatch: MonkeyPatch) -> None:
+    package_path = tmp_path / "derivation_package"
+    package_path.mkdir()
+    (package_path / "__init__.py").write_text("")
+    (package_path / "helper.py").write_text("def prove():\n    return True\n")
+    (package_path / "middle.py").write_text("from .helper import prove\n")
+    (package_path / "law.py").write_text("from derivation_package.middle import prove\n\n"
+        "runs = []\n\n\ndef verify_derivation():\n    runs.append(prove())\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("derivation_package.law")
+    run_derivation(module)
+    run_derivation(module)
+    assert module.runs == [True]
+
+    # helper is imported transitively through the middle module
+    (package_path / "helper.py").write_text("def prove():\n    return False\n")
+    importlib.invalidate_caches()
+    run_derivation(module)
+    assert module.runs == [True, True]
+    assert cache.hits == 1
+
+
+def test_derivation_depends_on_core() -> None:
+    law = importlib.import_module("symplyphysics.laws.thermodynamics.temperature_is_constant")
+    sources = disk_cache._module_sources(law)  # pylint: disable=protected-access
+    for core_module in (solved_forms, expr_comparisons, dimensions):
+        assert inspect.getsource(core_module) in sources
+
+
+def test_disabled_cache() -> None:
+    disable_disk_cache()
+    assert active_disk_cache() is None
@@ -1,5 +1,7 @@
-from sympy import symbols, sin, cos, pi
-from symplyphysics.core.expr_comparisons import expr_equals, expr_equals_abs
+from sympy import Function, symbols, sin, cos, pi, sqrt, exp, Min, Heaviside
+from sympy.vector import CoordSys3D
+from symplyphysics.core.expr_comparisons import (comparison_stats, expr_equals, expr_equals_abs,
+    reset_comparison_stats)
 
 
 def test_basic_comparison():
@@ -33,3 +35,63 @@ def test_basic_abs_comparison():
     assert expr_equals_abs(x1, -x1)
     assert expr_equals_abs(-x1, -x1)
     assert not expr_equals_abs(x1, x2)
+
+
+def test_comparison_stages():
+    x1, x2 = symbols("x1 x2")
+    reset_comparison_stats()
+    assert expr_equals(x1 + x2, x2 + x1)
+    assert comparison_stats() == (1, 0, 0)
+    assert expr_equals((x1 + x2)**2, x1**2 + 2 * x1 * x2 + x2**2)
+    assert not expr_equals(sin(x1)**2, cos(x1)**2)
+    assert comparison_stats() == (1, 2, 0)
+    reset_comparison_stats()
+    assert comparison_stats().numeric == 0
+
+
+def test_strict_comparison():
+    x1 = symbols("x1")
+    reset_comparison_stats()
+    assert expr_equals(sin(x1)**2 + cos(x1)**2, 1, strict=True)
+    assert comparison_stats().simplify == 1
+    assert not expr_equals(sin(x1), cos(x1), strict=True)
+    assert comparison_stats().numeric == 1
+
+
+def test_comparison_respects_assumptions():
+    x1 = symbols("x1")
+    positive = symbols("positive", positive=True)
+    assert not expr_equals(sqrt(x1**2), x1)
+    assert expr_equals(sqrt(positive**2), positive)
+    integer = symbols("integer", integer=True)
+    assert expr_equals(cos(2 * pi * integer), 1)
+
+
+def test_undefined_functions_are_simplified():
+    x1 = symbols("x1")
+    f = Function("f")
+    reset_comparison_stats()
+    assert expr_equals(f(x1) * (x1 + 1), f(x1) * x1 + f(x1))  # pylint: disable=not-callable
+    assert comparison_stats().simplify == 1
+
+
+def test_vector_comparison():
+    (i, j, _) = CoordSys3D("coordinates").base_vectors()
+    x1 = symbols("x1")
+    assert expr_equals((x1 + 1)**2 * i, (x1**2 + 2 * x1 + 1) * i)
+    assert not expr_equals(x1 * i, x1 * j)
+
+
+def test_small_differences():
+    x1 = symbols("x1")
+    assert not expr_equals(6.62e-34 * x1, 0)
+    assert not expr_equals(exp(-50 * x1), 0)
+    assert not expr_equals(x1, x1 + 1e-11)
+
+
+def test_piecewise_functions_are_simplified():
+    x1 = symbols("x1")
+    reset_comparison_stats()
+    assert not expr_equals(Min(x1, 3), x1)
+    assert not expr_equals(Heaviside(x1 - 50), 0)
+    assert comparison_stats().numeric == 0
@@ -1,10 +1,11 @@
+import signal
 from collections import namedtuple
 from typing import Sequence
-from pytest import approx, fixture, mark, raises
+from pytest import approx, fixture, importorskip, mark, raises, skip
 from sympy import Expr, cos, pi, sin, sqrt, Symbol as SymSymbol
 from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem
 from symplyphysics.core.dimensions import ScalarValue
-from symplyphysics.core.fields.analysis import circulation_along_curve, circulation_along_surface_boundary, flux_across_curve, flux_across_surface, flux_across_surface_boundary, flux_across_volume_boundary
+from symplyphysics.core.fields.analysis import NUMERIC, circulation_along_curve, circulation_along_curve_with_error, circulation_along_surface_boundary, flux_across_curve, flux_across_surface, flux_across_surface_boundary, flux_across_volume_boundary
 from symplyphysics.core.fields.vector_field import VectorField
 from symplyphysics.core.points.cartesian_point import CartesianPoint
 from symplyphysics.core.points.cylinder_point import CylinderPoint
@@ -214,3 +215,140 @@ def test_basic_flux_across_sphere_boundary():
     field = VectorField(field_function, B)
     result = flux_across_volume_boundary(field, (1, 2), (0, 2 * pi), (0, 5))
     assert result.evalf(4) == approx((150 * pi).evalf(4), 0.001)
+
+
+# Test numeric integration
+
+
+def test_numeric_circulation_along_curve(test_args):
+    importorskip("numpy")
+    field = VectorField(lambda point: [point.y, 0, point.x + point.z], test_args.C)
+    curve = [cos(test_args.parameter1), sin(test_args.parameter1)]
+    result = circulation_along_curve(field,
+        curve, (test_args.parameter1, 0, pi / 2),
+        method=NUMERIC)
+    assert result == approx(float(-pi / 4), 1e-8)
+
+
+def test_numeric_flux_across_curve(test_args):
+    importorskip("numpy")
+    field = VectorField(lambda point: [point.x, point.y], test_args.C)
+    ellipse = [2 * cos(test_args.parameter1), sin(test_args.parameter1)]
+    symbolic = flux_across_curve(field, ellipse, (test_args.parameter1, 0, 2 * pi))
+    numeric = flux_across_curve(field,
+        ellipse, (test_args.parameter1, 0, 2 * pi),
+        method=NUMERIC,
+        tolerance=1e-10)
+    assert numeric == approx(float(symbolic), 1e-8)
+
+
+def test_numeric_gravitational_field_flux(test_args):
+    importorskip("numpy")
+    field = VectorField(
+        lambda point: [
+        point.x / _distance(point)**3, point.y / _distance(point)**3, point.z / _distance(point)**3
+        ], test_args.C)
+    sphere = [
+        cos(test_args.parameter1) * sin(test_args.parameter2),
+        sin(test_args.parameter1) * sin(test_args.parameter2),
+        cos(test_args.parameter2)
+    ]
+    result = flux_across_surface(field,
+        sphere, (test_args.parameter1, 0, 2 * pi), (test_args.parameter2, 0, pi),
+        method=NUMERIC)
+    assert abs(result) == approx(float(4 * pi), 1e-6)
+
+
+def test_numeric_flux_across_surface_boundary(test_args):
+    importorskip("numpy")
+    field = VectorField(lambda point: [point.x**2, point.y], test_args.C)
+    x = field.coordinate_system.coord_system.base_scalars()[0]
+    y = field.coordinate_system.coord_system.base_scalars()[1]
+    result = flux_across_surface_boundary(field, [x, y], (x, -sqrt(9 - y**2), sqrt(9 - y**2)),
+        (y, -3, 3),
+        method=NUMERIC)
+    assert result == approx(float(9 * pi), 1e-6)
+
+
+def test_numeric_flux_across_volume_boundary(test_args):
+    importorskip("numpy")
+    field = VectorField(lambda point: [point.x**2 / 2, point.y * point.z, -point.x * point.z],
+        test_args.C)
+    x = field.coordinate_system.coord_system.base_scalars()[0]
+    y = field.coordinate_system.coord_system.base_scalars()[1]
+    result = flux_across_volume_boundary(field, (-2, 2), (-sqrt(4 - x**2), sqrt(4 - x**2)),
+        (0, sqrt(4 - x**2 - y**2)),
+        method=NUMERIC)
+    assert result == approx(float(4 * pi), 1e-6)
+    B = CoordinateSystem(CoordinateSystem.System.CYLINDRICAL)
+    field = VectorField(lambda p: [p.radius**3, 0, 0], B)
+    result = flux_across_volume_boundary(field, (1, 2), (0, 2 * pi), (0, 5), method=NUMERIC)
+    assert result == approx(float(150 * pi), 1e-6)
+
+
+def test_numeric_integration_error(test_args):
+    importorskip("numpy")
+    field = VectorField(lambda point: [point.y, 0, point.x + point.z], test_args.C)
+    curve = [cos(test_args.parameter1), sin(test_args.parameter1)]
+    (value, error) = circulation_along_curve_with_error(field,
+        curve, (test_args.parameter1, 0, pi / 2),
+        method=NUMERIC,
+        tolerance=1e-10)
+    assert value == approx(float(-pi / 4), 1e-10)
+    assert 0 <= error < 1e-10
+    assert abs(value - float(-pi / 4)) <= error + 1e-15
+    # symbolic integrals are exact
+    (value, error) = circulation_along_curve_with_error(field, curve,
+        (test_args.parameter1, 0, pi / 2))
+    assert value == -pi / 4
+    assert error == 0
+
+
+def test_symbolic_integration_falls_back_to_numeric(test_args):
+    importorskip("numpy")
+    field = VectorField(
+        lambda point: [
+        point.x / _distance(point)**3, point.y / _distance(point)**3, point.z / _distance(point)**3
+        ], test_args.C)
+    sphere = [
+        cos(test_args.parameter1) * sin(test_args.parameter2),
+        sin(test_args.parameter1) * sin(test_args.parameter2),
+        cos(test_args.parameter2)
+    ]
+    result = flux_across_surface(field,
+        sphere, (test_args.parameter1, 0, 2 * pi), (test_args.parameter2, 0, pi),
+        time_budget=0.1)
+    # SymPy may take the cached integral within the budget
+    assert float(abs(result)) == approx(float(4 * pi), 1e-6)
+
+
+def test_time_budget_keeps_outer_timer(test_args):
+    importorskip("numpy")
+    if not hasattr(signal, "setitimer"):
+        skip("Timer signals are not available")
+    field = VectorField(lambda point: [point.x**2, point.y], test_args.C)
+    x = field.coordinate_system.coord_system.base_scalars()[0]
+    y = field.coordinate_system.coord_system.base_scalars()[1]
+    previous_handler = signal.signal(signal.SIGALRM, signal.SIG_IGN)
+    signal.setitimer(signal.ITIMER_REAL, 60)
+    try:
+        flux_across_surface_boundary(field, [x, y], (x, -sqrt(9 - y**2), sqrt(9 - y**2)),
+            (y, -3, 3),
+            time_budget=0.1)
+        (delay, _) = signal.getitimer(signal.ITIMER_REAL)
+        assert 50 < delay <= 60
+        assert signal.getsignal(signal.SIGALRM) == signal.SIG_IGN
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def test_bad_numeric_integration(test_args):
+    importorskip("numpy")
+    field = VectorField(lambda point: [-point.y, point.x])
+    radius = SymSymbol("radius")
+    circle = [radius * cos(test_args.parameter1), radius * sin(test_args.parameter1)]
+    with raises(ValueError):
+        circulation_along_curve(field, circle, (test_args.parameter1, 0, 2 * pi), method=NUMERIC)
+    with raises(ValueError):
+        circulation_along_curve(field, circle, (test_args.parameter1, 0, 2 * pi), method="other")
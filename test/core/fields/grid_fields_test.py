@@ -0,0 +1,145 @@
+from pytest import approx, importorskip, raises
+from sympy import cos, exp, sin
+from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem
+from symplyphysics.core.fields.grid_fields import (GridScalarField, GridVectorField, UniformGrid,
+    grid_curl, grid_divergence, grid_gradient, grid_laplacian)
+from symplyphysics.core.fields.operators import (curl_operator, divergence_operator,
+    gradient_operator, laplacian_operator)
+from symplyphysics.core.fields.scalar_field import ScalarField
+from symplyphysics.core.fields.vector_field import VectorField
+from symplyphysics.core.points.cartesian_point import CartesianPoint
+from symplyphysics.core.points.cylinder_point import CylinderPoint
+
+np = importorskip("numpy")
+
+CARTESIAN = CoordinateSystem(CoordinateSystem.System.CARTESIAN)
+CYLINDRICAL = CoordinateSystem(CoordinateSystem.System.CYLINDRICAL)
+SPHERICAL = CoordinateSystem(CoordinateSystem.System.SPHERICAL)
+
+
+# Compares interior nodes, where finite differences are central
+def _assert_close(actual, expected, tolerance):
+    inner = tuple(slice(1, -1) if n > 2 else slice(None) for n in actual.shape[:3])
+    assert np.max(np.abs(actual[inner] - expected[inner])) < tolerance
+
+
+def _cartesian_grid(size: int = 41) -> UniformGrid:
+    axis = np.linspace(-1, 1, size)
+    return UniformGrid(axis, axis, axis, coordinate_system=CARTESIAN)
+
+
+def _spherical_grid(size: int = 81) -> UniformGrid:
+    return UniformGrid(np.linspace(1, 2, size),
+        np.linspace(0, 2, size),
+        np.linspace(0.5, 2.5, size),
+        coordinate_system=SPHERICAL)
+
+
+def test_basic_gradient():
+    grid = _cartesian_grid()
+    field = ScalarField(lambda p: p.x**2 * p.y + p.z, CARTESIAN)
+    result = grid_gradient(GridScalarField.from_field(field, grid))
+    expected = gradient_operator(field).evaluate_grid(*grid.axes)
+    assert result.values == approx(expected, abs=1e-12)
+
+
+def test_cylindrical_divergence():
+    grid = UniformGrid(np.linspace(1, 2, 81),
+        np.linspace(0, np.pi, 81),
+        np.linspace(0, 1, 81),
+        coordinate_system=CYLINDRICAL)
+    field = VectorField(lambda p: [p.radius**2 * cos(p.theta), p.radius * sin(p.theta), p.z**2],
+        CYLINDRICAL)
+    result = grid_divergence(GridVectorField.from_field(field, grid))
+    expected = ScalarField.from_expression(divergence_operator(field),
+        CYLINDRICAL).evaluate_grid(*grid.axes)
+    _assert_close(result.values, expected, 1e-3)
+
+
+def test_spherical_curl():
+    grid = _spherical_grid()
+    field = VectorField(
+        lambda p: [
+        cos(p.polar_angle) / p.radius**2,
+        cos(p.polar_angle), p.radius * sin(p.polar_angle) * cos(p.azimuthal_angle)
+        ], SPHERICAL)
+    result = grid_curl(GridVectorField.from_field(field, grid))
+    expected = curl_operator(field).evaluate_grid(*grid.axes)
+    _assert_close(result.values, expected, 1e-3)
+
+
+def test_spherical_laplacian():
+    grid = _spherical_grid()
+    field = ScalarField(
+        lambda p: p.radius**2 * sin(p.polar_angle) * cos(p.azimuthal_angle), SPHERICAL)
+    result = grid_laplacian(GridScalarField.from_field(field, grid))
+    expected = ScalarField.from_expression(laplacian_operator(field),
+        SPHERICAL).evaluate_grid(*grid.axes)
+    # Laplacian is the second derivative, boundary nodes are less accurate
+    inner = (slice(2, -2),) * 3
+    assert np.max(np.abs(result.values[inner] - expected[inner])) < 1e-2
+
+
+def test_vector_laplacian():
+    grid = _cartesian_grid()
+    field = VectorField(lambda p: [exp(p.x) * p.y, p.z**3, sin(p.x)], CARTESIAN)
+    result = grid_laplacian(GridVectorField.from_field(field, grid))
+    expected = laplacian_operator(field).evaluate_grid(*grid.axes)
+    inner = (slice(2, -2),) * 3
+    assert np.max(np.abs(result.values[inner] - expected[inner])) < 1e-2
+
+
+def test_two_dimensional_field():
+    axis = np.linspace(0, 1, 11)
+    grid = UniformGrid(axis, axis, coordinate_system=CARTESIAN)
+    assert grid.shape == (11, 11, 1)
+    assert grid.spacing == approx((0.1, 0.1, 0.0))
+    field = GridVectorField.from_field(VectorField(lambda p: [p.x, p.y], CARTESIAN), grid)
+    assert grid_divergence(field).values == approx(np.full(grid.shape, 2.0))
+
+
+def test_conversion_to_field():
+    grid = _cartesian_grid(11)
+    field = ScalarField(lambda p: 2 * p.x - p.y + 3 * p.z, CARTESIAN)
+    gridded = GridScalarField.from_field(field, grid)
+    interpolated = gridded.to_field()
+    # multilinear interpolation is exact for linear functions
+    assert interpolated(CartesianPoint(0.33, -0.71, 0.05)) == approx(2 * 0.33 + 0.71 + 0.15)
+    points = np.random.default_rng(1).uniform(-1, 1, (100, 3))
+    assert gridded.evaluate_points(points) == approx(field.evaluate_points(points))
+
+    # fields, converted from grids, are interpolated on other grids
+    other_grid = UniformGrid(np.linspace(-0.5, 0.5, 7), coordinate_system=CARTESIAN)
+    resampled = GridScalarField.from_field(interpolated, other_grid)
+    assert resampled.values == approx(field.evaluate_grid(*other_grid.axes))
+
+
+def test_vector_conversion_to_field():
+    grid = UniformGrid(np.linspace(1, 2, 11),
+        np.linspace(0, 1, 11),
+        np.linspace(0, 1, 3),
+        coordinate_system=CYLINDRICAL)
+    field = VectorField(lambda p: [p.radius, p.theta, 1], CYLINDRICAL)
+    gridded = GridVectorField.from_field(field, grid)
+    value = gridded.to_field()(CylinderPoint(1.25, 0.5, 0.5))
+    assert value.components == approx([1.25, 0.5, 1.0])
+    resampled = GridVectorField.from_field(gridded.to_field(), grid)
+    assert resampled.values == approx(gridded.values)
+
+
+def test_bad_grid():
+    with raises(ValueError):
+        UniformGrid([0, 1, 3])
+    with raises(ValueError):
+        UniformGrid([1, 0])
+    with raises(ValueError):
+        UniformGrid([0, 1], [0, 1], [0, 1], [0, 1])
+    grid = _cartesian_grid(5)
+    with raises(ValueError):
+        GridScalarField(grid, np.zeros((5, 5)))
+    with raises(ValueError):
+        GridVectorField(grid, np.zeros((5, 5, 5)))
+    with raises(ValueError):
+        GridScalarField.from_field(ScalarField(lambda p: p.radius, CYLINDRICAL), grid)
+    with raises(ValueError):
+        GridScalarField(grid, np.zeros(grid.shape)).evaluate_points([[2, 0, 0]])
@@ -2,12 +2,14 @@ from collections import namedtuple
 from typing import Sequence
 from pytest import fixture
 from sympy import Expr, cos, exp, sin, Symbol as SymSymbol, sqrt
-from sympy.vector import VectorZero
+from sympy.vector import CoordSys3D, Laplacian, VectorZero
 from symplyphysics.core.dimensions import ScalarValue
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem
+from symplyphysics.core.fields.scalar_field import ScalarField
 from symplyphysics.core.fields.vector_field import VectorField
-from symplyphysics.core.fields.operators import curl_operator, divergence_operator
+from symplyphysics.core.fields.operators import (cache_clear, cache_info, curl_operator,
+    divergence_operator, expression_laplacian, gradient_operator, laplacian_operator)
 from symplyphysics.core.points.cartesian_point import CartesianPoint
 from symplyphysics.core.points.cylinder_point import CylinderPoint
 from symplyphysics.core.points.sphere_point import SpherePoint
@@ -133,3 +135,71 @@ def test_gravitational_field_is_conservative(test_args):
     field_rotor = curl_operator(field)
     field_rotor_applied = field_rotor.apply_to_basis().to_sympy_vector()
     assert field_rotor_applied == VectorZero.zero
+
+
+def test_basic_gradient(test_args):
+    field = ScalarField(lambda point: point.x**2 * point.y + point.z, test_args.C)
+    result_vector = gradient_operator(field).apply_to_basis()
+    (x, y, _) = test_args.C.coord_system.base_scalars()
+    assert expr_equals(result_vector.components[0], 2 * x * y)
+    assert expr_equals(result_vector.components[1], x**2)
+    assert expr_equals(result_vector.components[2], 1)
+
+
+def test_spherical_gradient():
+    C1 = CoordinateSystem(CoordinateSystem.System.SPHERICAL)
+    field = ScalarField(lambda p: p.radius**2 * cos(p.polar_angle) * sin(p.azimuthal_angle), C1)
+    result_vector = gradient_operator(field).apply_to_basis()
+    (r, theta, phi) = C1.coord_system.base_scalars()
+    assert expr_equals(result_vector.components[0], 2 * r * cos(phi) * sin(theta))
+    assert expr_equals(result_vector.components[1], r * cos(phi) * cos(theta) / sin(phi))
+    assert expr_equals(result_vector.components[2], -r * sin(phi) * sin(theta))
+
+
+def test_cylindrical_laplacian():
+    C1 = CoordinateSystem(CoordinateSystem.System.CYLINDRICAL)
+    field = ScalarField(lambda p: p.radius**2 * cos(p.theta) + p.z**3, C1)
+    result = laplacian_operator(field)
+    (_, theta, z) = C1.coord_system.base_scalars()
+    assert expr_equals(result, 3 * cos(theta) + 6 * z)
+
+
+def test_laplacian_is_divergence_of_gradient():
+    for system in CoordinateSystem.System:
+        C1 = CoordinateSystem(system)
+        field = ScalarField(
+            lambda p: p.coordinate(0)**3 * sin(p.coordinate(1)) * exp(p.coordinate(2)), C1)
+        gradient = gradient_operator(field)
+        assert expr_equals(laplacian_operator(field), divergence_operator(gradient))
+        for component in curl_operator(gradient).apply_to_basis().components:
+            assert expr_equals(component, 0)
+
+
+def test_vector_laplacian(test_args):
+    field = VectorField(lambda point: [point.x**2 * point.y, point.z**3, 0], test_args.C)
+    result_vector = laplacian_operator(field).apply_to_basis()
+    (_, y, z) = test_args.C.coord_system.base_scalars()
+    assert expr_equals(result_vector.components[0], 2 * y)
+    assert expr_equals(result_vector.components[1], 6 * z)
+    assert expr_equals(result_vector.components[2], 0)
+
+
+def test_expression_laplacian(test_args):
+    for transformation in ("cartesian", "cylindrical", "spherical"):
+        C1 = CoordSys3D("C1", transformation=transformation)
+        (q1, q2, q3) = C1.base_scalars()
+        expression = q1**3 * sin(q2) * cos(q3) * test_args.parameter1
+        assert expr_equals(expression_laplacian(expression), Laplacian(expression).doit())
+    assert expression_laplacian(test_args.parameter2) == 0
+
+
+def test_operators_are_cached(test_args):
+    cache_clear()
+    field = VectorField(lambda point: [point.y * point.z, point.x**2, point.z], test_args.C)
+    curl_operator(curl_operator(field))
+    misses = cache_info().misses
+    curl_operator(curl_operator(field))
+    assert cache_info().misses == misses
+    assert cache_info().hits > 0
+    cache_clear()
+    assert cache_info().currsize == 0
@@ -0,0 +1,45 @@
+from pytest import approx, importorskip, raises
+from sympy import exp, oo, pi, sin, sqrt, symbols
+from symplyphysics.core.fields.quadrature import integrate_numeric
+
+importorskip("numpy")
+
+x, y, z = symbols("x y z")
+
+
+def test_basic_integral():
+    result = integrate_numeric(sin(x), (x, 0, pi))
+    assert result.value == approx(2.0, 1e-12)
+    assert result.error < 1e-8
+
+
+def test_singular_integrand():
+    result = integrate_numeric(1 / sqrt(x), (x, 0, 1), tolerance=1e-10)
+    assert result.value == approx(2.0, 1e-8)
+
+
+def test_multiple_integral():
+    result = integrate_numeric(exp(-x**2 - y**2), (x, -6, 6), (y, -6, 6))
+    assert result.value == approx(float(pi), 1e-8)
+
+
+def test_dependent_limits():
+    # volume of the ball of radius 2
+    result = integrate_numeric(1, (z, -sqrt(4 - x**2 - y**2), sqrt(4 - x**2 - y**2)),
+        (y, -sqrt(4 - x**2), sqrt(4 - x**2)), (x, -2, 2))
+    assert result.value == approx(float(32 * pi / 3), 1e-6)
+
+
+def test_bad_integral():
+    with raises(ValueError):
+        integrate_numeric(x * y, (x, 0, 1))
+    with raises(ValueError):
+        integrate_numeric(exp(-x), (x, 0, oo))
+    with raises(ValueError):
+        integrate_numeric(x)
+    with raises(ValueError):
+        integrate_numeric(x, (x, 0, 1), tolerance=0)
+    with raises(ValueError):
+        integrate_numeric(sin(1 / x), (x, 0, 1), max_subdivisions=3)
+    with raises(ValueError):
+        integrate_numeric(sqrt(x - 1), (x, 0, 2))
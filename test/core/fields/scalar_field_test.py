@@ -1,6 +1,6 @@
 from collections import namedtuple
 from test.test_decorators import unsupported_usage
-from pytest import fixture, raises
+from pytest import approx, fixture, importorskip, raises
 from sympy import atan, cos, pi, sin, sqrt, symbols, simplify
 from sympy.vector import express
 from symplyphysics.core.dimensions import ScalarValue
@@ -387,3 +387,47 @@ def test_cylindrical_field_create(test_args):
     point_polar = [sqrt(5), atan(2)]
     point_polar_value = field_rebased.apply(point_polar)
     assert simplify(point_polar_value) == 3
+
+
+# Test compiled field evaluation
+
+
+def test_evaluate_points(test_args):
+    np = importorskip("numpy")
+    C = test_args.C
+    field = ScalarField.from_expression(C.coord_system.x * C.coord_system.y + C.coord_system.z, C)
+    points = np.array([[1.0, 2.0, 3.0], [2.0, 3.0, 4.0]])
+    assert field.evaluate_points(points) == approx([5.0, 10.0])
+    assert field.evaluate_points([CartesianPoint(1, 2, 3), CartesianPoint(2, 3)]) == approx([5.0, 6.0])
+    # field function is compiled only once
+    assert field.evaluator() is field.evaluator()
+    with raises(ValueError):
+        field.evaluate_points([SpherePoint(1, 2, 3)])
+    with raises(ValueError):
+        field.evaluate_points(np.zeros((2, 4)))
+
+
+def test_evaluate_grid(test_args):
+    np = importorskip("numpy")
+    field = ScalarField(lambda p: p.x**2 + p.y, test_args.C)
+    values = field.evaluate_grid([0.0, 1.0, 2.0], [0.0, 10.0])
+    assert values.shape == (3, 2, 1)
+    assert values[:, :, 0] == approx(np.array([[0.0, 10.0], [1.0, 11.0], [4.0, 14.0]]))
+    constant = ScalarField(2)
+    assert constant.evaluate_grid([1.0, 2.0], [1.0], [1.0, 2.0]) == approx(np.full((2, 1, 2), 2.0))
+
+
+def test_evaluate_spherical_points():
+    importorskip("numpy")
+    field = ScalarField(lambda p: p.r * cos(p.phi), CoordinateSystem(CoordinateSystem.System.SPHERICAL))
+    assert field.evaluate_points([[2.0, 0.0, 0.0], [2.0, 1.0, pi / 2]]) == approx([2.0, 0.0])
+    with raises(ValueError):
+        field.evaluate_points([CylinderPoint(1, 2, 3)])
+
+
+def test_evaluate_field_with_parameters(test_args):
+    importorskip("numpy")
+    parameter = symbols("parameter")
+    field = ScalarField(lambda p: p.x * parameter, test_args.C)
+    with raises(ValueError):
+        field.evaluate_points([[1.0, 2.0, 3.0]])
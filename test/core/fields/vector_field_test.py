@@ -1,7 +1,7 @@
 from collections import namedtuple
 from typing import Sequence
 from test.test_decorators import unsupported_usage
-from pytest import fixture, raises
+from pytest import approx, fixture, importorskip, raises
 from sympy import Expr, atan, cos, sin, sqrt, symbols
 from sympy.vector import express
 from symplyphysics.core.dimensions import ScalarValue
@@ -304,3 +304,27 @@ def test_cylindrical_field_create(test_args):
     # it is the same as original vector
     vector_rebased = point_polar_vector.rebase(test_args.C)
     assert vector_rebased.components == [1, 2, 0]
+
+
+# Test compiled field evaluation
+
+
+def test_evaluate_points(test_args):
+    np = importorskip("numpy")
+    field = VectorField(lambda p: [p.x * p.y, 1], test_args.C)
+    values = field.evaluate_points(np.array([[1.0, 2.0, 3.0], [2.0, 3.0, 4.0]]))
+    assert values == approx(np.array([[2.0, 1.0, 0.0], [6.0, 1.0, 0.0]]))
+    values = field.evaluate_points([CartesianPoint(3, 3)])
+    assert values == approx(np.array([[9.0, 1.0, 0.0]]))
+    assert field.evaluator() is field.evaluator()
+    with raises(ValueError):
+        field.evaluate_points([CylinderPoint(1, 2, 3)])
+
+
+def test_evaluate_grid(test_args):
+    np = importorskip("numpy")
+    B = coordinates_transform(test_args.C, CoordinateSystem.System.CYLINDRICAL)
+    field = VectorField(lambda p: [p.r, 0, p.z], B)
+    values = field.evaluate_grid([1.0, 2.0], [0.0, 1.0, 2.0], [5.0])
+    assert values.shape == (2, 3, 1, 3)
+    assert values[1, 2, 0] == approx(np.array([2.0, 0.0, 5.0]))
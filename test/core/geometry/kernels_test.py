@@ -0,0 +1,82 @@
+from pytest import approx, importorskip, raises
+from sympy import cos, sin, sqrt, Symbol as SymSymbol
+from symplyphysics import Vector, vector_magnitude
+from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem
+from symplyphysics.core.geometry.elements import curve_element
+from symplyphysics.core.geometry.kernels import (curve_kernel, kernels_cache_clear,
+    kernels_cache_size, surface_kernel)
+from symplyphysics.core.geometry.normals import parametrized_surface_normal
+from symplyphysics.core.registries import RegistryScope
+
+np = importorskip("numpy")
+
+parameter1 = SymSymbol("parameter1")
+parameter2 = SymSymbol("parameter2")
+
+
+def test_curve_kernel():
+    helix = Vector([cos(parameter1), sin(parameter1), parameter1 / 2])
+    kernel = curve_kernel(helix, parameter1)
+    parameters = np.linspace(0, 2 * np.pi, 101)
+    points = kernel.points(parameters)
+    assert points.shape == (101, 3)
+    assert points[:, 2] == approx(parameters / 2)
+    tangents = kernel.tangents(parameters)
+    symbolic = curve_element(helix, parameter1)
+    for (t, tangent) in zip(parameters[::10], tangents[::10]):
+        expected = [float(c.subs(parameter1, t)) for c in symbolic.components]
+        assert tangent == approx(expected)
+    assert kernel.length_elements(parameters) == approx(np.full(101, np.sqrt(1.25)))
+
+
+def test_surface_kernel():
+    # hyperboloid
+    hyperboloid = Vector([
+        sqrt(parameter1**2 + 1) * cos(parameter2),
+        sqrt(parameter1**2 + 1) * sin(parameter2), -parameter1
+    ])
+    kernel = surface_kernel(hyperboloid, parameter1, parameter2)
+    (mesh1, mesh2) = np.meshgrid(np.linspace(-2, 1, 31), np.linspace(0, 2 * np.pi, 41),
+        indexing="ij")
+    normals = kernel.normals(mesh1, mesh2)
+    assert normals.shape == (31, 41, 3)
+    symbolic = parametrized_surface_normal(hyperboloid, parameter1, parameter2)
+    magnitude = vector_magnitude(symbolic)
+    for (i, j) in [(0, 0), (10, 20), (30, 40)]:
+        point = {parameter1: mesh1[i, j], parameter2: mesh2[i, j]}
+        expected = [float(c.subs(point)) for c in symbolic.components]
+        assert normals[i, j] == approx(expected)
+        assert kernel.area_elements(mesh1, mesh2)[i, j] == approx(float(magnitude.subs(point)))
+    (tangents1, tangents2) = kernel.tangents(mesh1, mesh2)
+    assert np.einsum("...i,...i", tangents1, normals) == approx(np.zeros((31, 41)), abs=1e-12)
+    assert np.einsum("...i,...i", tangents2, normals) == approx(np.zeros((31, 41)), abs=1e-12)
+
+
+def test_constant_components_are_broadcast():
+    plane = Vector([parameter1, parameter2])
+    kernel = surface_kernel(plane, parameter1, parameter2)
+    normals = kernel.normals(np.zeros(5), np.zeros(5))
+    assert normals == approx(np.tile([0, 0, 1], (5, 1)))
+    assert kernel.area_elements(0.5, 0.5) == approx(1.0)
+
+
+def test_kernels_are_cached():
+    kernels_cache_clear()
+    circle = Vector([cos(parameter1), sin(parameter1)])
+    assert curve_kernel(circle, parameter1) is curve_kernel(circle, parameter1)
+    assert kernels_cache_size() == 1
+    with RegistryScope():
+        C1 = CoordinateSystem()
+        curve_kernel(Vector([cos(parameter1), sin(parameter1)], C1), parameter1)
+        assert kernels_cache_size() == 2
+    assert kernels_cache_size() == 1
+
+
+def test_bad_parametrization():
+    other = SymSymbol("other")
+    with raises(ValueError):
+        curve_kernel(Vector([other * parameter1]), parameter1)
+    C1 = CoordinateSystem(CoordinateSystem.System.CYLINDRICAL)
+    kernel = surface_kernel(Vector([parameter1, parameter2], C1), parameter1, parameter2)
+    with raises(ValueError):
+        kernel.normals(0, 0)
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+from typing import Iterator
+from pytest import fixture, raises
+from symplyphysics.core.import_profiler import (folded_stacks, format_statements, format_table,
+    import_chain, profile_imports)
+
+
+@fixture(name="package")
+def package_fixture(tmp_path: Path) -> Iterator[str]:
+    root = tmp_path / "profiled_laws"
+    root.mkdir()
+    (root / "__init__.py").write_text('"""Profiled laws."""\n')
+    (root / "first.py").write_text("from profiled_laws import second\n"
+        "total = sum(range(1000))\n"
+        "def speed(): return second.distance / 2\n")
+    (root / "second.py").write_text("from __future__ import annotations\n"
+        "distance = 4\n")
+    sys.path.insert(0, str(tmp_path))
+    yield "profiled_laws"
+    sys.path.remove(str(tmp_path))
+    for name in [n for n in sys.modules if n.split(".")[0] == "profiled_laws"]:
+        del sys.modules[name]
+
+
+def test_profile_imports(package: str) -> None:
+    records = profile_imports(package)
+    by_name = {r.name: r for r in records}
+    assert list(by_name) == ["profiled_laws", "profiled_laws.first", "profiled_laws.second"]
+    first = by_name["profiled_laws.first"]
+    second = by_name["profiled_laws.second"]
+    assert second.parent == "profiled_laws.first"
+    assert first.inclusive >= second.inclusive
+    assert abs(first.exclusive - (first.inclusive - second.inclusive)) < 1e-9
+    assert [s.line for s in first.statements] == [1, 2, 3]
+    assert first.statements[1].source == "total = sum(range(1000))"
+    assert first.statements[0].exclusive < first.statements[0].inclusive
+    # modules are executed as usual
+    assert sys.modules["profiled_laws.first"].speed() == 2
+    assert sys.modules["profiled_laws"].__doc__ == "Profiled laws."
+    assert import_chain(records, "profiled_laws.second") == [
+        "profiled_laws.first", "profiled_laws.second"
+    ]
+
+
+def test_profile_imports_without_statements(package: str) -> None:
+    records = profile_imports(package, statements=False)
+    assert all(not r.statements for r in records)
+    assert len(records) == 3
+
+
+def test_reports(package: str) -> None:
+    records = profile_imports(package)
+    table = format_table(records, sort="name").splitlines()
+    assert len(table) == 4
+    assert table[1].split()[2] == "profiled_laws"
+    assert table[3].split()[2:] == ["profiled_laws.second", "profiled_laws.first"]
+    assert len(format_table(records, limit=1).splitlines()) == 2
+    assert "profiled_laws.first:2  total = sum(range(1000))" in format_statements(records)
+    with raises(ValueError):
+        format_table(records, sort="size")
+
+    for line in folded_stacks(records):
+        (stack, microseconds) = line.rsplit(" ", 1)
+        assert int(microseconds) > 0
+        assert stack.split(";")[0] in ("profiled_laws", "profiled_laws.first")
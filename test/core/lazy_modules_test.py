@@ -0,0 +1,24 @@
+import sys
+from pytest import raises
+import symplyphysics.laws
+from symplyphysics.laws import kinematic
+
+
+def test_submodule_is_imported_on_access() -> None:
+    module = kinematic.temporal_frequency_from_period
+    assert module.__name__ == "symplyphysics.laws.kinematic.temporal_frequency_from_period"
+    assert sys.modules[module.__name__] is module
+    assert kinematic.temporal_frequency_from_period is module
+
+
+def test_subpackage_is_imported_on_access() -> None:
+    assert symplyphysics.laws.nuclear.buckling.__name__ == "symplyphysics.laws.nuclear.buckling"
+
+
+def test_submodules_are_listed() -> None:
+    assert "temporal_frequency_from_period" in dir(kinematic)
+
+
+def test_unknown_submodule() -> None:
+    with raises(AttributeError):
+        _ = kinematic.not_a_law
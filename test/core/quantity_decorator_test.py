@@ -0,0 +1,114 @@
+from pytest import raises
+from symplyphysics import errors, units, Quantity, validate_input, validate_output, validation
+from symplyphysics.core.quantity_decorator import (reset_validation_stats, validate_output_same,
+    validation_stats)
+
+
+@validate_input(mass_=units.mass, acceleration_=units.acceleration)
+@validate_output(units.force)
+def _force(mass_: Quantity, acceleration_: Quantity = Quantity(units.meter / units.second**2)):
+    return Quantity(mass_ * acceleration_)
+
+
+@validate_input(mass_=units.mass)
+@validate_output(units.mass)
+def _mass(mass_: Quantity) -> Quantity:
+    return Quantity(mass_ * units.kilogram / units.second)
+
+
+@validate_output(units.force)
+def _bad_force(mass_: Quantity) -> Quantity:
+    return mass_
+
+
+@validate_output_same("length_")
+def _half(length_: Quantity) -> Quantity:
+    return Quantity(length_ / 2)
+
+
+def test_validate_input():
+    mass = Quantity(2 * units.kilogram)
+    acceleration = Quantity(3 * units.meter / units.second**2)
+    _force(mass, acceleration)
+    _force(mass, acceleration_=acceleration)
+    _force(acceleration_=acceleration, mass_=mass)
+    _force(mass)
+    with raises(errors.UnitsError):
+        _force(acceleration, mass)
+    with raises(errors.UnitsError):
+        _force(mass, acceleration_=mass)
+    with raises(TypeError):
+        # pylint: disable-next=no-value-for-parameter
+        _force(acceleration_=acceleration)
+
+
+def test_validate_output():
+    with raises(errors.UnitsError):
+        _bad_force(Quantity(units.kilogram))
+
+
+def test_validate_output_same():
+    _half(Quantity(2 * units.meter))
+    with raises(TypeError):
+
+        @validate_output_same("length_")
+        def _no_param(mass_: Quantity) -> Quantity:
+            return mass_
+
+
+def test_disabled_validation():
+    mass = Quantity(units.kilogram)
+    with validation(enabled=False):
+        _bad_force(mass)
+    with raises(errors.UnitsError):
+        _bad_force(mass)
+
+
+def test_sampled_validation():
+    mass = Quantity(units.kilogram)
+    reset_validation_stats()
+    failures = 0
+    with validation(sample_every=3):
+        for _ in range(6):
+            try:
+                _bad_force(mass)
+            except errors.UnitsError:
+                failures += 1
+    assert failures == 2
+    assert validation_stats().checked == 2
+    assert validation_stats().skipped == 4
+
+
+def test_sampled_validation_of_input_and_output():
+    # both decorators of the function check the same sampled calls
+    seconds = Quantity(units.second)
+    reset_validation_stats()
+    failures = 0
+    with validation(sample_every=2):
+        for _ in range(100):
+            try:
+                _mass(seconds)
+            except errors.UnitsError:
+                failures += 1
+    assert failures == 50
+    # output is not returned, when input is invalid
+    assert validation_stats().checked == 50
+    assert validation_stats().skipped == 100
+
+
+def test_validation_stats():
+    reset_validation_stats()
+    _force(Quantity(units.kilogram), Quantity(units.meter / units.second**2))
+    # input and output
+    assert validation_stats().checked == 2
+    assert validation_stats().skipped == 0
+    with validation(enabled=False):
+        _force(Quantity(units.kilogram), Quantity(units.meter / units.second**2))
+    assert validation_stats().checked == 2
+    assert validation_stats().skipped == 2
+
+
+def test_bad_sample_rate():
+    with raises(ValueError):
+        with validation(sample_every=0):
+            pass
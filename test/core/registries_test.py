@@ -0,0 +1,70 @@
+from sympy.physics.units.systems.si import SI
+from symplyphysics import units, Quantity, CoordinateSystem
+from symplyphysics.core.registries import (RegistryScope, on_coordinate_system_release,
+    registry_report)
+
+
+def _is_registered(quantity: Quantity) -> bool:
+    # pylint: disable-next=protected-access
+    return quantity in SI._quantity_scale_factors
+
+
+def test_scope_releases_quantities():
+    before = registry_report().quantity_scale_factors
+    with RegistryScope() as scope:
+        quantities = [Quantity(i * units.meter) for i in range(10)]
+        assert scope.quantities_count == 10
+        assert all(_is_registered(q) for q in quantities)
+        assert registry_report().quantity_scale_factors == before + 10
+    assert not any(_is_registered(q) for q in quantities)
+    assert registry_report().quantity_scale_factors == before
+
+
+def test_kept_quantities():
+    with RegistryScope() as scope:
+        kept = Quantity(2 * units.meter)
+        released = Quantity(3 * units.meter)
+        scope.keep(kept)
+    assert _is_registered(kept)
+    assert not _is_registered(released)
+    assert kept.scale_factor == 2
+
+
+def test_nested_scopes():
+    with RegistryScope() as outer:
+        with RegistryScope() as inner:
+            kept = Quantity(2 * units.meter)
+            released = Quantity(3 * units.meter)
+            inner.keep(kept)
+        assert _is_registered(kept)
+        assert not _is_registered(released)
+        assert outer.quantities_count == 1
+    assert not _is_registered(kept)
+
+
+def test_quantities_outside_scope():
+    quantity = Quantity(2 * units.meter)
+    with RegistryScope():
+        pass
+    assert _is_registered(quantity)
+
+
+def test_scope_releases_coordinate_systems():
+    released = []
+    on_coordinate_system_release(released.append)
+    with RegistryScope() as scope:
+        kept = CoordinateSystem(CoordinateSystem.System.SPHERICAL)
+        temporary = CoordinateSystem()
+        scope.keep(kept)
+        assert scope.coordinate_systems_count == 1
+    assert temporary.coord_system in released
+    assert kept.coord_system not in released
+
+
+def test_registry_report():
+    report = registry_report()
+    assert report.quantity_dimensions > 0
+    assert report.quantity_scale_factors > 0
+    assert report.size_bytes > 0
+    Quantity(units.meter)
+    assert registry_report().quantity_scale_factors == report.quantity_scale_factors + 1
@@ -0,0 +1,94 @@
+from pytest import fixture
+from sympy import Derivative, Eq, Function as SymFunction, symbols
+from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.solved_forms import cache_clear, cache_info, dsolve_for, solutions_for, solve_for
+
+
+@fixture(autouse=True)
+def clear_cache_fixture():
+    cache_clear()
+    yield
+    cache_clear()
+
+
+def test_basic_solve_for():
+    x, y = symbols("x y")
+    law = Eq(y, 2 * x)
+    assert expr_equals(solve_for(law, x), y / 2)
+    assert expr_equals(solve_for(law, y), 2 * x)
+
+
+def test_solve_for_is_cached():
+    x, y = symbols("x y")
+    law = Eq(y, 2 * x)
+    first = solve_for(law, x)
+    info = cache_info()
+    assert info.misses == 1
+    assert info.hits == 0
+    second = solve_for(law, x)
+    assert first is second
+    info = cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.currsize == 1
+
+
+def test_structurally_equal_laws_share_cache():
+    x, y = symbols("x y")
+    solve_for(Eq(y, 2 * x), x)
+    solve_for(Eq(y, 2 * x), x)
+    info = cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_different_unknowns_are_cached_separately():
+    x, y = symbols("x y")
+    law = Eq(y, 2 * x)
+    solve_for(law, x)
+    solve_for(law, y)
+    info = cache_info()
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+def test_solution_index():
+    x, y = symbols("x y")
+    law = Eq(y, x**2)
+    solutions = solutions_for(law, x)
+    assert len(solutions) == 2
+    assert expr_equals(solve_for(law, x, 0), solutions[0][x])
+    assert expr_equals(solve_for(law, x, 1), solutions[1][x])
+    assert expr_equals(solutions[0][x]**2, y)
+
+
+def test_system_of_equations():
+    x, y, z = symbols("x y z")
+    law = [Eq(x + y, z), Eq(x - y, 0)]
+    solved = solutions_for(law, (x, y))[0]
+    assert expr_equals(solved[x], z / 2)
+    assert expr_equals(solved[y], z / 2)
+    solutions_for(law, [x, y])
+    assert cache_info().hits == 1
+
+
+def test_dsolve_for():
+    t = symbols("t")
+    f = SymFunction("f")
+    law = Eq(Derivative(f(t), t), 0)  # pylint: disable=not-callable
+    solved = dsolve_for(law, f(t))  # pylint: disable=not-callable
+    assert solved.rhs == symbols("C1")
+    dsolve_for(law, f(t))  # pylint: disable=not-callable
+    info = cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_cache_clear():
+    x, y = symbols("x y")
+    solve_for(Eq(y, 2 * x), x)
+    cache_clear()
+    info = cache_info()
+    assert info.misses == 0
+    assert info.hits == 0
+    assert info.currsize == 0
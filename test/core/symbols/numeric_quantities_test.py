@@ -0,0 +1,96 @@
+from pytest import approx, importorskip, raises
+from sympy.physics.units.systems.si import SI
+from symplyphysics import (errors, units, convert_to, Quantity, NumericQuantity, validate_input,
+    validate_output)
+from symplyphysics.laws.dynamics import acceleration_from_force
+
+
+def test_basic_numeric_quantity():
+    q = NumericQuantity(3.0, units.velocity)
+    assert q.value == 3.0
+    assert SI.get_dimension_system().equivalent_dims(q.dimension, units.velocity)
+
+
+def test_dimensions_are_interned():
+    a = NumericQuantity(1.0, units.length / units.time)
+    b = NumericQuantity(2.0, units.velocity)
+    assert a.dimension is b.dimension
+    c = NumericQuantity(3.0, units.length) / NumericQuantity(4.0, units.time)
+    assert c.dimension is a.dimension
+
+
+def test_from_quantity():
+    q = NumericQuantity.from_quantity(Quantity(2 * units.kilometer / units.hour))
+    assert q.value == approx(2000 / 3600)
+    q = NumericQuantity.from_quantity(5 * units.gram)
+    assert q.value == approx(0.005)
+    assert SI.get_dimension_system().equivalent_dims(q.dimension, units.mass)
+
+
+def test_to_quantity():
+    q = NumericQuantity(2.0, units.mass).to_quantity()
+    assert isinstance(q, Quantity)
+    assert convert_to(q, units.kilogram) == approx(2.0)
+
+
+def test_arithmetics():
+    speed = NumericQuantity(3.0, units.velocity)
+    time = NumericQuantity.from_quantity(Quantity(2 * units.hour))
+    distance = speed * time
+    assert distance.value == approx(21600.0)
+    assert SI.get_dimension_system().equivalent_dims(distance.dimension, units.length)
+    assert (distance + distance).value == approx(43200.0)
+    assert (distance - distance).value == approx(0.0)
+    assert (2 * distance).value == approx(43200.0)
+    assert (distance / 2).value == approx(10800.0)
+    assert (-distance).value == approx(-21600.0)
+    assert abs(-distance).value == approx(21600.0)
+    area = distance**2
+    assert SI.get_dimension_system().equivalent_dims(area.dimension, units.area)
+    frequency = 1 / time
+    assert SI.get_dimension_system().equivalent_dims(frequency.dimension, units.frequency)
+    assert NumericQuantity(1.0, units.length) == NumericQuantity(1.0, units.length)
+    assert NumericQuantity(1.0, units.length) != NumericQuantity(1.0, units.time)
+
+
+def test_bad_arithmetics():
+    with raises(errors.UnitsError):
+        _ = NumericQuantity(1.0, units.length) + NumericQuantity(1.0, units.time)
+    with raises(errors.UnitsError):
+        _ = NumericQuantity(1.0, units.length) - NumericQuantity(1.0, units.time)
+
+
+def test_convert_to():
+    q = NumericQuantity(1500.0, units.length)
+    assert convert_to(q, units.kilometer) == approx(1.5)
+    with raises(errors.UnitsError):
+        convert_to(q, units.second)
+
+
+def test_validators():
+
+    @validate_input(mass_=units.mass, acceleration_=units.acceleration)
+    @validate_output(units.force)
+    def force(mass_: NumericQuantity, acceleration_: NumericQuantity) -> NumericQuantity:
+        return mass_ * acceleration_
+
+    result = force(NumericQuantity(2.0, units.mass), NumericQuantity(3.0, units.acceleration))
+    assert result.value == approx(6.0)
+    with raises(errors.UnitsError):
+        force(NumericQuantity(2.0, units.length), NumericQuantity(3.0, units.acceleration))
+
+
+def test_law_with_numeric_quantities():
+    result = acceleration_from_force.calculate_force(NumericQuantity(2.0, units.mass),
+        NumericQuantity(3.0, units.acceleration))
+    assert convert_to(result, units.newton) == approx(6.0)
+
+
+def test_array_numeric_quantity():
+    np = importorskip("numpy")
+    masses = NumericQuantity(np.array([1.0, 2.0]), units.mass)
+    forces = masses * NumericQuantity(2.0, units.acceleration)
+    assert convert_to(forces, units.newton) == approx([2.0, 4.0])
+    quantities = forces.to_quantity()
+    assert len(quantities) == 2
+    assert convert_to(quantities[1], units.newton) == approx(4.0)
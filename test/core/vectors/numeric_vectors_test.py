@@ -0,0 +1,101 @@
+from pytest import approx, importorskip, raises
+from sympy.physics.units.systems.si import SI
+from symplyphysics import (errors, units, convert_to, Quantity, QuantityVector, NumericQuantity,
+    NumericVector, scale_numeric_vector, add_numeric_vectors, dot_numeric_vectors,
+    cross_numeric_vectors, numeric_vector_unit, numeric_vector_magnitude)
+from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem
+
+np = importorskip("numpy")
+
+
+def test_basic_numeric_vector():
+    v = NumericVector([1, 2], units.length)
+    assert v.values.tolist() == [1.0, 2.0, 0.0]
+    assert not v.is_batch
+    assert len(v) == 1
+    b = NumericVector([[1, 2, 3], [4, 5, 6]], units.length)
+    assert b.is_batch
+    assert len(b) == 2
+    assert b[1].values.tolist() == [4.0, 5.0, 6.0]
+    assert SI.get_dimension_system().equivalent_dims(b.dimension, units.length)
+
+
+def test_bad_numeric_vector():
+    with raises(ValueError):
+        NumericVector([1, 2, 3, 4])
+    with raises(ValueError):
+        NumericVector([[[1]]])
+    with raises(TypeError):
+        _ = NumericVector([1, 2, 3])[0]
+
+
+def test_quantity_vector_conversion():
+    qv = QuantityVector([Quantity(1 * units.kilometer), Quantity(20 * units.centimeter)])
+    v = NumericVector.from_quantity_vector(qv)
+    assert v.values == approx([1000.0, 0.2, 0.0])
+    back = v.to_quantity_vector()
+    assert convert_to(back.components[0], units.meter) == approx(1000.0)
+    assert convert_to(back.components[1], units.meter) == approx(0.2)
+
+
+def test_quantity_vectors_batch_conversion():
+    vectors = [
+        QuantityVector([Quantity(1 * units.newton), Quantity(2 * units.newton)]),
+        QuantityVector([Quantity(3 * units.newton), Quantity(4 * units.newton)]),
+    ]
+    v = NumericVector.from_quantity_vectors(vectors)
+    assert v.values == approx(np.array([[1, 2, 0], [3, 4, 0]]))
+    back = v.to_quantity_vector()
+    assert len(back) == 2
+    assert convert_to(back[1].components[1], units.newton) == approx(4.0)
+    mixed = vectors + [QuantityVector([Quantity(1 * units.meter)])]
+    with raises(errors.UnitsError):
+        NumericVector.from_quantity_vectors(mixed)
+    with raises(ValueError):
+        NumericVector.from_quantity_vectors([])
+
+
+def test_batch_arithmetics():
+    a = NumericVector([[1, 0, 0], [0, 3, 4]], units.length)
+    b = NumericVector([[0, 1, 0], [0, 1, 0]], units.length)
+    assert add_numeric_vectors(a, b).values == approx(np.array([[1, 1, 0], [0, 4, 4]]))
+    dot = dot_numeric_vectors(a, b)
+    assert dot.value == approx([0.0, 3.0])
+    assert SI.get_dimension_system().equivalent_dims(dot.dimension, units.area)
+    cross = cross_numeric_vectors(a, b)
+    assert cross.values == approx(np.array([[0, 0, 1], [-4, 0, 0]]))
+    assert numeric_vector_magnitude(a).value == approx([1.0, 5.0])
+    unit = numeric_vector_unit(a)
+    assert unit.values == approx(np.array([[1, 0, 0], [0, 0.6, 0.8]]))
+    assert SI.get_dimension_system().is_dimensionless(unit.dimension)
+
+
+def test_scale_batch():
+    a = NumericVector([[1, 2, 3], [1, 2, 3]], units.length)
+    scaled = scale_numeric_vector(NumericQuantity(np.array([1.0, 2.0]), 1 / units.time), a)
+    assert scaled.values == approx(np.array([[1, 2, 3], [2, 4, 6]]))
+    assert SI.get_dimension_system().equivalent_dims(scaled.dimension, units.velocity)
+    assert scale_numeric_vector(2, a).values == approx(np.array([[2, 4, 6], [2, 4, 6]]))
+
+
+def test_scale_non_cartesian():
+    spherical = CoordinateSystem(CoordinateSystem.System.SPHERICAL)
+    v = NumericVector([1, 0.5, 0.25], units.length, spherical)
+    assert scale_numeric_vector(2, v).values == approx([2, 0.5, 0.25])
+    cylindrical = CoordinateSystem(CoordinateSystem.System.CYLINDRICAL)
+    v = NumericVector([1, 0.5, 3], units.length, cylindrical)
+    assert scale_numeric_vector(2, v).values == approx([2, 0.5, 6])
+    with raises(ValueError):
+        numeric_vector_magnitude(v)
+
+
+def test_bad_arithmetics():
+    a = NumericVector([1, 2, 3], units.length)
+    b = NumericVector([1, 2, 3], units.time)
+    with raises(errors.UnitsError):
+        add_numeric_vectors(a, b)
+    c = NumericVector([1, 2, 3], units.length, CoordinateSystem(CoordinateSystem.System.CARTESIAN))
+    with raises(TypeError):
+        add_numeric_vectors(a, c)
+    with raises(TypeError):
+        dot_numeric_vectors(a, c)
@@ -0,0 +1,27 @@
+import importlib
+import pkgutil
+from pytest import mark
+import symplyphysics.definitions
+import symplyphysics.laws
+from symplyphysics.core.disk_cache import run_derivation
+
+# Laws and definitions keep their derivation proofs in verify_derivation() hooks, so
+# that importing a law does not run them. Run all of them here. Derivations that have
+# succeeded are skipped if SYMPLYPHYSICS_CACHE_DIR persistent cache is enabled.
+
+
+def _modules_with_derivation() -> list[str]:
+    names = []
+    for package in (symplyphysics.laws, symplyphysics.definitions):
+        for info in pkgutil.walk_packages(package.__path__, package.__name__ + "."):
+            if info.ispkg:
+                continue
+            module = importlib.import_module(info.name)
+            if hasattr(module, "verify_derivation"):
+                names.append(info.name)
+    return names
+
+
+@mark.parametrize("module_name", _modules_with_derivation())
+def test_derivation(module_name: str) -> None:
+    run_derivation(importlib.import_module(module_name))
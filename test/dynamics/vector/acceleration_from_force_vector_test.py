@@ -1,5 +1,5 @@
 from collections import namedtuple
-from pytest import approx, fixture, raises
+from pytest import approx, fixture, importorskip, raises
 from symplyphysics import (
     units,
     errors,
@@ -7,6 +7,8 @@ from symplyphysics import (
     Quantity,
     SI,
     QuantityVector,
+    NumericQuantity,
+    NumericVector,
 )
 from symplyphysics.laws.dynamics.vector import acceleration_from_force as newton_second_law
 
@@ -62,3 +64,16 @@ def test_bad_force(test_args):
         newton_second_law.calculate_acceleration(test_args.m, fb)
     with raises(TypeError):
         newton_second_law.calculate_acceleration(test_args.m, 100)
+
+
+def test_numeric_acceleration_batch():
+    np = importorskip("numpy")
+    forces = NumericVector(np.array([[3.0, 0.0, 6.0], [2.0, 4.0, 0.0]]), units.force)
+    masses = NumericQuantity(np.array([3.0, 2.0]), units.mass)
+    result = newton_second_law.calculate_acceleration(masses, forces)
+    assert SI.get_dimension_system().equivalent_dims(result.dimension, units.acceleration)
+    assert result.values == approx(np.array([[1.0, 0.0, 2.0], [1.0, 2.0, 0.0]]))
+    result = newton_second_law.calculate_force(Quantity(500 * units.gram), result)
+    assert result.values == approx(np.array([[0.5, 0.0, 1.0], [0.5, 1.0, 0.0]]))
+    with raises(errors.UnitsError):
+        newton_second_law.calculate_acceleration(masses, NumericVector([1, 2, 3], units.length))
@@ -53,3 +53,21 @@ def test_bad_resistance(test_args):
         serial_resistor.calculate_serial_resistance([100, 100])
     with raises(TypeError):
         serial_resistor.calculate_serial_resistance(test_args.R1)
+
+
+def test_batch_resistance(test_args):
+    result = serial_resistor.calculate_serial_resistance_batch([test_args.R1, test_args.R2])
+    assert result == approx(3.0)
+    result = serial_resistor.calculate_serial_resistance_batch([[1.0, 2.0, 3.0], [0.5, 0.5, 0.5]])
+    assert result == approx([6.0, 1.5])
+    kiloohms = [1.0] * 1000
+    result = serial_resistor.calculate_serial_resistance_batch((kiloohms, units.kilo * units.ohm))
+    assert result == approx(1e6)
+
+
+def test_bad_batch_resistance(test_args):
+    Rb = Quantity(1 * units.meter)
+    with raises(errors.UnitsError):
+        serial_resistor.calculate_serial_resistance_batch([test_args.R1, Rb])
+    with raises(errors.UnitsError):
+        serial_resistor.calculate_serial_resistance_batch(([1.0, 2.0], units.meter))
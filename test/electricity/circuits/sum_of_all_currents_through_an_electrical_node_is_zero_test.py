@@ -55,3 +55,10 @@ def test_array_bad_current(test_args):
         kirchhoff_law.calculate_current_from_array([100, 100])
     with raises(TypeError):
         kirchhoff_law.calculate_current_from_array(test_args.I1)
+
+
+def test_batch_current(test_args):
+    result = kirchhoff_law.calculate_current_from_array_batch([test_args.I1, test_args.I2])
+    assert result == approx(2.0)
+    result = kirchhoff_law.calculate_current_from_array_batch([[3.0, -5.0], [1.0, 1.0]])
+    assert result == approx([2.0, -2.0])
@@ -49,3 +49,13 @@ def test_bad_distance(test_args):
         gravity_law.calculate_force(test_args.m1, test_args.m2, db)
     with raises(TypeError):
         gravity_law.calculate_force(test_args.m1, test_args.m2, 100)
+
+
+def test_batch_force(test_args):
+    result = gravity_law.calculate_force_batch([3000, 6000], (5, units.tonne), test_args.R)
+    assert result == approx([0.27809583, 0.27809583 * 2], 0.0000001)
+
+
+def test_bad_batch_mass():
+    with raises(errors.UnitsError):
+        gravity_law.calculate_force_batch((3000, units.coulomb), 5000, 0.06)
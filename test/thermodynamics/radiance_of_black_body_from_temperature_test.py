@@ -34,3 +34,15 @@ def test_bad_temperature():
         stefan_boltzmann_law.calculate_radiance(tb)
     with raises(TypeError):
         stefan_boltzmann_law.calculate_radiance(100)
+
+
+def test_batch_radiance(test_args):
+    result = stefan_boltzmann_law.calculate_radiance_batch([20, 40])
+    assert result == approx([0.009073, 0.009073 * 16], 0.0001)
+    result = stefan_boltzmann_law.calculate_radiance_batch(test_args.t)
+    assert result == approx(0.009073, 0.0001)
+
+
+def test_bad_batch_temperature():
+    with raises(errors.UnitsError):
+        stefan_boltzmann_law.calculate_radiance_batch(([1, 2], units.second))